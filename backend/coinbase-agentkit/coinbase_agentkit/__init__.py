@@ -1,47 +1,105 @@
 """Coinbase AgentKit - Framework for enabling AI agents to take actions onchain."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .__version__ import __version__
-from .action_providers import (
-    Action,
-    ActionProvider,
-    allora_action_provider,
-    basename_action_provider,
-    cdp_api_action_provider,
-    compound_action_provider,
-    create_action,
-    erc20_action_provider,
-    hyperbolic_action_provider,
-    morpho_action_provider,
-    nillion_action_provider,
-    onramp_action_provider,
-    pyth_action_provider,
-    ssh_action_provider,
-    superfluid_action_provider,
-    twitter_action_provider,
-    wallet_action_provider,
-    weth_action_provider,
-    wow_action_provider,
-)
-from .agentkit import AgentKit, AgentKitConfig
-from .wallet_providers import (
-    CdpEvmServerWalletProvider,
-    CdpEvmServerWalletProviderConfig,
-    CdpEvmSmartWalletProvider,
-    CdpEvmSmartWalletProviderConfig,
-    EthAccountWalletProvider,
-    EthAccountWalletProviderConfig,
-    EvmWalletProvider,
-    WalletProvider,
-)
+from .action_providers import Action, ActionProvider, create_action
+from .agentkit import ActionCall, AgentKit, AgentKitConfig
+from .wallet_providers import AsyncWalletProvider, WalletProvider
+
+if TYPE_CHECKING:
+    from .action_providers import (
+        allora_action_provider,
+        async_wallet_action_provider,
+        basename_action_provider,
+        cdp_api_action_provider,
+        compound_action_provider,
+        erc20_action_provider,
+        hyperbolic_action_provider,
+        morpho_action_provider,
+        nillion_action_provider,
+        onramp_action_provider,
+        pyth_action_provider,
+        ssh_action_provider,
+        superfluid_action_provider,
+        twitter_action_provider,
+        wallet_action_provider,
+        weth_action_provider,
+        wow_action_provider,
+    )
+    from .wallet_providers import (
+        AsyncCdpEvmServerWalletProvider,
+        AsyncCdpEvmSmartWalletProvider,
+        AsyncEthAccountWalletProvider,
+        AsyncEvmWalletProvider,
+        CdpEvmServerWalletProvider,
+        CdpEvmServerWalletProviderConfig,
+        CdpEvmSmartWalletProvider,
+        CdpEvmSmartWalletProviderConfig,
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+        EvmWalletProvider,
+    )
+
+# Package defining each lazily imported name
+_LAZY_IMPORTS = {
+    "allora_action_provider": ".action_providers",
+    "basename_action_provider": ".action_providers",
+    "cdp_api_action_provider": ".action_providers",
+    "compound_action_provider": ".action_providers",
+    "erc20_action_provider": ".action_providers",
+    "hyperbolic_action_provider": ".action_providers",
+    "morpho_action_provider": ".action_providers",
+    "nillion_action_provider": ".action_providers",
+    "onramp_action_provider": ".action_providers",
+    "pyth_action_provider": ".action_providers",
+    "ssh_action_provider": ".action_providers",
+    "superfluid_action_provider": ".action_providers",
+    "twitter_action_provider": ".action_providers",
+    "async_wallet_action_provider": ".action_providers",
+    "wallet_action_provider": ".action_providers",
+    "weth_action_provider": ".action_providers",
+    "wow_action_provider": ".action_providers",
+    "AsyncCdpEvmServerWalletProvider": ".wallet_providers",
+    "AsyncCdpEvmSmartWalletProvider": ".wallet_providers",
+    "AsyncEthAccountWalletProvider": ".wallet_providers",
+    "AsyncEvmWalletProvider": ".wallet_providers",
+    "CdpEvmServerWalletProvider": ".wallet_providers",
+    "CdpEvmServerWalletProviderConfig": ".wallet_providers",
+    "CdpEvmSmartWalletProvider": ".wallet_providers",
+    "CdpEvmSmartWalletProviderConfig": ".wallet_providers",
+    "EthAccountWalletProvider": ".wallet_providers",
+    "EthAccountWalletProviderConfig": ".wallet_providers",
+    "EvmWalletProvider": ".wallet_providers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an action or wallet provider on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including those not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "AgentKit",
     "AgentKitConfig",
+    "ActionCall",
     "Action",
     "ActionProvider",
     "create_action",
     "basename_action_provider",
     "WalletProvider",
+    "AsyncWalletProvider",
     "CdpEvmServerWalletProvider",
     "CdpEvmServerWalletProviderConfig",
     "CdpEvmSmartWalletProvider",
@@ -49,6 +107,10 @@ __all__ = [
     "EvmWalletProvider",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
+    "AsyncEvmWalletProvider",
+    "AsyncEthAccountWalletProvider",
+    "AsyncCdpEvmServerWalletProvider",
+    "AsyncCdpEvmSmartWalletProvider",
     "allora_action_provider",
     "cdp_api_action_provider",
     "compound_action_provider",
@@ -62,6 +124,7 @@ __all__ = [
     "superfluid_action_provider",
     "twitter_action_provider",
     "wallet_action_provider",
+    "async_wallet_action_provider",
     "weth_action_provider",
     "wow_action_provider",
     "__version__",
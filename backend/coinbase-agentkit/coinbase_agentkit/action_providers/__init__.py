@@ -1,32 +1,96 @@
-"""Action providers for AgentKit."""
+"""Action providers for AgentKit.
+
+Action providers are imported on first use, so importing AgentKit does not load the
+dependencies of providers that are never used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from .action_decorator import create_action
 from .action_provider import Action, ActionProvider
-from .allora.allora_action_provider import AlloraActionProvider, allora_action_provider
-from .basename.basename_action_provider import (
-    BasenameActionProvider,
-    basename_action_provider,
-)
-from .cdp.cdp_api_action_provider import CdpApiActionProvider, cdp_api_action_provider
-from .compound.compound_action_provider import CompoundActionProvider, compound_action_provider
-from .erc20.erc20_action_provider import ERC20ActionProvider, erc20_action_provider
-from .hyperboliclabs.hyperbolic_action_provider import (
-    HyperbolicActionProvider,
-    hyperbolic_action_provider,
-)
-from .morpho.morpho_action_provider import MorphoActionProvider, morpho_action_provider
-from .nillion.nillion_action_provider import NillionActionProvider, nillion_action_provider
-from .onramp.onramp_action_provider import OnrampActionProvider, onramp_action_provider
-from .pyth.pyth_action_provider import PythActionProvider, pyth_action_provider
-from .ssh.ssh_action_provider import SshActionProvider, ssh_action_provider
-from .superfluid.superfluid_action_provider import (
-    SuperfluidActionProvider,
-    superfluid_action_provider,
-)
-from .twitter.twitter_action_provider import TwitterActionProvider, twitter_action_provider
-from .wallet.wallet_action_provider import WalletActionProvider, wallet_action_provider
-from .weth.weth_action_provider import WethActionProvider, weth_action_provider
-from .wow.wow_action_provider import WowActionProvider, wow_action_provider
+
+if TYPE_CHECKING:
+    from .allora.allora_action_provider import AlloraActionProvider, allora_action_provider
+    from .basename.basename_action_provider import BasenameActionProvider, basename_action_provider
+    from .cdp.cdp_api_action_provider import CdpApiActionProvider, cdp_api_action_provider
+    from .compound.compound_action_provider import CompoundActionProvider, compound_action_provider
+    from .erc20.erc20_action_provider import ERC20ActionProvider, erc20_action_provider
+    from .hyperboliclabs.hyperbolic_action_provider import (
+        HyperbolicActionProvider,
+        hyperbolic_action_provider,
+    )
+    from .morpho.morpho_action_provider import MorphoActionProvider, morpho_action_provider
+    from .nillion.nillion_action_provider import NillionActionProvider, nillion_action_provider
+    from .onramp.onramp_action_provider import OnrampActionProvider, onramp_action_provider
+    from .pyth.pyth_action_provider import PythActionProvider, pyth_action_provider
+    from .ssh.ssh_action_provider import SshActionProvider, ssh_action_provider
+    from .superfluid.superfluid_action_provider import (
+        SuperfluidActionProvider,
+        superfluid_action_provider,
+    )
+    from .twitter.twitter_action_provider import TwitterActionProvider, twitter_action_provider
+    from .wallet.async_wallet_action_provider import (
+        AsyncWalletActionProvider,
+        async_wallet_action_provider,
+    )
+    from .wallet.wallet_action_provider import WalletActionProvider, wallet_action_provider
+    from .weth.weth_action_provider import WethActionProvider, weth_action_provider
+    from .wow.wow_action_provider import WowActionProvider, wow_action_provider
+
+# Module defining each lazily imported name
+_LAZY_IMPORTS = {
+    "AlloraActionProvider": ".allora.allora_action_provider",
+    "allora_action_provider": ".allora.allora_action_provider",
+    "BasenameActionProvider": ".basename.basename_action_provider",
+    "basename_action_provider": ".basename.basename_action_provider",
+    "CdpApiActionProvider": ".cdp.cdp_api_action_provider",
+    "cdp_api_action_provider": ".cdp.cdp_api_action_provider",
+    "CompoundActionProvider": ".compound.compound_action_provider",
+    "compound_action_provider": ".compound.compound_action_provider",
+    "ERC20ActionProvider": ".erc20.erc20_action_provider",
+    "erc20_action_provider": ".erc20.erc20_action_provider",
+    "HyperbolicActionProvider": ".hyperboliclabs.hyperbolic_action_provider",
+    "hyperbolic_action_provider": ".hyperboliclabs.hyperbolic_action_provider",
+    "MorphoActionProvider": ".morpho.morpho_action_provider",
+    "morpho_action_provider": ".morpho.morpho_action_provider",
+    "NillionActionProvider": ".nillion.nillion_action_provider",
+    "nillion_action_provider": ".nillion.nillion_action_provider",
+    "OnrampActionProvider": ".onramp.onramp_action_provider",
+    "onramp_action_provider": ".onramp.onramp_action_provider",
+    "PythActionProvider": ".pyth.pyth_action_provider",
+    "pyth_action_provider": ".pyth.pyth_action_provider",
+    "SshActionProvider": ".ssh.ssh_action_provider",
+    "ssh_action_provider": ".ssh.ssh_action_provider",
+    "SuperfluidActionProvider": ".superfluid.superfluid_action_provider",
+    "superfluid_action_provider": ".superfluid.superfluid_action_provider",
+    "TwitterActionProvider": ".twitter.twitter_action_provider",
+    "twitter_action_provider": ".twitter.twitter_action_provider",
+    "AsyncWalletActionProvider": ".wallet.async_wallet_action_provider",
+    "async_wallet_action_provider": ".wallet.async_wallet_action_provider",
+    "WalletActionProvider": ".wallet.wallet_action_provider",
+    "wallet_action_provider": ".wallet.wallet_action_provider",
+    "WethActionProvider": ".weth.weth_action_provider",
+    "weth_action_provider": ".weth.weth_action_provider",
+    "WowActionProvider": ".wow.wow_action_provider",
+    "wow_action_provider": ".wow.wow_action_provider",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an action provider on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including those not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "Action",
@@ -60,6 +124,8 @@ __all__ = [
     "twitter_action_provider",
     "WalletActionProvider",
     "wallet_action_provider",
+    "AsyncWalletActionProvider",
+    "async_wallet_action_provider",
     "WethActionProvider",
     "weth_action_provider",
     "WowActionProvider",
@@ -1,13 +1,17 @@
 """Decorator utilities for creating and managing actions."""
 
+import contextlib
 import inspect
+import threading
+import weakref
 from collections.abc import Callable
 from functools import wraps
 from typing import Any, TypedDict
 
 from pydantic import BaseModel
 
-from ..analytics import RequiredEventData, send_analytics_event
+from ..analytics import RequiredEventData, analytics_enabled, send_analytics_event
+from ..metrics import record_action_result, track_action
 
 
 class WalletMetadata(TypedDict):
@@ -20,6 +24,46 @@ class WalletMetadata(TypedDict):
     protocol_family: str
 
 
+# Wallet metadata sent with action events, computed once per wallet provider
+_wallet_metadata_cache: "weakref.WeakKeyDictionary[Any, WalletMetadata]" = (
+    weakref.WeakKeyDictionary()
+)
+_wallet_metadata_lock = threading.Lock()
+
+
+def _get_wallet_metadata(wallet_provider: Any) -> WalletMetadata:
+    """Get the analytics metadata of a wallet provider, computing it on first use.
+
+    Args:
+        wallet_provider: The wallet provider passed to the action.
+
+    Returns:
+        WalletMetadata: The wallet provider's name, address and network.
+
+    """
+    with _wallet_metadata_lock:
+        try:
+            cached = _wallet_metadata_cache.get(wallet_provider)
+        except TypeError:
+            cached = None
+    if cached is not None:
+        return cached
+
+    network = wallet_provider.get_network()
+    wallet_metadata = WalletMetadata(
+        wallet_provider=wallet_provider.get_name(),
+        wallet_address=wallet_provider.get_address(),
+        network_id=network.network_id or "",
+        chain_id=network.chain_id or "",
+        protocol_family=network.protocol_family,
+    )
+
+    # Providers that cannot be weakly referenced are described on every call
+    with _wallet_metadata_lock, contextlib.suppress(TypeError):
+        _wallet_metadata_cache[wallet_provider] = wallet_metadata
+    return wallet_metadata
+
+
 class ActionMetadata(BaseModel):
     """Metadata for an action."""
 
@@ -28,10 +72,33 @@ class ActionMetadata(BaseModel):
     args_schema: type[BaseModel] | None
     invoke: Callable
     wallet_provider: bool = False
-
-
-def create_action(name: str, description: str, schema: type[BaseModel] | None = None):
-    """Decorate an action with a name, description, and schema."""
+    read_only: bool = False
+    validates_args: bool = False
+    is_async: bool = False
+
+
+def create_action(
+    name: str,
+    description: str,
+    schema: type[BaseModel] | None = None,
+    read_only: bool = False,
+    validates_args: bool = False,
+):
+    """Decorate an action with a name, description, and schema.
+
+    Actions marked read_only do not change any state, so AgentKit may run them
+    concurrently with other actions on the same wallet. Other actions that take a wallet
+    provider hold a lock on it while they run, so they never overlap with each other on
+    the same wallet provider, even when several agents or threads share it. Actions on
+    different wallet providers are not serialized. Actions marked validates_args
+    build their schema from the raw arguments themselves, so framework tools pass the
+    arguments through without validating them a second time. Actions declared with
+    ``async def`` take an async wallet provider and are awaited with ``AgentKit.ainvoke``.
+
+    Every invocation records its wall time, wallet calls, receipt wait time, HTTP calls
+    and errors to the metrics sink, under the action's name. An action that returns an
+    "Error ..." message instead of raising is counted as failed.
+    """
 
     def decorator(func: Callable) -> Callable:
         signature = inspect.signature(func)
@@ -41,36 +108,46 @@ def create_action(name: str, description: str, schema: type[BaseModel] | None =
         method_name = func.__name__
         prefixed_name = f"{class_name}_{method_name}"
 
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            wallet_metadata = {}
-
-            if has_wallet_provider:
-                network = args[1].get_network()
-                wallet_metadata = WalletMetadata(
-                    wallet_provider=args[1].get_name(),
-                    wallet_address=args[1].get_address(),
-                    network_id=network.network_id or "",
-                    chain_id=network.chain_id or "",
-                    protocol_family=network.protocol_family,
+        def track_invocation(args: tuple[Any, ...]) -> None:
+            if not analytics_enabled():
+                return
+            try:
+                wallet_metadata = _get_wallet_metadata(args[1]) if has_wallet_provider else {}
+
+                event_data = RequiredEventData(
+                    name="agent_action_invocation",
+                    action="invoke_action",
+                    component="agent_action",
+                    action_name=prefixed_name,
+                    class_name=class_name,
+                    method_name=method_name,
+                    **wallet_metadata,
                 )
 
-            event_data = RequiredEventData(
-                name="agent_action_invocation",
-                action="invoke_action",
-                component="agent_action",
-                action_name=prefixed_name,
-                class_name=class_name,
-                method_name=method_name,
-                **wallet_metadata,
-            )
-
-            try:
                 send_analytics_event(event_data)
             except Exception as e:
                 print(f"Warning: Failed to track action invocation: {e}")
 
-            return func(*args, **kwargs)
+        is_async = inspect.iscoroutinefunction(func)
+        if is_async:
+
+            @wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                track_invocation(args)
+                with track_action(prefixed_name):
+                    result = await func(*args, **kwargs)
+                    record_action_result(result)
+                    return result
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                track_invocation(args)
+                with track_action(prefixed_name):
+                    result = func(*args, **kwargs)
+                    record_action_result(result)
+                    return result
 
         wrapper._action_metadata = ActionMetadata(
             name=prefixed_name,
@@ -78,15 +155,12 @@ def create_action(name: str, description: str, schema: type[BaseModel] | None =
             args_schema=schema,
             invoke=wrapper,
             wallet_provider=has_wallet_provider,
+            read_only=read_only,
+            # Actions without a schema have no arguments to validate
+            validates_args=validates_args or schema is None,
+            is_async=is_async,
         )
 
-        def _add_to_actions(owner: Any) -> None:
-            if not hasattr(owner, "_actions"):
-                owner._actions = []
-            owner._actions.append(wrapper._action_metadata)
-
-        wrapper._add_to_actions = _add_to_actions
-
         return wrapper
 
     return decorator
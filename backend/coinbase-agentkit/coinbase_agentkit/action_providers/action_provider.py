@@ -1,15 +1,146 @@
 """Base class for action providers."""
 
+import asyncio
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..network import Network
-from ..wallet_providers import WalletProvider
+from ..wallet_providers import AsyncWalletProvider, WalletProvider
+from .action_decorator import ActionMetadata
 
-TWalletProvider = TypeVar("TWalletProvider", bound=WalletProvider)
+TWalletProvider = TypeVar("TWalletProvider", bound=WalletProvider | AsyncWalletProvider)
+
+# Locks serializing the actions that change a wallet's state, by wallet provider
+_wallet_locks: "weakref.WeakKeyDictionary[WalletProvider, threading.RLock]" = (
+    weakref.WeakKeyDictionary()
+)
+_wallet_locks_lock = threading.Lock()
+
+# Locks serializing the async actions that change a wallet's state, by async wallet provider
+_async_wallet_locks: "weakref.WeakKeyDictionary[AsyncWalletProvider, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_wallet_lock(wallet_provider: WalletProvider) -> threading.RLock:
+    """Get the lock serializing the actions that change a wallet's state.
+
+    Args:
+        wallet_provider: The wallet provider.
+
+    Returns:
+        threading.RLock: The lock shared by every action using the wallet provider.
+
+    """
+    with _wallet_locks_lock:
+        try:
+            lock = _wallet_locks.get(wallet_provider)
+        except TypeError:
+            # Wallet providers that cannot be weakly referenced are not serialized
+            return threading.RLock()
+        if lock is None:
+            lock = threading.RLock()
+            _wallet_locks[wallet_provider] = lock
+        return lock
+
+
+def _get_async_wallet_lock(wallet_provider: AsyncWalletProvider) -> asyncio.Lock:
+    """Get the lock serializing the async actions that change a wallet's state.
+
+    Args:
+        wallet_provider: The async wallet provider.
+
+    Returns:
+        asyncio.Lock: The lock shared by every async action using the wallet provider.
+
+    """
+    with _wallet_locks_lock:
+        try:
+            lock = _async_wallet_locks.get(wallet_provider)
+        except TypeError:
+            return asyncio.Lock()
+        if lock is None:
+            lock = asyncio.Lock()
+            _async_wallet_locks[wallet_provider] = lock
+        return lock
+
+
+def _resolve_wallet(wallet_ref: TWalletProvider | weakref.ref[TWalletProvider]) -> TWalletProvider:
+    """Get the wallet provider an action was built for.
+
+    Args:
+        wallet_ref: The wallet provider, or a weak reference to it.
+
+    Returns:
+        TWalletProvider: The wallet provider.
+
+    Raises:
+        ReferenceError: If the wallet provider no longer exists.
+
+    """
+    if not isinstance(wallet_ref, weakref.ref):
+        return wallet_ref
+    wallet_provider = wallet_ref()
+    if wallet_provider is None:
+        raise ReferenceError("The wallet provider of this action no longer exists")
+    return wallet_provider
+
+
+def _invoke_action(
+    action_metadata: ActionMetadata,
+    provider: "ActionProvider",
+    wallet_provider: WalletProvider,
+    args: dict[str, Any],
+) -> Any:
+    """Invoke an action, holding the wallet lock if it may change the wallet's state.
+
+    Args:
+        action_metadata: The action.
+        provider: The action provider declaring the action.
+        wallet_provider: The wallet provider the action is built for.
+        args: The action arguments.
+
+    Returns:
+        Any: The action result.
+
+    """
+    if not action_metadata.wallet_provider:
+        return action_metadata.invoke(provider, args)
+    if action_metadata.read_only:
+        return action_metadata.invoke(provider, wallet_provider, args)
+    with _get_wallet_lock(wallet_provider):
+        return action_metadata.invoke(provider, wallet_provider, args)
+
+
+async def _ainvoke_action(
+    action_metadata: ActionMetadata,
+    provider: "ActionProvider",
+    wallet_provider: AsyncWalletProvider,
+    args: dict[str, Any],
+) -> Any:
+    """Await an async action, holding the wallet lock if it may change the wallet's state.
+
+    Args:
+        action_metadata: The async action.
+        provider: The action provider declaring the action.
+        wallet_provider: The async wallet provider the action is built for.
+        args: The action arguments.
+
+    Returns:
+        Any: The action result.
+
+    """
+    if not action_metadata.wallet_provider:
+        return await action_metadata.invoke(provider, args)
+    if action_metadata.read_only:
+        return await action_metadata.invoke(provider, wallet_provider, args)
+    async with _get_async_wallet_lock(wallet_provider):
+        return await action_metadata.invoke(provider, wallet_provider, args)
 
 
 class Action(BaseModel):
@@ -19,41 +150,113 @@ class Action(BaseModel):
     description: str
     args_schema: type[BaseModel] | None = None
     invoke: Callable = Field(..., exclude=True)
+    read_only: bool = False
+    validates_args: bool = False
+    is_async: bool = False
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    async def ainvoke(self, args: dict[str, Any]) -> Any:
+        """Invoke the action from an event loop.
+
+        Async actions are awaited on the loop, other actions run on a worker thread so
+        they do not block it.
+
+        Args:
+            args: The action arguments.
+
+        Returns:
+            Any: The action result.
+
+        """
+        if self.is_async:
+            return await self.invoke(args)
+        return await asyncio.to_thread(self.invoke, args)
+
 
 class ActionProvider(Generic[TWalletProvider], ABC):
     """Base class for all action providers."""
 
+    # Metadata of the actions declared on the class and its bases, collected once per class
+    _class_actions: tuple[ActionMetadata, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the actions declared on a new subclass and its bases."""
+        super().__init_subclass__(**kwargs)
+
+        actions: dict[str, ActionMetadata] = {}
+        for klass in reversed(cls.__mro__):
+            for attribute_name, value in vars(klass).items():
+                metadata = getattr(value, "_action_metadata", None)
+                if isinstance(metadata, ActionMetadata):
+                    actions[attribute_name] = metadata
+                else:
+                    # A subclass may override an action with a plain method
+                    actions.pop(attribute_name, None)
+
+        cls._class_actions = tuple(actions[name] for name in sorted(actions))
+
     def __init__(
         self, name: str, action_providers: list["ActionProvider[TWalletProvider]"]
     ) -> None:
         self.name = name
         self.action_providers = action_providers
-
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            if hasattr(method, "_add_to_actions"):
-                method._add_to_actions(self)
+        self._actions_lock = threading.Lock()
+        self._actions_by_wallet: weakref.WeakKeyDictionary[WalletProvider, list[Action]] = (
+            weakref.WeakKeyDictionary()
+        )
 
     def get_actions(self, wallet_provider: TWalletProvider) -> list[Action]:
-        """Get all actions from this provider and its sub-providers."""
+        """Get all actions from this provider and its sub-providers.
+
+        The actions are built once per wallet provider and reused on later calls. Actions
+        that use the wallet provider and are not read-only never run at the same time as
+        each other on the same wallet provider.
+        """
+        with self._actions_lock:
+            try:
+                actions = self._actions_by_wallet.get(wallet_provider)
+            except TypeError:
+                return self._build_actions(wallet_provider)
+            if actions is None:
+                actions = self._build_actions(wallet_provider)
+                self._actions_by_wallet[wallet_provider] = actions
+        return list(actions)
+
+    def _build_actions(self, wallet_provider: TWalletProvider) -> list[Action]:
+        """Build the actions of this provider and its sub-providers for a wallet provider.
+
+        The actions hold a weak reference to the wallet provider, so the actions cached for
+        a wallet provider do not keep it alive. Actions that use the wallet provider are
+        built for it when they are async and it is an AsyncWalletProvider, or when both
+        are synchronous.
+        """
         actions: list[Action] = []
         action_providers = [self, *self.action_providers]
 
+        wallet_ref: TWalletProvider | weakref.ref[TWalletProvider]
+        try:
+            wallet_ref = weakref.ref(wallet_provider)
+        except TypeError:
+            # Actions of wallet providers that cannot be weakly referenced are not cached
+            wallet_ref = wallet_provider
+
+        wallet_is_async = isinstance(wallet_provider, AsyncWalletProvider)
         for provider in action_providers:
-            provider_actions = getattr(provider, "_actions", [])
-            for action_metadata in provider_actions:
+            for action_metadata in provider._class_actions:
+                if action_metadata.wallet_provider and action_metadata.is_async != wallet_is_async:
+                    continue
+                invoke_action = _ainvoke_action if action_metadata.is_async else _invoke_action
                 actions.append(
                     Action(
                         name=action_metadata.name,
                         description=action_metadata.description,
                         args_schema=action_metadata.args_schema,
-                        invoke=lambda args, m=action_metadata, p=provider: (
-                            m.invoke(p, wallet_provider, args)
-                            if m.wallet_provider
-                            else m.invoke(p, args)
+                        read_only=action_metadata.read_only,
+                        validates_args=action_metadata.validates_args,
+                        is_async=action_metadata.is_async,
+                        invoke=lambda args, m=action_metadata, p=provider, i=invoke_action: i(
+                            m, p, _resolve_wallet(wallet_ref), args
                         ),
                     )
                 )
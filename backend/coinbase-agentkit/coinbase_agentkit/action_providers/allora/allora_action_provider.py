@@ -12,6 +12,7 @@ from allora_sdk.v2.api_client import (
     PriceInferenceToken,
 )
 
+from ...metrics import track_http_request
 from ...network import Network
 from ...wallet_providers import WalletProvider
 from ..action_decorator import create_action
@@ -81,7 +82,8 @@ class AlloraActionProvider(ActionProvider[WalletProvider]):
         """
         loop = asyncio.new_event_loop()
         try:
-            return loop.run_until_complete(coro)
+            with track_http_request("allora"):
+                return loop.run_until_complete(coro)
         finally:
             loop.close()
 
@@ -119,6 +121,7 @@ Key fields:
 A failure response will return an error message with details.
         """,
         schema=GetAllTopicsInput,
+        read_only=True,
     )
     def get_all_topics(self, args: dict[str, Any]) -> str:
         """Get all available topics from Allora Network."""
@@ -155,6 +158,7 @@ The network_inference_normalized field is the normalized inference for the topic
 A failure response will return an error message with details.
         """,
         schema=GetInferenceByTopicIdInput,
+        read_only=True,
     )
     def get_inference_by_topic_id(self, args: dict[str, Any]) -> str:
         """Get inference data for a specific topic."""
@@ -189,6 +193,7 @@ A successful response will return a message with the price inference. Example:
 A failure response will return an error message with details.
         """,
         schema=GetPriceInferenceInput,
+        read_only=True,
     )
     def get_price_inference(self, args: dict[str, Any]) -> str:
         """Get price inference for a token/timeframe pair."""
@@ -1,6 +1,6 @@
 """CDP API action provider."""
 
-import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any, Literal, TypeVar
 
 from cdp import CdpClient
@@ -12,6 +12,7 @@ from ..action_provider import ActionProvider
 from .schemas import RequestFaucetFundsSchema
 
 TWalletProvider = TypeVar("TWalletProvider", bound=EvmWalletProvider)
+T = TypeVar("T")
 
 
 class CdpApiActionProvider(ActionProvider[TWalletProvider]):
@@ -23,24 +24,29 @@ class CdpApiActionProvider(ActionProvider[TWalletProvider]):
     def __init__(self):
         super().__init__("cdp_api", [])
 
-    def _get_client(self, wallet_provider: TWalletProvider) -> CdpClient:
-        """Get the CDP client from the wallet provider if it has one.
+    def _run_with_client(
+        self,
+        wallet_provider: TWalletProvider,
+        operation: Callable[[CdpClient], Awaitable[T]],
+    ) -> T:
+        """Run an operation on the wallet provider's long-lived CDP client.
 
         Args:
-            wallet_provider: The wallet provider to get the client from.
+            wallet_provider: The wallet provider that owns the client.
+            operation: Callable that takes the CDP client and returns an awaitable.
 
         Returns:
-            CdpClient: The CDP client.
+            T: The result of the operation.
 
         Raises:
-            AttributeError: If the wallet provider doesn't have a get_client method.
+            AttributeError: If the wallet provider doesn't have a run_with_client method.
 
         """
-        if not hasattr(wallet_provider, "get_client"):
+        if not hasattr(wallet_provider, "run_with_client"):
             raise AttributeError(
-                "Wallet provider must have a get_client method to use CDP API actions"
+                "Wallet provider must have a run_with_client method to use CDP API actions"
             )
-        return wallet_provider.get_client()
+        return wallet_provider.run_with_client(operation)
 
     @create_action(
         name="request_faucet_funds",
@@ -52,6 +58,7 @@ If fauceting on 'solana-devnet', user can only provide asset ID 'sol' or 'usdc',
 You are not allowed to faucet with any other network or asset ID. If you are on another network, suggest that the user sends you some ETH
 from another wallet and provide the user with your wallet details.""",
         schema=RequestFaucetFundsSchema,
+        validates_args=True,
     )
     def request_faucet_funds(self, wallet_provider: TWalletProvider, args: dict[str, Any]) -> str:
         """Request test tokens from the faucet.
@@ -73,45 +80,31 @@ from another wallet and provide the user with your wallet details.""",
                 return "Error: Faucet is only supported on 'base-sepolia' or 'ethereum-sepolia' evm networks."
 
             token: Literal["eth", "usdc", "eurc", "cbbtc"] = validated_args.asset_id or "eth"
-
-            client = self._get_client(wallet_provider)
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            async def _request_faucet():
-                async with client as cdp:
-                    return await cdp.evm.request_faucet(
-                        address=wallet_provider.get_address(),
-                        token=token,
-                        network=network_id,
-                    )
-
-            faucet_hash = loop.run_until_complete(_request_faucet())
+            address = wallet_provider.get_address()
+
+            faucet_hash = self._run_with_client(
+                wallet_provider,
+                lambda cdp: cdp.evm.request_faucet(
+                    address=address,
+                    token=token,
+                    network=network_id,
+                ),
+            )
             return f"Received {validated_args.asset_id or 'ETH'} from the faucet. Transaction hash: {faucet_hash}"
         elif network.protocol_family == "svm":
             if network_id != "solana-devnet":
                 return "Error: Faucet is only supported on 'solana-devnet' solana networks."
 
             token: Literal["sol", "usdc"] = validated_args.asset_id or "sol"
-
-            client = self._get_client(wallet_provider)
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            async def _request_faucet():
-                async with client as cdp:
-                    return await cdp.solana.request_faucet(
-                        address=wallet_provider.get_address(),
-                        token=token,
-                    )
-
-            response = loop.run_until_complete(_request_faucet())
+            address = wallet_provider.get_address()
+
+            response = self._run_with_client(
+                wallet_provider,
+                lambda cdp: cdp.solana.request_faucet(
+                    address=address,
+                    token=token,
+                ),
+            )
             return f"Received {validated_args.asset_id or 'SOL'} from the faucet. Transaction signature hash: {response.transaction_signature}"
         else:
             return "Error: Faucet is only supported on Ethereum and Solana protocol families."
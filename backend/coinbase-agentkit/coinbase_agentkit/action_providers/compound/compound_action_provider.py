@@ -16,21 +16,22 @@ from .constants import (
     COMET_ADDRESSES,
     SUPPORTED_NETWORKS,
 )
+from .ladder import build_health_ladder
+from .rates import load_market_rates
 from .schemas import (
     CompoundBorrowSchema,
+    CompoundHealthLadderSchema,
     CompoundPortfolioSchema,
+    CompoundRatesSchema,
     CompoundRepaySchema,
     CompoundSupplySchema,
     CompoundWithdrawSchema,
 )
+from .snapshot import load_position_snapshot
 from .utils import (
     format_amount_from_decimals,
     format_amount_with_decimals,
-    get_base_token_address,
-    get_collateral_balance,
     get_health_ratio,
-    get_health_ratio_after_borrow,
-    get_health_ratio_after_withdraw,
     get_portfolio_details_markdown,
     get_token_balance,
     get_token_decimals,
@@ -68,6 +69,7 @@ Important notes:
 - The token must be an approved collateral asset for the Compound market
 """,
         schema=CompoundSupplySchema,
+        validates_args=True,
     )
     def supply(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Supply collateral assets to Compound.
@@ -166,6 +168,7 @@ Important notes:
 - The token must be a collateral asset you have supplied to the Compound market
 """,
         schema=CompoundWithdrawSchema,
+        validates_args=True,
     )
     def withdraw(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Withdraw collateral assets from Compound.
@@ -188,17 +191,18 @@ Important notes:
             decimals = get_token_decimals(wallet_provider, token_address)
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
+            # Read the position once for both pre-withdraw checks
+            snapshot = load_position_snapshot(wallet_provider, comet_address)
+
             # Check that there is enough balance supplied to withdraw amount
-            collateral_balance = get_collateral_balance(
-                wallet_provider, comet_address, token_address
-            )
+            collateral_balance = snapshot.get_collateral_balance(token_address)
             if amount_atomic > collateral_balance:
                 human_balance = format_amount_from_decimals(collateral_balance, decimals)
                 return f"Error: Insufficient balance. Trying to withdraw {validated_args.amount}, but only have {human_balance} supplied"
 
             # Check if position would be healthy after withdrawal
-            projected_health_ratio = get_health_ratio_after_withdraw(
-                wallet_provider, comet_address, token_address, amount_atomic
+            projected_health_ratio = snapshot.health_ratio_after_withdraw(
+                token_address, amount_atomic
             )
 
             if projected_health_ratio < 1:
@@ -223,7 +227,7 @@ Important notes:
                 return f"Error executing transaction: {e!s}"
 
             # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
+            current_health = snapshot.health_ratio()
 
             # Get new health ratio
             new_health = get_health_ratio(wallet_provider, comet_address)
@@ -260,6 +264,7 @@ Important notes:
 - You must have sufficient collateral to borrow
 """,
         schema=CompoundBorrowSchema,
+        validates_args=True,
     )
     def borrow(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Borrow base assets from Compound.
@@ -275,22 +280,23 @@ Important notes:
         try:
             validated_args = CompoundBorrowSchema(**args)
             comet_address = self._get_comet_address(wallet_provider.get_network())
-            base_token_address = get_base_token_address(wallet_provider, comet_address)
-            base_token_decimals = get_token_decimals(wallet_provider, base_token_address)
+            # Read the position once for both the current and the projected health ratio
+            snapshot = load_position_snapshot(wallet_provider, comet_address)
+            base_token_address = snapshot.market.base_token
 
             # Convert human-readable amount to atomic amount
-            amount_atomic = format_amount_with_decimals(validated_args.amount, base_token_decimals)
+            amount_atomic = format_amount_with_decimals(
+                validated_args.amount, snapshot.market.base_decimals
+            )
 
             # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
+            current_health = snapshot.health_ratio()
             current_health_str = (
                 "Infinity" if current_health == Decimal("Infinity") else f"{current_health:.2f}"
             )
 
             # Check if position would be healthy after borrow
-            projected_health_ratio = get_health_ratio_after_borrow(
-                wallet_provider, comet_address, amount_atomic
-            )
+            projected_health_ratio = snapshot.health_ratio_after_borrow(amount_atomic)
 
             if projected_health_ratio < 1:
                 return f"Error: Borrowing {validated_args.amount} USDC would result in an unhealthy position. Health ratio would be {projected_health_ratio:.2f}"
@@ -337,6 +343,7 @@ Important notes:
 - You must have sufficient balance of the asset you want to repay
 """,
         schema=CompoundRepaySchema,
+        validates_args=True,
     )
     def repay(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Repay borrowed assets to Compound.
@@ -424,6 +431,7 @@ Returns portfolio details including:
 Formatted in Markdown for readability.
 """,
         schema=CompoundPortfolioSchema,
+        read_only=True,
     )
     def get_portfolio(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Get portfolio details from Compound.
@@ -442,6 +450,90 @@ Formatted in Markdown for readability.
         except Exception as e:
             return f"Error getting portfolio details: {e!s}"
 
+    @create_action(
+        name="get_health_ladder",
+        description="""
+This tool shows how the health ratio of the Compound position would change before borrowing, repaying, supplying or withdrawing.
+It takes:
+- target_health_ratio: The lowest health ratio considered safe, defaults to 1
+- steps: The number of intervals each curve is divided into, defaults to 10
+
+Returns, from a single read of the position:
+- The maximum amount that can be borrowed while staying at or above the target health ratio
+- The maximum amount of each supplied asset that can be withdrawn while staying at or above it
+- The health ratio after borrowing, repaying, supplying or withdrawing increasing amounts
+Formatted in Markdown for readability.
+Use it to size a borrow or withdrawal instead of trying several amounts.
+""",
+        schema=CompoundHealthLadderSchema,
+        validates_args=True,
+        read_only=True,
+    )
+    def get_health_ladder(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get the health ratio ladder of the wallet's Compound position.
+
+        Args:
+            wallet_provider: The wallet to use for getting details.
+            args: The input arguments containing the target health ratio and steps.
+
+        Returns:
+            str: A markdown formatted string with the maximum safe amounts and curves.
+
+        """
+        try:
+            validated_args = CompoundHealthLadderSchema(**args)
+            comet_address = self._get_comet_address(wallet_provider.get_network())
+            snapshot = load_position_snapshot(wallet_provider, comet_address)
+            # The ladder sizes real borrows and withdrawals, so its ratios must not be
+            # rounded through floating point
+            ladder = build_health_ladder(
+                snapshot,
+                Decimal(validated_args.target_health_ratio),
+                validated_args.steps,
+                exact=True,
+            )
+            return ladder.to_markdown()
+        except Exception as e:
+            return f"Error getting health ratio ladder: {e!s}"
+
+    @create_action(
+        name="get_rates",
+        description="""
+This tool gets the utilization and the supply and borrow APRs of the Compound market.
+It takes:
+- supply_amount: An amount of the base token to project the rates after supplying, defaults to 0
+- borrow_amount: An amount of the base token to project the rates after borrowing, defaults to 0
+
+Returns the market's total supply and borrow, and the utilization and APRs now and after the given amounts.
+Formatted in Markdown for readability.
+Rates are computed locally from Compound's interest rate model, so use it to compare yields at several amounts.
+""",
+        schema=CompoundRatesSchema,
+        validates_args=True,
+        read_only=True,
+    )
+    def get_rates(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get the interest rates of the Compound market.
+
+        Args:
+            wallet_provider: The wallet to use for reading the market.
+            args: The input arguments containing the supply and borrow amounts.
+
+        Returns:
+            str: A markdown formatted string with the utilization and rates.
+
+        """
+        try:
+            validated_args = CompoundRatesSchema(**args)
+            comet_address = self._get_comet_address(wallet_provider.get_network())
+            rates = load_market_rates(wallet_provider, comet_address)
+            return rates.to_markdown(
+                format_amount_with_decimals(validated_args.supply_amount, rates.base_decimals),
+                format_amount_with_decimals(validated_args.borrow_amount, rates.base_decimals),
+            )
+        except Exception as e:
+            return f"Error getting market rates: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by Compound."""
         return network.protocol_family == "evm" and network.network_id in SUPPORTED_NETWORKS
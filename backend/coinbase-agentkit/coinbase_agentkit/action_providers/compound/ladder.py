@@ -0,0 +1,390 @@
+"""What-if health ratios of a Compound position over grids of amounts."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from math import floor
+from typing import Any
+
+from web3 import Web3
+
+from .snapshot import FACTOR_DECIMALS, PRICE_DECIMALS, CometPositionSnapshot
+
+# Number of intervals each curve of a ladder is divided into
+DEFAULT_LADDER_STEPS = 10
+
+# Health ratio below which the borrow and withdraw actions refuse to proceed
+DEFAULT_TARGET_HEALTH_RATIO = Decimal(1)
+
+
+@dataclass
+class LadderPoint:
+    """The health ratio of a position after changing it by an amount."""
+
+    amount: Decimal
+    health_ratio: Decimal
+
+
+@dataclass
+class HealthLadder:
+    """Health ratios of a position over ranges of borrow, repay, supply and withdraw amounts."""
+
+    block_number: int | None
+    base_symbol: str
+    target_health_ratio: Decimal
+    health_ratio: Decimal
+    # Largest amounts keeping the health ratio at or above the target, in human units
+    max_borrow: Decimal
+    max_withdraw: dict[str, Decimal] = field(default_factory=dict)
+    # Curves by "<operation> <token symbol>", e.g. "borrow USDC"
+    curves: dict[str, list[LadderPoint]] = field(default_factory=dict)
+
+    def to_markdown(self) -> str:
+        """Format the ladder as markdown.
+
+        Returns:
+            str: Markdown formatted maximum amounts and health ratio curves
+
+        """
+        markdown_output = "# Health Ratio Ladder\n\n"
+        if self.block_number is not None:
+            markdown_output += f"- **Block:** {self.block_number}\n"
+        markdown_output += f"- **Current Health Ratio:** {self.health_ratio:.2f}\n"
+        markdown_output += f"- **Target Health Ratio:** {self.target_health_ratio:.2f}\n"
+        markdown_output += f"- **Max Safe Borrow:** {self.max_borrow:f} {self.base_symbol}\n"
+        for symbol, amount in self.max_withdraw.items():
+            markdown_output += f"- **Max Safe Withdraw:** {amount:f} {symbol}\n"
+
+        for name, points in self.curves.items():
+            markdown_output += f"\n## {name[0].upper()}{name[1:]}\n\n"
+            markdown_output += "| Amount | Health Ratio |\n|---|---|\n"
+            for point in points:
+                markdown_output += f"| {point.amount:f} | {point.health_ratio:.2f} |\n"
+
+        return markdown_output
+
+
+def _collateral_weights(snapshot: CometPositionSnapshot) -> dict[str, Fraction]:
+    """Get the risk-adjusted USD value of one atomic unit of each collateral asset.
+
+    Args:
+        snapshot: The position.
+
+    Returns:
+        dict[str, Fraction]: Price times borrow collateral factor, by asset address.
+
+    """
+    return {
+        asset.address: Fraction(
+            snapshot.prices[asset.price_feed] * asset.borrow_collateral_factor,
+            10 ** (asset.decimals + PRICE_DECIMALS + FACTOR_DECIMALS),
+        )
+        for asset in snapshot.market.assets
+    }
+
+
+def _base_price(snapshot: CometPositionSnapshot) -> Fraction:
+    """Get the USD value of one atomic unit of the base token.
+
+    Args:
+        snapshot: The position.
+
+    Returns:
+        Fraction: The price of an atomic unit.
+
+    """
+    market = snapshot.market
+    return Fraction(
+        snapshot.prices[market.base_price_feed], 10 ** (market.base_decimals + PRICE_DECIMALS)
+    )
+
+
+def _to_decimal(value: Fraction) -> Decimal:
+    """Convert an exact ratio to a Decimal.
+
+    Args:
+        value: The ratio.
+
+    Returns:
+        Decimal: The ratio, rounded to the current Decimal precision.
+
+    """
+    return Decimal(value.numerator) / Decimal(value.denominator)
+
+
+def _to_amount(amount: int, decimals: int) -> Decimal:
+    """Convert an atomic amount to a human-readable amount without trailing zeros.
+
+    Args:
+        amount: The amount in atomic units.
+        decimals: The number of decimals of the token.
+
+    Returns:
+        Decimal: The human-readable amount.
+
+    """
+    return (Decimal(amount) / Decimal(10**decimals)).normalize()
+
+
+def _collateral_value(snapshot: CometPositionSnapshot) -> Fraction:
+    """Get the risk-adjusted USD value of the position's collateral.
+
+    Args:
+        snapshot: The position.
+
+    Returns:
+        Fraction: Σ balance * price * borrow collateral factor.
+
+    """
+    weights = _collateral_weights(snapshot)
+    return sum(
+        (
+            snapshot.collateral_balances.get(address, 0) * weight
+            for address, weight in weights.items()
+        ),
+        Fraction(0),
+    )
+
+
+def _target(target_health_ratio: Decimal | str) -> Fraction:
+    """Validate a target health ratio.
+
+    Args:
+        target_health_ratio: The target health ratio.
+
+    Returns:
+        Fraction: The target as an exact ratio.
+
+    Raises:
+        ValueError: If the target is not a positive number.
+
+    """
+    target = Decimal(target_health_ratio)
+    if not target.is_finite() or target <= 0:
+        raise ValueError(f"Target health ratio must be a positive number, got {target}")
+    return Fraction(target)
+
+
+def max_safe_borrow(
+    snapshot: CometPositionSnapshot,
+    target_health_ratio: Decimal | str = DEFAULT_TARGET_HEALTH_RATIO,
+) -> int:
+    """Get the largest additional borrow keeping the health ratio at or above a target.
+
+    Args:
+        snapshot: The position.
+        target_health_ratio: The lowest acceptable health ratio.
+
+    Returns:
+        int: The amount of base token in atomic units, 0 if nothing can be borrowed.
+
+    """
+    target = _target(target_health_ratio)
+    collateral = _collateral_value(snapshot)
+    return max(floor(collateral / (target * _base_price(snapshot))) - snapshot.borrow_balance, 0)
+
+
+def max_safe_withdraw(
+    snapshot: CometPositionSnapshot,
+    asset_address: str,
+    target_health_ratio: Decimal | str = DEFAULT_TARGET_HEALTH_RATIO,
+) -> int:
+    """Get the largest withdrawal of a collateral asset keeping the health ratio at a target.
+
+    Args:
+        snapshot: The position.
+        asset_address: The address of the asset to withdraw.
+        target_health_ratio: The lowest acceptable health ratio.
+
+    Returns:
+        int: The amount in atomic units, at most the supplied balance.
+
+    """
+    target = _target(target_health_ratio)
+    address = Web3.to_checksum_address(asset_address)
+    balance = snapshot.collateral_balances.get(address, 0)
+    weight = _collateral_weights(snapshot).get(address, Fraction(0))
+    if balance <= 0 or snapshot.borrow_balance == 0 or weight == 0:
+        return max(balance, 0)
+
+    excess = _collateral_value(snapshot) - target * snapshot.borrow_balance * _base_price(snapshot)
+    return min(balance, max(floor(excess / weight), 0))
+
+
+def _import_numpy() -> Any:
+    """Import NumPy, an optional dependency.
+
+    Returns:
+        The numpy module, or None if it is not installed.
+
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def evaluate_health_ratios(
+    snapshot: CometPositionSnapshot,
+    borrow_changes: Sequence[int],
+    collateral_changes: Mapping[str, Sequence[int]] | None = None,
+    exact: bool = False,
+) -> list[Decimal]:
+    """Calculate the health ratio of a position after each of many hypothetical changes.
+
+    Scenario k borrows borrow_changes[k] more base token, repaying when negative, and
+    supplies collateral_changes[asset][k] more of each asset, withdrawing when negative.
+    Balances changed below zero count as zero.
+
+    The scenarios are evaluated as arrays with NumPy when it is installed, in floating
+    point. Without NumPy, or with exact set, they are evaluated with exact integer
+    arithmetic and rounded once to a Decimal.
+
+    Args:
+        snapshot: The position.
+        borrow_changes: The change of the borrowed base token of each scenario, in atomic
+            units.
+        collateral_changes: The change of each collateral asset's balance by asset
+            address, in atomic units, one entry per scenario.
+        exact: Use exact arithmetic even when NumPy is installed.
+
+    Returns:
+        list[Decimal]: The health ratio of each scenario, infinity where nothing is borrowed.
+
+    Raises:
+        ValueError: If the changes do not have one entry per scenario, or an asset is not
+            collateral in the market.
+
+    """
+    weights = _collateral_weights(snapshot)
+    changes = {
+        Web3.to_checksum_address(address): list(amounts)
+        for address, amounts in (collateral_changes or {}).items()
+    }
+    unknown = set(changes) - set(weights)
+    if unknown:
+        raise ValueError(f"Not collateral in this market: {', '.join(sorted(unknown))}")
+    if any(len(amounts) != len(borrow_changes) for amounts in changes.values()):
+        raise ValueError("Every list of changes must have one entry per scenario")
+
+    np = None if exact else _import_numpy()
+
+    base_price = _base_price(snapshot)
+    if np is not None:
+        collateral = np.zeros(len(borrow_changes))
+        for address, weight in weights.items():
+            balance = snapshot.collateral_balances.get(address, 0)
+            balances = np.full(len(borrow_changes), float(balance))
+            if address in changes:
+                balances += np.asarray(changes[address], dtype=float)
+            collateral += np.clip(balances, 0, None) * float(weight)
+        borrowed = np.clip(
+            snapshot.borrow_balance + np.asarray(borrow_changes, dtype=float), 0, None
+        )
+        debt = borrowed * float(base_price)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(debt > 0, collateral / debt, np.inf)
+        return [Decimal(repr(float(ratio))) for ratio in ratios]
+
+    ratios = []
+    for k, borrow_change in enumerate(borrow_changes):
+        borrowed = max(snapshot.borrow_balance + borrow_change, 0)
+        if borrowed == 0:
+            ratios.append(Decimal("Infinity"))
+            continue
+        collateral = sum(
+            (
+                max(
+                    snapshot.collateral_balances.get(address, 0)
+                    + (changes[address][k] if address in changes else 0),
+                    0,
+                )
+                * weight
+                for address, weight in weights.items()
+            ),
+            Fraction(0),
+        )
+        ratios.append(_to_decimal(collateral / (borrowed * base_price)))
+    return ratios
+
+
+def build_health_ladder(
+    snapshot: CometPositionSnapshot,
+    target_health_ratio: Decimal | str = DEFAULT_TARGET_HEALTH_RATIO,
+    steps: int = DEFAULT_LADDER_STEPS,
+    exact: bool = False,
+) -> HealthLadder:
+    """Calculate the health ratio curves of a position and its largest safe changes.
+
+    The curves cover borrowing up to the largest safe borrow, repaying the whole borrow,
+    and, for every supplied asset, withdrawing the whole balance or supplying as much again.
+    All their points are evaluated in a single evaluate_health_ratios call.
+
+    Args:
+        snapshot: The position.
+        target_health_ratio: The lowest acceptable health ratio.
+        steps: Number of intervals each curve is divided into.
+        exact: Use exact arithmetic even when NumPy is installed.
+
+    Returns:
+        HealthLadder: The curves and the largest safe borrow and withdrawals.
+
+    Raises:
+        ValueError: If steps is not positive or the target is not a positive number.
+
+    """
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+    market = snapshot.market
+    max_borrow = max_safe_borrow(snapshot, target_health_ratio)
+    supplied = [
+        asset for asset in market.assets if snapshot.collateral_balances.get(asset.address, 0) > 0
+    ]
+
+    # Each curve's name, token decimals, collateral asset (None for the base token) and
+    # the change of balance at its last step, negative for repaying and withdrawing
+    curves: list[tuple[str, int, str | None, int]] = [
+        (f"borrow {market.base_symbol}", market.base_decimals, None, max_borrow),
+        (f"repay {market.base_symbol}", market.base_decimals, None, -snapshot.borrow_balance),
+    ]
+    for asset in supplied:
+        balance = snapshot.collateral_balances[asset.address]
+        curves.append((f"withdraw {asset.symbol}", asset.decimals, asset.address, -balance))
+        curves.append((f"supply {asset.symbol}", asset.decimals, asset.address, balance))
+    curves = [curve for curve in curves if curve[3] != 0]
+
+    amounts: list[int] = []
+    borrow_changes: list[int] = []
+    collateral_changes: dict[str, list[int]] = {asset.address: [] for asset in supplied}
+    for _, _, address, limit in curves:
+        for k in range(steps + 1):
+            change = int(Fraction(limit * k, steps))
+            amounts.append(abs(change))
+            borrow_changes.append(0 if address else change)
+            for asset_address, changes in collateral_changes.items():
+                changes.append(change if asset_address == address else 0)
+
+    ratios = evaluate_health_ratios(snapshot, borrow_changes, collateral_changes, exact=exact)
+
+    ladder = HealthLadder(
+        block_number=snapshot.block_number,
+        base_symbol=market.base_symbol,
+        target_health_ratio=Decimal(target_health_ratio),
+        health_ratio=snapshot.health_ratio(),
+        max_borrow=_to_amount(max_borrow, market.base_decimals),
+        max_withdraw={
+            asset.symbol: _to_amount(
+                max_safe_withdraw(snapshot, asset.address, target_health_ratio), asset.decimals
+            )
+            for asset in supplied
+        },
+    )
+    for i, (name, decimals, _, _) in enumerate(curves):
+        points = range(i * (steps + 1), (i + 1) * (steps + 1))
+        ladder.curves[name] = [
+            LadderPoint(amount=_to_amount(amounts[j], decimals), health_ratio=ratios[j])
+            for j in points
+        ]
+    return ladder
@@ -0,0 +1,470 @@
+"""Block-driven liquidation risk monitoring of many Compound accounts."""
+
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers.multicall import ContractCall
+from .constants import COMET_ABI, PRICE_FEED_ABI
+from .snapshot import CometMarket, CometPositionSnapshot, get_comet_market
+
+# Liquidation ratios below which an alert is emitted. Below 1 Compound can absorb a position.
+DEFAULT_ALERT_THRESHOLDS = (Decimal("1.1"), Decimal(1))
+
+# Seconds between checks for a new block while the monitor runs in the background
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Blocks after which every account is read again, so that accrued interest is reflected
+# even for accounts no log was emitted for
+DEFAULT_FULL_REFRESH_BLOCKS = 150
+
+# Largest block range searched for logs, beyond which every account is read again instead
+MAX_LOG_BLOCK_RANGE = 1000
+
+# Comet events emitted when an account's balances change, the account being one of the
+# first two indexed arguments
+COMET_ACCOUNT_EVENTS = (
+    "Supply(address,address,uint256)",
+    "Withdraw(address,address,uint256)",
+    "Transfer(address,address,uint256)",
+    "SupplyCollateral(address,address,address,uint256)",
+    "WithdrawCollateral(address,address,address,uint256)",
+    "TransferCollateral(address,address,address,uint256)",
+    "AbsorbDebt(address,address,uint256,uint256)",
+    "AbsorbCollateral(address,address,address,uint256,uint256)",
+)
+
+COMET_ACCOUNT_EVENT_TOPICS = [
+    Web3.to_hex(Web3.keccak(text=event)) for event in COMET_ACCOUNT_EVENTS
+]
+
+
+@dataclass
+class AccountHealth:
+    """The health of a watched account at a block."""
+
+    account: str
+    block_number: int
+    health_ratio: Decimal
+    liquidation_ratio: Decimal
+    snapshot: CometPositionSnapshot
+
+
+@dataclass
+class HealthAlert:
+    """An account's liquidation ratio crossed a threshold."""
+
+    account: str
+    block_number: int
+    threshold: Decimal
+    liquidation_ratio: Decimal
+    # None on the account's first reading
+    previous_liquidation_ratio: Decimal | None
+    # True when the ratio fell below the threshold, False when it recovered above it
+    below: bool
+
+
+def _topic_address(topic: Any) -> str:
+    """Get the address held by an indexed event argument.
+
+    Args:
+        topic: The 32-byte topic.
+
+    Returns:
+        str: The checksummed address.
+
+    """
+    return Web3.to_checksum_address("0x" + bytes(HexBytes(topic))[-20:].hex())
+
+
+class CompoundPositionMonitor:
+    """Tracks the liquidation risk of many accounts in a Compound market, block by block.
+
+    On each new block, the prices of the market's assets are read once and shared by every
+    account. Balances are only read again for accounts that Comet emitted a Supply,
+    Withdraw, Transfer, collateral or absorb log for since the previous block, for newly
+    watched accounts, and for every account each ``full_refresh_blocks`` blocks so that
+    accrued interest is reflected. Prices and balances are read together in one multicall,
+    pinned to the new block.
+
+    Health is then recomputed for every account and ``on_alert`` is called for each
+    threshold an account's liquidation ratio crossed. Blocks can be fed to ``refresh``
+    by the caller, e.g. from a newHeads subscription, or detected by a background thread
+    started with ``start``.
+    """
+
+    def __init__(
+        self,
+        wallet: EvmWalletProvider,
+        web3: Web3,
+        comet_address: str,
+        accounts: Iterable[str] = (),
+        on_alert: Callable[[HealthAlert], None] | None = None,
+        thresholds: Sequence[Decimal] = DEFAULT_ALERT_THRESHOLDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        full_refresh_blocks: int = DEFAULT_FULL_REFRESH_BLOCKS,
+    ):
+        """Initialize the monitor without reading anything.
+
+        Args:
+            wallet: The wallet provider contract reads are batched through.
+            web3: The Web3 instance used to look up new blocks and logs.
+            comet_address: The address of the Compound Comet contract.
+            accounts: The accounts to watch.
+            on_alert: Called with each alert, from the thread refreshing the monitor.
+            thresholds: Liquidation ratios crossing which emits an alert.
+            poll_interval: Seconds between checks for a new block in the background.
+            full_refresh_blocks: Blocks after which every account's balances are read again.
+
+        """
+        self._wallet = wallet
+        self._web3 = web3
+        self._comet_address = Web3.to_checksum_address(comet_address)
+        self._on_alert = on_alert
+        self._thresholds = sorted((Decimal(t) for t in thresholds), reverse=True)
+        self._poll_interval = poll_interval
+        self._full_refresh_blocks = full_refresh_blocks
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._accounts: dict[str, None] = {}
+        self._stale: set[str] = set()
+        self._balances: dict[str, tuple[int, dict[str, int]]] = {}
+        self._health: dict[str, AccountHealth] = {}
+        self._last_block: int | None = None
+        self._last_full_refresh: int | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.watch(accounts)
+
+    def watch(self, accounts: Iterable[str]) -> None:
+        """Start watching accounts, reading them on the next refresh.
+
+        Args:
+            accounts: The account addresses.
+
+        """
+        with self._lock:
+            for account in accounts:
+                account = Web3.to_checksum_address(account)
+                if account not in self._accounts:
+                    self._accounts[account] = None
+                    self._stale.add(account)
+
+    def unwatch(self, accounts: Iterable[str]) -> None:
+        """Stop watching accounts.
+
+        Args:
+            accounts: The account addresses.
+
+        """
+        with self._lock:
+            for account in accounts:
+                account = Web3.to_checksum_address(account)
+                self._accounts.pop(account, None)
+                self._stale.discard(account)
+                self._balances.pop(account, None)
+                self._health.pop(account, None)
+
+    def accounts(self) -> list[str]:
+        """Get the watched accounts.
+
+        Returns:
+            list[str]: The account addresses, in the order they were watched.
+
+        """
+        with self._lock:
+            return list(self._accounts)
+
+    def get_health(self, account: str) -> AccountHealth | None:
+        """Get the latest health of an account.
+
+        Args:
+            account: The account address.
+
+        Returns:
+            AccountHealth | None: The health, or None if the account was not read yet.
+
+        """
+        with self._lock:
+            return self._health.get(Web3.to_checksum_address(account))
+
+    def at_risk(self, threshold: Decimal | None = None) -> list[AccountHealth]:
+        """Get the accounts whose liquidation ratio is below a threshold, riskiest first.
+
+        Args:
+            threshold: The liquidation ratio, defaults to the highest alert threshold.
+
+        Returns:
+            list[AccountHealth]: The accounts' latest health.
+
+        """
+        if threshold is None:
+            threshold = self._thresholds[0] if self._thresholds else Decimal(1)
+        with self._lock:
+            health = [h for h in self._health.values() if h.liquidation_ratio < threshold]
+        return sorted(health, key=lambda h: h.liquidation_ratio)
+
+    def refresh(self, block_number: int | None = None) -> list[HealthAlert]:
+        """Bring every watched account up to date with a new block.
+
+        Does nothing if the block is not newer than the last one processed.
+
+        Args:
+            block_number: The new block, defaults to the latest block.
+
+        Returns:
+            list[HealthAlert]: The alerts emitted.
+
+        """
+        with self._refresh_lock:
+            head = block_number if block_number is not None else self._web3.eth.block_number
+            if self._last_block is not None and head <= self._last_block:
+                return []
+
+            market = get_comet_market(self._wallet, self._comet_address)
+            with self._lock:
+                accounts = list(self._accounts)
+                full = (
+                    self._last_full_refresh is None
+                    or self._last_block is None
+                    or head - self._last_full_refresh >= self._full_refresh_blocks
+                    or head - self._last_block > MAX_LOG_BLOCK_RANGE
+                )
+            if full:
+                to_read = set(accounts)
+            else:
+                to_read = self._touched_accounts(self._last_block + 1, head, set(accounts))
+                with self._lock:
+                    to_read |= self._stale & set(accounts)
+
+            num_assets, prices, balances = self._read(market, head, to_read)
+            if num_assets != len(market.assets):
+                # Governance listed a new asset, every balance needs reading again
+                market = get_comet_market(self._wallet, self._comet_address, refresh=True)
+                to_read = set(accounts)
+                _, prices, balances = self._read(market, head, to_read)
+
+            with self._lock:
+                self._balances.update(
+                    {account: b for account, b in balances.items() if account in self._accounts}
+                )
+                self._stale -= to_read
+                self._last_block = head
+                if full:
+                    self._last_full_refresh = head
+                alerts = self._update_health(market, head, prices)
+
+        for alert in alerts:
+            self._emit(alert)
+        return alerts
+
+    def start(self) -> None:
+        """Refresh the monitor on every new block from a background thread."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="compound-position-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish.
+
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def __enter__(self) -> "CompoundPositionMonitor":
+        """Start refreshing in the background."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop refreshing in the background."""
+        self.stop()
+
+    def _run(self) -> None:
+        """Refresh on each new block until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                # Retried on the next interval
+                print(f"Warning: Failed to refresh Compound positions: {e}")
+            self._stop.wait(self._poll_interval)
+
+    def _touched_accounts(self, from_block: int, to_block: int, accounts: set[str]) -> set[str]:
+        """Find the watched accounts whose balances changed in a range of blocks.
+
+        Args:
+            from_block: The first block of the range.
+            to_block: The last block of the range.
+            accounts: The watched accounts.
+
+        Returns:
+            set[str]: The accounts named in a Comet balance-changing log.
+
+        """
+        logs = self._web3.eth.get_logs(
+            {
+                "address": self._comet_address,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "topics": [COMET_ACCOUNT_EVENT_TOPICS],
+            }
+        )
+        touched = set()
+        for log in logs:
+            for topic in log["topics"][1:3]:
+                address = _topic_address(topic)
+                if address in accounts:
+                    touched.add(address)
+        return touched
+
+    def _read(
+        self, market: CometMarket, block_number: int, accounts: set[str]
+    ) -> tuple[int, dict[str, int], dict[str, tuple[int, dict[str, int]]]]:
+        """Read the market's prices and accounts' balances in one batch.
+
+        Args:
+            market: The market configuration.
+            block_number: The block to read at.
+            accounts: The accounts whose balances are read.
+
+        Returns:
+            tuple: The number of assets of the market, the price of each price feed and the
+                borrow and collateral balances of each account.
+
+        """
+        feeds = market.price_feeds()
+        ordered = sorted(accounts)
+        calls = [
+            ContractCall(market.address, COMET_ABI, "numAssets", allow_failure=False),
+            *(
+                ContractCall(feed, PRICE_FEED_ABI, "latestRoundData", allow_failure=False)
+                for feed in feeds
+            ),
+        ]
+        for account in ordered:
+            calls.append(
+                ContractCall(
+                    market.address, COMET_ABI, "borrowBalanceOf", [account], allow_failure=False
+                )
+            )
+            calls.extend(
+                ContractCall(
+                    market.address,
+                    COMET_ABI,
+                    "collateralBalanceOf",
+                    [account, asset.address],
+                    allow_failure=False,
+                )
+                for asset in market.assets
+            )
+
+        results = [
+            result.value
+            for result in self._wallet.batch_read_contract(calls, block_identifier=block_number)
+        ]
+        rounds = results[1 : 1 + len(feeds)]
+        prices = {feed: round_data[1] for feed, round_data in zip(feeds, rounds, strict=True)}
+
+        balances = {}
+        per_account = 1 + len(market.assets)
+        offset = 1 + len(feeds)
+        for i, account in enumerate(ordered):
+            values = results[offset + i * per_account : offset + (i + 1) * per_account]
+            balances[account] = (
+                values[0],
+                {
+                    asset.address: value
+                    for asset, value in zip(market.assets, values[1:], strict=True)
+                },
+            )
+        return results[0], prices, balances
+
+    def _update_health(
+        self, market: CometMarket, block_number: int, prices: dict[str, int]
+    ) -> list[HealthAlert]:
+        """Recompute every account's health from its balances and the latest prices.
+
+        Must hold the lock.
+
+        Args:
+            market: The market configuration.
+            block_number: The block the prices were read at.
+            prices: The price of each price feed.
+
+        Returns:
+            list[HealthAlert]: The thresholds crossed since the previous block.
+
+        """
+        alerts = []
+        for account in self._accounts:
+            if account not in self._balances:
+                continue
+            borrow_balance, collateral_balances = self._balances[account]
+            snapshot = CometPositionSnapshot(
+                market=market,
+                account=account,
+                block_number=block_number,
+                borrow_balance=borrow_balance,
+                collateral_balances=collateral_balances,
+                prices=prices,
+            )
+            health = AccountHealth(
+                account=account,
+                block_number=block_number,
+                health_ratio=snapshot.health_ratio(),
+                liquidation_ratio=snapshot.liquidation_ratio(),
+                snapshot=snapshot,
+            )
+            previous = self._health.get(account)
+            self._health[account] = health
+
+            previous_ratio = previous.liquidation_ratio if previous else None
+            for threshold in self._thresholds:
+                was_below = previous_ratio is not None and previous_ratio < threshold
+                is_below = health.liquidation_ratio < threshold
+                if is_below != was_below:
+                    alerts.append(
+                        HealthAlert(
+                            account=account,
+                            block_number=block_number,
+                            threshold=threshold,
+                            liquidation_ratio=health.liquidation_ratio,
+                            previous_liquidation_ratio=previous_ratio,
+                            below=is_below,
+                        )
+                    )
+        return alerts
+
+    def _emit(self, alert: HealthAlert) -> None:
+        """Pass an alert to the callback.
+
+        Args:
+            alert: The alert.
+
+        """
+        if self._on_alert is None:
+            return
+        try:
+            self._on_alert(alert)
+        except Exception as e:
+            print(f"Warning: Compound position alert callback failed: {e}")
@@ -0,0 +1,345 @@
+"""Local model of the interest rates of a Compound market."""
+
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+
+from web3.types import BlockIdentifier
+
+from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers.multicall import ContractCall, get_multicall_address
+from .constants import COMET_ABI
+from .snapshot import FACTOR_DECIMALS, MULTICALL3_BLOCK_NUMBER_ABI, get_comet_market
+
+# Comet rates are per second, annualized over a 365 day year like the Compound app
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+# Comet getters of the rate model, in the order of CometRateModel's fields
+RATE_MODEL_FUNCTIONS = (
+    "supplyKink",
+    "supplyPerSecondInterestRateBase",
+    "supplyPerSecondInterestRateSlopeLow",
+    "supplyPerSecondInterestRateSlopeHigh",
+    "borrowKink",
+    "borrowPerSecondInterestRateBase",
+    "borrowPerSecondInterestRateSlopeLow",
+    "borrowPerSecondInterestRateSlopeHigh",
+)
+
+
+def _mul_factor(amount: int, factor: int) -> int:
+    """Multiply by a fixed-point factor, truncating like Comet's mulFactor.
+
+    Args:
+        amount: The amount to multiply.
+        factor: The factor, with FACTOR_DECIMALS decimals.
+
+    Returns:
+        int: The product, rounded down.
+
+    """
+    return amount * factor // 10**FACTOR_DECIMALS
+
+
+def _piecewise_rate(utilization: int, kink: int, base: int, slope_low: int, slope_high: int) -> int:
+    """Compute a per-second rate from a kinked linear model, like Comet's rate getters.
+
+    Args:
+        utilization: The utilization, with FACTOR_DECIMALS decimals.
+        kink: The utilization at which the slope changes.
+        base: The rate at zero utilization.
+        slope_low: The slope below the kink.
+        slope_high: The slope above the kink.
+
+    Returns:
+        int: The per-second rate, with FACTOR_DECIMALS decimals.
+
+    """
+    if utilization <= kink:
+        return base + _mul_factor(slope_low, utilization)
+    return base + _mul_factor(slope_low, kink) + _mul_factor(slope_high, utilization - kink)
+
+
+@dataclass(frozen=True)
+class CometRateModel:
+    """The interest rate parameters of a Compound market, which only change through governance.
+
+    Every parameter is a fixed-point number with FACTOR_DECIMALS decimals, and rates are per
+    second.
+
+    """
+
+    supply_kink: int
+    supply_base: int
+    supply_slope_low: int
+    supply_slope_high: int
+    borrow_kink: int
+    borrow_base: int
+    borrow_slope_low: int
+    borrow_slope_high: int
+
+    @staticmethod
+    def utilization(total_supply: int, total_borrow: int) -> int:
+        """Compute the utilization of a market like Comet's getUtilization.
+
+        Args:
+            total_supply: The total supply of the base token, in atomic units.
+            total_borrow: The total borrow of the base token, in atomic units.
+
+        Returns:
+            int: The utilization, with FACTOR_DECIMALS decimals.
+
+        """
+        if total_supply == 0:
+            return 0
+        return total_borrow * 10**FACTOR_DECIMALS // total_supply
+
+    def supply_rate(self, utilization: int) -> int:
+        """Compute the per-second supply rate at a utilization like Comet's getSupplyRate.
+
+        Args:
+            utilization: The utilization, with FACTOR_DECIMALS decimals.
+
+        Returns:
+            int: The per-second supply rate, with FACTOR_DECIMALS decimals.
+
+        """
+        return _piecewise_rate(
+            utilization,
+            self.supply_kink,
+            self.supply_base,
+            self.supply_slope_low,
+            self.supply_slope_high,
+        )
+
+    def borrow_rate(self, utilization: int) -> int:
+        """Compute the per-second borrow rate at a utilization like Comet's getBorrowRate.
+
+        Args:
+            utilization: The utilization, with FACTOR_DECIMALS decimals.
+
+        Returns:
+            int: The per-second borrow rate, with FACTOR_DECIMALS decimals.
+
+        """
+        return _piecewise_rate(
+            utilization,
+            self.borrow_kink,
+            self.borrow_base,
+            self.borrow_slope_low,
+            self.borrow_slope_high,
+        )
+
+
+@dataclass
+class RateQuote:
+    """The utilization and annual rates of a market, as fractions."""
+
+    utilization: Decimal
+    supply_apr: Decimal
+    borrow_apr: Decimal
+
+
+def _annualize(rate: int) -> Decimal:
+    """Convert a per-second rate to an annual percentage rate.
+
+    Args:
+        rate: The per-second rate, with FACTOR_DECIMALS decimals.
+
+    Returns:
+        Decimal: The APR, as a fraction.
+
+    """
+    return Decimal(rate * SECONDS_PER_YEAR) / Decimal(10**FACTOR_DECIMALS)
+
+
+@dataclass(frozen=True)
+class CometMarketRates:
+    """The totals of a Compound market at a block, with its rate model."""
+
+    model: CometRateModel
+    block_number: int | None
+    base_symbol: str
+    base_decimals: int
+    # Present values of the base token supplied and borrowed, in atomic units
+    total_supply: int
+    total_borrow: int
+
+    def quote(self, supply_change: int = 0, borrow_change: int = 0) -> RateQuote:
+        """Compute the rates after hypothetical changes of the market's totals.
+
+        Args:
+            supply_change: The base token supplied, or withdrawn if negative, in atomic units.
+            borrow_change: The base token borrowed, or repaid if negative, in atomic units.
+
+        Returns:
+            RateQuote: The projected utilization and rates.
+
+        Raises:
+            ValueError: If the changes withdraw or repay more than the market's totals.
+
+        """
+        total_supply = self.total_supply + supply_change
+        total_borrow = self.total_borrow + borrow_change
+        if total_supply < 0 or total_borrow < 0:
+            raise ValueError("Changes exceed the market's total supply or borrow")
+
+        utilization = self.model.utilization(total_supply, total_borrow)
+        return RateQuote(
+            utilization=Decimal(utilization) / Decimal(10**FACTOR_DECIMALS),
+            supply_apr=_annualize(self.model.supply_rate(utilization)),
+            borrow_apr=_annualize(self.model.borrow_rate(utilization)),
+        )
+
+    def supply_apr(self, amount: int = 0) -> Decimal:
+        """Get the supply APR after supplying an amount of the base token.
+
+        Args:
+            amount: The amount to supply, in atomic units.
+
+        Returns:
+            Decimal: The supply APR, as a fraction.
+
+        """
+        return self.quote(supply_change=amount).supply_apr
+
+    def borrow_apr(self, amount: int = 0) -> Decimal:
+        """Get the borrow APR after borrowing an amount of the base token.
+
+        Args:
+            amount: The amount to borrow, in atomic units.
+
+        Returns:
+            Decimal: The borrow APR, as a fraction.
+
+        """
+        return self.quote(borrow_change=amount).borrow_apr
+
+    def to_markdown(self, supply_amount: int = 0, borrow_amount: int = 0) -> str:
+        """Format the current rates, and the rates after a supply or borrow, as markdown.
+
+        Args:
+            supply_amount: An amount to project the rates of supplying, in atomic units.
+            borrow_amount: An amount to project the rates of borrowing, in atomic units.
+
+        Returns:
+            str: Markdown formatted utilization and rates
+
+        """
+        scale = Decimal(10**self.base_decimals)
+        markdown_output = f"# Compound {self.base_symbol} Market Rates\n\n"
+        if self.block_number is not None:
+            markdown_output += f"- **Block:** {self.block_number}\n"
+        markdown_output += (
+            f"- **Total Supply:** {Decimal(self.total_supply) / scale:.2f} {self.base_symbol}\n"
+        )
+        markdown_output += (
+            f"- **Total Borrow:** {Decimal(self.total_borrow) / scale:.2f} {self.base_symbol}\n"
+        )
+
+        scenarios = [("Current", self.quote())]
+        if supply_amount:
+            scenarios.append(
+                (f"After Supplying {Decimal(supply_amount) / scale:f}", self.quote(supply_amount))
+            )
+        if borrow_amount:
+            scenarios.append(
+                (
+                    f"After Borrowing {Decimal(borrow_amount) / scale:f}",
+                    self.quote(borrow_change=borrow_amount),
+                )
+            )
+
+        markdown_output += (
+            "\n| Scenario | Utilization | Supply APR | Borrow APR |\n|---|---|---|---|\n"
+        )
+        for name, quote in scenarios:
+            markdown_output += (
+                f"| {name} | {quote.utilization * 100:.2f}% | {quote.supply_apr * 100:.2f}% "
+                f"| {quote.borrow_apr * 100:.2f}% |\n"
+            )
+
+        return markdown_output
+
+
+_rate_models: dict[tuple[str, str], CometRateModel] = {}
+_rate_models_lock = threading.Lock()
+
+
+def get_rate_model(
+    wallet: EvmWalletProvider, comet_address: str, refresh: bool = False
+) -> CometRateModel:
+    """Get the rate model of a Compound market, reading it from the chain on first use.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        comet_address: The address of the Compound Comet contract.
+        refresh: Read the parameters again even if they are cached.
+
+    Returns:
+        CometRateModel: The rate model.
+
+    """
+    key = (str(wallet.get_network().chain_id), comet_address)
+    with _rate_models_lock:
+        model = _rate_models.get(key)
+    if model is None or refresh:
+        results = wallet.batch_read_contract(
+            [
+                ContractCall(comet_address, COMET_ABI, function_name, allow_failure=False)
+                for function_name in RATE_MODEL_FUNCTIONS
+            ]
+        )
+        model = CometRateModel(*(result.value for result in results))
+        with _rate_models_lock:
+            _rate_models[key] = model
+    return model
+
+
+def clear_rate_models() -> None:
+    """Forget every cached rate model."""
+    with _rate_models_lock:
+        _rate_models.clear()
+
+
+def load_market_rates(
+    wallet: EvmWalletProvider,
+    comet_address: str,
+    block_identifier: BlockIdentifier = "latest",
+) -> CometMarketRates:
+    """Read the totals of a Compound market in a single batch.
+
+    The rate model and the market configuration are read on first use and cached, so
+    rates at any number of hypothetical amounts then cost one read of the totals.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        comet_address: The address of the Compound Comet contract.
+        block_identifier: The block to read at, defaults to 'latest'.
+
+    Returns:
+        CometMarketRates: The market's totals and rate model.
+
+    """
+    model = get_rate_model(wallet, comet_address)
+    market = get_comet_market(wallet, comet_address)
+    block_number, total_supply, total_borrow = wallet.batch_read_contract(
+        [
+            ContractCall(
+                get_multicall_address(wallet.get_network()),
+                MULTICALL3_BLOCK_NUMBER_ABI,
+                "getBlockNumber",
+            ),
+            ContractCall(comet_address, COMET_ABI, "totalSupply", allow_failure=False),
+            ContractCall(comet_address, COMET_ABI, "totalBorrow", allow_failure=False),
+        ],
+        block_identifier=block_identifier,
+    )
+    return CometMarketRates(
+        model=model,
+        block_number=block_number.value if block_number.success else None,
+        base_symbol=market.base_symbol,
+        base_decimals=market.base_decimals,
+        total_supply=total_supply.value,
+        total_borrow=total_borrow.value,
+    )
@@ -61,3 +61,31 @@ class CompoundPortfolioSchema(BaseModel):
     """Input schema for getting portfolio details from Compound."""
 
     pass  # No inputs required
+
+
+class CompoundHealthLadderSchema(BaseModel):
+    """Input schema for getting the health ratio ladder of a Compound position."""
+
+    target_health_ratio: str = Field(
+        "1",
+        description="The lowest health ratio considered safe, e.g. `1` or `1.25`",
+    )
+    steps: int = Field(
+        10,
+        ge=1,
+        le=100,
+        description="The number of intervals each health ratio curve is divided into",
+    )
+
+
+class CompoundRatesSchema(BaseModel):
+    """Input schema for getting the interest rates of the Compound market."""
+
+    supply_amount: str = Field(
+        "0",
+        description="An amount of the base token to project the rates after supplying, e.g. `1000` usdc",
+    )
+    borrow_amount: str = Field(
+        "0",
+        description="An amount of the base token to project the rates after borrowing, e.g. `1000` usdc",
+    )
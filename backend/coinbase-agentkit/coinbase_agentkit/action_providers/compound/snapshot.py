@@ -0,0 +1,520 @@
+"""Block-pinned snapshots of Compound positions."""
+
+import threading
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from web3 import Web3
+from web3.types import BlockIdentifier
+
+from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers.multicall import CallResult, ContractCall, get_multicall_address
+from ..erc20.token_metadata import get_token_metadata_registry
+from .constants import COMET_ABI, PRICE_FEED_ABI
+
+# Multicall3 function returning the block a batch of reads is executed at
+MULTICALL3_BLOCK_NUMBER_ABI = [
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"internalType": "uint256", "name": "blockNumber", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    }
+]
+
+# Chainlink prices and Comet collateral factors are fixed-point with these many decimals
+PRICE_DECIMALS = 8
+FACTOR_DECIMALS = 18
+
+
+@dataclass(frozen=True)
+class CometAsset:
+    """A collateral asset of a Compound market."""
+
+    address: str
+    price_feed: str
+    symbol: str
+    decimals: int
+    # Collateral factors, as fixed-point numbers with FACTOR_DECIMALS decimals
+    borrow_collateral_factor: int
+    liquidate_collateral_factor: int
+
+    @property
+    def collateral_factor(self) -> Decimal:
+        """The borrow collateral factor as a fraction."""
+        return Decimal(self.borrow_collateral_factor) / Decimal(10**FACTOR_DECIMALS)
+
+    @property
+    def liquidation_factor(self) -> Decimal:
+        """The liquidate collateral factor as a fraction."""
+        return Decimal(self.liquidate_collateral_factor) / Decimal(10**FACTOR_DECIMALS)
+
+
+@dataclass(frozen=True)
+class CometMarket:
+    """The configuration of a Compound market, which only changes through governance."""
+
+    chain_id: str
+    address: str
+    base_token: str
+    base_symbol: str
+    base_decimals: int
+    base_price_feed: str
+    assets: tuple[CometAsset, ...]
+
+    def get_asset(self, address: str) -> CometAsset | None:
+        """Get a collateral asset of the market.
+
+        Args:
+            address: The asset address.
+
+        Returns:
+            CometAsset | None: The asset, or None if it is not collateral in this market.
+
+        """
+        address = Web3.to_checksum_address(address)
+        return next((asset for asset in self.assets if asset.address == address), None)
+
+    def price_feeds(self) -> list[str]:
+        """Get the price feeds of the base token and every collateral asset.
+
+        Returns:
+            list[str]: The distinct price feed addresses.
+
+        """
+        return list(dict.fromkeys([self.base_price_feed, *(a.price_feed for a in self.assets)]))
+
+
+def _to_amount(amount: int, decimals: int) -> Decimal:
+    """Convert an atomic amount to a human-readable amount.
+
+    Args:
+        amount: The amount in atomic units.
+        decimals: The number of decimals of the token.
+
+    Returns:
+        Decimal: The human-readable amount.
+
+    """
+    return Decimal(amount) / Decimal(10**decimals)
+
+
+@dataclass
+class CometPositionSnapshot:
+    """An account's position in a Compound market, read at a single block.
+
+    Every value is read in one batch, so the borrow, the collateral and the prices are
+    consistent with each other. The health ratio, projections and portfolio summary are
+    computed from the snapshot without further reads.
+    """
+
+    market: CometMarket
+    account: str
+    block_number: int | None
+    # Borrowed base token, in atomic units
+    borrow_balance: int
+    # Supplied collateral in atomic units, by asset address
+    collateral_balances: dict[str, int] = field(default_factory=dict)
+    # Latest price answers, with PRICE_DECIMALS decimals, by price feed address
+    prices: dict[str, int] = field(default_factory=dict)
+
+    def get_price(self, price_feed: str) -> Decimal:
+        """Get the USD price reported by a price feed.
+
+        Args:
+            price_feed: The price feed address.
+
+        Returns:
+            Decimal: The price in USD.
+
+        """
+        return Decimal(self.prices[price_feed]) / Decimal(10**PRICE_DECIMALS)
+
+    def get_collateral_balance(self, asset_address: str) -> int:
+        """Get the supplied balance of a collateral asset.
+
+        Args:
+            asset_address: The asset address.
+
+        Returns:
+            int: The collateral balance in atomic units, 0 if the asset is not collateral.
+
+        """
+        return self.collateral_balances.get(Web3.to_checksum_address(asset_address), 0)
+
+    def borrow_details(self) -> dict[str, Any]:
+        """Get the borrow amount, token symbol, and price of the position.
+
+        Returns:
+            dict: Dictionary containing:
+                Token Symbol (str): The symbol of the base token.
+                Borrow Amount (Decimal): The human-readable amount borrowed.
+                Price (Decimal): The price of the base token in USD.
+
+        """
+        return {
+            "Token Symbol": self.market.base_symbol,
+            "Borrow Amount": _to_amount(self.borrow_balance, self.market.base_decimals),
+            "Price": self.get_price(self.market.base_price_feed),
+        }
+
+    def supply_details(self) -> list[dict[str, Any]]:
+        """Get the details of every asset supplied as collateral.
+
+        Returns:
+            List[dict]: List of dictionaries containing:
+                Token Symbol (str): Symbol of the supplied token.
+                Supply Amount (Decimal): Human-readable supplied amount.
+                Price (Decimal): Price in USD.
+                Collateral Factor (Decimal): Borrow collateral factor as a fraction.
+                Decimals (int): Number of decimals for the token.
+
+        """
+        return [
+            {
+                "Token Symbol": asset.symbol,
+                "Supply Amount": _to_amount(
+                    self.collateral_balances[asset.address], asset.decimals
+                ),
+                "Price": self.get_price(asset.price_feed),
+                "Collateral Factor": asset.collateral_factor,
+                "Decimals": asset.decimals,
+            }
+            for asset in self.market.assets
+            if self.collateral_balances.get(asset.address, 0) > 0
+        ]
+
+    def health_ratio(
+        self, additional_borrow: int = 0, withdrawals: dict[str, int] | None = None
+    ) -> Decimal:
+        """Calculate the health ratio of the position, optionally after changes to it.
+
+        Health ratio is calculated using human-readable values:
+            - Borrow value = (human borrow amount) * (price)
+            - Collateral value = Σ (human supply amount * price * collateral factor)
+        A ratio >= 1 indicates a healthy position.
+
+        Args:
+            additional_borrow: Base token borrowed on top of the position, in atomic units.
+            withdrawals: Collateral withdrawn from the position in atomic units, by asset
+                address.
+
+        Returns:
+            Decimal: The health ratio, infinity if there are no borrows.
+
+        """
+        withdrawn = {
+            Web3.to_checksum_address(address): amount
+            for address, amount in (withdrawals or {}).items()
+        }
+        borrow = _to_amount(self.borrow_balance + additional_borrow, self.market.base_decimals)
+        borrow_value = borrow * self.get_price(self.market.base_price_feed)
+
+        total_adjusted_collateral = Decimal(0)
+        for asset in self.market.assets:
+            balance = self.collateral_balances.get(asset.address, 0)
+            if balance <= 0:
+                continue
+            supply_amount = _to_amount(balance - withdrawn.get(asset.address, 0), asset.decimals)
+            collateral_value = supply_amount * self.get_price(asset.price_feed)
+            total_adjusted_collateral += collateral_value * asset.collateral_factor
+
+        return (
+            Decimal("Infinity") if borrow_value == 0 else total_adjusted_collateral / borrow_value
+        )
+
+    def liquidation_ratio(self) -> Decimal:
+        """Calculate how far the position is from being liquidated.
+
+        Like the health ratio, but with the liquidate collateral factors Compound uses to
+        decide whether a position can be absorbed.
+
+        Returns:
+            Decimal: The ratio, below 1 if the position can be liquidated, infinity if
+                there are no borrows.
+
+        """
+        borrow = _to_amount(self.borrow_balance, self.market.base_decimals)
+        borrow_value = borrow * self.get_price(self.market.base_price_feed)
+
+        total_liquidation_collateral = Decimal(0)
+        for asset in self.market.assets:
+            balance = self.collateral_balances.get(asset.address, 0)
+            if balance > 0:
+                collateral_value = _to_amount(balance, asset.decimals) * self.get_price(
+                    asset.price_feed
+                )
+                total_liquidation_collateral += collateral_value * asset.liquidation_factor
+
+        return (
+            Decimal("Infinity")
+            if borrow_value == 0
+            else total_liquidation_collateral / borrow_value
+        )
+
+    def health_ratio_after_borrow(self, borrow_amount: int) -> Decimal:
+        """Calculate what the health ratio would be after a proposed borrow.
+
+        Args:
+            borrow_amount: The additional amount to borrow in atomic units.
+
+        Returns:
+            Decimal: The projected health ratio, infinity if there would be no borrows.
+
+        """
+        return self.health_ratio(additional_borrow=borrow_amount)
+
+    def health_ratio_after_withdraw(self, asset_address: str, withdraw_amount: int) -> Decimal:
+        """Calculate what the health ratio would be after a proposed withdrawal.
+
+        Args:
+            asset_address: The address of the asset to withdraw.
+            withdraw_amount: The amount to withdraw in atomic units.
+
+        Returns:
+            Decimal: The projected health ratio, infinity if there are no borrows.
+
+        """
+        return self.health_ratio(withdrawals={asset_address: withdraw_amount})
+
+    def to_markdown(self) -> str:
+        """Format the position as markdown.
+
+        Returns:
+            str: Markdown formatted portfolio details
+
+        """
+        markdown_output = "# Portfolio Details\n\n"
+
+        markdown_output += "## Supply Details\n\n"
+        total_supply_value = Decimal(0)
+
+        supply_details = self.supply_details()
+
+        if supply_details:
+            for supply in supply_details:
+                token = supply["Token Symbol"]
+                supply_amount = supply["Supply Amount"]
+                price = supply["Price"]
+                decimals = supply["Decimals"]
+                collateral_factor = supply["Collateral Factor"]
+                asset_value = supply_amount * price
+
+                markdown_output += f"### {token}\n"
+                markdown_output += (
+                    f"- **Supply Amount:** {format(supply_amount, f'.{decimals}f')}\n"
+                )
+                markdown_output += f"- **Price:** ${price:.2f}\n"
+                markdown_output += f"- **Collateral Factor:** {collateral_factor:.2f}\n"
+                markdown_output += f"- **Asset Value:** ${asset_value:.2f}\n\n"
+                total_supply_value += asset_value
+        else:
+            markdown_output += "No supplied assets found in your Compound position.\n\n"
+
+        markdown_output += f"### Total Supply Value: ${total_supply_value:.2f}\n\n"
+
+        markdown_output += "## Borrow Details\n\n"
+
+        borrow_details = self.borrow_details()
+        borrow_amount = borrow_details["Borrow Amount"]
+
+        if borrow_amount > 0:
+            token = borrow_details["Token Symbol"]
+            price = borrow_details["Price"]
+            borrow_value = borrow_amount * price
+
+            markdown_output += f"### {token}\n"
+            markdown_output += f"- **Borrow Amount:** {borrow_amount:.6f}\n"
+            markdown_output += f"- **Price:** ${price:.2f}\n"
+            markdown_output += f"- **Borrow Value:** ${borrow_value:.2f}\n\n"
+        else:
+            markdown_output += "No borrowed assets found in your Compound position.\n\n"
+
+        markdown_output += "## Overall Health\n\n"
+        markdown_output += f"- **Health Ratio:** {self.health_ratio():.2f}\n"
+
+        return markdown_output
+
+
+_markets: dict[tuple[str, str], CometMarket] = {}
+_markets_lock = threading.Lock()
+
+
+def _read_market(wallet: EvmWalletProvider, chain_id: str, comet_address: str) -> CometMarket:
+    """Read the configuration of a Compound market from the chain.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        chain_id: The chain the market is on.
+        comet_address: The address of the Compound Comet contract.
+
+    Returns:
+        CometMarket: The market configuration.
+
+    """
+    base_token, base_price_feed, num_assets = (
+        result.value
+        for result in wallet.batch_read_contract(
+            [
+                ContractCall(comet_address, COMET_ABI, "baseToken", allow_failure=False),
+                ContractCall(comet_address, COMET_ABI, "baseTokenPriceFeed", allow_failure=False),
+                ContractCall(comet_address, COMET_ABI, "numAssets", allow_failure=False),
+            ]
+        )
+    )
+    asset_infos = [
+        result.value
+        for result in wallet.batch_read_contract(
+            [
+                ContractCall(comet_address, COMET_ABI, "getAssetInfo", [i], allow_failure=False)
+                for i in range(num_assets)
+            ]
+        )
+    ]
+
+    metadata = get_token_metadata_registry().get_many(
+        wallet, [base_token, *(asset_info[1] for asset_info in asset_infos)]
+    )
+    base_metadata, asset_metadata = metadata[0], metadata[1:]
+    return CometMarket(
+        chain_id=chain_id,
+        address=comet_address,
+        base_token=base_metadata.address,
+        base_symbol=base_metadata.symbol or base_metadata.address,
+        base_decimals=base_metadata.decimals,
+        base_price_feed=base_price_feed,
+        assets=tuple(
+            CometAsset(
+                address=token.address,
+                price_feed=asset_info[2],
+                symbol=token.symbol or token.address,
+                decimals=token.decimals,
+                borrow_collateral_factor=asset_info[4],
+                liquidate_collateral_factor=asset_info[5],
+            )
+            for asset_info, token in zip(asset_infos, asset_metadata, strict=True)
+        ),
+    )
+
+
+def get_comet_market(
+    wallet: EvmWalletProvider, comet_address: str, refresh: bool = False
+) -> CometMarket:
+    """Get the configuration of a Compound market, reading it from the chain on first use.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        comet_address: The address of the Compound Comet contract.
+        refresh: Read the configuration again even if it is cached.
+
+    Returns:
+        CometMarket: The market configuration.
+
+    """
+    key = (str(wallet.get_network().chain_id), comet_address)
+    with _markets_lock:
+        market = _markets.get(key)
+    if market is None or refresh:
+        market = _read_market(wallet, key[0], comet_address)
+        with _markets_lock:
+            _markets[key] = market
+    return market
+
+
+def clear_comet_markets() -> None:
+    """Forget every cached market configuration."""
+    with _markets_lock:
+        _markets.clear()
+
+
+def _read_position(
+    wallet: EvmWalletProvider,
+    market: CometMarket,
+    account: str,
+    block_identifier: BlockIdentifier,
+) -> list[CallResult]:
+    """Read the number of assets, the block number and an account's balances and prices.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        market: The market configuration.
+        account: The account to read.
+        block_identifier: The block to read at.
+
+    Returns:
+        list[CallResult]: The block number, number of assets, borrow balance, collateral
+            balance of each asset and round data of each price feed, in this order.
+
+    """
+    calls = [
+        ContractCall(
+            get_multicall_address(wallet.get_network()),
+            MULTICALL3_BLOCK_NUMBER_ABI,
+            "getBlockNumber",
+        ),
+        ContractCall(market.address, COMET_ABI, "numAssets", allow_failure=False),
+        ContractCall(market.address, COMET_ABI, "borrowBalanceOf", [account], allow_failure=False),
+        *(
+            ContractCall(
+                market.address,
+                COMET_ABI,
+                "collateralBalanceOf",
+                [account, asset.address],
+                allow_failure=False,
+            )
+            for asset in market.assets
+        ),
+        *(
+            ContractCall(feed, PRICE_FEED_ABI, "latestRoundData", allow_failure=False)
+            for feed in market.price_feeds()
+        ),
+    ]
+    return wallet.batch_read_contract(calls, block_identifier=block_identifier)
+
+
+def load_position_snapshot(
+    wallet: EvmWalletProvider,
+    comet_address: str,
+    account: str | None = None,
+    block_identifier: BlockIdentifier = "latest",
+) -> CometPositionSnapshot:
+    """Read an account's Compound position in a single batch.
+
+    The borrow balance, collateral balances and prices are read in one multicall, along
+    with the number of assets of the market. Only when governance listed a new asset since
+    the market configuration was cached are the configuration and the position read again.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        comet_address: The address of the Compound Comet contract.
+        account: The account to read, defaults to the wallet's address.
+        block_identifier: The block to read at, defaults to 'latest'.
+
+    Returns:
+        CometPositionSnapshot: The position.
+
+    """
+    account = account or wallet.get_address()
+    market = get_comet_market(wallet, comet_address)
+    results = _read_position(wallet, market, account, block_identifier)
+    if results[1].value != len(market.assets):
+        market = get_comet_market(wallet, comet_address, refresh=True)
+        results = _read_position(wallet, market, account, block_identifier)
+
+    balances = results[3 : 3 + len(market.assets)]
+    rounds = results[3 + len(market.assets) :]
+    return CometPositionSnapshot(
+        market=market,
+        account=account,
+        block_number=results[0].value if results[0].success else None,
+        borrow_balance=results[2].value,
+        collateral_balances={
+            asset.address: result.value
+            for asset, result in zip(market.assets, balances, strict=True)
+        },
+        prices={
+            feed: result.value[1] for feed, result in zip(market.price_feeds(), rounds, strict=True)
+        },
+    )
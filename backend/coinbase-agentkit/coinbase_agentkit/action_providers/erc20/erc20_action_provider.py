@@ -10,6 +10,7 @@ from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import ERC20_ABI
 from .schemas import GetBalanceSchema, TransferSchema
+from .token_metadata import get_token_metadata_registry
 
 
 class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
@@ -25,6 +26,8 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         This tool will get the balance of an ERC20 asset in the wallet. It takes the contract address as input.
         """,
         schema=GetBalanceSchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_balance(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Get the balance of an ERC20 token for the wallet's address.
@@ -47,11 +50,8 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
                 args=[wallet_provider.get_address()],
             )
 
-            decimals = wallet_provider.read_contract(
-                contract_address=validated_args.contract_address,
-                abi=ERC20_ABI,
-                function_name="decimals",
-                args=[],
+            decimals = get_token_metadata_registry().get_decimals(
+                wallet_provider, validated_args.contract_address
             )
 
             return f"Balance of {validated_args.contract_address} is {balance / 10 ** decimals}"
@@ -73,6 +73,7 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         - When sending native assets (e.g. 'eth' on base-mainnet), ensure there is sufficient balance for the transfer itself AND the gas cost of this transfer
         """,
         schema=TransferSchema,
+        validates_args=True,
     )
     def transfer(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Transfer ERC20 tokens to a destination address.
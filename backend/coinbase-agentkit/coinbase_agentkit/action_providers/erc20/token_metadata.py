@@ -0,0 +1,347 @@
+"""Registry of ERC20 token metadata, which never changes once a token is deployed."""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass
+
+from web3 import Web3
+
+from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+from ...wallet_providers.multicall import ContractCall
+from .constants import ERC20_ABI
+
+# Environment variable naming the sqlite file backing the default registry
+TOKEN_METADATA_CACHE_PATH_ENV = "TOKEN_METADATA_CACHE_PATH"
+
+# Metadata read for every token, in the order the calls are batched
+METADATA_FUNCTIONS = ("decimals", "symbol", "name")
+
+
+@dataclass(frozen=True)
+class TokenMetadata:
+    """Immutable metadata of an ERC20 token on a chain."""
+
+    chain_id: str
+    address: str
+    decimals: int
+    symbol: str | None = None
+    name: str | None = None
+
+
+# Tokens whose metadata is known without reading it from the chain
+KNOWN_TOKENS: list[TokenMetadata] = [
+    # Base mainnet
+    TokenMetadata("8453", "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913", 6, "USDC", "USD Coin"),
+    TokenMetadata(
+        "8453", "0x4200000000000000000000000000000000000006", 18, "WETH", "Wrapped Ether"
+    ),
+    TokenMetadata(
+        "8453",
+        "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
+        18,
+        "cbETH",
+        "Coinbase Wrapped Staked ETH",
+    ),
+    TokenMetadata(
+        "8453", "0xcbB7C0000aB88B473b1f5aFd9ef808440eed33Bf", 8, "cbBTC", "Coinbase Wrapped BTC"
+    ),
+    TokenMetadata(
+        "8453",
+        "0xc1CBa3fCea344f92D9239c08C0568f6F2F0ee452",
+        18,
+        "wstETH",
+        "Wrapped liquid staked Ether 2.0",
+    ),
+    # Base Sepolia
+    TokenMetadata("84532", "0x036CbD53842c5426634e7929541eC2318f3dCF7e", 6, "USDC", "USDC"),
+    TokenMetadata(
+        "84532", "0x4200000000000000000000000000000000000006", 18, "WETH", "Wrapped Ether"
+    ),
+]
+
+
+class TokenMetadataRegistry:
+    """Looks up token decimals, symbol and name, reading each token from the chain once.
+
+    Metadata is kept in memory and, when a path is given, in a sqlite file shared by
+    every process using it. Tokens missing from both are read from the chain through
+    the wallet's batch_read_contract, which providers backed by an RPC node aggregate
+    into a single Multicall3 eth_call, however many tokens are requested.
+    """
+
+    def __init__(self, path: str | None = None, seed: Iterable[TokenMetadata] = KNOWN_TOKENS):
+        """Initialize the registry.
+
+        Args:
+            path: Path of the sqlite file used as the on-disk tier, or None to keep
+                metadata in memory only.
+            seed: Metadata known up front, added to the memory tier.
+
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._memory: dict[tuple[str, str], TokenMetadata] = {}
+        if path:
+            self._init_db()
+        for metadata in seed:
+            self._memory[(metadata.chain_id, metadata.address)] = metadata
+
+    def lookup(self, chain_id: str, address: str) -> TokenMetadata | None:
+        """Get a token's metadata without reading it from the chain.
+
+        Args:
+            chain_id: The chain ID.
+            address: The token address.
+
+        Returns:
+            TokenMetadata | None: The metadata, or None if the token has not been seen.
+
+        """
+        key = (str(chain_id), Web3.to_checksum_address(address))
+        with self._lock:
+            metadata = self._memory.get(key)
+        if metadata is None and self._path:
+            metadata = self._load(*key)
+            if metadata is not None:
+                with self._lock:
+                    self._memory[key] = metadata
+        return metadata
+
+    def add(self, metadata: Iterable[TokenMetadata]) -> None:
+        """Add token metadata to the memory tier and, if configured, the on-disk tier.
+
+        Args:
+            metadata: The metadata to add.
+
+        """
+        entries = [
+            TokenMetadata(
+                chain_id=str(entry.chain_id),
+                address=Web3.to_checksum_address(entry.address),
+                decimals=entry.decimals,
+                symbol=entry.symbol,
+                name=entry.name,
+            )
+            for entry in metadata
+        ]
+        with self._lock:
+            for entry in entries:
+                self._memory[(entry.chain_id, entry.address)] = entry
+        if self._path and entries:
+            self._store(entries)
+
+    def get(self, wallet: EvmWalletProvider, address: str) -> TokenMetadata:
+        """Get a token's metadata, reading it from the chain on first use.
+
+        Args:
+            wallet: The wallet provider used to read missing metadata.
+            address: The token address.
+
+        Returns:
+            TokenMetadata: The token's metadata.
+
+        Raises:
+            ValueError: If the token's decimals cannot be read.
+
+        """
+        return self.get_many(wallet, [address])[0]
+
+    def get_many(self, wallet: EvmWalletProvider, addresses: list[str]) -> list[TokenMetadata]:
+        """Get the metadata of several tokens, reading all missing ones in one batch.
+
+        Args:
+            wallet: The wallet provider used to read missing metadata.
+            addresses: The token addresses.
+
+        Returns:
+            list[TokenMetadata]: The metadata, in the order the addresses were given.
+
+        Raises:
+            ValueError: If the decimals of a token cannot be read.
+
+        """
+        chain_id = str(wallet.get_network().chain_id)
+        keys = [Web3.to_checksum_address(address) for address in addresses]
+
+        found: dict[str, TokenMetadata] = {}
+        missing = []
+        for address in dict.fromkeys(keys):
+            metadata = self.lookup(chain_id, address)
+            if metadata is None:
+                missing.append(address)
+            else:
+                found[address] = metadata
+
+        if missing:
+            found.update(self._fetch(wallet, chain_id, missing))
+        return [found[address] for address in keys]
+
+    def get_decimals(self, wallet: EvmWalletProvider, address: str) -> int:
+        """Get the number of decimals of a token.
+
+        Args:
+            wallet: The wallet provider used to read missing metadata.
+            address: The token address.
+
+        Returns:
+            int: The number of decimals.
+
+        """
+        return self.get(wallet, address).decimals
+
+    def get_symbol(self, wallet: EvmWalletProvider, address: str) -> str:
+        """Get the symbol of a token.
+
+        Args:
+            wallet: The wallet provider used to read missing metadata.
+            address: The token address.
+
+        Returns:
+            str: The token symbol.
+
+        Raises:
+            ValueError: If the token does not have a readable symbol.
+
+        """
+        metadata = self.get(wallet, address)
+        if metadata.symbol is None:
+            raise ValueError(f"Token {metadata.address} does not have a readable symbol")
+        return metadata.symbol
+
+    def _fetch(
+        self, wallet: EvmWalletProvider, chain_id: str, addresses: list[str]
+    ) -> dict[str, TokenMetadata]:
+        """Read the metadata of tokens from the chain and add it to the registry.
+
+        Args:
+            wallet: The wallet provider to read with.
+            chain_id: The chain ID.
+            addresses: The checksummed token addresses.
+
+        Returns:
+            dict[str, TokenMetadata]: The metadata, by address.
+
+        Raises:
+            ValueError: If the decimals of a token cannot be read. Metadata of the other
+                tokens is still added.
+
+        """
+        calls = [
+            ContractCall(address, ERC20_ABI, function_name)
+            for address in addresses
+            for function_name in METADATA_FUNCTIONS
+        ]
+        results = wallet.batch_read_contract(calls)
+
+        fetched: dict[str, TokenMetadata] = {}
+        errors = []
+        for i, address in enumerate(addresses):
+            decimals, symbol, name = results[i * 3 : i * 3 + 3]
+            if not decimals.success:
+                errors.append(f"Failed to read decimals of token {address}: {decimals.error}")
+                continue
+            # Symbol and name are optional in ERC20 and some tokens return bytes32 instead
+            fetched[address] = TokenMetadata(
+                chain_id=chain_id,
+                address=address,
+                decimals=int(decimals.value),
+                symbol=symbol.value if symbol.success else None,
+                name=name.value if name.success else None,
+            )
+
+        self.add(fetched.values())
+        if errors:
+            raise ValueError("; ".join(errors))
+        return fetched
+
+    def _init_db(self) -> None:
+        """Create the sqlite file and table, falling back to memory only on failure."""
+        try:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with closing(sqlite3.connect(self._path)) as connection, connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS token_metadata ("
+                    "chain_id TEXT NOT NULL, address TEXT NOT NULL, decimals INTEGER NOT NULL, "
+                    "symbol TEXT, name TEXT, PRIMARY KEY (chain_id, address))"
+                )
+        except (OSError, sqlite3.Error):
+            self._path = None
+
+    def _load(self, chain_id: str, address: str) -> TokenMetadata | None:
+        """Read a token's metadata from the sqlite file.
+
+        Args:
+            chain_id: The chain ID.
+            address: The checksummed token address.
+
+        Returns:
+            TokenMetadata | None: The metadata, or None if it is not stored.
+
+        """
+        try:
+            with closing(sqlite3.connect(self._path)) as connection:
+                row = connection.execute(
+                    "SELECT decimals, symbol, name FROM token_metadata "
+                    "WHERE chain_id = ? AND address = ?",
+                    (chain_id, address),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return TokenMetadata(chain_id, address, row[0], row[1], row[2])
+
+    def _store(self, entries: list[TokenMetadata]) -> None:
+        """Write token metadata to the sqlite file.
+
+        Args:
+            entries: The metadata to write.
+
+        """
+        try:
+            with closing(sqlite3.connect(self._path)) as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO token_metadata VALUES (?, ?, ?, ?, ?)",
+                    [(e.chain_id, e.address, e.decimals, e.symbol, e.name) for e in entries],
+                )
+        except sqlite3.Error:
+            # The memory tier still has the metadata, it is only read again by new processes
+            pass
+
+
+_registry: TokenMetadataRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_token_metadata_registry() -> TokenMetadataRegistry:
+    """Get the registry shared by every action provider.
+
+    The registry is created on first use, backed by the sqlite file named by the
+    TOKEN_METADATA_CACHE_PATH environment variable if it is set.
+
+    Returns:
+        TokenMetadataRegistry: The shared registry.
+
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TokenMetadataRegistry(os.getenv(TOKEN_METADATA_CACHE_PATH_ENV))
+        return _registry
+
+
+def set_token_metadata_registry(registry: TokenMetadataRegistry | None) -> None:
+    """Replace the registry shared by every action provider.
+
+    Args:
+        registry: The registry to use, or None to create a new default one on next use.
+
+    """
+    global _registry
+    with _registry_lock:
+        _registry = registry
@@ -123,6 +123,7 @@ It takes the following inputs:
 - address: (Optional) The address to check NFT balance for. If not provided, uses the wallet's address
 """,
         schema=GetBalanceSchema,
+        read_only=True,
     )
     def get_balance(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Get the NFT balance for a given address and contract.
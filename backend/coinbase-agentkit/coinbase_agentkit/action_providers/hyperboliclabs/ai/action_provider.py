@@ -68,6 +68,7 @@ Important notes:
 - The generated text is saved to a file with a UUID in the name
 """,
         schema=GenerateTextSchema,
+        validates_args=True,
     )
     def generate_text(self, args: dict[str, Any]) -> str:
         """Generate text using specified language model.
@@ -144,6 +145,7 @@ Important notes:
 - The image files include a UUID in the filename
 """,
         schema=GenerateImageSchema,
+        validates_args=True,
     )
     def generate_image(self, args: dict[str, Any]) -> str:
         """Generate images using specified model.
@@ -213,6 +215,7 @@ Important notes:
 - The audio files include a UUID in the filename
 """,
         schema=GenerateAudioSchema,
+        validates_args=True,
     )
     def generate_audio(self, args: dict[str, Any]) -> str:
         """Generate audio from text using specified language and speaker.
@@ -67,6 +67,8 @@ Important notes:
 - Balance is displayed with 2 decimal precision
 """,
         schema=GetCurrentBalanceSchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_current_balance(self, args: dict[str, Any]) -> str:
         """Retrieve current balance and purchase history from the account.
@@ -130,6 +132,8 @@ Important notes:
 - History includes instance names with animal-based identifiers
 """,
         schema=GetSpendHistorySchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_spend_history(self, args: dict[str, Any]) -> str:
         """Retrieve GPU rental spending history from the platform.
@@ -178,6 +182,8 @@ Important notes:
 - Purchase history is limited to 5 most recent by default
 """,
         schema=GetPurchaseHistorySchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_purchase_history(self, args: dict[str, Any]) -> str:
         """Retrieve the purchase history of platform credits.
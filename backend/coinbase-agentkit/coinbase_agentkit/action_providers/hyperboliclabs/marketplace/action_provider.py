@@ -77,6 +77,8 @@ Important notes:
 - GPU availability is real-time and may change between queries
 """,
         schema=GetAvailableGpusSchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_available_gpus(self, args: dict[str, Any]) -> str:
         """Retrieve available GPU instances from the marketplace.
@@ -124,6 +126,8 @@ Important notes:
 - The GPU model names include manufacturer and specific model details
 """,
         schema=GetAvailableGpusTypesSchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_available_gpus_types(self, args: dict[str, Any]) -> str:
         """Retrieve available GPU types/models from the marketplace.
@@ -183,6 +187,8 @@ Important notes:
 - Availability is real-time and may change
 """,
         schema=GetAvailableGpusByTypeSchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_available_gpus_by_type(self, args: dict[str, Any]) -> str:
         """Retrieve available GPU instances of a specific model from the marketplace.
@@ -239,6 +245,8 @@ Important notes:
 - Once status is "running", you can use the SSH command to access the instance
 """,
         schema=GetGpuStatusSchema,
+        validates_args=True,
+        read_only=True,
     )
     def get_gpu_status(self, args: dict[str, Any]) -> str:
         """Retrieve status and SSH commands for currently rented GPUs.
@@ -312,6 +320,7 @@ Important notes:
 - Do not ask for a duration, it is not needed
 """,
         schema=RentComputeSchema,
+        validates_args=True,
     )
     def rent_compute(self, args: dict[str, Any]) -> str:
         """Rents a GPU machine on the platform.
@@ -367,6 +376,7 @@ Important notes:
 - Terminated instances will still appear in your spend history
 """,
         schema=TerminateComputeSchema,
+        validates_args=True,
     )
     def terminate_compute(self, args: dict[str, Any]) -> str:
         """Terminates a GPU instance on the platform.
@@ -4,6 +4,7 @@ from typing import Any
 
 import requests
 
+from ...metrics import track_http_request
 from .constants import API_BASE_URL
 
 
@@ -55,9 +56,10 @@ class Base:
         )
 
         url = f"{self.base_url}{endpoint}"
-        response = requests.request(
-            method=method, url=url, headers=headers, json=data, params=params
-        )
+        with track_http_request("hyperbolic"):
+            response = requests.request(
+                method=method, url=url, headers=headers, json=data, params=params
+            )
 
         try:
             response.raise_for_status()
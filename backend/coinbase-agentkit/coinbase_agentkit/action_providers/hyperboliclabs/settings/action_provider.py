@@ -72,6 +72,7 @@ Important notes:
 - If no address is provided, you can get the user's wallet address
 """,
         schema=LinkWalletAddressSchema,
+        validates_args=True,
     )
     def link_wallet_address(self, args: dict[str, Any]) -> str:
         """Links a wallet address to your Hyperbolic account.
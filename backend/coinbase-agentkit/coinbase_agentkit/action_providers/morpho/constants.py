@@ -22,4 +22,108 @@ METAMORPHO_ABI = [
         "stateMutability": "nonpayable",
         "type": "function",
     },
+    {
+        "inputs": [],
+        "name": "asset",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "totalAssets",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "totalSupply",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "shares", "type": "uint256"}],
+        "name": "convertToAssets",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "fee",
+        "outputs": [{"internalType": "uint96", "name": "", "type": "uint96"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "name": "maxDeposit",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "MORPHO",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "withdrawQueueLength",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "name": "withdrawQueue",
+        "outputs": [{"internalType": "bytes32", "name": "", "type": "bytes32"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# Morpho Blue functions reading a market's totals and a vault's position in it
+MORPHO_BLUE_ABI = [
+    {
+        "inputs": [{"internalType": "bytes32", "name": "id", "type": "bytes32"}],
+        "name": "market",
+        "outputs": [
+            {"internalType": "uint128", "name": "totalSupplyAssets", "type": "uint128"},
+            {"internalType": "uint128", "name": "totalSupplyShares", "type": "uint128"},
+            {"internalType": "uint128", "name": "totalBorrowAssets", "type": "uint128"},
+            {"internalType": "uint128", "name": "totalBorrowShares", "type": "uint128"},
+            {"internalType": "uint128", "name": "lastUpdate", "type": "uint128"},
+            {"internalType": "uint128", "name": "fee", "type": "uint128"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "bytes32", "name": "id", "type": "bytes32"},
+            {"internalType": "address", "name": "user", "type": "address"},
+        ],
+        "name": "position",
+        "outputs": [
+            {"internalType": "uint256", "name": "supplyShares", "type": "uint256"},
+            {"internalType": "uint128", "name": "borrowShares", "type": "uint128"},
+            {"internalType": "uint128", "name": "collateral", "type": "uint128"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
 ]
+
+# MetaMorpho vaults indexed by default, by chain ID
+DEFAULT_VAULTS = {
+    "8453": [
+        "0xc1256Ae5FF1cf2719D4937adb3bbCCab2E00A2Ca",  # Moonwell Flagship USDC
+        "0xbeeF010f9cb27031ad51e3333f9aF9C6B1228183",  # Steakhouse USDC
+        "0xa0E430870c4604CcfC7B38Ca7845B1FF653D0ff1",  # Moonwell Flagship ETH
+    ],
+}
@@ -0,0 +1,712 @@
+"""Index of MetaMorpho vaults ranked by trailing APY."""
+
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.erc20.token_metadata import get_token_metadata_registry
+from coinbase_agentkit.action_providers.morpho.constants import (
+    DEFAULT_VAULTS,
+    METAMORPHO_ABI,
+    MORPHO_BLUE_ABI,
+)
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.multicall import (
+    CallResult,
+    ContractCall,
+    get_multicall_address,
+)
+
+# Multicall3 functions returning the block a batch of reads is executed at
+MULTICALL3_BLOCK_ABI = [
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"internalType": "uint256", "name": "blockNumber", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getCurrentBlockTimestamp",
+        "outputs": [{"internalType": "uint256", "name": "timestamp", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# Blocks between two refreshes of a vault table, about 5 minutes on Base
+DEFAULT_REFRESH_BLOCKS = 150
+
+# Blocks the trailing APY is measured over, about 7 days on Base
+DEFAULT_APY_WINDOW_BLOCKS = 7 * 24 * 60 * 60 // 2
+
+# Seconds between blocks, used to tell a table is stale without reading the chain
+DEFAULT_BLOCK_TIME = 2.0
+
+# Trailing share price growth is annualized over a 365 day year
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+# Morpho Blue virtual assets and shares, used to convert supply shares to assets
+VIRTUAL_ASSETS = 1
+VIRTUAL_SHARES = 10**6
+
+# MetaMorpho fees are fixed-point numbers with 18 decimals
+FEE_DECIMALS = 18
+
+# Receiver passed to maxDeposit, which only depends on the vault's supply caps
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Vault reads batched for each vault before the reads of its withdraw queue markets
+VAULT_STATE_FUNCTIONS = (
+    "totalAssets",
+    "totalSupply",
+    "convertToAssets",
+    "fee",
+    "maxDeposit",
+    "withdrawQueueLength",
+)
+
+
+@dataclass(frozen=True)
+class VaultConfig:
+    """The configuration of a MetaMorpho vault, which only changes through its curator."""
+
+    address: str
+    symbol: str
+    decimals: int
+    asset: str
+    asset_symbol: str
+    asset_decimals: int
+    morpho: str
+    # Morpho Blue market IDs the vault withdraws from, in order
+    withdraw_queue: tuple[bytes, ...]
+
+
+@dataclass
+class VaultInfo:
+    """The state of a MetaMorpho vault at a block."""
+
+    address: str
+    symbol: str
+    asset: str
+    asset_symbol: str
+    asset_decimals: int
+    # Amounts in atomic units of the asset, or of the vault's shares for total_supply
+    total_assets: int
+    total_supply: int
+    liquidity: int
+    deposit_capacity: int
+    # Assets per whole share, and fee on interest, as human-readable numbers
+    share_price: Decimal
+    fee: Decimal
+    # Trailing APY earned by depositors, net of the fee, or None without a past share price
+    apy: Decimal | None = None
+
+    def projected_apy(self, amount: int = 0) -> Decimal | None:
+        """Estimate the APY after depositing an amount, assuming the vault's interest is unchanged.
+
+        Args:
+            amount: The amount to deposit, in atomic units of the asset.
+
+        Returns:
+            Decimal | None: The APY diluted by the deposit, or None if the APY is unknown.
+
+        """
+        if self.apy is None or self.total_assets + amount == 0:
+            return self.apy
+        return self.apy * self.total_assets / (self.total_assets + amount)
+
+
+@dataclass
+class VaultTable:
+    """MetaMorpho vaults of a chain at a block, ranked by trailing APY."""
+
+    chain_id: str
+    block_number: int
+    vaults: list[VaultInfo] = field(default_factory=list)
+
+    def for_asset(self, asset: str) -> list[VaultInfo]:
+        """Get the vaults of an asset, ranked by trailing APY.
+
+        Args:
+            asset: The asset address.
+
+        Returns:
+            list[VaultInfo]: The vaults.
+
+        """
+        asset = Web3.to_checksum_address(asset)
+        return [vault for vault in self.vaults if vault.asset == asset]
+
+    def best(self, asset: str, amount: int = 0) -> VaultInfo | None:
+        """Get the vault with the highest projected APY able to take a deposit.
+
+        Vaults whose APY is unknown, e.g. because past share prices could not be read,
+        rank below those with a known APY and among themselves by total assets.
+
+        Args:
+            asset: The asset address.
+            amount: The amount to deposit, in atomic units of the asset.
+
+        Returns:
+            VaultInfo | None: The best vault, or None if no vault has room.
+
+        """
+        candidates = [vault for vault in self.for_asset(asset) if vault.deposit_capacity >= amount]
+        return max(
+            candidates,
+            key=lambda vault: (
+                vault.apy is not None,
+                vault.projected_apy(amount) or 0,
+                vault.total_assets,
+            ),
+            default=None,
+        )
+
+    def to_markdown(self, asset: str, amount: int = 0) -> str:
+        """Format the best vault for a deposit and the ranking of the asset's vaults as markdown.
+
+        Args:
+            asset: The asset address.
+            amount: The amount to deposit, in atomic units of the asset.
+
+        Returns:
+            str: Markdown formatted best vault and ranking
+
+        """
+        vaults = self.for_asset(asset)
+        if not vaults:
+            return f"No indexed Morpho vault accepts {asset}."
+
+        scale = Decimal(10 ** vaults[0].asset_decimals)
+        symbol = vaults[0].asset_symbol
+        best = self.best(asset, amount)
+
+        markdown_output = "# Best Morpho Vault\n\n"
+        markdown_output += f"- **Block:** {self.block_number}\n"
+        if best is None:
+            markdown_output += (
+                f"- No vault can take a deposit of {Decimal(amount) / scale:f} {symbol}\n"
+            )
+        elif best.apy is None:
+            markdown_output += f"- **Vault:** {best.symbol} ({best.address})\n"
+            markdown_output += f"- **Asset:** {symbol} ({best.asset})\n"
+            markdown_output += "- **Trailing APY:** n/a, ranked by total assets\n"
+        else:
+            markdown_output += f"- **Vault:** {best.symbol} ({best.address})\n"
+            markdown_output += f"- **Asset:** {symbol} ({best.asset})\n"
+            markdown_output += f"- **Trailing APY:** {best.apy * 100:.2f}%\n"
+            if amount:
+                markdown_output += (
+                    f"- **APY After Deposit of {Decimal(amount) / scale:f} {symbol}:** "
+                    f"{best.projected_apy(amount) * 100:.2f}%\n"
+                )
+
+        markdown_output += "\n## Vaults\n\n"
+        markdown_output += (
+            "| Vault | Address | APY | Total Assets | Liquidity | Deposit Capacity | Fee |\n"
+            "|---|---|---|---|---|---|---|\n"
+        )
+        for vault in vaults:
+            apy = "n/a" if vault.apy is None else f"{vault.apy * 100:.2f}%"
+            markdown_output += (
+                f"| {vault.symbol} | {vault.address} | {apy} "
+                f"| {Decimal(vault.total_assets) / scale:.2f} "
+                f"| {Decimal(vault.liquidity) / scale:.2f} "
+                f"| {Decimal(vault.deposit_capacity) / scale:.2f} | {vault.fee * 100:.2f}% |\n"
+            )
+
+        return markdown_output
+
+
+def _trailing_apy(
+    share_price: int, timestamp: int, past_share_price: int | None, past_timestamp: int
+) -> Decimal | None:
+    """Annualize the growth of a vault's share price.
+
+    Args:
+        share_price: The current assets per whole share, in atomic units.
+        timestamp: The current block timestamp.
+        past_share_price: The assets per whole share at a past block, if it was read.
+        past_timestamp: The past block timestamp.
+
+    Returns:
+        Decimal | None: The APY, or None if the growth cannot be measured.
+
+    """
+    if not past_share_price or timestamp <= past_timestamp:
+        return None
+    growth = Decimal(share_price) / Decimal(past_share_price)
+    return growth ** (Decimal(SECONDS_PER_YEAR) / Decimal(timestamp - past_timestamp)) - 1
+
+
+def _liquidity(markets: list[CallResult], positions: list[CallResult]) -> int:
+    """Get the assets a vault can withdraw from its markets.
+
+    Args:
+        markets: The Morpho Blue market totals of each market in the withdraw queue.
+        positions: The vault's position in each market.
+
+    Returns:
+        int: The withdrawable assets, in atomic units.
+
+    """
+    liquidity = 0
+    for market, position in zip(markets, positions, strict=True):
+        total_supply_assets, total_supply_shares, total_borrow_assets = market.value[:3]
+        supplied = (
+            position.value[0]
+            * (total_supply_assets + VIRTUAL_ASSETS)
+            // (total_supply_shares + VIRTUAL_SHARES)
+        )
+        liquidity += min(supplied, total_supply_assets - total_borrow_assets)
+    return liquidity
+
+
+class MorphoVaultIndexer:
+    """Keeps a ranked table of MetaMorpho vaults per chain, refreshed every few blocks.
+
+    Vault configurations are read once. A refresh reads the state of every vault of a
+    chain and the Morpho Blue markets they withdraw from in one batch, then the share
+    prices at a block sampled on a grid of refresh_blocks, so successive refreshes
+    measure the trailing APY against the same cached sample. Between refreshes, finding
+    the best vault is a lookup in the cached table.
+
+    Staleness is not measured in blocks read from the chain: a table is reused for
+    refresh_blocks * block_time seconds of wall clock, which spares a head lookup on every
+    call. The table's block_number is where it was read, so a table may be reused for
+    somewhat more or fewer than refresh_blocks blocks when the chain's block time drifts
+    from block_time.
+
+    Reading share prices at a past block needs an archive node, or one that keeps at
+    least apy_window_blocks of state. On other nodes the trailing APY of every vault is
+    unknown and vaults are ranked by total assets.
+    """
+
+    def __init__(
+        self,
+        vaults: Mapping[str, Iterable[str]] | None = None,
+        refresh_blocks: int = DEFAULT_REFRESH_BLOCKS,
+        apy_window_blocks: int = DEFAULT_APY_WINDOW_BLOCKS,
+        block_time: float = DEFAULT_BLOCK_TIME,
+    ):
+        """Initialize the indexer.
+
+        Args:
+            vaults: Vault addresses by chain ID, defaults to DEFAULT_VAULTS.
+            refresh_blocks: Blocks a table is used for before being read again.
+            apy_window_blocks: Blocks the trailing APY is measured over.
+            block_time: Seconds between blocks, which turns refresh_blocks into the wall
+                clock time a table is reused for. The default matches Base.
+
+        """
+        self.refresh_blocks = refresh_blocks
+        self.apy_window_blocks = apy_window_blocks
+        self.block_time = block_time
+        self._lock = threading.Lock()
+        self._vaults: dict[str, list[str]] = {}
+        self._configs: dict[tuple[str, str], VaultConfig] = {}
+        # Tables by chain ID, with the monotonic time they were read at
+        self._tables: dict[str, tuple[float, VaultTable]] = {}
+        # Sampled past share prices by chain ID: block, timestamp and prices by vault
+        self._samples: dict[str, tuple[int, int, dict[str, int | None]]] = {}
+        for chain_id, addresses in (DEFAULT_VAULTS if vaults is None else vaults).items():
+            self.add_vaults(chain_id, addresses)
+
+    def add_vaults(self, chain_id: str, addresses: Iterable[str]) -> None:
+        """Index more vaults of a chain.
+
+        Args:
+            chain_id: The chain ID.
+            addresses: The vault addresses.
+
+        """
+        chain_id = str(chain_id)
+        with self._lock:
+            vaults = self._vaults.setdefault(chain_id, [])
+            for address in addresses:
+                address = Web3.to_checksum_address(address)
+                if address not in vaults:
+                    vaults.append(address)
+            self._tables.pop(chain_id, None)
+
+    def vaults(self, chain_id: str) -> list[str]:
+        """Get the vaults indexed on a chain.
+
+        Args:
+            chain_id: The chain ID.
+
+        Returns:
+            list[str]: The vault addresses.
+
+        """
+        with self._lock:
+            return list(self._vaults.get(str(chain_id), []))
+
+    def get_table(self, wallet: EvmWalletProvider, refresh: bool = False) -> VaultTable:
+        """Get the ranked vaults of the wallet's chain, reading them when the table is stale.
+
+        A table is stale once refresh_blocks * block_time seconds have passed since it was
+        read, an estimate of refresh_blocks blocks that does not read the chain head.
+
+        Args:
+            wallet: The wallet provider for reading from contracts.
+            refresh: Read the vaults even if the table is not stale.
+
+        Returns:
+            VaultTable: The ranked vaults.
+
+        """
+        chain_id = str(wallet.get_network().chain_id)
+        with self._lock:
+            cached = self._tables.get(chain_id)
+        max_age = self.refresh_blocks * self.block_time
+        if cached is not None and not refresh and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        table = self._read_table(wallet, chain_id)
+        with self._lock:
+            self._tables[chain_id] = (time.monotonic(), table)
+        return table
+
+    def get_best_vault(
+        self, wallet: EvmWalletProvider, asset: str, amount: int = 0
+    ) -> VaultInfo | None:
+        """Get the vault of an asset with the highest projected APY able to take a deposit.
+
+        Args:
+            wallet: The wallet provider for reading from contracts.
+            asset: The asset address.
+            amount: The amount to deposit, in atomic units of the asset.
+
+        Returns:
+            VaultInfo | None: The best vault, or None if no vault qualifies.
+
+        """
+        return self.get_table(wallet).best(asset, amount)
+
+    def _load_configs(
+        self, wallet: EvmWalletProvider, chain_id: str, addresses: list[str]
+    ) -> dict[str, VaultConfig]:
+        """Read the configuration of vaults, skipping those that cannot be read.
+
+        Args:
+            wallet: The wallet provider for reading from contracts.
+            chain_id: The chain the vaults are on.
+            addresses: The vault addresses.
+
+        Returns:
+            dict[str, VaultConfig]: The configurations by vault address.
+
+        """
+        functions = ("asset", "MORPHO", "withdrawQueueLength")
+        results = wallet.batch_read_contract(
+            [
+                ContractCall(address, METAMORPHO_ABI, function_name)
+                for address in addresses
+                for function_name in functions
+            ]
+        )
+        vaults = {}
+        for i, address in enumerate(addresses):
+            vault_results = results[i * len(functions) : (i + 1) * len(functions)]
+            if all(result.success for result in vault_results):
+                vaults[address] = [result.value for result in vault_results]
+            else:
+                print(f"Warning: Skipping Morpho vault {address}, its configuration cannot be read")
+
+        queues = iter(
+            wallet.batch_read_contract(
+                [
+                    ContractCall(address, METAMORPHO_ABI, "withdrawQueue", [i], allow_failure=False)
+                    for address, (_, _, length) in vaults.items()
+                    for i in range(length)
+                ]
+            )
+        )
+        metadata = get_token_metadata_registry().get_many(
+            wallet, [*vaults, *(asset for asset, _, _ in vaults.values())]
+        )
+        vault_metadata, asset_metadata = metadata[: len(vaults)], metadata[len(vaults) :]
+
+        configs = {}
+        for (address, (_, morpho, length)), vault_token, asset_token in zip(
+            vaults.items(), vault_metadata, asset_metadata, strict=True
+        ):
+            configs[address] = VaultConfig(
+                address=address,
+                symbol=vault_token.symbol or address,
+                decimals=vault_token.decimals,
+                asset=asset_token.address,
+                asset_symbol=asset_token.symbol or asset_token.address,
+                asset_decimals=asset_token.decimals,
+                morpho=morpho,
+                withdraw_queue=tuple(next(queues).value for _ in range(length)),
+            )
+        with self._lock:
+            self._configs.update(
+                ((chain_id, address), config) for address, config in configs.items()
+            )
+        return configs
+
+    def _get_configs(self, wallet: EvmWalletProvider, chain_id: str) -> dict[str, VaultConfig]:
+        """Get the configuration of every vault of a chain, reading those not cached.
+
+        Args:
+            wallet: The wallet provider for reading from contracts.
+            chain_id: The chain ID.
+
+        Returns:
+            dict[str, VaultConfig]: The configurations by vault address.
+
+        """
+        addresses = self.vaults(chain_id)
+        with self._lock:
+            configs = {
+                address: self._configs[(chain_id, address)]
+                for address in addresses
+                if (chain_id, address) in self._configs
+            }
+        missing = [address for address in addresses if address not in configs]
+        if missing:
+            configs.update(self._load_configs(wallet, chain_id, missing))
+        return {address: configs[address] for address in addresses if address in configs}
+
+    @staticmethod
+    def _vault_calls(config: VaultConfig) -> list[ContractCall]:
+        """Build the reads of a vault's state and of the markets it withdraws from.
+
+        Args:
+            config: The vault configuration.
+
+        Returns:
+            list[ContractCall]: The VAULT_STATE_FUNCTIONS reads, then the totals of each
+                withdraw queue market and the vault's position in it.
+
+        """
+        args = {"convertToAssets": [10**config.decimals], "maxDeposit": [ZERO_ADDRESS]}
+        return [
+            *(
+                ContractCall(config.address, METAMORPHO_ABI, name, args.get(name, []))
+                for name in VAULT_STATE_FUNCTIONS
+            ),
+            *(
+                call
+                for market_id in config.withdraw_queue
+                for call in (
+                    ContractCall(config.morpho, MORPHO_BLUE_ABI, "market", [market_id]),
+                    ContractCall(
+                        config.morpho, MORPHO_BLUE_ABI, "position", [market_id, config.address]
+                    ),
+                )
+            ),
+        ]
+
+    def _read_state(
+        self, wallet: EvmWalletProvider, configs: dict[str, VaultConfig]
+    ) -> tuple[int, int, dict[str, list[CallResult]]]:
+        """Read the state of vaults in a single batch.
+
+        Args:
+            wallet: The wallet provider for reading from contracts.
+            configs: The vault configurations.
+
+        Returns:
+            tuple[int, int, dict[str, list[CallResult]]]: The block number, block timestamp
+                and results of each vault's reads.
+
+        """
+        multicall = get_multicall_address(wallet.get_network())
+        vault_calls = {address: self._vault_calls(config) for address, config in configs.items()}
+        results = wallet.batch_read_contract(
+            [
+                ContractCall(
+                    multicall, MULTICALL3_BLOCK_ABI, "getBlockNumber", allow_failure=False
+                ),
+                ContractCall(
+                    multicall, MULTICALL3_BLOCK_ABI, "getCurrentBlockTimestamp", allow_failure=False
+                ),
+                *(call for calls in vault_calls.values() for call in calls),
+            ]
+        )
+
+        offset = 2
+        vault_results = {}
+        for address, calls in vault_calls.items():
+            vault_results[address] = results[offset : offset + len(calls)]
+            offset += len(calls)
+        return results[0].value, results[1].value, vault_results
+
+    def _past_share_prices(
+        self,
+        wallet: EvmWalletProvider,
+        chain_id: str,
+        block_number: int,
+        configs: dict[str, VaultConfig],
+    ) -> tuple[int, dict[str, int | None]]:
+        """Get vault share prices at a block on the sample grid before the APY window.
+
+        Args:
+            wallet: The wallet provider for reading from contracts.
+            chain_id: The chain ID.
+            block_number: The current block number.
+            configs: The vault configurations.
+
+        Returns:
+            tuple[int, dict[str, int | None]]: The sample's timestamp and the share price of
+                each vault, None for vaults that could not be read at the sample.
+
+        """
+        sample_block = (block_number - self.apy_window_blocks) // self.refresh_blocks
+        sample_block *= self.refresh_blocks
+        if sample_block <= 0:
+            return 0, {}
+
+        with self._lock:
+            sample = self._samples.get(chain_id)
+        if sample is None or sample[0] != sample_block:
+            sample = (sample_block, 0, {})
+        missing = [address for address in configs if address not in sample[2]]
+        if not missing:
+            return sample[1], sample[2]
+
+        try:
+            results = wallet.batch_read_contract(
+                [
+                    ContractCall(
+                        get_multicall_address(wallet.get_network()),
+                        MULTICALL3_BLOCK_ABI,
+                        "getCurrentBlockTimestamp",
+                        allow_failure=False,
+                    ),
+                    *(
+                        ContractCall(
+                            address,
+                            METAMORPHO_ABI,
+                            "convertToAssets",
+                            [10 ** configs[address].decimals],
+                        )
+                        for address in missing
+                    ),
+                ],
+                block_identifier=sample_block,
+            )
+        except Exception as e:
+            # Nodes that prune old state cannot read at the sample, so the APYs stay unknown
+            print(
+                f"Warning: Cannot read Morpho vault share prices at block {sample_block}, "
+                f"trailing APYs need an archive node: {e}"
+            )
+            prices = dict(sample[2])
+            prices.update((address, None) for address in missing)
+            with self._lock:
+                self._samples[chain_id] = (sample_block, sample[1], prices)
+            return sample[1], prices
+
+        prices = dict(sample[2])
+        prices.update(
+            (address, result.value if result.success else None)
+            for address, result in zip(missing, results[1:], strict=True)
+        )
+        with self._lock:
+            self._samples[chain_id] = (sample_block, results[0].value, prices)
+        return results[0].value, prices
+
+    def _read_table(self, wallet: EvmWalletProvider, chain_id: str) -> VaultTable:
+        """Read the vaults of a chain and rank them.
+
+        Args:
+            wallet: The wallet provider for reading from contracts.
+            chain_id: The chain ID.
+
+        Returns:
+            VaultTable: The ranked vaults.
+
+        """
+        configs = self._get_configs(wallet, chain_id)
+        block_number, timestamp, states = self._read_state(wallet, configs)
+
+        # Curators changed a withdraw queue since it was cached, read those vaults again
+        changed = [
+            address
+            for address, results in states.items()
+            if results[5].success and results[5].value != len(configs[address].withdraw_queue)
+        ]
+        if changed:
+            configs.update(self._load_configs(wallet, chain_id, changed))
+            block_number, timestamp, states = self._read_state(wallet, configs)
+
+        past_timestamp, past_prices = self._past_share_prices(
+            wallet, chain_id, block_number, configs
+        )
+
+        vaults = []
+        for address, results in states.items():
+            config = configs[address]
+            if not all(result.success for result in results):
+                print(f"Warning: Skipping Morpho vault {address}, its state cannot be read")
+                continue
+
+            total_assets, total_supply, share_price, fee, deposit_capacity, _ = (
+                result.value for result in results[: len(VAULT_STATE_FUNCTIONS)]
+            )
+            markets = results[len(VAULT_STATE_FUNCTIONS) :]
+            vaults.append(
+                VaultInfo(
+                    address=address,
+                    symbol=config.symbol,
+                    asset=config.asset,
+                    asset_symbol=config.asset_symbol,
+                    asset_decimals=config.asset_decimals,
+                    total_assets=total_assets,
+                    total_supply=total_supply,
+                    liquidity=_liquidity(markets[::2], markets[1::2]),
+                    deposit_capacity=deposit_capacity,
+                    share_price=Decimal(share_price) / Decimal(10**config.asset_decimals),
+                    fee=Decimal(fee) / Decimal(10**FEE_DECIMALS),
+                    apy=_trailing_apy(
+                        share_price, timestamp, past_prices.get(address), past_timestamp
+                    ),
+                )
+            )
+
+        vaults.sort(
+            key=lambda vault: (vault.apy is not None, vault.apy or 0, vault.total_assets),
+            reverse=True,
+        )
+        return VaultTable(chain_id=chain_id, block_number=block_number, vaults=vaults)
+
+
+_indexer: MorphoVaultIndexer | None = None
+_indexer_lock = threading.Lock()
+
+
+def get_vault_indexer() -> MorphoVaultIndexer:
+    """Get the vault indexer shared by every Morpho action provider.
+
+    Returns:
+        MorphoVaultIndexer: The shared indexer, indexing DEFAULT_VAULTS.
+
+    """
+    global _indexer
+    with _indexer_lock:
+        if _indexer is None:
+            _indexer = MorphoVaultIndexer()
+        return _indexer
+
+
+def set_vault_indexer(indexer: MorphoVaultIndexer | None) -> None:
+    """Replace the vault indexer shared by every Morpho action provider.
+
+    Args:
+        indexer: The indexer to use, or None to create a new default one on next use.
+
+    """
+    global _indexer
+    with _indexer_lock:
+        _indexer = indexer
@@ -7,15 +7,21 @@ from web3 import Web3
 
 from coinbase_agentkit.action_providers.action_decorator import create_action
 from coinbase_agentkit.action_providers.action_provider import ActionProvider
-from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.action_providers.erc20.token_metadata import get_token_metadata_registry
 from coinbase_agentkit.action_providers.morpho.constants import METAMORPHO_ABI
+from coinbase_agentkit.action_providers.morpho.indexer import (
+    MorphoVaultIndexer,
+    get_vault_indexer,
+)
 from coinbase_agentkit.action_providers.morpho.schemas import (
+    MorphoBestVaultSchema,
     MorphoDepositSchema,
     MorphoWithdrawSchema,
 )
-from coinbase_agentkit.action_providers.morpho.utils import approve
+from coinbase_agentkit.action_providers.morpho.utils import build_approve_transaction
 from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import TransactionFailedError
 
 SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
 
@@ -23,8 +29,9 @@ SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
 class MorphoActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Morpho Vaults."""
 
-    def __init__(self):
+    def __init__(self, vault_indexer: MorphoVaultIndexer | None = None):
         super().__init__("morpho", [])
+        self._vault_indexer = vault_indexer
 
     @create_action(
         name="deposit",
@@ -61,21 +68,15 @@ Important notes:
             return "Error: Assets amount must be greater than 0"
 
         try:
-            decimals = wallet_provider.read_contract(
-                contract_address=args["token_address"],
-                abi=ERC20_ABI,
-                function_name="decimals",
-                args=[],
+            decimals = get_token_metadata_registry().get_decimals(
+                wallet_provider, args["token_address"]
             )
 
             atomic_assets = int(assets * (10**decimals))
 
-            try:
-                approve(
-                    wallet_provider, args["token_address"], args["vault_address"], atomic_assets
-                )
-            except Exception as e:
-                return f"Error approving Morpho Vault as spender: {e!s}"
+            approve_params = build_approve_transaction(
+                args["token_address"], args["vault_address"], atomic_assets
+            )
 
             morpho_contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
 
@@ -88,8 +89,20 @@ Important notes:
                 "data": encoded_data,
             }
 
-            tx_hash = wallet_provider.send_transaction(params)
-            wallet_provider.wait_for_transaction_receipt(tx_hash)
+            # Submit the approval and the deposit back to back when the deposit's gas can be
+            # estimated, otherwise send_transactions waits for the approval to be mined first
+            try:
+                approve_hash, tx_hash = wallet_provider.send_transactions([approve_params, params])
+            except TransactionFailedError as e:
+                return f"Error approving Morpho Vault as spender: {e!s}"
+
+            approve_receipt = wallet_provider.wait_for_transaction_receipt(approve_hash)
+            if approve_receipt["status"] == 0:
+                return f"Error approving Morpho Vault as spender: Transaction {approve_hash} failed to execute"
+
+            receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+            if receipt["status"] == 0:
+                return f"Error depositing to Morpho Vault: Transaction {tx_hash} failed to execute"
 
             return f"Deposited {args['assets']} to Morpho Vault {args['vault_address']} with transaction hash: {tx_hash}"
 
@@ -143,6 +156,51 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
         except Exception as e:
             return f"Error withdrawing from Morpho Vault: {e!s}"
 
+    @create_action(
+        name="get_best_vault",
+        description="""
+This tool finds the Morpho Vault with the highest yield for depositing an asset.
+It takes:
+- asset_address: The address of the asset to deposit
+- amount: The amount of assets to deposit in whole units, defaults to 0
+    Examples for USDC:
+    - 1000 USDC
+    - 0.5 USDC
+Returns the best vault address, its trailing APY and the APY after the deposit, and a ranking of the asset's vaults with their total assets, withdrawable liquidity, deposit capacity and fee.
+Formatted in Markdown for readability.
+Use it to choose the vault_address of a deposit instead of guessing one.""",
+        schema=MorphoBestVaultSchema,
+        validates_args=True,
+        read_only=True,
+    )
+    def get_best_vault(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Find the best Morpho Vault for a deposit.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the best vault and ranking or error details.
+
+        """
+        try:
+            validated_args = MorphoBestVaultSchema(**args)
+            indexer = self._vault_indexer or get_vault_indexer()
+            table = indexer.get_table(wallet_provider)
+
+            vaults = table.for_asset(validated_args.asset_address)
+            if not vaults:
+                return f"No indexed Morpho Vault accepts {validated_args.asset_address}"
+
+            amount = int(Decimal(validated_args.amount) * (10 ** vaults[0].asset_decimals))
+            if amount < 0:
+                return "Error: Assets amount must not be negative"
+
+            return table.to_markdown(validated_args.asset_address, amount)
+        except Exception as e:
+            return f"Error finding the best Morpho Vault: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if the network is supported by this action provider.
 
@@ -156,11 +214,17 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
         return network.protocol_family == "evm" and network.network_id in SUPPORTED_NETWORKS
 
 
-def morpho_action_provider() -> MorphoActionProvider:
+def morpho_action_provider(
+    vault_indexer: MorphoVaultIndexer | None = None,
+) -> MorphoActionProvider:
     """Create a new Morpho action provider.
 
+    Args:
+        vault_indexer (MorphoVaultIndexer | None): The vault indexer used to rank vaults,
+            defaults to the shared indexer.
+
     Returns:
         MorphoActionProvider: A new Morpho action provider instance.
 
     """
-    return MorphoActionProvider()
+    return MorphoActionProvider(vault_indexer)
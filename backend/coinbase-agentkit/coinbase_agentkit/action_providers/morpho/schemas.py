@@ -23,3 +23,12 @@ class MorphoWithdrawSchema(BaseModel):
     vault_address: str = Field(..., description="The address of the Morpho Vault to withdraw from")
     assets: str = Field(..., description="The amount of assets to withdraw in atomic units")
     receiver: str = Field(..., description="The address to receive the withdrawn assets")
+
+
+class MorphoBestVaultSchema(BaseModel):
+    """Input schema for Morpho best vault action."""
+
+    asset_address: str = Field(..., description="The address of the asset to deposit")
+    amount: str = Field(
+        "0", description="The quantity of assets to deposit, in whole units, e.g. `1000` usdc"
+    )
@@ -22,6 +22,7 @@ from coinbase_agentkit.action_providers.nillion.schemas import (
     NillionDataUploadInput,
     NillionDataDownloadInput,
 )
+from coinbase_agentkit.metrics import track_http_request
 from coinbase_agentkit.network import Network
 
 
@@ -43,13 +44,14 @@ class NillionActionProvider(ActionProvider):
 
         """Initialize config with JWTs signed with ES256K for multiple node_ids; Add cluster key."""
         self.org_did = org_did
-        response = requests.post(
-            "https://secret-vault-registration.replit.app/api/config",
-            headers={
-                "Content-Type": "application/json",
-            },
-            json={"org_did": org_did},
-        )
+        with track_http_request("nillion"):
+            response = requests.post(
+                "https://secret-vault-registration.replit.app/api/config",
+                headers={
+                    "Content-Type": "application/json",
+                },
+                json={"org_did": org_did},
+            )
         self.nodes = response.json()["nodes"]
 
         # Convert the secret key from hex to bytes
@@ -79,11 +81,12 @@ class NillionActionProvider(ActionProvider):
                 "Content-Type": "application/json",
             }
 
-            response = requests.post(
-                f"{node['url']}/api/v1/{endpoint}",
-                headers=headers,
-                json=payload,
-            )
+            with track_http_request("nillion"):
+                response = requests.post(
+                    f"{node['url']}/api/v1/{endpoint}",
+                    headers=headers,
+                    json=payload,
+                )
 
             assert (
                 response.status_code == 200 and response.json().get("errors", []) == []
@@ -98,7 +101,8 @@ class NillionActionProvider(ActionProvider):
             "Content-Type": "application/json",
         }
 
-        response = requests.get(f"{self.nodes[0]['url']}/api/v1/schemas", headers=headers)
+        with track_http_request("nillion"):
+            response = requests.get(f"{self.nodes[0]['url']}/api/v1/schemas", headers=headers)
 
         assert (
             response.status_code == 200 and response.json().get("errors", []) == []
@@ -176,6 +180,8 @@ definition:
 A failure response will return a tuple with empty values
     """,
         schema=NillionLookupSchemaInput,
+        validates_args=True,
+        read_only=True,
     )
     def lookup_schema(self, args: dict[str, Any]) -> tuple:
         """Lookup a JSON schema based on input description and return it's UUID.
@@ -264,6 +270,7 @@ definition:
 A failure response will return a tuple with empty values
     """,
         schema=NillionCreateSchemaInput,
+        validates_args=True,
     )
     def create_schema(self, args: dict[str, Any]) -> tuple:
         """Create a schema in your privacy preserving database, called the Nillion SecretVault
@@ -383,6 +390,7 @@ action of the NillionActionProvider.
 Success will return  a list of created record UUIDs, failure is an empty list.
     """,
         schema=NillionDataUploadInput,
+        validates_args=True,
     )
     def data_upload(self, args: dict[str, Any]) -> list[str]:
         """Upload data into my privacy preserving database, called the Nillion SecretVault
@@ -421,11 +429,12 @@ Success will return  a list of created record UUIDs, failure is an empty list.
 
                 body = {"schema": validated_args.schema_uuid, "data": shard}
 
-                response = requests.post(
-                    f"{node['url']}/api/v1/data/create",
-                    headers=headers,
-                    json=body,
-                )
+                with track_http_request("nillion"):
+                    response = requests.post(
+                        f"{node['url']}/api/v1/data/create",
+                        headers=headers,
+                        json=body,
+                    )
 
                 assert response.status_code == 200 and response.json().get("errors", []) == [], (
                     f"upload (host-{idx}) failed: " + response.content.decode("utf8")
@@ -447,6 +456,8 @@ NillionActionProvider.
 Success will return true, whereas a failure response will return false.
     """,
         schema=NillionDataDownloadInput,
+        validates_args=True,
+        read_only=True,
     )
     def data_download(self, args: dict[str, Any]) -> list[dict]:
         """Download data from my privacy preserving database, called the Nillion SecretVault
@@ -475,11 +486,12 @@ Success will return true, whereas a failure response will return false.
                     "filter": {},
                 }
 
-                response = requests.post(
-                    f"{node['url']}/api/v1/data/read",
-                    headers=headers,
-                    json=body,
-                )
+                with track_http_request("nillion"):
+                    response = requests.post(
+                        f"{node['url']}/api/v1/data/read",
+                        headers=headers,
+                        json=body,
+                    )
                 assert response.status_code == 200, "upload failed: " + response.content.decode(
                     "utf8"
                 )
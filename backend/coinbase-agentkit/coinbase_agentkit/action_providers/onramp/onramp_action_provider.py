@@ -40,6 +40,7 @@ Use this when:
 The URL will direct to a secure Coinbase-powered purchase interface.
 """,
         schema=GetOnrampBuyUrlSchema,
+        read_only=True,
     )
     def get_onramp_buy_url(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Get a URL for purchasing cryptocurrency through Coinbase's onramp service.
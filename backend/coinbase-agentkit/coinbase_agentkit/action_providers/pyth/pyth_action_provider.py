@@ -5,6 +5,7 @@ from typing import Any
 import requests
 from pydantic import BaseModel, Field
 
+from ...metrics import track_http_request
 from ...network import Network
 from ...wallet_providers import WalletProvider
 from ..action_decorator import create_action
@@ -33,6 +34,7 @@ class PythActionProvider(ActionProvider[WalletProvider]):
         name="fetch_price_feed_id",
         description="Fetch the price feed ID for a given token symbol (e.g. BTC, ETH, etc.) from Pyth.",
         schema=FetchPriceFeedIdSchema,
+        read_only=True,
     )
     def fetch_price_feed_id(self, args: dict[str, Any]) -> str:
         """Fetch the price feed ID for a given token symbol from Pyth.
@@ -46,7 +48,8 @@ class PythActionProvider(ActionProvider[WalletProvider]):
         """
         token_symbol = args["token_symbol"]
         url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-        response = requests.get(url)
+        with track_http_request("pyth"):
+            response = requests.get(url)
         response.raise_for_status()
         data = response.json()
 
@@ -72,6 +75,7 @@ Important notes:
 - If you are asked to fetch the price from Pyth for a ticker symbol such as BTC, you must first use the fetch_price_feed_id action.
 """,
         schema=FetchPriceSchema,
+        read_only=True,
     )
     def fetch_price(self, args: dict[str, Any]) -> str:
         """Fetch price from Pyth for the given price feed ID.
@@ -86,7 +90,8 @@ Important notes:
         try:
             price_feed_id = args["price_feed_id"]
             url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
-            response = requests.get(url)
+            with track_http_request("pyth"):
+                response = requests.get(url)
             response.raise_for_status()
             data = response.json()
             parsed_data = data["parsed"]
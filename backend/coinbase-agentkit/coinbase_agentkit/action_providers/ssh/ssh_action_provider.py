@@ -78,6 +78,7 @@ Important notes:
 - If host key verification fails, use ssh_add_host_key
 """,
         schema=SSHConnectionSchema,
+        validates_args=True,
     )
     def ssh_connect(self, args: dict[str, Any]) -> str:
         """Establish SSH connection to remote server.
@@ -148,6 +149,7 @@ Important notes:
 - You can install any packages you need on the remote server
 """,
         schema=RemoteShellSchema,
+        validates_args=True,
     )
     def remote_shell(self, args: dict[str, Any]) -> str:
         """Execute a command on the remote server.
@@ -203,6 +205,7 @@ Important notes:
 - You will need to establish a new connection to reconnect
 """,
         schema=DisconnectSchema,
+        validates_args=True,
     )
     def ssh_disconnect(self, args: dict[str, Any]) -> str:
         """Disconnects from an active SSH session.
@@ -258,6 +261,7 @@ Important notes:
 - To list all connections, use the list_connections action
 """,
         schema=ConnectionStatusSchema,
+        validates_args=True,
     )
     def ssh_status(self, args: dict[str, Any]) -> str:
         """Retrieve status of a specific SSH connection.
@@ -366,6 +370,7 @@ Important notes:
 - SSH user must have permission to write to the remote location
 """,
         schema=FileUploadSchema,
+        validates_args=True,
     )
     def ssh_upload(self, args: dict[str, Any]) -> str:
         """Upload a file to the remote server.
@@ -444,6 +449,7 @@ Important notes:
 - If the local file already exists, it will be overwritten
 """,
         schema=FileDownloadSchema,
+        validates_args=True,
     )
     def ssh_download(self, args: dict[str, Any]) -> str:
         """Download a file from the remote server.
@@ -522,6 +528,7 @@ Important notes:
 - Existing entries for the same host will be updated (not duplicated)
 """,
         schema=AddHostKeySchema,
+        validates_args=True,
     )
     def ssh_add_host_key(self, args: dict[str, Any]) -> str:
         """Add an SSH host key to the known_hosts file.
@@ -74,6 +74,8 @@ A successful response will return a message with the api response as a json payl
 A failure response will return a message with a Twitter API request error:
     Error retrieving authenticated user account: 429 Too Many Requests""",
         schema=AccountDetailsSchema,
+        validates_args=True,
+        read_only=True,
     )
     def account_details(self, args: dict[str, Any]) -> str:
         """Get the authenticated Twitter user account details.
@@ -109,6 +111,8 @@ A successful response will return a message with the API response as a JSON payl
 A failure response will return a message with the Twitter API request error:
     Error retrieving user mentions: 429 Too Many Requests""",
         schema=AccountMentionsSchema,
+        validates_args=True,
+        read_only=True,
     )
     def account_mentions(self, args: dict[str, Any]) -> str:
         """Get mentions for a specified Twitter user.
@@ -141,6 +145,7 @@ A successful response will return a message with the API response as a JSON payl
 A failure response will return a message with the Twitter API request error:
     You are not allowed to create a Tweet with duplicate content.""",
         schema=PostTweetSchema,
+        validates_args=True,
     )
     def post_tweet(self, args: dict[str, Any]) -> str:
         """Post a tweet on Twitter.
@@ -173,6 +178,7 @@ A successful response will return a message with the API response as a JSON payl
 A failure response will return a message with the Twitter API request error:
     You are not allowed to create a Tweet with duplicate content.""",
         schema=PostTweetReplySchema,
+        validates_args=True,
     )
     def post_tweet_reply(self, args: dict[str, Any]) -> str:
         """Post a reply to a tweet on Twitter.
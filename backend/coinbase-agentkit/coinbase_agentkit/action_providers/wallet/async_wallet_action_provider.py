@@ -0,0 +1,141 @@
+"""Async wallet action provider for basic wallet operations."""
+
+from typing import Any
+
+from ...metrics import record_action_error
+from ...network import Network
+from ...wallet_providers.wallet_provider import AsyncWalletProvider
+from ..action_decorator import create_action
+from ..action_provider import ActionProvider
+from .schemas import GetBalanceSchema, GetWalletDetailsSchema, NativeTransferSchema
+
+
+class AsyncWalletActionProvider(ActionProvider[AsyncWalletProvider]):
+    """Provides the wallet actions for async wallet providers, awaiting their network calls."""
+
+    def __init__(self):
+        super().__init__("async_wallet", [])
+
+    @create_action(
+        name="get_wallet_details",
+        description="""
+    This tool will return the details of the connected wallet including:
+    - Wallet address
+    - Network information (protocol family, network ID, chain ID)
+    - Native token balance
+    - Wallet provider name
+    """,
+        schema=GetWalletDetailsSchema,
+        read_only=True,
+    )
+    async def get_wallet_details(
+        self, wallet_provider: AsyncWalletProvider, args: dict[str, Any]
+    ) -> str:
+        """Get details about the connected wallet.
+
+        Args:
+            wallet_provider (AsyncWalletProvider): The wallet provider to get details from.
+            args (dict[str, Any]): The input arguments.
+
+        Returns:
+            str: A formatted string containing wallet details and network information.
+
+        """
+        try:
+            network = wallet_provider.get_network()
+            balance = await wallet_provider.get_balance()
+
+            return f"""Wallet Details:
+- Provider: {wallet_provider.get_name()}
+- Address: {wallet_provider.get_address()}
+- Network:
+  * Protocol Family: {network.protocol_family}
+  * Network ID: {network.network_id or "N/A"}
+  * Chain ID: {network.chain_id if network.chain_id else "N/A"}
+- Native Balance: {balance}"""
+        except Exception as e:
+            record_action_error(e)
+            return f"Error getting wallet details: {e}"
+
+    @create_action(
+        name="get_balance",
+        description="This tool will get the native currency balance of the connected wallet.",
+        schema=GetBalanceSchema,
+        read_only=True,
+    )
+    async def get_balance(self, wallet_provider: AsyncWalletProvider, args: dict[str, Any]) -> str:
+        """Get the native currency balance for the connected wallet.
+
+        Args:
+            wallet_provider (AsyncWalletProvider): The wallet provider to get the balance from.
+            args (dict[str, Any]): The input arguments.
+
+        Returns:
+            str: A message containing the wallet address and balance information.
+
+        """
+        try:
+            balance = await wallet_provider.get_balance()
+            return f"Native balance at address {wallet_provider.get_address()}: {balance}"
+        except Exception as e:
+            record_action_error(e)
+            return f"Error getting balance: {e}"
+
+    @create_action(
+        name="native_transfer",
+        description="""
+This tool will transfer native tokens from the wallet to another onchain address.
+
+It takes the following inputs:
+- to: The destination address to receive the funds (e.g. '0x5154eae861cac3aa757d6016babaf972341354cf')
+- value: The amount to transfer in whole units (e.g. '1.5' for 1.5 ETH)
+
+Important notes:
+- Ensure sufficient balance of the input asset before transferring
+- Ensure there is sufficient balance for the transfer itself AND the gas cost of this transfer
+""",
+        schema=NativeTransferSchema,
+        validates_args=True,
+    )
+    async def native_transfer(
+        self, wallet_provider: AsyncWalletProvider, args: dict[str, Any]
+    ) -> str:
+        """Transfer native tokens from the connected wallet to a destination address.
+
+        Args:
+            wallet_provider (AsyncWalletProvider): The wallet provider to transfer tokens from.
+            args (dict[str, Any]): Arguments containing destination address and transfer amount.
+
+        Returns:
+            str: A message containing the transfer details and transaction hash.
+
+        """
+        try:
+            validated_args = NativeTransferSchema(**args)
+            tx_hash = await wallet_provider.native_transfer(validated_args.to, validated_args.value)
+            return f"Successfully transferred {validated_args.value} native tokens to {validated_args.to}.\nTransaction hash: {tx_hash}"
+        except Exception as e:
+            record_action_error(e)
+            return f"Error transferring native tokens: {e}"
+
+    def supports_network(self, network: Network) -> bool:
+        """Check if network is supported by wallet actions.
+
+        Args:
+            network (Network): The network to check support for.
+
+        Returns:
+            bool: True if the network is supported.
+
+        """
+        return True
+
+
+def async_wallet_action_provider() -> AsyncWalletActionProvider:
+    """Create a new AsyncWalletActionProvider instance.
+
+    Returns:
+        AsyncWalletActionProvider: A new async wallet action provider instance.
+
+    """
+    return AsyncWalletActionProvider()
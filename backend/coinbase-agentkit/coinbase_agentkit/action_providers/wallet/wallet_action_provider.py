@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from ...metrics import record_action_error
 from ...network import Network
 from ...wallet_providers.wallet_provider import WalletProvider
 from ..action_decorator import create_action
@@ -25,6 +26,7 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
     - Wallet provider name
     """,
         schema=GetWalletDetailsSchema,
+        read_only=True,
     )
     def get_wallet_details(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
         """Get details about the connected wallet.
@@ -52,12 +54,14 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
   * Chain ID: {network.chain_id if network.chain_id else "N/A"}
 - Native Balance: {balance}"""
         except Exception as e:
+            record_action_error(e)
             return f"Error getting wallet details: {e}"
 
     @create_action(
         name="get_balance",
         description="This tool will get the native currency balance of the connected wallet.",
         schema=GetBalanceSchema,
+        read_only=True,
     )
     def get_balance(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
         """Get the native currency balance for the connected wallet.
@@ -76,6 +80,7 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
 
             return f"Native balance at address {wallet_address}: {balance}"
         except Exception as e:
+            record_action_error(e)
             return f"Error getting balance: {e}"
 
     @create_action(
@@ -92,6 +97,7 @@ Important notes:
 - Ensure there is sufficient balance for the transfer itself AND the gas cost of this transfer
 """,
         schema=NativeTransferSchema,
+        validates_args=True,
     )
     def native_transfer(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
         """Transfer native tokens from the connected wallet to a destination address.
@@ -109,6 +115,7 @@ Important notes:
             tx_hash = wallet_provider.native_transfer(validated_args.to, validated_args.value)
             return f"Successfully transferred {validated_args.value} native tokens to {validated_args.to}.\nTransaction hash: {tx_hash}"
         except Exception as e:
+            record_action_error(e)
             return f"Error transferring native tokens: {e}"
 
     def supports_network(self, network: Network) -> bool:
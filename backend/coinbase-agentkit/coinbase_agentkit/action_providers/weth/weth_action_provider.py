@@ -34,6 +34,7 @@ Important notes:
 - Minimum purchase amount is 100000000000000 wei (0.0001 WETH)
 """,
         schema=WrapEthSchema,
+        validates_args=True,
     )
     def wrap_eth(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Wrap ETH to WETH by calling the deposit function on the WETH contract.
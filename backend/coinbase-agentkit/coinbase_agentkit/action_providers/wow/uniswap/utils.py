@@ -7,7 +7,8 @@ from typing import Literal
 from web3 import Web3
 from web3.types import Wei
 
-from ....wallet_providers import EvmWalletProvider
+from ....tracing import traced
+from ....wallet_providers import ContractCall, EvmWalletProvider
 from ..constants import WOW_ABI, addresses
 from .constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
 
@@ -108,49 +109,24 @@ def get_pool_info(wallet_provider: EvmWalletProvider, pool_address: str) -> Pool
 
     """
     try:
-        token0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token0",
-            args=[],
-        )
-        token1 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token1",
-            args=[],
-        )
-        fee = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="fee",
-            args=[],
-        )
-        liquidity = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="liquidity",
-            args=[],
-        )
-        slot0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="slot0",
-            args=[],
-        )
-
-        balance0 = wallet_provider.read_contract(
-            contract_address=token0,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
+        token0, token1, fee, liquidity, slot0 = (
+            result.value
+            for result in wallet_provider.batch_read_contract(
+                [
+                    ContractCall(pool_address, UNISWAP_V3_ABI, function_name, allow_failure=False)
+                    for function_name in ("token0", "token1", "fee", "liquidity", "slot0")
+                ]
+            )
         )
 
-        balance1 = wallet_provider.read_contract(
-            contract_address=token1,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
+        balance0, balance1 = (
+            result.value
+            for result in wallet_provider.batch_read_contract(
+                [
+                    ContractCall(token, WOW_ABI, "balanceOf", [pool_address], allow_failure=False)
+                    for token in (token0, token1)
+                ]
+            )
         )
 
         return PoolInfo(
@@ -208,6 +184,7 @@ def exact_input_single(
         return 0
 
 
+@traced("wow.get_uniswap_quote")
 def get_uniswap_quote(
     wallet_provider: EvmWalletProvider,
     token_address: str,
@@ -1,5 +1,6 @@
 """Utilities for WOW action provider."""
 
+from ...tracing import traced
 from ...wallet_providers import EvmWalletProvider
 from .constants import WOW_ABI, WOW_FACTORY_CONTRACT_ADDRESSES
 from .uniswap.utils import get_has_graduated, get_uniswap_quote
@@ -46,6 +47,7 @@ def get_current_supply(wallet_provider: EvmWalletProvider, token_address: str) -
     )
 
 
+@traced("wow.get_buy_quote")
 def get_buy_quote(
     wallet_provider: EvmWalletProvider, token_address: str, amount_eth_in_wei: str
 ) -> int:
@@ -77,6 +79,7 @@ def get_buy_quote(
     return token_quote
 
 
+@traced("wow.get_sell_quote")
 def get_sell_quote(
     wallet_provider: EvmWalletProvider, token_address: str, amount_tokens_in_wei: str
 ) -> int:
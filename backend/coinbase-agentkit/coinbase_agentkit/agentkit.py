@@ -1,13 +1,27 @@
 """AgentKit - The framework for enabling AI agents to take actions onchain."""
 
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict
 
-from .action_providers import Action, ActionProvider, wallet_action_provider
-from .wallet_providers import (
-    CdpEvmServerWalletProvider,
-    CdpEvmServerWalletProviderConfig,
-    WalletProvider,
-)
+from .action_providers import Action, ActionProvider
+from .wallet_providers import AsyncWalletProvider, WalletProvider
+
+# Default number of actions run at the same time by invoke_many
+DEFAULT_MAX_PARALLEL_ACTIONS = 8
+
+
+@dataclass
+class ActionCall:
+    """A call to an action, by name, with its arguments."""
+
+    name: str
+    args: dict[str, Any] = field(default_factory=dict)
 
 
 class AgentKitConfig(BaseModel):
@@ -16,8 +30,9 @@ class AgentKitConfig(BaseModel):
     cdp_api_key_id: str | None = None
     cdp_api_key_secret: str | None = None
     cdp_wallet_secret: str | None = None
-    wallet_provider: WalletProvider | None = None
+    wallet_provider: WalletProvider | AsyncWalletProvider | None = None
     action_providers: list[ActionProvider] | None = None
+    max_parallel_actions: int | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -40,14 +55,64 @@ class AgentKit:
         if not config:
             config = AgentKitConfig()
 
-        self.wallet_provider = config.wallet_provider or CdpEvmServerWalletProvider(
+        self.wallet_provider = config.wallet_provider or self._default_wallet_provider(config)
+        self.action_providers = config.action_providers or self._default_action_providers(
+            self.wallet_provider
+        )
+        self._max_parallel_actions = config.max_parallel_actions or DEFAULT_MAX_PARALLEL_ACTIONS
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # Marks the worker threads running actions, on which nested invoke_many calls run inline
+        self._worker = threading.local()
+
+    @staticmethod
+    def _default_wallet_provider(config: AgentKitConfig) -> WalletProvider:
+        """Create the CDP server wallet provider used when none is configured.
+
+        Args:
+            config (AgentKitConfig): Configuration options holding the CDP credentials.
+
+        Returns:
+            WalletProvider: The CDP server wallet provider.
+
+        """
+        # Imported here so the CDP SDK is only loaded when the default provider is used
+        from .wallet_providers.cdp_evm_server_wallet_provider import (
+            CdpEvmServerWalletProvider,
+            CdpEvmServerWalletProviderConfig,
+        )
+
+        return CdpEvmServerWalletProvider(
             CdpEvmServerWalletProviderConfig(
                 api_key_id=config.cdp_api_key_id,
                 api_key_secret=config.cdp_api_key_secret,
                 wallet_secret=config.cdp_wallet_secret,
             )
         )
-        self.action_providers = config.action_providers or [wallet_action_provider()]
+
+    @staticmethod
+    def _default_action_providers(
+        wallet_provider: WalletProvider | AsyncWalletProvider,
+    ) -> list[ActionProvider]:
+        """Create the action providers used when none are configured.
+
+        Args:
+            wallet_provider (WalletProvider | AsyncWalletProvider): The wallet provider.
+
+        Returns:
+            list[ActionProvider]: The wallet action provider matching the wallet provider.
+
+        """
+        if isinstance(wallet_provider, AsyncWalletProvider):
+            from .action_providers.wallet.async_wallet_action_provider import (
+                async_wallet_action_provider,
+            )
+
+            return [async_wallet_action_provider()]
+
+        from .action_providers.wallet.wallet_action_provider import wallet_action_provider
+
+        return [wallet_action_provider()]
 
     def get_actions(self) -> list[Action]:
         """Get all available actions for the current wallet and network.
@@ -62,9 +127,208 @@ class AgentKit:
         if not self.wallet_provider:
             raise ValueError("No wallet provider configured")
 
+        network = self.wallet_provider.get_network()
         actions: list[Action] = []
         for provider in self.action_providers:
-            if provider.supports_network(self.wallet_provider.get_network()):
+            if provider.supports_network(network):
                 actions.extend(provider.get_actions(self.wallet_provider))
 
         return actions
+
+    def invoke_many(self, calls: list[ActionCall], return_exceptions: bool = False) -> list[Any]:
+        """Invoke several independent actions, running read-only actions concurrently.
+
+        Read-only actions run on a bounded worker pool. Actions that change state run one
+        after another, in the order they were given, and actions that change the wallet's
+        state never overlap with others on the same wallet, whoever invokes them. The call
+        takes about as long as the slowest read-only action or the sum of the other
+        actions, whichever is longer. Called from an action that is itself run by
+        invoke_many, the actions run one after another on the calling thread instead, so
+        nested calls cannot exhaust the worker pool and deadlock.
+
+        Args:
+            calls (list[ActionCall]): The actions to invoke, with their arguments.
+            return_exceptions (bool): Return exceptions raised by actions in place of their
+                result instead of raising the first one.
+
+        Returns:
+            list[Any]: The action results, in the order of the calls.
+
+        Raises:
+            ValueError: If no available action has one of the given names, or an action is
+                async and must be awaited with ainvoke_many. No action is invoked in that
+                case.
+
+        """
+        actions = self._get_actions_by_name([call.name for call in calls])
+        async_names = [action.name for action in actions if action.is_async]
+        if async_names:
+            raise ValueError(f"Async actions must be awaited: {', '.join(async_names)}")
+        futures: list[Future] = [Future() for _ in calls]
+
+        if getattr(self._worker, "active", False):
+            self._run(list(zip(futures, actions, [call.args for call in calls], strict=True)))
+            return self._collect(futures, return_exceptions)
+
+        executor = self._get_executor()
+        writes = []
+        # Each worker runs in a copy of the caller's context, so actions join its trace
+        for future, action, call in zip(futures, actions, calls, strict=True):
+            if action.read_only:
+                executor.submit(
+                    contextvars.copy_context().run, self._run, [(future, action, call.args)]
+                )
+            else:
+                writes.append((future, action, call.args))
+        if writes:
+            executor.submit(contextvars.copy_context().run, self._run, writes)
+
+        wait(futures)
+        return self._collect(futures, return_exceptions)
+
+    async def ainvoke(self, name: str, args: dict[str, Any] | None = None) -> Any:
+        """Invoke an action from an event loop.
+
+        Async actions are awaited on the loop, so an async wallet provider can keep many
+        reads and receipt waits in flight without a thread per request. Other actions run
+        on a worker thread.
+
+        Args:
+            name (str): The action name.
+            args (dict[str, Any] | None): The action arguments.
+
+        Returns:
+            Any: The action result.
+
+        Raises:
+            ValueError: If no available action has the given name.
+
+        """
+        (action,) = self._get_actions_by_name([name])
+        return await action.ainvoke(args or {})
+
+    async def ainvoke_many(
+        self, calls: list[ActionCall], return_exceptions: bool = False
+    ) -> list[Any]:
+        """Invoke several independent actions from an event loop, like invoke_many.
+
+        Read-only actions run concurrently, at most max_parallel_actions at a time, and
+        the other actions run one after another, in the order they were given.
+
+        Args:
+            calls (list[ActionCall]): The actions to invoke, with their arguments.
+            return_exceptions (bool): Return exceptions raised by actions in place of their
+                result instead of raising the first one.
+
+        Returns:
+            list[Any]: The action results, in the order of the calls.
+
+        Raises:
+            ValueError: If no available action has one of the given names. No action is
+                invoked in that case.
+
+        """
+        actions = self._get_actions_by_name([call.name for call in calls])
+        limit = asyncio.Semaphore(self._max_parallel_actions)
+        outcomes: list[Any] = [None] * len(calls)
+
+        async def run(index: int) -> None:
+            try:
+                outcomes[index] = await actions[index].ainvoke(calls[index].args)
+            except Exception as e:
+                outcomes[index] = e
+
+        async def read(index: int) -> None:
+            async with limit:
+                await run(index)
+
+        async def write_all(indexes: list[int]) -> None:
+            for index in indexes:
+                await run(index)
+
+        reads = [index for index, action in enumerate(actions) if action.read_only]
+        writes = [index for index, action in enumerate(actions) if not action.read_only]
+        await asyncio.gather(write_all(writes), *(read(index) for index in reads))
+
+        if not return_exceptions:
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+        return outcomes
+
+    def _get_actions_by_name(self, names: list[str]) -> list[Action]:
+        """Look up available actions by name.
+
+        Args:
+            names (list[str]): The action names.
+
+        Returns:
+            list[Action]: The actions, in the order of the names.
+
+        Raises:
+            ValueError: If no available action has one of the given names.
+
+        """
+        actions = {action.name: action for action in self.get_actions()}
+        missing = [name for name in names if name not in actions]
+        if missing:
+            raise ValueError(f"Unknown actions: {', '.join(missing)}")
+        return [actions[name] for name in names]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool actions run on, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The worker pool.
+
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_parallel_actions, thread_name_prefix="agentkit-action"
+                )
+            return self._executor
+
+    def _run(self, calls: list[tuple[Future, Action, dict[str, Any]]]) -> None:
+        """Invoke actions one after another, resolving their futures.
+
+        Args:
+            calls (list[tuple[Future, Action, dict[str, Any]]]): The future to resolve,
+                the action and its arguments, for each call.
+
+        """
+        nested = getattr(self._worker, "active", False)
+        self._worker.active = True
+        try:
+            for future, action, args in calls:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = action.invoke(args)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        finally:
+            self._worker.active = nested
+
+    @staticmethod
+    def _collect(futures: list[Future], return_exceptions: bool) -> list[Any]:
+        """Get the results of resolved futures.
+
+        Args:
+            futures (list[Future]): The resolved futures, in the order of the calls.
+            return_exceptions (bool): Return exceptions in place of results instead of
+                raising the first one.
+
+        Returns:
+            list[Any]: The results, in the order of the futures.
+
+        """
+        results = []
+        for future in futures:
+            error = future.exception()
+            if error is not None and not return_exceptions:
+                raise error
+            results.append(error if error is not None else future.result())
+        return results
@@ -1,5 +1,19 @@
 """Analytics module for tracking metrics in AgentKit."""
 
-from .send_analytics_event import RequiredEventData, send_analytics_event
+from .send_analytics_event import (
+    AnalyticsQueue,
+    RequiredEventData,
+    analytics_enabled,
+    flush_analytics_events,
+    get_analytics_queue,
+    send_analytics_event,
+)
 
-__all__ = ["RequiredEventData", "send_analytics_event"]
+__all__ = [
+    "AnalyticsQueue",
+    "RequiredEventData",
+    "analytics_enabled",
+    "flush_analytics_events",
+    "get_analytics_queue",
+    "send_analytics_event",
+]
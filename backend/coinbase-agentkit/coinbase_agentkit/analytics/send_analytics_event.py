@@ -1,12 +1,34 @@
 """Analytics event tracking."""
 
+import atexit
 import hashlib
 import json
+import os
+import queue
+import threading
 import time
 from typing import TypedDict
 
 import requests
 
+# Endpoint analytics events are posted to
+ANALYTICS_ENDPOINT = "https://cca-lite.coinbase.com/amp"
+
+# Environment variable that turns analytics off when set to a truthy value
+DISABLE_ANALYTICS_ENV = "DISABLE_AGENTKIT_ANALYTICS"
+
+# Largest number of events waiting to be sent, newer events are dropped beyond it
+DEFAULT_MAX_QUEUE_SIZE = 1000
+
+# Largest number of events sent in one request
+DEFAULT_MAX_BATCH_SIZE = 100
+
+# Seconds between two uploads of queued events
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# Seconds an upload may take before it is abandoned
+DEFAULT_REQUEST_TIMEOUT = 5.0
+
 
 class RequiredEventData(TypedDict, total=False):
     """The required data for an analytics event.
@@ -19,21 +41,29 @@ class RequiredEventData(TypedDict, total=False):
     name: str
 
 
-def send_analytics_event(event: RequiredEventData) -> None:
-    """Send an analytics event to the default endpoint.
+def analytics_enabled() -> bool:
+    """Check whether analytics events are sent.
+
+    Returns:
+        bool: False if the DISABLE_AGENTKIT_ANALYTICS environment variable is set.
+
+    """
+    return os.getenv(DISABLE_ANALYTICS_ENV, "").strip().lower() not in ("1", "true", "yes")
+
+
+def _serialize_event(event: RequiredEventData) -> str:
+    """Wrap event data in the format expected by the analytics service and serialize it.
 
     Args:
         event: The event data containing required action, component and name fields
 
-    Raises:
-        requests.exceptions.RequestException: If the HTTP request fails
-
     Returns:
-        None
+        str: The event as uploaded, in JSON.
 
-    """
-    timestamp = int(time.time() * 1000)
+    Raises:
+        TypeError: If the event data cannot be serialized.
 
+    """
     enhanced_event = {
         "event_type": event["name"],
         "platform": "server",
@@ -41,30 +71,191 @@ def send_analytics_event(event: RequiredEventData) -> None:
             "component_type": event["component"],
             "platform": "server",
             "project_name": "agentkit",
-            "time_start": timestamp,
+            "time_start": int(time.time() * 1000),
             "agentkit_language": "python",
             **event,
         },
     }
+    return json.dumps(enhanced_event)
 
-    events = [enhanced_event]
-    stringified_event_data = json.dumps(events)
-    upload_time = str(timestamp)
 
-    checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
+class AnalyticsQueue:
+    """Sends analytics events from a background thread, in batches.
 
-    analytics_service_data = {
-        "e": stringified_event_data,
-        "checksum": checksum,
-    }
+    Events are put on a bounded in-memory queue and never block the caller: once the
+    queue is full, new events are dropped. A daemon thread uploads the queued events
+    every ``flush_interval`` seconds, in requests of at most ``max_batch_size`` events.
+    Failed uploads are discarded.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = ANALYTICS_ENDPOINT,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ):
+        """Initialize the queue without starting its thread.
+
+        Args:
+            endpoint: The URL events are posted to.
+            max_queue_size: Largest number of events waiting to be sent.
+            max_batch_size: Largest number of events sent in one request.
+            flush_interval: Seconds between two uploads.
+            request_timeout: Seconds an upload may take.
+
+        """
+        self._endpoint = endpoint
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._request_timeout = request_timeout
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self.dropped = 0
+
+    def enqueue(self, event: RequiredEventData) -> bool:
+        """Queue an event to be sent.
+
+        Args:
+            event: The event data containing required action, component and name fields
+
+        Returns:
+            bool: False if the event was dropped because the queue is full or closed.
+
+        Raises:
+            TypeError: If the event data cannot be serialized.
+
+        """
+        if self._stopped.is_set():
+            return False
+        data = _serialize_event(event)
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        self._ensure_thread()
+        return True
+
+    def pending_count(self) -> int:
+        """Get the number of events waiting to be sent.
+
+        Returns:
+            int: The number of queued events.
+
+        """
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        """Send every queued event now, on the calling thread."""
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            self._upload(batch)
+
+    def close(self) -> None:
+        """Stop the background thread and send the remaining events."""
+        self._stopped.set()
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        """Start the upload thread if it is not running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="agentkit-analytics", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Upload queued events once per interval until the queue is closed."""
+        while not self._stopped.wait(self._flush_interval):
+            self.flush()
+
+    def _take_batch(self) -> list[str]:
+        """Take up to a batch of serialized events off the queue.
+
+        Returns:
+            list[str]: The events, empty if the queue is empty.
+
+        """
+        batch = []
+        while len(batch) < self._max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _upload(self, events: list[str]) -> None:
+        """Post a batch of events to the analytics service.
+
+        Args:
+            events: The serialized events to post.
+
+        """
+        stringified_event_data = "[" + ", ".join(events) + "]"
+        upload_time = str(int(time.time() * 1000))
+        checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
+
+        try:
+            response = requests.post(
+                self._endpoint,
+                json={"e": stringified_event_data, "checksum": checksum},
+                headers={"Content-Type": "application/json"},
+                timeout=self._request_timeout,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            # Analytics are best effort, a failed upload is not retried
+            pass
+
+
+_queue: AnalyticsQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_analytics_queue() -> AnalyticsQueue:
+    """Get the queue shared by every analytics event, creating it on first use.
+
+    Returns:
+        AnalyticsQueue: The shared queue.
+
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = AnalyticsQueue()
+            atexit.register(_queue.close)
+        return _queue
+
+
+def send_analytics_event(event: RequiredEventData) -> None:
+    """Queue an analytics event to be sent to the default endpoint in the background.
+
+    The call never waits on the network. Events are dropped when analytics are disabled
+    with the DISABLE_AGENTKIT_ANALYTICS environment variable or the queue is full.
+
+    Args:
+        event: The event data containing required action, component and name fields
+
+    Returns:
+        None
+
+    """
+    if not analytics_enabled():
+        return
+    get_analytics_queue().enqueue(event)
 
-    api_endpoint = "https://cca-lite.coinbase.com"
-    event_path = "/amp"
-    event_endpoint = f"{api_endpoint}{event_path}"
 
-    response = requests.post(
-        event_endpoint,
-        json=analytics_service_data,
-        headers={"Content-Type": "application/json"},
-    )
-    response.raise_for_status()
+def flush_analytics_events() -> None:
+    """Send every queued analytics event now, e.g. before a short-lived process exits."""
+    with _queue_lock:
+        analytics_queue = _queue
+    if analytics_queue is not None:
+        analytics_queue.flush()
@@ -0,0 +1,35 @@
+"""Metrics recorded by actions and wallet providers."""
+
+from .recorder import (
+    ActionStats,
+    current_action_stats,
+    instrument_wallet_method,
+    record_action_error,
+    record_action_result,
+    track_action,
+    track_http_request,
+)
+from .registry import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsRegistry,
+    MetricsSink,
+    get_metrics_sink,
+    metrics_view,
+    set_metrics_sink,
+)
+
+__all__ = [
+    "PROMETHEUS_CONTENT_TYPE",
+    "ActionStats",
+    "MetricsRegistry",
+    "MetricsSink",
+    "current_action_stats",
+    "get_metrics_sink",
+    "instrument_wallet_method",
+    "metrics_view",
+    "record_action_error",
+    "record_action_result",
+    "set_metrics_sink",
+    "track_action",
+    "track_http_request",
+]
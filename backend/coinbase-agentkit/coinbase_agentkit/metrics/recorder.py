@@ -0,0 +1,283 @@
+"""Recording of per-action metrics from actions, wallet providers and HTTP clients."""
+
+import functools
+import inspect
+import itertools
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..tracing import start_span
+from .registry import get_metrics_sink
+
+# Wallet provider methods whose calls are counted and timed
+INSTRUMENTED_WALLET_METHODS = frozenset(
+    {
+        "read_contract",
+        "batch_read_contract",
+        "send_transaction",
+        "send_transactions",
+        "wait_for_transaction_receipt",
+    }
+)
+
+# Wallet provider methods whose call count is recorded for every action, even when zero
+ALWAYS_RECORDED_WALLET_METHODS = ("read_contract", "send_transaction")
+
+# Wallet provider method whose time is recorded as receipt wait time
+RECEIPT_WAIT_METHOD = "wait_for_transaction_receipt"
+
+# Prefix of the messages actions return instead of raising when they fail
+ERROR_RESULT_PREFIX = "Error"
+
+# Error label of failures an action only reports in its returned message
+ERROR_RESULT_LABEL = "ErrorResult"
+
+
+@dataclass
+class ActionStats:
+    """What an action invocation did, gathered while it runs."""
+
+    action: str = ""
+    invocation_id: int = 0
+    wallet_calls: Counter = field(default_factory=Counter)
+    receipt_wait_seconds: float = 0.0
+    http_requests: Counter = field(default_factory=Counter)
+    error: str | None = None
+
+
+# Source of the IDs telling apart the invocations of actions
+_invocation_ids = itertools.count(1)
+
+_current_stats: ContextVar[ActionStats | None] = ContextVar("agentkit_action_stats", default=None)
+
+# Whether an instrumented wallet call is running, so the calls it makes are not counted twice
+_in_wallet_call: ContextVar[bool] = ContextVar("agentkit_in_wallet_call", default=False)
+
+
+def current_action_stats() -> ActionStats | None:
+    """Get the stats of the action running in the current context.
+
+    Returns:
+        ActionStats | None: The stats, or None outside of an action.
+
+    """
+    return _current_stats.get()
+
+
+def record_action_error(error: BaseException | str) -> None:
+    """Record that the action running in the current context failed.
+
+    Actions that catch an exception and return an error message instead of raising call
+    this so the failure is still counted. The first error recorded for an invocation is
+    the one its metrics are labelled with.
+
+    Args:
+        error: The exception caught, labelled by its type, or the error label itself.
+
+    """
+    stats = _current_stats.get()
+    if stats is not None and stats.error is None:
+        stats.error = error if isinstance(error, str) else type(error).__name__
+
+
+def record_action_result(result: Any) -> None:
+    """Record the failure reported by an action's result, if it is an error message.
+
+    Args:
+        result: The value the action returned.
+
+    """
+    if isinstance(result, str) and result.startswith(ERROR_RESULT_PREFIX):
+        record_action_error(ERROR_RESULT_LABEL)
+
+
+@contextmanager
+def track_action(action_name: str) -> Iterator[ActionStats]:
+    """Record the wall time, wallet calls, receipt wait, HTTP calls and errors of an action.
+
+    An invocation counts as failed when it raises or when it records an error with
+    ``record_action_error`` or ``record_action_result``. The invocation is traced as a span, parent of the spans of its wallet and HTTP calls.
+
+    Args:
+        action_name: The action name, used as the "action" label.
+
+    Yields:
+        ActionStats: The stats of the invocation, filled while it runs.
+
+    """
+    stats = ActionStats(action=action_name, invocation_id=next(_invocation_ids))
+    with start_span(f"action {action_name}", attributes={"agentkit.action": action_name}):
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+        error = None
+        try:
+            yield stats
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            _current_stats.reset(token)
+            _record_action(action_name, duration, stats, error or stats.error)
+
+
+def _record_action(
+    action_name: str, duration: float, stats: ActionStats, error: str | None
+) -> None:
+    """Send the metrics of a finished action invocation to the metrics sink.
+
+    Args:
+        action_name: The action name.
+        duration: The wall time of the invocation, in seconds.
+        stats: What the invocation did.
+        error: The name of the exception the action raised or recorded, if any.
+
+    """
+    try:
+        sink = get_metrics_sink()
+        labels = {"action": action_name}
+        status = "ok" if error is None else "error"
+        sink.observe("agentkit_action_duration_seconds", duration, {**labels, "status": status})
+        methods = set(ALWAYS_RECORDED_WALLET_METHODS) | set(stats.wallet_calls)
+        for method in sorted(methods):
+            sink.observe(
+                "agentkit_action_wallet_calls",
+                stats.wallet_calls[method],
+                {**labels, "method": method},
+            )
+        if stats.wallet_calls[RECEIPT_WAIT_METHOD]:
+            sink.observe("agentkit_action_receipt_wait_seconds", stats.receipt_wait_seconds, labels)
+        sink.observe("agentkit_action_http_requests", sum(stats.http_requests.values()), labels)
+        if error is not None:
+            sink.increment("agentkit_action_errors_total", {**labels, "error": error})
+    except Exception as e:
+        print(f"Warning: Failed to record action metrics: {e}")
+
+
+def _record_wallet_call(provider: str, method: str, duration: float) -> None:
+    """Record a finished wallet provider call.
+
+    Args:
+        provider: The wallet provider class name.
+        method: The wallet provider method name.
+        duration: The wall time of the call, in seconds.
+
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.wallet_calls[method] += 1
+        if method == RECEIPT_WAIT_METHOD:
+            stats.receipt_wait_seconds += duration
+    try:
+        get_metrics_sink().observe(
+            "agentkit_wallet_call_duration_seconds",
+            duration,
+            {"provider": provider, "method": method},
+        )
+    except Exception as e:
+        print(f"Warning: Failed to record wallet call metrics: {e}")
+
+
+def _wallet_span(provider: Any, method: str) -> Any:
+    """Open the span of a wallet provider call.
+
+    Args:
+        provider: The wallet provider.
+        method: The wallet provider method name.
+
+    Returns:
+        A context manager yielding the span.
+
+    """
+    return start_span(
+        f"rpc {method}",
+        kind="client",
+        attributes={"wallet.provider": type(provider).__name__, "rpc.method": method},
+    )
+
+
+def instrument_wallet_method(method: str, func: Callable) -> Callable:
+    """Wrap a wallet provider method so its calls are counted, timed and traced.
+
+    Calls made while another instrumented call is running, such as the send_transaction
+    calls of a send_transactions, are part of the outer call and are not recorded again.
+
+    Args:
+        method: The method name, used as the "method" label.
+        func: The method, synchronous or a coroutine function.
+
+    Returns:
+        Callable: The wrapped method.
+
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if _in_wallet_call.get():
+                return await func(self, *args, **kwargs)
+            token = _in_wallet_call.set(True)
+            try:
+                with _wallet_span(self, method):
+                    start = time.perf_counter()
+                    try:
+                        return await func(self, *args, **kwargs)
+                    finally:
+                        duration = time.perf_counter() - start
+                        _record_wallet_call(type(self).__name__, method, duration)
+            finally:
+                _in_wallet_call.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if _in_wallet_call.get():
+            return func(self, *args, **kwargs)
+        token = _in_wallet_call.set(True)
+        try:
+            with _wallet_span(self, method):
+                start = time.perf_counter()
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    _record_wallet_call(type(self).__name__, method, time.perf_counter() - start)
+        finally:
+            _in_wallet_call.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def track_http_request(service: str) -> Iterator[None]:
+    """Count, time and trace an HTTP call to a third-party API.
+
+    Args:
+        service: The API called, used as the "service" label.
+
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.http_requests[service] += 1
+    with start_span(f"http {service}", kind="client", attributes={"http.service": service}):
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            try:
+                sink = get_metrics_sink()
+                labels = {"service": service}
+                sink.increment("agentkit_http_requests_total", {**labels, "status": status})
+                sink.observe("agentkit_http_request_duration_seconds", duration, labels)
+            except Exception as e:
+                print(f"Warning: Failed to record HTTP request metrics: {e}")
@@ -0,0 +1,271 @@
+"""Metrics sinks and the in-process metrics registry."""
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+# Histogram buckets, in seconds, of metrics whose name ends with "_seconds"
+DEFAULT_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Histogram buckets of the other metrics, which count calls
+DEFAULT_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsSink(ABC):
+    """Receives the metrics recorded by actions and wallet providers."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: dict[str, str]) -> None:
+        """Record a value of a histogram.
+
+        Args:
+            name: The metric name.
+            value: The observed value.
+            labels: The metric labels.
+
+        """
+
+    @abstractmethod
+    def increment(self, name: str, labels: dict[str, str], value: float = 1) -> None:
+        """Increase a counter.
+
+        Args:
+            name: The metric name.
+            labels: The metric labels.
+            value: The amount to add.
+
+        """
+
+
+class _Histogram:
+    """Cumulative bucket counts, sum and count of a histogram series."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    """Format labels as in the Prometheus text format.
+
+    Args:
+        labels: The label names and values, sorted by name.
+
+    Returns:
+        str: The labels in braces, or an empty string without labels.
+
+    """
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as in the Prometheus text format.
+
+    Args:
+        value: The value.
+
+    Returns:
+        str: The value, without a decimal point for whole numbers.
+
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry(MetricsSink):
+    """Keeps histograms and counters in memory and renders them for Prometheus.
+
+    Metrics whose name ends with "_seconds" use duration buckets, other histograms count
+    calls and use count buckets. The registry is safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        duration_buckets: tuple[float, ...] = DEFAULT_DURATION_BUCKETS,
+        count_buckets: tuple[float, ...] = DEFAULT_COUNT_BUCKETS,
+    ):
+        """Initialize an empty registry.
+
+        Args:
+            duration_buckets: Upper bounds of the buckets of duration histograms.
+            count_buckets: Upper bounds of the buckets of the other histograms.
+
+        """
+        self._duration_buckets = tuple(sorted(duration_buckets))
+        self._count_buckets = tuple(sorted(count_buckets))
+        self._histograms: dict[str, dict[tuple, _Histogram]] = {}
+        self._counters: dict[str, dict[tuple, float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, labels: dict[str, str]) -> None:
+        """Record a value of a histogram.
+
+        Args:
+            name: The metric name.
+            value: The observed value.
+            labels: The metric labels.
+
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                buckets = (
+                    self._duration_buckets if name.endswith("_seconds") else self._count_buckets
+                )
+                histogram = series[key] = _Histogram(buckets)
+            histogram.observe(value)
+
+    def increment(self, name: str, labels: dict[str, str], value: float = 1) -> None:
+        """Increase a counter.
+
+        Args:
+            name: The metric name.
+            labels: The metric labels.
+            value: The amount to add.
+
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def get_counter(self, name: str, labels: dict[str, str]) -> float:
+        """Get the value of a counter.
+
+        Args:
+            name: The metric name.
+            labels: The metric labels.
+
+        Returns:
+            float: The counter value, 0 if it was never increased.
+
+        """
+        with self._lock:
+            return self._counters.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    def get_histogram(self, name: str, labels: dict[str, str]) -> tuple[int, float]:
+        """Get the number and sum of the values of a histogram.
+
+        Args:
+            name: The metric name.
+            labels: The metric labels.
+
+        Returns:
+            tuple[int, float]: The number of observed values and their sum.
+
+        """
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(tuple(sorted(labels.items())))
+            return (histogram.count, histogram.sum) if histogram else (0, 0.0)
+
+    def reset(self) -> None:
+        """Remove every recorded metric."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one sample per line.
+
+        """
+        lines = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    bounds = (*histogram.buckets, math.inf)
+                    for bound, count in zip(bounds, histogram.counts, strict=True):
+                        cumulative += count
+                        labels = _format_labels((*key, ("le", _format_value(bound))))
+                        lines.append(f"{name}_bucket{labels} {cumulative}")
+                    labels = _format_labels(key)
+                    lines.append(f"{name}_sum{labels} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{labels} {histogram.count}")
+            for name in sorted(self._counters):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+_sink: MetricsSink | None = None
+_sink_lock = threading.Lock()
+
+
+def get_metrics_sink() -> MetricsSink:
+    """Get the sink metrics are recorded to, an in-process registry by default.
+
+    Returns:
+        MetricsSink: The current sink.
+
+    """
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            _sink = MetricsRegistry()
+        return _sink
+
+
+def set_metrics_sink(sink: MetricsSink | None) -> None:
+    """Replace the sink metrics are recorded to.
+
+    Args:
+        sink: The new sink, or None to go back to a fresh in-process registry.
+
+    """
+    global _sink
+    with _sink_lock:
+        _sink = sink
+
+
+def metrics_view(
+    registry: MetricsRegistry | None = None,
+) -> Callable[[], tuple[str, int, dict[str, str]]]:
+    """Create a view serving metrics in the Prometheus text format.
+
+    The view returns a (body, status, headers) tuple, so it can be mounted on a Flask app
+    without this module depending on Flask:
+
+        app.add_url_rule("/metrics", "metrics", metrics_view())
+
+    Args:
+        registry: The registry to serve. Defaults to the current sink, which must then be
+            a MetricsRegistry.
+
+    Returns:
+        Callable[[], tuple[str, int, dict[str, str]]]: The view.
+
+    """
+
+    def view() -> tuple[str, int, dict[str, str]]:
+        source = registry or get_metrics_sink()
+        if not isinstance(source, MetricsRegistry):
+            return "metrics are not recorded in process\n", 404, {"Content-Type": "text/plain"}
+        return source.render_prometheus(), 200, {"Content-Type": PROMETHEUS_CONTENT_TYPE}
+
+    return view
@@ -0,0 +1,22 @@
+"""CPU and memory profiling of long-running agent servers."""
+
+from .cpu import CpuProfile, profile_cpu
+from .flask_blueprint import create_profiling_blueprint
+from .memory import (
+    MemoryGrowth,
+    MemoryTracker,
+    agent_memory_stats,
+    count_objects,
+    get_memory_tracker,
+)
+
+__all__ = [
+    "CpuProfile",
+    "MemoryGrowth",
+    "MemoryTracker",
+    "agent_memory_stats",
+    "count_objects",
+    "create_profiling_blueprint",
+    "get_memory_tracker",
+    "profile_cpu",
+]
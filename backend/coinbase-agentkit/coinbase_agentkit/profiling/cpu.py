@@ -0,0 +1,207 @@
+"""Sampling CPU profiler."""
+
+import html
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+
+# Seconds between two samples of every thread's stack
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Longest profile, in seconds, that can be requested
+MAX_PROFILE_SECONDS = 60.0
+
+# Innermost frames of threads waiting for work, left out of profiles unless requested
+IDLE_FRAMES = frozenset(
+    {
+        ("threading.py", "wait"),
+        ("threading.py", "_wait_for_tstate_lock"),
+        ("selectors.py", "select"),
+        ("socket.py", "accept"),
+        ("queue.py", "get"),
+        ("thread.py", "_worker"),
+    }
+)
+
+# Size, in pixels, of the flamegraph
+FLAMEGRAPH_WIDTH = 1200
+FLAMEGRAPH_FRAME_HEIGHT = 16
+
+_profile_lock = threading.Lock()
+
+
+@dataclass
+class CpuProfile:
+    """Stacks sampled from every thread, with the number of times each was seen."""
+
+    duration: float
+    interval: float
+    samples: Counter = field(default_factory=Counter)
+
+    @property
+    def sample_count(self) -> int:
+        """The number of stacks sampled."""
+        return sum(self.samples.values())
+
+    def collapsed(self) -> str:
+        """Export the profile as collapsed stacks, one stack per line.
+
+        Returns:
+            str: Lines of frames separated by semicolons, outermost first, followed by the
+                number of samples, as read by flamegraph.pl and speedscope.
+
+        """
+        return "".join(
+            f"{';'.join(stack)} {count}\n" for stack, count in sorted(self.samples.items())
+        )
+
+    def flamegraph(self, title: str = "CPU profile") -> str:
+        """Render the profile as a flamegraph.
+
+        Args:
+            title: The title drawn above the graph.
+
+        Returns:
+            str: An SVG document, outermost frames at the top. Hovering a frame shows its
+                name and share of the samples.
+
+        """
+        root: dict = {"count": 0, "children": {}}
+        for stack, count in self.samples.items():
+            node = root
+            node["count"] += count
+            for frame in stack:
+                node = node["children"].setdefault(frame, {"count": 0, "children": {}})
+                node["count"] += count
+
+        total = max(root["count"], 1)
+        rects: list[str] = []
+        depth = 0
+
+        def draw(children: dict, x: float, level: int) -> None:
+            nonlocal depth
+            depth = max(depth, level + 1)
+            for name, node in sorted(children.items()):
+                width = node["count"] / total * FLAMEGRAPH_WIDTH
+                if width >= 0.5:
+                    y = 24 + level * FLAMEGRAPH_FRAME_HEIGHT
+                    hue = zlib.crc32(name.encode()) % 60
+                    label = html.escape(name)
+                    share = node["count"] / total * 100
+                    text = label if width > 40 else ""
+                    rects.append(
+                        f'<g><title>{label} ({node["count"]} samples, {share:.1f}%)</title>'
+                        f'<rect x="{x:.1f}" y="{y}" width="{width:.1f}" '
+                        f'height="{FLAMEGRAPH_FRAME_HEIGHT - 1}" fill="hsl({hue},90%,60%)"/>'
+                        f'<text x="{x + 3:.1f}" y="{y + 12}" textLength="{max(width - 6, 0):.1f}" '
+                        f'lengthAdjust="spacingAndGlyphs">{text}</text></g>'
+                    )
+                    draw(node["children"], x, level + 1)
+                x += width
+
+        draw(root["children"], 0.0, 0)
+        height = 24 + depth * FLAMEGRAPH_FRAME_HEIGHT + 8
+        heading = html.escape(f"{title}: {self.sample_count} samples over {self.duration:.1f}s")
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{FLAMEGRAPH_WIDTH}" '
+            f'height="{height}" font-family="monospace" font-size="11">'
+            f'<text x="4" y="16" font-size="13">{heading}</text>' + "".join(rects) + "</svg>\n"
+        )
+
+
+def _frame_name(frame: FrameType) -> str:
+    """Name a frame by its function, file and first line.
+
+    Args:
+        frame: The frame.
+
+    Returns:
+        str: The function name, with the file name and line it is defined at.
+
+    """
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None) -> list[FrameType]:
+    """Get the frames of a stack, outermost first.
+
+    Args:
+        frame: The innermost frame.
+
+    Returns:
+        list[FrameType]: The frames.
+
+    """
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def _is_idle(frame: FrameType) -> bool:
+    """Check whether a thread is waiting for work.
+
+    Args:
+        frame: The thread's innermost frame.
+
+    Returns:
+        bool: True if the frame is a known waiting function.
+
+    """
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+
+
+def profile_cpu(
+    seconds: float,
+    interval: float = DEFAULT_SAMPLE_INTERVAL,
+    include_idle: bool = False,
+) -> CpuProfile:
+    """Sample the stacks of every other thread for a while.
+
+    The calling thread sleeps between samples, so the profile can be taken from a request
+    handler of the server being profiled. Only one profile runs at a time.
+
+    Args:
+        seconds: How long to sample, at most MAX_PROFILE_SECONDS.
+        interval: Seconds between two samples.
+        include_idle: Keep the stacks of threads waiting on a lock, queue or socket.
+
+    Returns:
+        CpuProfile: The sampled stacks, each starting with the thread name.
+
+    Raises:
+        ValueError: If seconds is not positive or above MAX_PROFILE_SECONDS.
+        RuntimeError: If another profile is running.
+
+    """
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        raise ValueError(f"seconds must be between 0 and {MAX_PROFILE_SECONDS}")
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("A CPU profile is already running")
+
+    try:
+        me = threading.get_ident()
+        samples: Counter = Counter()
+        start = time.perf_counter()
+        deadline = start + seconds
+        while time.perf_counter() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me or (not include_idle and _is_idle(frame)):
+                    continue
+                thread_name = names.get(ident, f"thread-{ident}")
+                stack = (thread_name, *(_frame_name(f) for f in _stack(frame)))
+                samples[stack] += 1
+            time.sleep(interval)
+        return CpuProfile(duration=time.perf_counter() - start, interval=interval, samples=samples)
+    finally:
+        _profile_lock.release()
@@ -0,0 +1,108 @@
+"""Flask blueprint serving the profiling tools of a running server."""
+
+import hmac
+from dataclasses import asdict
+from typing import Any
+
+from .cpu import DEFAULT_SAMPLE_INTERVAL, profile_cpu
+from .memory import agent_memory_stats, count_objects, get_memory_tracker
+
+# Header carrying the token that gives access to the profiling endpoints
+PROFILING_TOKEN_HEADER = "X-Profiling-Token"
+
+
+def create_profiling_blueprint(token: str, url_prefix: str = "/debug") -> Any:
+    """Create a Flask blueprint exposing CPU and memory profiling.
+
+    Endpoints:
+        GET  /cpu?seconds=10&format=collapsed|svg  Sample every thread for a while
+        POST /memory/start                         Start tracing allocations
+        POST /memory/snapshot?label=before         Take a labeled snapshot
+        GET  /memory/diff?from=before&to=after     Largest growths between two snapshots
+        POST /memory/stop                          Stop tracing allocations
+        GET  /objects                              Counts of agent, tool and Web3 objects
+
+    Args:
+        token: Token requests must send in the X-Profiling-Token header.
+        url_prefix: The path the endpoints are mounted under.
+
+    Returns:
+        flask.Blueprint: The blueprint, to register with app.register_blueprint.
+
+    Raises:
+        ValueError: If the token is empty.
+        ImportError: If Flask is not installed.
+
+    """
+    if not token:
+        raise ValueError("A token is required to serve the profiling endpoints")
+
+    try:
+        from flask import Blueprint, Response, abort, jsonify, request
+    except ImportError as e:
+        raise ImportError(
+            "Failed to import flask. Please install it with 'pip install flask'."
+        ) from e
+
+    blueprint = Blueprint("agentkit_profiling", __name__, url_prefix=url_prefix)
+    tracker = get_memory_tracker()
+
+    @blueprint.before_request
+    def check_token() -> None:
+        sent = request.headers.get(PROFILING_TOKEN_HEADER, "")
+        if not hmac.compare_digest(sent, token):
+            abort(403)
+
+    @blueprint.get("/cpu")
+    def cpu() -> Any:
+        seconds = request.args.get("seconds", 10, type=float)
+        interval = request.args.get("interval", DEFAULT_SAMPLE_INTERVAL, type=float)
+        include_idle = request.args.get("idle", "false").lower() == "true"
+        try:
+            profile = profile_cpu(seconds, interval=interval, include_idle=include_idle)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except RuntimeError as e:
+            return jsonify({"error": str(e)}), 409
+        if request.args.get("format", "collapsed") == "svg":
+            return Response(profile.flamegraph(), mimetype="image/svg+xml")
+        return Response(profile.collapsed(), mimetype="text/plain")
+
+    @blueprint.post("/memory/start")
+    def memory_start() -> Any:
+        tracker.start(request.args.get("frames", 10, type=int))
+        return jsonify({"tracing": True, "snapshots": tracker.labels()})
+
+    @blueprint.post("/memory/snapshot")
+    def memory_snapshot() -> Any:
+        try:
+            label = tracker.snapshot(request.args.get("label"))
+        except RuntimeError as e:
+            return jsonify({"error": str(e)}), 409
+        return jsonify({"label": label, "snapshots": tracker.labels()})
+
+    @blueprint.get("/memory/diff")
+    def memory_diff() -> Any:
+        try:
+            growth = tracker.diff(
+                request.args["from"],
+                request.args.get("to"),
+                limit=request.args.get("limit", 20, type=int),
+                group_by=request.args.get("group_by", "lineno"),
+            )
+        except KeyError as e:
+            return jsonify({"error": f"Unknown snapshot or missing parameter: {e}"}), 404
+        except (RuntimeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 409
+        return jsonify([asdict(item) for item in growth])
+
+    @blueprint.post("/memory/stop")
+    def memory_stop() -> Any:
+        tracker.stop()
+        return jsonify({"tracing": False})
+
+    @blueprint.get("/objects")
+    def objects() -> Any:
+        return jsonify({"objects": count_objects(), "agent_memory": agent_memory_stats()})
+
+    return blueprint
@@ -0,0 +1,238 @@
+"""Memory snapshots and counts of the objects agents accumulate."""
+
+import gc
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Number of frames kept for each traced allocation
+DEFAULT_TRACEBACK_FRAMES = 10
+
+# Largest number of snapshots kept, older ones are dropped beyond it
+MAX_SNAPSHOTS = 10
+
+# Class names counted by count_objects, by group. An object belongs to a group if its
+# class or one of its base classes has one of the names.
+DEFAULT_OBJECT_GROUPS = {
+    "agent_memory": ("MemorySaver", "BaseCheckpointSaver"),
+    "tools": ("BaseTool", "FunctionTool"),
+    "actions": ("Action",),
+    "wallet_providers": ("WalletProvider",),
+    "web3": ("Web3", "AsyncWeb3"),
+    "web3_providers": ("HTTPProvider", "AsyncHTTPProvider"),
+}
+
+
+@dataclass
+class MemoryGrowth:
+    """Memory allocated at one place in the code between two snapshots."""
+
+    location: str
+    size: int
+    size_diff: int
+    count: int
+    count_diff: int
+
+
+class MemoryTracker:
+    """Takes labeled tracemalloc snapshots and compares them.
+
+    Tracing allocations slows the process down, so it only runs between start and stop.
+    """
+
+    def __init__(self, max_snapshots: int = MAX_SNAPSHOTS):
+        """Initialize the tracker without starting tracemalloc.
+
+        Args:
+            max_snapshots: Largest number of snapshots kept.
+
+        """
+        self._max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, tracemalloc.Snapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        """Whether allocations are being traced."""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = DEFAULT_TRACEBACK_FRAMES) -> None:
+        """Start tracing allocations, if they are not traced already.
+
+        Args:
+            frames: Number of frames kept for each allocation.
+
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        """Stop tracing allocations and forget the snapshots."""
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+
+    def snapshot(self, label: str | None = None) -> str:
+        """Take a snapshot of the traced allocations.
+
+        Args:
+            label: The snapshot label. Defaults to the current time.
+
+        Returns:
+            str: The snapshot label.
+
+        Raises:
+            RuntimeError: If allocations are not being traced.
+
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory tracing is not started")
+        label = label or time.strftime("%Y%m%dT%H%M%S")
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        with self._lock:
+            self._snapshots.pop(label, None)
+            self._snapshots[label] = snapshot
+            while len(self._snapshots) > self._max_snapshots:
+                self._snapshots.popitem(last=False)
+        return label
+
+    def labels(self) -> list[str]:
+        """Get the labels of the kept snapshots, oldest first.
+
+        Returns:
+            list[str]: The labels.
+
+        """
+        with self._lock:
+            return list(self._snapshots)
+
+    def diff(
+        self,
+        old_label: str,
+        new_label: str | None = None,
+        limit: int = 20,
+        group_by: str = "lineno",
+    ) -> list[MemoryGrowth]:
+        """Compare two snapshots, largest growth first.
+
+        Args:
+            old_label: The label of the earlier snapshot.
+            new_label: The label of the later snapshot. Defaults to a new snapshot.
+            limit: Largest number of locations returned.
+            group_by: "lineno", "filename" or "traceback".
+
+        Returns:
+            list[MemoryGrowth]: The locations whose allocations grew the most.
+
+        Raises:
+            KeyError: If there is no snapshot with one of the labels.
+
+        """
+        if new_label is None:
+            new_label = self.snapshot()
+        with self._lock:
+            old = self._snapshots[old_label]
+            new = self._snapshots[new_label]
+        stats = new.compare_to(old, group_by)
+        return [
+            MemoryGrowth(
+                location=str(stat.traceback),
+                size=stat.size,
+                size_diff=stat.size_diff,
+                count=stat.count,
+                count_diff=stat.count_diff,
+            )
+            for stat in stats[:limit]
+        ]
+
+
+_tracker: MemoryTracker | None = None
+_tracker_lock = threading.Lock()
+
+
+def get_memory_tracker() -> MemoryTracker:
+    """Get the memory tracker shared by the process, creating it on first use.
+
+    Returns:
+        MemoryTracker: The shared tracker.
+
+    """
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = MemoryTracker()
+        return _tracker
+
+
+def count_objects(
+    groups: dict[str, tuple[str, ...]] | None = None,
+) -> dict[str, int]:
+    """Count the live objects of each group of classes.
+
+    Args:
+        groups: Class names by group. Defaults to DEFAULT_OBJECT_GROUPS.
+
+    Returns:
+        dict[str, int]: The number of live objects in each group.
+
+    """
+    groups = groups or DEFAULT_OBJECT_GROUPS
+    counts = dict.fromkeys(groups, 0)
+    by_class: dict[type, list[str]] = {}
+    for obj in gc.get_objects():
+        cls = type(obj)
+        matched = by_class.get(cls)
+        if matched is None:
+            names = {base.__name__ for base in getattr(cls, "__mro__", (cls,))}
+            matched = [group for group, classes in groups.items() if names.intersection(classes)]
+            by_class[cls] = matched
+        for group in matched:
+            counts[group] += 1
+    return counts
+
+
+def _size(container: Any) -> int:
+    """Get the number of entries of a container, 0 if it has none.
+
+    Args:
+        container: The container.
+
+    Returns:
+        int: Its length.
+
+    """
+    try:
+        return len(container)
+    except TypeError:
+        return 0
+
+
+def agent_memory_stats() -> dict[str, int]:
+    """Measure what in-memory LangGraph checkpointers hold.
+
+    MemorySaver keeps every checkpoint of every conversation thread, so these numbers grow
+    with each message a long-running agent handles.
+
+    Returns:
+        dict[str, int]: The number of savers, conversation threads, checkpoints, pending
+            writes and channel values held in memory.
+
+    """
+    stats = {"savers": 0, "threads": 0, "checkpoints": 0, "writes": 0, "blobs": 0}
+    for obj in gc.get_objects():
+        if type(obj).__name__ != "MemorySaver":
+            continue
+        stats["savers"] += 1
+        storage = getattr(obj, "storage", {})
+        stats["threads"] += _size(storage)
+        for namespaces in storage.values():
+            for checkpoints in namespaces.values():
+                stats["checkpoints"] += _size(checkpoints)
+        stats["writes"] += _size(getattr(obj, "writes", {}))
+        stats["blobs"] += _size(getattr(obj, "blobs", {}))
+    return stats
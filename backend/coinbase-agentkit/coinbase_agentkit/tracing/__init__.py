@@ -0,0 +1,39 @@
+"""Tracing of requests through actions, wallet providers and third-party APIs."""
+
+from .exporters import (
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    SlowTraceExporter,
+    SpanExporter,
+    format_waterfall,
+)
+from .spans import (
+    REQUEST_ID_HEADER,
+    Span,
+    Tracer,
+    get_request_id,
+    get_tracer,
+    record_span,
+    request_context,
+    set_tracer,
+    start_span,
+    traced,
+)
+
+__all__ = [
+    "REQUEST_ID_HEADER",
+    "FileSpanExporter",
+    "OtlpHttpSpanExporter",
+    "SlowTraceExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "format_waterfall",
+    "get_request_id",
+    "get_tracer",
+    "record_span",
+    "request_context",
+    "set_tracer",
+    "start_span",
+    "traced",
+]
@@ -0,0 +1,262 @@
+"""Destinations finished traces are exported to."""
+
+import json
+import sys
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TextIO
+
+import requests
+
+if TYPE_CHECKING:
+    from .spans import Span
+
+# Seconds an upload to an OTLP collector may take before it is abandoned
+DEFAULT_OTLP_TIMEOUT = 5.0
+
+# Width, in characters, of the bars of a waterfall
+WATERFALL_WIDTH = 40
+
+# OTLP span kinds by span kind name
+_OTLP_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+class SpanExporter(ABC):
+    """Receives the spans of each finished trace."""
+
+    @abstractmethod
+    def export(self, spans: list["Span"]) -> None:
+        """Export the spans of a trace.
+
+        Args:
+            spans: The finished spans, the outermost one last.
+
+        """
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        """Initialize the exporter.
+
+        Args:
+            path: The file spans are appended to.
+
+        """
+        self._path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: list["Span"]) -> None:
+        """Append the spans of a trace to the file.
+
+        Args:
+            spans: The finished spans.
+
+        """
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock, open(self._path, "a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Convert an attribute value to an OTLP AnyValue.
+
+    Args:
+        value: The attribute value.
+
+    Returns:
+        dict[str, Any]: The value in OTLP/JSON.
+
+    """
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: "Span") -> dict[str, Any]:
+    """Convert a span to OTLP/JSON.
+
+    Args:
+        span: The finished span.
+
+    Returns:
+        dict[str, Any]: The span in OTLP/JSON.
+
+    """
+    otlp_span = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _OTLP_SPAN_KINDS.get(span.kind, 1),
+        "startTimeUnixNano": str(int(span.start_time * 1e9)),
+        "endTimeUnixNano": str(int((span.end_time or span.start_time) * 1e9)),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()
+        ],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_id:
+        otlp_span["parentSpanId"] = span.parent_id
+    return otlp_span
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """Sends spans to an OpenTelemetry collector with OTLP over HTTP, in JSON.
+
+    Uploads run on a background thread, so exporting a trace never waits on the network.
+    Failed uploads are discarded.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "agentkit",
+        timeout: float = DEFAULT_OTLP_TIMEOUT,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            endpoint: The collector's base URL, e.g. http://localhost:4318.
+            service_name: The service.name resource attribute of the spans.
+            timeout: Seconds an upload may take.
+
+        """
+        endpoint = endpoint.rstrip("/")
+        self._url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self._service_name = service_name
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentkit-otlp")
+
+    def export(self, spans: list["Span"]) -> None:
+        """Queue the spans of a trace for upload.
+
+        Args:
+            spans: The finished spans.
+
+        """
+        self._executor.submit(self._upload, self.to_payload(spans))
+
+    def to_payload(self, spans: list["Span"]) -> dict[str, Any]:
+        """Build the OTLP/JSON request body for spans.
+
+        Args:
+            spans: The finished spans.
+
+        Returns:
+            dict[str, Any]: The ExportTraceServiceRequest.
+
+        """
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": self._service_name}}
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "coinbase_agentkit"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _upload(self, payload: dict[str, Any]) -> None:
+        """Post spans to the collector.
+
+        Args:
+            payload: The OTLP/JSON request body.
+
+        """
+        try:
+            requests.post(self._url, json=payload, timeout=self._timeout).raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"Warning: Failed to upload spans: {e}")
+
+
+def format_waterfall(spans: list["Span"], width: int = WATERFALL_WIDTH) -> str:
+    """Draw the spans of a trace as a waterfall, one line per span.
+
+    Args:
+        spans: The finished spans of a trace.
+        width: Width of the bars, in characters.
+
+    Returns:
+        str: Each span's offset and duration in milliseconds, a bar placing it in time
+            and its name, indented under its parent.
+
+    """
+    if not spans:
+        return ""
+    ordered = sorted(spans, key=lambda span: span.start_time)
+    start = ordered[0].start_time
+    end = max(span.end_time or span.start_time for span in ordered)
+    total = max(end - start, 1e-9)
+
+    by_id = {span.span_id: span for span in ordered}
+    lines = []
+    for span in ordered:
+        depth = 0
+        parent = by_id.get(span.parent_id or "")
+        while parent is not None:
+            depth += 1
+            parent = by_id.get(parent.parent_id or "")
+        first = int((span.start_time - start) / total * width)
+        length = max(1, round(span.duration / total * width))
+        bar = (" " * first + "#" * length)[:width].ljust(width)
+        error = f" ({span.error})" if span.error else ""
+        lines.append(
+            f"{(span.start_time - start) * 1000:9.1f} {span.duration * 1000:9.1f} |{bar}| "
+            f"{'  ' * depth}{span.name}{error}"
+        )
+    return "\n".join(["offset ms  dur ms", *lines])
+
+
+class SlowTraceExporter(SpanExporter):
+    """Prints the waterfall of traces where an operation took longer than a threshold."""
+
+    def __init__(
+        self,
+        threshold: float,
+        span_names: tuple[str, ...] | None = None,
+        stream: TextIO | None = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            threshold: Seconds a span must last for its trace to be printed.
+            span_names: Only consider spans whose name starts with one of these, e.g.
+                ("wow.get_buy_quote",). Defaults to the outermost span of each trace.
+            stream: Where waterfalls are written. Defaults to standard error.
+
+        """
+        self._threshold = threshold
+        self._span_names = span_names
+        self._stream = stream
+
+    def export(self, spans: list["Span"]) -> None:
+        """Print the waterfall of the trace if one of its spans is slow.
+
+        Args:
+            spans: The finished spans.
+
+        """
+        if self._span_names is None:
+            candidates = [span for span in spans if span.span_id == span.local_root_id]
+        else:
+            candidates = [span for span in spans if span.name.startswith(self._span_names)]
+        slow = [span for span in candidates if span.duration >= self._threshold]
+        if not slow:
+            return
+        stream = self._stream or sys.stderr
+        names = ", ".join(f"{span.name} ({span.duration * 1000:.0f} ms)" for span in slow)
+        stream.write(f"Slow trace {spans[-1].trace_id}: {names}\n{format_waterfall(spans)}\n")
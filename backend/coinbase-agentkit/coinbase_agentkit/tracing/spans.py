@@ -0,0 +1,375 @@
+"""Spans, the tracer and request ID propagation."""
+
+import functools
+import hashlib
+import os
+import re
+import secrets
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from .exporters import (
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    SlowTraceExporter,
+    SpanExporter,
+)
+
+# Header carrying the request ID from the master server to the agents
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Environment variable naming a file spans are appended to, as JSON lines
+TRACE_FILE_ENV = "AGENTKIT_TRACE_FILE"
+
+# Environment variable holding the URL of an OTLP/HTTP collector spans are sent to
+OTLP_ENDPOINT_ENV = "OTEL_EXPORTER_OTLP_ENDPOINT"
+
+# Environment variable holding the seconds above which a trace's waterfall is printed
+SLOW_TRACE_SECONDS_ENV = "AGENTKIT_SLOW_TRACE_SECONDS"
+
+_TRACE_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    end_time: float | None = None
+    kind: str = "internal"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    # Span ID of the outermost span of the trace in this process
+    local_root_id: str = ""
+
+    @property
+    def duration(self) -> float:
+        """The span's duration in seconds, 0 while it is open."""
+        return (self.end_time - self.start_time) if self.end_time is not None else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the span to a JSON-serializable dict.
+
+        Returns:
+            dict[str, Any]: The span's fields.
+
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "kind": self.kind,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("agentkit_span", default=None)
+_request_id: ContextVar[str | None] = ContextVar("agentkit_request_id", default=None)
+
+
+def get_request_id() -> str | None:
+    """Get the ID of the request being handled in the current context.
+
+    Returns:
+        str | None: The request ID, or None outside of a request.
+
+    """
+    return _request_id.get()
+
+
+@contextmanager
+def request_context(request_id: str | None = None) -> Iterator[str]:
+    """Handle a request, tagging the spans opened within it with its ID.
+
+    Spans of the same request share a trace ID derived from the request ID, so spans
+    recorded by the master server and each agent join into one trace.
+
+    Args:
+        request_id: The ID received with the request, e.g. in the X-Request-ID header.
+            A new ID is generated if None.
+
+    Yields:
+        str: The request ID, to forward to downstream services.
+
+    """
+    request_id = request_id or uuid.uuid4().hex
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+def _trace_id_for(request_id: str | None) -> str:
+    """Get the trace ID of a new trace.
+
+    Args:
+        request_id: The ID of the request being handled, if any.
+
+    Returns:
+        str: 32 hex characters, the same for every trace of a request.
+
+    """
+    if request_id is None:
+        return secrets.token_hex(16)
+    if _TRACE_ID_PATTERN.fullmatch(request_id):
+        return request_id
+    return hashlib.sha256(request_id.encode()).hexdigest()[:32]
+
+
+class Tracer:
+    """Opens spans and exports the spans of each trace together.
+
+    Spans opened while another span is open in the same context are its children. The
+    spans of a trace are kept in memory until its outermost span in this process ends,
+    then passed to every exporter at once. Without exporters, no span is recorded.
+    """
+
+    def __init__(self, exporters: list[SpanExporter] | None = None):
+        """Initialize the tracer.
+
+        Args:
+            exporters: The exporters finished traces are passed to.
+
+        """
+        self._exporters = list(exporters or [])
+        self._pending: dict[str, list[Span]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return bool(self._exporters)
+
+    @contextmanager
+    def start_span(
+        self, name: str, kind: str = "internal", attributes: dict[str, Any] | None = None
+    ) -> Iterator[Span | None]:
+        """Open a span for the duration of a block.
+
+        Args:
+            name: The span name.
+            kind: "internal", "server" for handled requests or "client" for outgoing calls.
+            attributes: Attributes describing the operation.
+
+        Yields:
+            Span | None: The span, None when tracing is disabled. Attributes may be added
+                to it while it is open.
+
+        """
+        if not self._exporters:
+            yield None
+            return
+
+        span = self._open(name, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time = time.time()
+            self._finish(span)
+
+    def record_span(
+        self,
+        name: str,
+        start_time: float,
+        end_time: float,
+        kind: str = "internal",
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        """Record an operation already timed, as a child of the current span.
+
+        Args:
+            name: The span name.
+            start_time: When the operation started, in seconds since the epoch.
+            end_time: When the operation ended, in seconds since the epoch.
+            kind: The span kind.
+            attributes: Attributes describing the operation.
+
+        """
+        if not self._exporters:
+            return
+        span = self._open(name, kind, attributes)
+        span.start_time = start_time
+        span.end_time = end_time
+        self._finish(span)
+
+    def _open(self, name: str, kind: str, attributes: dict[str, Any] | None) -> Span:
+        """Create a span, child of the current span if there is one.
+
+        Args:
+            name: The span name.
+            kind: The span kind.
+            attributes: The span attributes.
+
+        Returns:
+            Span: The open span.
+
+        """
+        parent = _current_span.get()
+        span_id = secrets.token_hex(8)
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else _trace_id_for(_request_id.get()),
+            span_id=span_id,
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time(),
+            kind=kind,
+            attributes=dict(attributes or {}),
+            local_root_id=parent.local_root_id if parent else span_id,
+        )
+        if parent is None:
+            request_id = _request_id.get()
+            if request_id is not None:
+                span.attributes["request.id"] = request_id
+            with self._lock:
+                self._pending[span_id] = []
+        return span
+
+    def _finish(self, span: Span) -> None:
+        """Keep a finished span with its trace, exporting the trace once it is complete.
+
+        Args:
+            span: The finished span.
+
+        """
+        with self._lock:
+            if span.span_id == span.local_root_id:
+                spans = [*self._pending.pop(span.span_id, []), span]
+            elif span.local_root_id in self._pending:
+                self._pending[span.local_root_id].append(span)
+                return
+            else:
+                # The trace was already exported, e.g. a thread outlived its request
+                spans = [span]
+        for exporter in self._exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                print(f"Warning: Failed to export spans: {e}")
+
+
+def _tracer_from_env() -> Tracer:
+    """Create a tracer exporting to the destinations set in the environment.
+
+    Returns:
+        Tracer: The tracer, disabled if no destination is set.
+
+    """
+    exporters: list[SpanExporter] = []
+    if os.getenv(TRACE_FILE_ENV):
+        exporters.append(FileSpanExporter(os.environ[TRACE_FILE_ENV]))
+    if os.getenv(OTLP_ENDPOINT_ENV):
+        exporters.append(OtlpHttpSpanExporter(os.environ[OTLP_ENDPOINT_ENV]))
+    if os.getenv(SLOW_TRACE_SECONDS_ENV):
+        exporters.append(SlowTraceExporter(float(os.environ[SLOW_TRACE_SECONDS_ENV])))
+    return Tracer(exporters)
+
+
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the tracer spans are opened with, configured from the environment on first use.
+
+    Returns:
+        Tracer: The current tracer.
+
+    """
+    global _tracer
+    tracer = _tracer
+    if tracer is not None:
+        return tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = _tracer_from_env()
+        return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Replace the tracer spans are opened with.
+
+    Args:
+        tracer: The new tracer, or None to configure one from the environment on next use.
+
+    """
+    global _tracer
+    with _tracer_lock:
+        _tracer = tracer
+
+
+def start_span(name: str, kind: str = "internal", attributes: dict[str, Any] | None = None) -> Any:
+    """Open a span with the current tracer for the duration of a block.
+
+    Args:
+        name: The span name.
+        kind: "internal", "server" for handled requests or "client" for outgoing calls.
+        attributes: Attributes describing the operation.
+
+    Returns:
+        A context manager yielding the span, or None when tracing is disabled.
+
+    """
+    return get_tracer().start_span(name, kind, attributes)
+
+
+def record_span(
+    name: str,
+    start_time: float,
+    end_time: float,
+    kind: str = "internal",
+    attributes: dict[str, Any] | None = None,
+) -> None:
+    """Record an operation already timed with the current tracer.
+
+    Args:
+        name: The span name.
+        start_time: When the operation started, in seconds since the epoch.
+        end_time: When the operation ended, in seconds since the epoch.
+        kind: The span kind.
+        attributes: Attributes describing the operation.
+
+    """
+    get_tracer().record_span(name, start_time, end_time, kind, attributes)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Decorate a function so that each call opens a span.
+
+    Args:
+        name: The span name.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator.
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with start_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,19 +1,80 @@
-"""Wallet providers for AgentKit."""
-
-from .cdp_evm_server_wallet_provider import (
-    CdpEvmServerWalletProvider,
-    CdpEvmServerWalletProviderConfig,
-)
-from .cdp_evm_smart_wallet_provider import (
-    CdpEvmSmartWalletProvider,
-    CdpEvmSmartWalletProviderConfig,
-)
-from .eth_account_wallet_provider import EthAccountWalletProvider, EthAccountWalletProviderConfig
-from .evm_wallet_provider import EvmWalletProvider
-from .wallet_provider import WalletProvider
+"""Wallet providers for AgentKit.
+
+Wallet providers are imported on first use, so importing AgentKit does not load the
+CDP SDK unless a CDP wallet provider is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .wallet_provider import AsyncWalletProvider, WalletProvider
+
+if TYPE_CHECKING:
+    from .async_cdp_evm_server_wallet_provider import AsyncCdpEvmServerWalletProvider
+    from .async_cdp_evm_smart_wallet_provider import AsyncCdpEvmSmartWalletProvider
+    from .async_eth_account_wallet_provider import AsyncEthAccountWalletProvider
+    from .async_evm_wallet_provider import AsyncEvmWalletProvider
+    from .batching_provider import BatchingProvider, RequestBatch
+    from .cdp_evm_server_wallet_provider import (
+        CdpEvmServerWalletProvider,
+        CdpEvmServerWalletProviderConfig,
+    )
+    from .cdp_evm_smart_wallet_provider import (
+        CdpEvmSmartWalletProvider,
+        CdpEvmSmartWalletProviderConfig,
+    )
+    from .eth_account_wallet_provider import (
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+    )
+    from .evm_wallet_provider import EvmWalletProvider
+    from .multicall import CallResult, ContractCall
+    from .rpc_router import EndpointHealth, RpcRouterProvider
+    from .rpc_tracer import RedundantRead, RpcTracer, TracedCall
+
+# Module defining each lazily imported name
+_LAZY_IMPORTS = {
+    "AsyncCdpEvmServerWalletProvider": ".async_cdp_evm_server_wallet_provider",
+    "AsyncCdpEvmSmartWalletProvider": ".async_cdp_evm_smart_wallet_provider",
+    "AsyncEthAccountWalletProvider": ".async_eth_account_wallet_provider",
+    "AsyncEvmWalletProvider": ".async_evm_wallet_provider",
+    "BatchingProvider": ".batching_provider",
+    "RequestBatch": ".batching_provider",
+    "CdpEvmServerWalletProvider": ".cdp_evm_server_wallet_provider",
+    "CdpEvmServerWalletProviderConfig": ".cdp_evm_server_wallet_provider",
+    "CdpEvmSmartWalletProvider": ".cdp_evm_smart_wallet_provider",
+    "CdpEvmSmartWalletProviderConfig": ".cdp_evm_smart_wallet_provider",
+    "EthAccountWalletProvider": ".eth_account_wallet_provider",
+    "EthAccountWalletProviderConfig": ".eth_account_wallet_provider",
+    "EvmWalletProvider": ".evm_wallet_provider",
+    "CallResult": ".multicall",
+    "ContractCall": ".multicall",
+    "EndpointHealth": ".rpc_router",
+    "RpcRouterProvider": ".rpc_router",
+    "RedundantRead": ".rpc_tracer",
+    "RpcTracer": ".rpc_tracer",
+    "TracedCall": ".rpc_tracer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a wallet provider on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including those not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "WalletProvider",
+    "AsyncWalletProvider",
     "CdpEvmServerWalletProvider",
     "CdpEvmServerWalletProviderConfig",
     "CdpEvmSmartWalletProvider",
@@ -21,4 +82,17 @@ __all__ = [
     "EvmWalletProvider",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
+    "AsyncEvmWalletProvider",
+    "AsyncEthAccountWalletProvider",
+    "AsyncCdpEvmServerWalletProvider",
+    "AsyncCdpEvmSmartWalletProvider",
+    "ContractCall",
+    "CallResult",
+    "RpcRouterProvider",
+    "EndpointHealth",
+    "BatchingProvider",
+    "RequestBatch",
+    "RpcTracer",
+    "TracedCall",
+    "RedundantRead",
 ]
@@ -0,0 +1,292 @@
+"""Async CDP EVM Server Wallet provider."""
+
+import os
+from decimal import Decimal
+from typing import Any
+
+from cdp import CdpClient
+from cdp.evm_transaction_types import TransactionRequestEIP1559
+from web3 import AsyncWeb3, Web3
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from ..network import NETWORK_ID_TO_CHAIN, Network
+from .async_evm_wallet_provider import AsyncEvmWalletProvider
+from .cdp_evm_server_wallet_provider import CdpEvmServerWalletProviderConfig
+from .multicall import CallResult, ContractCall, async_batch_read_contract, get_multicall_address
+
+
+class AsyncCdpEvmServerWalletProvider(AsyncEvmWalletProvider):
+    """An async wallet provider that uses the CDP EVM Server SDK.
+
+    A single CdpClient is kept open for the lifetime of the provider and its calls are
+    awaited directly on the caller's event loop. Use ``create`` to construct the provider,
+    since resolving the account requires a network round trip.
+    """
+
+    def __init__(self, config: CdpEvmServerWalletProviderConfig):
+        """Initialize the async CDP EVM Server wallet provider without resolving the account.
+
+        Args:
+            config (CdpEvmServerWalletProviderConfig): Configuration options for the CDP provider.
+
+        Raises:
+            ValueError: If required configuration is missing
+
+        """
+        self._config = config
+        self._api_key_id = config.api_key_id or os.getenv("CDP_API_KEY_ID")
+        self._api_key_secret = config.api_key_secret or os.getenv("CDP_API_KEY_SECRET")
+        self._wallet_secret = config.wallet_secret or os.getenv("CDP_WALLET_SECRET")
+
+        if not self._api_key_id or not self._api_key_secret or not self._wallet_secret:
+            raise ValueError(
+                "Missing required environment variables. CDP_API_KEY_ID, CDP_API_KEY_SECRET, CDP_WALLET_SECRET are required."
+            )
+
+        network_id = config.network_id or os.getenv("NETWORK_ID", "base-sepolia")
+        self._idempotency_key = config.idempotency_key or os.getenv("IDEMPOTENCY_KEY") or None
+
+        chain = NETWORK_ID_TO_CHAIN[network_id]
+        rpc_url = (config.rpc_urls or chain.rpc_urls["default"].http)[0]
+
+        self._network = Network(
+            protocol_family="evm",
+            network_id=network_id,
+            chain_id=chain.id,
+        )
+        self._web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        self._client = CdpClient(
+            api_key_id=self._api_key_id,
+            api_key_secret=self._api_key_secret,
+            wallet_secret=self._wallet_secret,
+        )
+        self._account = None
+
+    @classmethod
+    async def create(
+        cls, config: CdpEvmServerWalletProviderConfig
+    ) -> "AsyncCdpEvmServerWalletProvider":
+        """Create the provider and resolve or create its account.
+
+        Args:
+            config (CdpEvmServerWalletProviderConfig): Configuration options for the CDP provider.
+
+        Returns:
+            AsyncCdpEvmServerWalletProvider: The initialized provider
+
+        Raises:
+            ValueError: If required configuration is missing or initialization fails
+
+        """
+        try:
+            provider = cls(config)
+            if config.address:
+                provider._account = await provider._client.evm.get_account(address=config.address)
+            else:
+                provider._account = await provider._client.evm.create_account(
+                    idempotency_key=provider._idempotency_key
+                )
+            return provider
+        except Exception as e:
+            raise ValueError(f"Failed to initialize CDP wallet: {e!s}") from e
+
+    def get_address(self) -> str:
+        """Get the wallet address.
+
+        Returns:
+            str: The wallet's address as a hex string
+
+        """
+        return self._account.address
+
+    def get_network(self) -> Network:
+        """Get the current network.
+
+        Returns:
+            Network: Network object containing protocol family, network ID, and chain ID
+
+        """
+        return self._network
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider.
+
+        Returns:
+            str: The string 'async_cdp_evm_server_wallet_provider'
+
+        """
+        return "async_cdp_evm_server_wallet_provider"
+
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency.
+
+        Returns:
+            Decimal: The wallet's balance in wei as a Decimal
+
+        """
+        balance = await self._web3.eth.get_balance(self.get_address())
+        return Decimal(balance)
+
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        """
+        value_wei = Web3.to_wei(value, "ether")
+        return await self._client.evm.send_transaction(
+            address=self.get_address(),
+            transaction=TransactionRequestEIP1559(to=to, value=value_wei),
+            network=self._network.network_id,
+        )
+
+    async def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        contract = self._web3.eth.contract(address=contract_address, abi=abi)
+        func = contract.functions[function_name]
+        if args is None:
+            args = []
+        return await func(*args).call(block_identifier=block_identifier)
+
+    async def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions through Multicall3.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        return await async_batch_read_contract(
+            self._web3,
+            get_multicall_address(self._network),
+            calls,
+            block_identifier=block_identifier,
+        )
+
+    async def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction to the network.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        return await self._client.evm.send_transaction(
+            address=self.get_address(),
+            transaction=TransactionRequestEIP1559(
+                to=transaction["to"],
+                value=transaction.get("value", 0),
+                data=transaction.get("data", "0x"),
+            ),
+            network=self._network.network_id,
+        )
+
+    async def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        Raises:
+            TimeoutError: If transaction is not mined within timeout period
+
+        """
+        return await self._web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=timeout, poll_latency=poll_latency
+        )
+
+    async def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message using the wallet's private key.
+
+        Args:
+            message (str | bytes): The message to sign, either as a string or bytes
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        return await self._client.evm.sign_message(address=self.get_address(), message=message)
+
+    async def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard.
+
+        Args:
+            typed_data (dict[str, Any]): The typed data to sign following EIP-712 format
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        return await self._client.evm.sign_typed_data(
+            address=self.get_address(),
+            domain=typed_data.get("domain", {}),
+            types=typed_data.get("types", {}),
+            primary_type=typed_data.get("primaryType", ""),
+            message=typed_data.get("message", {}),
+        )
+
+    async def sign_transaction(self, transaction: TxParams) -> HexStr:
+        """Sign an EVM transaction.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction signature as a hex string
+
+        """
+        return await self._client.evm.sign_transaction(
+            address=self.get_address(),
+            transaction=TransactionRequestEIP1559(
+                to=transaction["to"],
+                value=transaction.get("value", 0),
+                data=transaction.get("data", "0x"),
+            ),
+            network=self._network.network_id,
+        )
+
+    async def close(self) -> None:
+        """Close the CDP client and the HTTP session used for reads."""
+        await self._client.close()
+        await self._web3.provider.disconnect()
@@ -0,0 +1,322 @@
+"""Async CDP EVM Smart Wallet provider."""
+
+import os
+from decimal import Decimal
+from typing import Any
+
+from cdp import CdpClient
+from cdp.evm_call_types import EncodedCall
+from eth_account import Account
+from web3 import AsyncWeb3, Web3
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from ..network import NETWORK_ID_TO_CHAIN, Network
+from .async_evm_wallet_provider import AsyncEvmWalletProvider
+from .cdp_evm_smart_wallet_provider import CdpEvmSmartWalletProviderConfig
+from .multicall import CallResult, ContractCall, async_batch_read_contract, get_multicall_address
+
+
+class AsyncCdpEvmSmartWalletProvider(AsyncEvmWalletProvider):
+    """An async wallet provider that uses the CDP EVM Smart Account SDK.
+
+    A single CdpClient is kept open for the lifetime of the provider and its calls are
+    awaited directly on the caller's event loop. Use ``create`` to construct the provider,
+    since resolving the owner and smart account requires network round trips.
+    """
+
+    def __init__(self, config: CdpEvmSmartWalletProviderConfig):
+        """Initialize the async CDP EVM Smart Wallet provider without resolving the accounts.
+
+        Args:
+            config (CdpEvmSmartWalletProviderConfig): Configuration options for the CDP provider.
+
+        Raises:
+            ValueError: If required configuration is missing
+
+        """
+        self._config = config
+        self._api_key_id = config.api_key_id or os.getenv("CDP_API_KEY_ID")
+        self._api_key_secret = config.api_key_secret or os.getenv("CDP_API_KEY_SECRET")
+        self._wallet_secret = config.wallet_secret or os.getenv("CDP_WALLET_SECRET")
+        self._paymaster_url = config.paymaster_url
+        self._owner_address_or_private_key = config.owner or os.getenv("OWNER")
+
+        if not self._api_key_id or not self._api_key_secret or not self._wallet_secret:
+            raise ValueError(
+                "Missing required environment variables. CDP_API_KEY_ID, CDP_API_KEY_SECRET, CDP_WALLET_SECRET are required."
+            )
+
+        if not self._owner_address_or_private_key:
+            raise ValueError("Owner private key or CDP server wallet address is required")
+
+        network_id = config.network_id or os.getenv("NETWORK_ID", "base-sepolia")
+
+        chain = NETWORK_ID_TO_CHAIN[network_id]
+        rpc_url = (config.rpc_urls or chain.rpc_urls["default"].http)[0]
+
+        self._network = Network(
+            protocol_family="evm",
+            network_id=network_id,
+            chain_id=chain.id,
+        )
+        self._web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        self._client = CdpClient(
+            api_key_id=self._api_key_id,
+            api_key_secret=self._api_key_secret,
+            wallet_secret=self._wallet_secret,
+        )
+        self._owner = None
+        self._smart_account = None
+        self._address = None
+
+    @classmethod
+    async def create(
+        cls, config: CdpEvmSmartWalletProviderConfig
+    ) -> "AsyncCdpEvmSmartWalletProvider":
+        """Create the provider and resolve its owner and smart account.
+
+        Args:
+            config (CdpEvmSmartWalletProviderConfig): Configuration options for the CDP provider.
+
+        Returns:
+            AsyncCdpEvmSmartWalletProvider: The initialized provider
+
+        Raises:
+            ValueError: If required configuration is missing or initialization fails
+
+        """
+        try:
+            provider = cls(config)
+            owner_address_or_private_key = provider._owner_address_or_private_key
+            cdp = provider._client
+
+            if (
+                owner_address_or_private_key.startswith("0x")
+                and len(owner_address_or_private_key) == 42
+            ):
+                owner = await cdp.evm.get_account(address=owner_address_or_private_key)
+            else:
+                owner = Account.from_key(owner_address_or_private_key)
+
+            if config.address:
+                smart_account = await cdp.evm.get_smart_account(owner=owner, address=config.address)
+            else:
+                smart_account = await cdp.evm.create_smart_account(owner=owner)
+
+            provider._owner = owner
+            provider._smart_account = smart_account
+            provider._address = smart_account.address
+            return provider
+        except Exception as e:
+            raise ValueError(f"Failed to initialize CDP smart wallet: {e!s}") from e
+
+    def get_address(self) -> str:
+        """Get the wallet address.
+
+        Returns:
+            str: The wallet's address as a hex string
+
+        """
+        return self._address
+
+    def get_network(self) -> Network:
+        """Get the current network.
+
+        Returns:
+            Network: Network object containing protocol family, network ID, and chain ID
+
+        """
+        return self._network
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider.
+
+        Returns:
+            str: The string 'async_cdp_evm_smart_wallet_provider'
+
+        """
+        return "async_cdp_evm_smart_wallet_provider"
+
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency.
+
+        Returns:
+            Decimal: The wallet's balance in wei as a Decimal
+
+        """
+        balance = await self._web3.eth.get_balance(self.get_address())
+        return Decimal(balance)
+
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network using a user operation.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        """
+        value_wei = Web3.to_wei(value, "ether")
+        return await self.send_user_operation([EncodedCall(to=to, value=value_wei, data="0x")])
+
+    async def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        contract = self._web3.eth.contract(address=contract_address, abi=abi)
+        func = contract.functions[function_name]
+        if args is None:
+            args = []
+        return await func(*args).call(block_identifier=block_identifier)
+
+    async def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions through Multicall3.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        return await async_batch_read_contract(
+            self._web3,
+            get_multicall_address(self._network),
+            calls,
+            block_identifier=block_identifier,
+        )
+
+    async def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction using a user operation.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        return await self.send_user_operation(
+            [
+                EncodedCall(
+                    to=transaction["to"],
+                    value=transaction.get("value", 0),
+                    data=transaction.get("data", "0x"),
+                )
+            ]
+        )
+
+    async def send_user_operation(self, calls: list[EncodedCall]) -> str:
+        """Send a user operation with multiple calls.
+
+        Args:
+            calls (List[EncodedCall]): List of encoded calls to execute in the user operation
+
+        Returns:
+            str: The transaction hash of the executed user operation
+
+        """
+        user_operation = await self._client.evm.send_user_operation(
+            smart_account=self._smart_account,
+            network=self._network.network_id,
+            calls=calls,
+            paymaster_url=self._paymaster_url,
+        )
+        result = await self._client.evm.wait_for_user_operation(
+            smart_account_address=self._address,
+            user_op_hash=user_operation.user_op_hash,
+        )
+        return result.transaction_hash
+
+    async def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        Raises:
+            TimeoutError: If transaction is not mined within timeout period
+
+        """
+        return await self._web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=timeout, poll_latency=poll_latency
+        )
+
+    async def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message using the wallet's private key.
+
+        Args:
+            message (str | bytes): The message to sign, either as a string or bytes
+
+        Raises:
+            NotImplementedError: Smart wallets cannot sign messages directly
+
+        """
+        raise NotImplementedError(
+            "Smart wallets cannot sign messages directly. Use the owner account to sign messages."
+        )
+
+    async def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard.
+
+        Args:
+            typed_data (dict[str, Any]): The typed data to sign following EIP-712 format
+
+        Raises:
+            NotImplementedError: Smart wallets cannot sign typed data directly
+
+        """
+        raise NotImplementedError(
+            "Smart wallets cannot sign typed data directly. Use the owner account to sign typed data."
+        )
+
+    async def sign_transaction(self, transaction: TxParams) -> HexStr:
+        """Sign an EVM transaction.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Raises:
+            NotImplementedError: Smart wallets cannot sign transactions directly
+
+        """
+        raise NotImplementedError(
+            "Smart wallets cannot sign transactions directly. Use send_transaction or send_user_operation instead."
+        )
+
+    async def close(self) -> None:
+        """Close the CDP client and the HTTP session used for reads."""
+        await self._client.close()
+        await self._web3.provider.disconnect()
@@ -0,0 +1,342 @@
+"""Async eth account wallet provider."""
+
+from decimal import Decimal
+from typing import Any
+
+from eth_account.datastructures import SignedTransaction
+from eth_account.messages import encode_defunct
+from web3 import AsyncWeb3, Web3
+from web3.middleware import SignAndSendRawMiddlewareBuilder
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from ..network import Network
+from .async_evm_wallet_provider import AsyncEvmWalletProvider
+from .eth_account_wallet_provider import EthAccountWalletProviderConfig, resolve_rpc_urls
+from .evm_wallet_provider import check_receipt, resolve_gas_settings
+from .fee_oracle import AsyncFeeOracle, FeeProfile, scale_fees
+from .multicall import CallResult, ContractCall, async_batch_read_contract, get_multicall_address
+from .nonce_manager import AsyncNonceManager, is_already_known_error
+
+
+class AsyncEthAccountWalletProvider(AsyncEvmWalletProvider):
+    """An async wallet provider that uses eth-account and AsyncWeb3 for EVM chain interactions."""
+
+    def __init__(self, config: EthAccountWalletProviderConfig):
+        """Initialize the wallet provider with an eth-account.
+
+        Args:
+            config (EthAccountWalletProviderConfig): Configuration options including account and network ID.
+
+        """
+        self.config = config
+        self.account = config.account
+
+        network_id, rpc_urls = resolve_rpc_urls(config)
+
+        self.web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_urls[0]))
+        self.web3.middleware_onion.inject(
+            SignAndSendRawMiddlewareBuilder.build(self.account), layer=0
+        )
+        self._nonce_manager = AsyncNonceManager(self.web3, self.account.address)
+        self._fee_oracle = AsyncFeeOracle(self.web3)
+
+        self._network = Network(
+            protocol_family="evm",
+            chain_id=self.config.chain_id,
+            network_id=network_id,
+        )
+
+        self._gas_limit_multiplier, self._fee_per_gas_multiplier, self._fee_profile = (
+            resolve_gas_settings(config.gas)
+        )
+
+    def get_address(self) -> str:
+        """Get the wallet address.
+
+        Returns:
+            str: The wallet's address as a hex string.
+
+        """
+        return self.account.address
+
+    def get_network(self) -> Network:
+        """Get the current network.
+
+        Returns:
+            Network: Network object containing protocol family, network ID, and chain ID.
+
+        """
+        return self._network
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider.
+
+        Returns:
+            str: The string 'async_eth_account_wallet_provider'
+
+        """
+        return "async_eth_account_wallet_provider"
+
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency.
+
+        Returns:
+            Decimal: The wallet's balance in wei as a Decimal
+
+        """
+        balance_wei = await self.web3.eth.get_balance(self.account.address)
+        return Decimal(str(balance_wei))
+
+    async def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message using the wallet's private key.
+
+        Args:
+            message (str | bytes): The message to sign, either as a string or bytes
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        if isinstance(message, str):
+            message = message.encode()
+        message_obj = encode_defunct(message)
+        signed = self.account.sign_message(message_obj)
+        return HexStr(signed.signature.hex())
+
+    async def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard.
+
+        Args:
+            typed_data (dict[str, Any]): The typed data to sign following EIP-712 format
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        signed = self.account.sign_typed_data(full_message=typed_data)
+        return HexStr(signed.signature.hex())
+
+    async def sign_transaction(self, transaction: TxParams) -> SignedTransaction:
+        """Sign an EVM transaction.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data.
+
+        Returns:
+            SignedTransaction: The signed transaction object
+
+        """
+        if "chainId" not in transaction:
+            transaction["chainId"] = int(self._network.chain_id)
+        if "from" not in transaction:
+            transaction["from"] = self.account.address
+
+        return self.account.sign_transaction(transaction)
+
+    async def estimate_fees(self, profile: FeeProfile | None = None) -> tuple[int, int]:
+        """Estimate gas fees for a transaction, applying the configured fee multipliers.
+
+        Args:
+            profile (FeeProfile | None): The fee profile to use, defaults to the configured profile
+
+        Returns:
+            tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
+
+        """
+        base_fee_per_gas, max_priority_fee_per_gas = await self._fee_oracle.get_fees(
+            profile or self._fee_profile
+        )
+        return scale_fees(base_fee_per_gas, max_priority_fee_per_gas, self._fee_per_gas_multiplier)
+
+    async def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a signed transaction to the network.
+
+        The nonce is taken from the local nonce manager, so concurrent sends never reuse a
+        nonce. A nonce, fee or gas limit already present on the transaction is used as is.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        Raises:
+            Exception: If transaction preparation or sending fails
+
+        """
+        transaction["from"] = self.account.address
+        transaction["chainId"] = int(self._network.chain_id)
+
+        if "maxFeePerGas" not in transaction:
+            max_priority_fee_per_gas, max_fee_per_gas = await self.estimate_fees()
+            transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+            transaction["maxFeePerGas"] = max_fee_per_gas
+
+        if "gas" not in transaction:
+            gas = await self.web3.eth.estimate_gas(transaction)
+            transaction["gas"] = int(gas * self._gas_limit_multiplier)
+
+        return await self._nonce_manager.send(transaction, self._broadcast)
+
+    async def _broadcast(self, transaction: TxParams) -> HexStr:
+        """Sign and broadcast a transaction with its nonce set.
+
+        Args:
+            transaction (TxParams): The complete transaction
+
+        Returns:
+            HexStr: The transaction hash, also when the node already had the transaction
+
+        """
+        try:
+            return Web3.to_hex(await self.web3.eth.send_transaction(transaction))
+        except Exception as e:
+            if not is_already_known_error(e):
+                raise
+            # Sending it again under a new nonce would execute it twice
+            return Web3.to_hex((await self.sign_transaction(transaction)).hash)
+
+    async def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions back to back, in order, without waiting for receipts.
+
+        A transaction whose gas cannot be estimated until an earlier one is mined waits
+        for the previous receipt first, unless it already carries a gas limit.
+
+        Args:
+            transactions (list[TxParams]): The transactions to send, in nonce order
+
+        Returns:
+            list[HexStr]: The transaction hashes, in the order the transactions were given
+
+        Raises:
+            TransactionFailedError: If a transaction waited for fails, the transactions
+                after it are not sent
+
+        """
+        hashes: list[HexStr] = []
+        for transaction in transactions:
+            if hashes and "gas" not in transaction:
+                try:
+                    transaction["from"] = self.account.address
+                    gas = await self.web3.eth.estimate_gas(transaction)
+                    transaction["gas"] = int(gas * self._gas_limit_multiplier)
+                except Exception:
+                    check_receipt(await self.wait_for_transaction_receipt(hashes[-1]), hashes[-1])
+            hashes.append(await self.send_transaction(transaction))
+        return hashes
+
+    async def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        Raises:
+            TimeoutError: If transaction is not mined within timeout period
+
+        """
+        try:
+            return await self.web3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=timeout, poll_latency=poll_latency
+            )
+        except Exception:
+            # A transaction that never lands may have left a nonce gap behind it
+            self._nonce_manager.reset()
+            raise
+
+    async def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        contract = self.web3.eth.contract(address=contract_address, abi=abi)
+        func = contract.functions[function_name]
+        if args is None:
+            args = []
+        return await func(*args).call(block_identifier=block_identifier)
+
+    async def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions through Multicall3.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        return await async_batch_read_contract(
+            self.web3,
+            get_multicall_address(self._network),
+            calls,
+            block_identifier=block_identifier,
+        )
+
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        Raises:
+            Exception: If transfer fails
+
+        """
+        try:
+            value_wei = Web3.to_wei(value, "ether")
+
+            transfer_result = await self.send_transaction(
+                {
+                    "to": Web3.to_checksum_address(to),
+                    "value": value_wei,
+                }
+            )
+
+            receipt = await self.wait_for_transaction_receipt(transfer_result)
+            if not receipt:
+                raise Exception("Transaction failed")
+
+            tx_hash = receipt["transactionHash"]
+            if not tx_hash:
+                raise Exception("Transaction hash not found")
+
+            return tx_hash.hex()
+        except Exception as e:
+            raise Exception(f"Failed to transfer native tokens: {e!s}") from e
+
+    async def close(self) -> None:
+        """Close the HTTP session used by the AsyncWeb3 provider."""
+        await self.web3.provider.disconnect()
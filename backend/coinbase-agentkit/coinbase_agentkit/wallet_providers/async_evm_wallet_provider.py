@@ -0,0 +1,145 @@
+"""Base class for async EVM-compatible wallet providers."""
+
+import asyncio
+from abc import abstractmethod
+from typing import Any
+
+from eth_account.datastructures import SignedTransaction
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from .evm_wallet_provider import check_receipt
+from .multicall import CallResult, ContractCall, to_contract_call
+from .wallet_provider import AsyncWalletProvider
+
+
+class AsyncEvmWalletProvider(AsyncWalletProvider):
+    """Abstract base class for async EVM wallet providers.
+
+    Mirrors the EvmWalletProvider interface with awaitable methods, so that async
+    actions, invoked with ``AgentKit.ainvoke``, can keep many reads, sends and receipt
+    waits in flight at once without blocking the loop or using a thread per request.
+    """
+
+    @abstractmethod
+    async def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message using the wallet's private key."""
+        pass
+
+    @abstractmethod
+    async def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard."""
+        pass
+
+    @abstractmethod
+    async def sign_transaction(self, transaction: TxParams) -> SignedTransaction:
+        """Sign an EVM transaction."""
+        pass
+
+    @abstractmethod
+    async def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a signed transaction to the network."""
+        pass
+
+    async def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several dependent transactions to the network, in order.
+
+        The default implementation waits for each transaction to be mined before sending
+        the next one.
+
+        Args:
+            transactions (list[TxParams]): The transactions to send, in order
+
+        Returns:
+            list[HexStr]: The transaction hashes, in the order the transactions were given
+
+        Raises:
+            TransactionFailedError: If a transaction waited for fails, the transactions
+                after it are not sent
+
+        """
+        hashes: list[HexStr] = []
+        for transaction in transactions:
+            if hashes:
+                check_receipt(await self.wait_for_transaction_receipt(hashes[-1]), hashes[-1])
+            hashes.append(await self.send_transaction(transaction))
+        return hashes
+
+    @abstractmethod
+    async def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt."""
+        pass
+
+    @abstractmethod
+    async def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract."""
+        pass
+
+    async def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions at once.
+
+        The default implementation runs one read_contract call per entry concurrently.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        contract_calls = [to_contract_call(call) for call in calls]
+        outcomes = await asyncio.gather(
+            *(
+                self.read_contract(
+                    call.contract_address,
+                    call.abi,
+                    call.function_name,
+                    call.args,
+                    block_identifier=block_identifier,
+                )
+                for call in contract_calls
+            ),
+            return_exceptions=True,
+        )
+
+        results = []
+        for call, outcome in zip(contract_calls, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                if not call.allow_failure:
+                    raise outcome
+                results.append(CallResult(success=False, error=str(outcome)))
+            else:
+                results.append(CallResult(success=True, value=outcome))
+        return results
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release any network resources held by the provider."""
+        pass
+
+    async def __aenter__(self) -> "AsyncEvmWalletProvider":
+        """Enter the provider's async context.
+
+        Returns:
+            AsyncEvmWalletProvider: The provider itself
+
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the provider when leaving its async context."""
+        await self.close()
@@ -0,0 +1,331 @@
+"""A JSON-RPC transport that sends concurrent requests as one batch."""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from web3.providers import BaseProvider, JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+T = TypeVar("T")
+
+# Seconds a request made while others are in flight waits for more requests to join its batch
+DEFAULT_BATCH_WINDOW = 0.002
+
+# Largest number of requests sent in one JSON-RPC batch
+DEFAULT_MAX_BATCH_SIZE = 100
+
+# Largest number of calls a RequestBatch runs at the same time
+DEFAULT_MAX_WORKERS = 8
+
+# The RequestBatch a worker thread is running a call for, if any
+_local = threading.local()
+
+
+class _PendingRequest:
+    """A request waiting to be sent, and the future its response is delivered to."""
+
+    def __init__(self, method: RPCEndpoint, params: Any):
+        self.method = method
+        self.params = params
+        self.future: Future = Future()
+
+
+class BatchingProvider(JSONBaseProvider):
+    """A Web3 provider that sends requests made close together as one JSON-RPC batch.
+
+    A request made while no other request is in flight is sent straight away. Requests
+    made while others are in flight wait up to ``window`` seconds for more requests to
+    join them, and are then posted together as a JSON-RPC array with each caller getting
+    its own response back. For
+    code that runs on a single thread, ``batch`` runs independent calls concurrently so
+    that their requests share a round trip. Requests are sent through the wrapped
+    provider, which can be an HTTPProvider or an RpcRouterProvider.
+    """
+
+    def __init__(
+        self,
+        provider: BaseProvider,
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """Initialize the provider.
+
+        Args:
+            provider: The provider requests are sent through.
+            window: Seconds a request made while others are in flight waits for more
+                requests to join its batch. Zero sends requests made outside ``batch``
+                straight away.
+            max_batch_size: Largest number of requests sent in one batch.
+
+        """
+        super().__init__()
+        self.provider = provider
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: list[_PendingRequest] = []
+        self._in_flight = 0
+        self._full = threading.Event()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __str__(self) -> str:
+        """Describe the provider by the one it wraps."""
+        return f"Batching {self.provider}"
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a request, batched with any others made while requests are in flight.
+
+        Args:
+            method: The JSON-RPC method.
+            params: The method parameters.
+
+        Returns:
+            RPCResponse: The response to this request.
+
+        """
+        batch = getattr(_local, "batch", None)
+        if batch is not None and batch.provider is self:
+            return batch._hold(_PendingRequest(method, params)).result()
+
+        if self._window <= 0:
+            return self.provider.make_request(method, params)
+
+        request = _PendingRequest(method, params)
+        with self._lock:
+            # A request with no company has nothing to wait for
+            if not self._pending and self._in_flight == 0:
+                self._in_flight += 1
+                alone = True
+            else:
+                alone = False
+                self._pending.append(request)
+                leader = len(self._pending) == 1
+                if len(self._pending) >= self._max_batch_size:
+                    self._full.set()
+
+        if alone:
+            try:
+                return self.provider.make_request(method, params)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+        # The first request of a window sends everything that arrived while it waited
+        if leader:
+            self._full.wait(self._window)
+            with self._lock:
+                requests, self._pending = self._pending, []
+                self._full.clear()
+                self._in_flight += len(requests)
+            try:
+                self._send(requests)
+            finally:
+                with self._lock:
+                    self._in_flight -= len(requests)
+
+        return request.future.result()
+
+    def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        """Send an explicit batch of requests straight through the wrapped provider.
+
+        Args:
+            requests: The (method, params) pairs to send.
+
+        Returns:
+            list[RPCResponse] | RPCResponse: The responses, or a single error response
+                if the batch was rejected as a whole.
+
+        """
+        return self.provider.make_batch_request(requests)
+
+    def batch(self) -> "RequestBatch":
+        """Start a batch of calls whose requests are sent together.
+
+        Returns:
+            RequestBatch: A context manager whose ``call`` method schedules a call.
+
+        """
+        return RequestBatch(self)
+
+    def close(self) -> None:
+        """Stop the worker threads used by batches."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _send(self, requests: list[_PendingRequest]) -> None:
+        """Send requests and deliver each response to its future.
+
+        Args:
+            requests: The requests to send.
+
+        """
+        for start in range(0, len(requests), self._max_batch_size):
+            chunk = requests[start : start + self._max_batch_size]
+            if len(chunk) == 1:
+                self._send_one(chunk[0])
+                continue
+
+            try:
+                responses = self.provider.make_batch_request(
+                    [(request.method, request.params) for request in chunk]
+                )
+            except NotImplementedError:
+                responses = None
+            except Exception as e:
+                for request in chunk:
+                    request.future.set_exception(e)
+                continue
+
+            if not isinstance(responses, list) or len(responses) != len(chunk):
+                # The batch was rejected as a whole, e.g. because the node does not accept
+                # batches, so the requests are sent one at a time instead
+                for request in chunk:
+                    self._send_one(request)
+                continue
+
+            for request, response in zip(chunk, responses, strict=True):
+                request.future.set_result(response)
+
+    def _send_one(self, request: _PendingRequest) -> None:
+        """Send a single request and deliver its response to its future.
+
+        Args:
+            request: The request to send.
+
+        """
+        try:
+            request.future.set_result(self.provider.make_request(request.method, request.params))
+        except Exception as e:
+            request.future.set_exception(e)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker threads used by batches, starting them if needed.
+
+        Returns:
+            ThreadPoolExecutor: The executor.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="rpc-batch"
+                )
+            return self._executor
+
+
+class RequestBatch:
+    """Runs independent calls concurrently and sends the requests they make together.
+
+    Each call scheduled with ``call`` runs on a worker thread. The requests the calls
+    make through the batching provider are held until the ``with`` block exits, and then
+    until every unfinished call is waiting on a request, and are sent as one JSON-RPC
+    batch. Calls that make further requests once answered are batched again in the same
+    way, so independent calls that make one request each cost a single round trip.
+
+    The futures returned by ``call`` are resolved once the block exits and must not be
+    waited on inside it.
+    """
+
+    def __init__(self, provider: BatchingProvider):
+        """Initialize an empty batch.
+
+        Args:
+            provider: The batching provider the calls send their requests through.
+
+        """
+        self.provider = provider
+        self._condition = threading.Condition()
+        self._held: list[_PendingRequest] = []
+        self._submitted = 0
+        self._started = 0
+        self._finished = 0
+        self._closed = False
+
+    def __enter__(self) -> "RequestBatch":
+        """Start collecting calls.
+
+        Returns:
+            RequestBatch: The batch.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Send the held requests and wait for every call to finish."""
+        with self._condition:
+            self._closed = True
+        self._flush()
+
+    def call(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Schedule a call whose requests are batched with those of the other calls.
+
+        Args:
+            function: The function to call, e.g. ``web3.eth.get_balance``.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Future[T]: A future resolved with the call's result once the block exits.
+
+        Raises:
+            RuntimeError: If the batch has already been sent.
+
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The batch has already been sent")
+            self._submitted += 1
+        return self.provider._get_executor().submit(self._run, function, args, kwargs)
+
+    def _run(self, function: Callable[..., T], args: tuple, kwargs: dict[str, Any]) -> T:
+        """Run a call on a worker thread, routing its requests through the batch."""
+        with self._condition:
+            self._started += 1
+        _local.batch = self
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.batch = None
+            with self._condition:
+                self._finished += 1
+                self._condition.notify_all()
+
+    def _hold(self, request: _PendingRequest) -> Future:
+        """Hold a request until the next round of the batch is sent.
+
+        Args:
+            request: The request.
+
+        Returns:
+            Future: A future resolved with the response.
+
+        """
+        with self._condition:
+            self._held.append(request)
+            self._condition.notify_all()
+        return request.future
+
+    def _ready(self) -> bool:
+        """Check whether the held requests can be sent. Must hold the condition."""
+        if not self._closed:
+            return False
+        running = self._started - self._finished
+        return self._finished == self._submitted or (
+            bool(self._held) and len(self._held) >= running
+        )
+
+    def _flush(self) -> None:
+        """Send rounds of held requests until every call has finished."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._ready)
+                if not self._held and self._finished == self._submitted:
+                    return
+                requests, self._held = self._held, []
+            self.provider._send(requests)
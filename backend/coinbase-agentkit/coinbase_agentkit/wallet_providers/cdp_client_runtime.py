@@ -0,0 +1,256 @@
+"""A long-lived CDP client running on a dedicated event loop thread."""
+
+import asyncio
+import contextlib
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, TypeVar
+
+import aiohttp
+from cdp import CdpClient
+
+T = TypeVar("T")
+
+# Seconds a synchronous caller waits for a CDP call before giving up
+DEFAULT_CDP_TIMEOUT = 120.0
+
+# Seconds allowed for closing the client and stopping the loop on shutdown
+SHUTDOWN_TIMEOUT = 5.0
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Check whether an error means the client's HTTP session can no longer be used.
+
+    Args:
+        error: The error raised by a CDP call.
+
+    Returns:
+        bool: True if the client should be discarded and reconnected.
+
+    """
+    if isinstance(error, aiohttp.ClientConnectionError):
+        return True
+    return isinstance(error, RuntimeError) and "closed" in str(error).lower()
+
+
+class _ClientSlot:
+    """Holds a runtime's client, so it can be closed without a reference to the runtime."""
+
+    def __init__(self):
+        self.client: CdpClient | None = None
+
+    async def discard(self) -> None:
+        """Close the current client, if any, so the next call creates a new one."""
+        client, self.client = self.client, None
+        if client is not None:
+            with contextlib.suppress(Exception):
+                await client.close()
+
+
+async def _stop(slot: _ClientSlot) -> None:
+    """Close a runtime's client, then stop the event loop it runs on.
+
+    Args:
+        slot: The slot holding the runtime's client.
+
+    """
+    try:
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(slot.discard(), SHUTDOWN_TIMEOUT)
+    finally:
+        asyncio.get_running_loop().stop()
+
+
+def _shutdown(
+    loop: asyncio.AbstractEventLoop,
+    thread: threading.Thread,
+    slot: _ClientSlot,
+    wait: bool = False,
+) -> None:
+    """Close a runtime's client and stop its loop thread.
+
+    Args:
+        loop: The runtime's event loop.
+        thread: The thread running the loop.
+        slot: The slot holding the runtime's client.
+        wait: Whether to wait for the thread to stop. A runtime being garbage collected
+            does not wait, as it may be collected on its own loop thread.
+
+    """
+    stop = _stop(slot)
+    try:
+        asyncio.run_coroutine_threadsafe(stop, loop)
+    except RuntimeError:
+        # The loop is already closed
+        stop.close()
+        return
+    if wait and threading.current_thread() is not thread:
+        thread.join(timeout=SHUTDOWN_TIMEOUT)
+
+
+class CdpClientRuntime:
+    """Runs CDP calls on one long-lived CdpClient owned by a background event loop.
+
+    The event loop thread and the client are created on first use and reused by every
+    later call, so each call costs a single API round trip instead of building a new
+    client and opening a new HTTPS connection. Synchronous callers submit coroutines
+    through ``run``, which is safe to call from any thread, including threads that
+    already run their own event loop. A client whose connection breaks is closed and
+    replaced on the next call. The loop thread is stopped by ``close``, when the runtime
+    is garbage collected, or at interpreter exit, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], CdpClient],
+        timeout: float | None = DEFAULT_CDP_TIMEOUT,
+    ):
+        """Initialize the runtime without starting the loop thread.
+
+        Args:
+            client_factory: Callable that builds a new CdpClient.
+            timeout: Seconds to wait for each call, or None to wait indefinitely.
+
+        """
+        self._client_factory = client_factory
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._slot = _ClientSlot()
+        self._finalizer: weakref.finalize | None = None
+        self._closed = False
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the runtime's event loop and wait for its result.
+
+        Args:
+            coroutine: The coroutine to run. It may await ``get_client`` for the shared client.
+
+        Returns:
+            T: The result of the coroutine.
+
+        Raises:
+            RuntimeError: If the runtime is closed or called from its own loop thread.
+            TimeoutError: If the call does not complete within the timeout.
+
+        """
+        try:
+            loop = self._ensure_loop()
+        except RuntimeError:
+            coroutine.close()
+            raise
+
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("CdpClientRuntime.run cannot be called from its own event loop")
+
+        future = asyncio.run_coroutine_threadsafe(self._guard(coroutine), loop)
+        try:
+            return future.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            if future.done():
+                # The coroutine itself raised a TimeoutError
+                raise
+            future.cancel()
+            raise TimeoutError(
+                f"CDP call did not complete within {self._timeout} seconds"
+            ) from None
+
+    def run_with_client(self, operation: Callable[[CdpClient], Awaitable[T]]) -> T:
+        """Run an operation against the shared client and wait for its result.
+
+        Args:
+            operation: Callable that takes the CdpClient and returns an awaitable.
+
+        Returns:
+            T: The result of the operation.
+
+        """
+
+        async def _call() -> T:
+            return await operation(await self.get_client())
+
+        return self.run(_call())
+
+    async def get_client(self) -> CdpClient:
+        """Get the shared client, creating it if needed. Must be awaited on the runtime's loop.
+
+        Returns:
+            CdpClient: The shared client.
+
+        """
+        if self._slot.client is None:
+            self._slot.client = self._client_factory()
+        return self._slot.client
+
+    def close(self) -> None:
+        """Close the client and stop the loop thread. Later calls raise RuntimeError."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            finalizer = self._finalizer
+
+        detached = finalizer.detach() if finalizer is not None else None
+        if detached is not None:
+            _, _, args, _ = detached
+            _shutdown(*args, wait=True)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread on first use.
+
+        Returns:
+            asyncio.AbstractEventLoop: The runtime's event loop.
+
+        Raises:
+            RuntimeError: If the runtime has been closed.
+
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot use a closed CdpClientRuntime")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop,), name="cdp-client-runtime", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                # Unlike an atexit hook, the finalizer does not keep the runtime, and the
+                # provider its client factory belongs to, alive until the interpreter exits
+                self._finalizer = weakref.finalize(self, _shutdown, loop, thread, self._slot)
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Run the event loop until it is stopped, then close it.
+
+        Args:
+            loop: The event loop to run.
+
+        """
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _guard(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Await a coroutine, dropping the client if its connection broke.
+
+        Args:
+            coroutine: The coroutine to await.
+
+        Returns:
+            T: The result of the coroutine.
+
+        """
+        try:
+            return await coroutine
+        except Exception as e:
+            if is_connection_error(e):
+                await self._slot.discard()
+            raise
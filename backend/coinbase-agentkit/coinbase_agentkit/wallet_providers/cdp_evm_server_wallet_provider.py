@@ -1,9 +1,9 @@
 """CDP EVM Server Wallet provider."""
 
-import asyncio
 import os
+from collections.abc import Awaitable, Callable
 from decimal import Decimal
-from typing import Any
+from typing import Any, TypeVar
 
 from cdp import CdpClient
 from cdp.evm_transaction_types import TransactionRequestEIP1559
@@ -12,7 +12,15 @@ from web3 import Web3
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
 from ..network import NETWORK_ID_TO_CHAIN, Network
+from .batching_provider import DEFAULT_BATCH_WINDOW, BatchingProvider, RequestBatch
+from .cdp_client_runtime import CdpClientRuntime
 from .evm_wallet_provider import EvmWalletProvider
+from .multicall import CallResult, ContractCall, batch_read_contract, get_multicall_address
+from .read_cache import ReadCache, function_signature
+from .receipt_watcher import get_receipt_watcher
+from .rpc_router import RpcRouterProvider
+
+T = TypeVar("T")
 
 
 class CdpEvmServerProviderConfig(BaseModel):
@@ -29,6 +37,18 @@ class CdpEvmServerWalletProviderConfig(CdpEvmServerProviderConfig):
     network_id: str | None = Field(None, description="The network id")
     address: str | None = Field(None, description="The address to use")
     idempotency_key: str | None = Field(None, description="The idempotency key for wallet creation")
+    rpc_urls: list[str] | None = Field(
+        None,
+        description="Optional RPC URLs to route requests across, with failover and hedged reads",
+    )
+    batch_window: float | None = Field(
+        None,
+        description="Seconds to collect concurrent RPC requests into one JSON-RPC batch, 0 disables",
+    )
+    read_cache_size: int | None = Field(
+        None,
+        description="Number of read_contract results to cache by block, caching is off when unset",
+    )
 
 
 class CdpEvmServerWalletProvider(EvmWalletProvider):
@@ -59,20 +79,30 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             self._idempotency_key = config.idempotency_key or os.getenv("IDEMPOTENCY_KEY") or None
 
             chain = NETWORK_ID_TO_CHAIN[network_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
+            # Routing across several endpoints is opt-in through rpc_urls
+            rpc_urls = config.rpc_urls or chain.rpc_urls["default"].http[:1]
 
             self._network = Network(
                 protocol_family="evm",
                 network_id=network_id,
                 chain_id=chain.id,
             )
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._router = RpcRouterProvider(rpc_urls) if len(rpc_urls) > 1 else None
+            self._rpc = BatchingProvider(
+                self._router or Web3.HTTPProvider(rpc_urls[0]),
+                window=(
+                    config.batch_window if config.batch_window is not None else DEFAULT_BATCH_WINDOW
+                ),
+            )
+            self._web3 = Web3(self._rpc)
+            self._receipt_watcher = get_receipt_watcher(chain.id, self._web3)
+            self._read_cache = ReadCache(self._web3, chain.id, max_size=config.read_cache_size or 0)
+            self._runtime = CdpClientRuntime(lambda: self.get_client())
 
-            client = self.get_client()
             if config.address:
-                account = asyncio.run(self._get_account(client, config.address))
+                account = self._run_async(self._get_account(config.address))
             else:
-                account = asyncio.run(self._create_account(client))
+                account = self._run_async(self._create_account())
 
             self._account = account
 
@@ -92,6 +122,35 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             wallet_secret=self._wallet_secret,
         )
 
+    def run_with_client(self, operation: Callable[[CdpClient], Awaitable[T]]) -> T:
+        """Run an operation against the provider's long-lived CDP client.
+
+        Args:
+            operation (Callable[[CdpClient], Awaitable[T]]): Callable that takes the client and
+                returns an awaitable
+
+        Returns:
+            T: The result of the operation
+
+        """
+        return self._runtime.run_with_client(operation)
+
+    def close(self) -> None:
+        """Close the CDP client and stop its background threads."""
+        self._runtime.close()
+        self._rpc.close()
+        if self._router is not None:
+            self._router.close()
+
+    def batch(self) -> RequestBatch:
+        """Start a batch of independent calls whose RPC requests are sent together.
+
+        Returns:
+            RequestBatch: A context manager whose ``call`` method schedules a call
+
+        """
+        return self._rpc.batch()
+
     def get_address(self) -> str:
         """Get the wallet address.
 
@@ -141,18 +200,17 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
 
         """
         value_wei = Web3.to_wei(value, "ether")
-        client = self.get_client()
 
         async def _send_transaction():
-            async with client as cdp:
-                return await cdp.evm.send_transaction(
-                    address=self.get_address(),
-                    transaction=TransactionRequestEIP1559(
-                        to=to,
-                        value=value_wei,
-                    ),
-                    network=self._network.network_id,
-                )
+            cdp = await self._runtime.get_client()
+            return await cdp.evm.send_transaction(
+                address=self.get_address(),
+                transaction=TransactionRequestEIP1559(
+                    to=to,
+                    value=value_wei,
+                ),
+                network=self._network.network_id,
+            )
 
         return self._run_async(_send_transaction())
 
@@ -166,6 +224,9 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
     ) -> Any:
         """Read data from a smart contract.
 
+        When ``read_cache_size`` is configured, results at "latest" or at a block number
+        are cached per block, so repeated reads within a block are answered from memory.
+
         Args:
             contract_address (ChecksumAddress): The address of the contract to read from
             abi (list[dict[str, Any]]): The ABI of the contract
@@ -181,7 +242,36 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
         func = contract.functions[function_name]
         if args is None:
             args = []
-        return func(*args).call(block_identifier=block_identifier)
+        return self._read_cache.read(
+            contract_address,
+            function_signature(abi, function_name),
+            args,
+            block_identifier,
+            lambda block: func(*args).call(block_identifier=block),
+        )
+
+    def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions through Multicall3.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        return batch_read_contract(
+            self._web3,
+            get_multicall_address(self._network),
+            calls,
+            block_identifier=block_identifier,
+        )
 
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a transaction to the network.
@@ -193,19 +283,18 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The transaction hash as a hex string
 
         """
-        client = self.get_client()
 
         async def _send_transaction():
-            async with client as cdp:
-                return await cdp.evm.send_transaction(
-                    address=self.get_address(),
-                    transaction=TransactionRequestEIP1559(
-                        to=transaction["to"],
-                        value=transaction.get("value", 0),
-                        data=transaction.get("data", "0x"),
-                    ),
-                    network=self._network.network_id,
-                )
+            cdp = await self._runtime.get_client()
+            return await cdp.evm.send_transaction(
+                address=self.get_address(),
+                transaction=TransactionRequestEIP1559(
+                    to=transaction["to"],
+                    value=transaction.get("value", 0),
+                    data=transaction.get("data", "0x"),
+                ),
+                network=self._network.network_id,
+            )
 
         return self._run_async(_send_transaction())
 
@@ -217,7 +306,8 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float): Unused, kept for compatibility. The chain's shared receipt
+                watcher polls once per new block for every pending transaction
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
@@ -226,9 +316,10 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             TimeoutError: If transaction is not mined within timeout period
 
         """
-        return self._web3.eth.wait_for_transaction_receipt(
-            tx_hash, timeout=timeout, poll_latency=poll_latency
-        )
+        receipt = self._receipt_watcher.wait(tx_hash, timeout=timeout)
+        # Reads at "latest" must see the state the transaction produced
+        self._read_cache.invalidate_head()
+        return receipt
 
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key.
@@ -240,14 +331,13 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The signature as a hex string
 
         """
-        client = self.get_client()
 
         async def _sign_message():
-            async with client as cdp:
-                return await cdp.evm.sign_message(
-                    address=self.get_address(),
-                    message=message,
-                )
+            cdp = await self._runtime.get_client()
+            return await cdp.evm.sign_message(
+                address=self.get_address(),
+                message=message,
+            )
 
         return self._run_async(_sign_message())
 
@@ -261,8 +351,6 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The signature as a hex string
 
         """
-        client = self.get_client()
-
         # Extract required parameters from typed_data
         domain = typed_data.get("domain", {})
         types = typed_data.get("types", {})
@@ -270,14 +358,14 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
         message = typed_data.get("message", {})
 
         async def _sign_typed_data():
-            async with client as cdp:
-                return await cdp.evm.sign_typed_data(
-                    address=self.get_address(),
-                    domain=domain,
-                    types=types,
-                    primary_type=primary_type,
-                    message=message,
-                )
+            cdp = await self._runtime.get_client()
+            return await cdp.evm.sign_typed_data(
+                address=self.get_address(),
+                domain=domain,
+                types=types,
+                primary_type=primary_type,
+                message=message,
+            )
 
         return self._run_async(_sign_typed_data())
 
@@ -291,51 +379,46 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             HexStr: The transaction signature as a hex string
 
         """
-        client = self.get_client()
 
         async def _sign_transaction():
-            async with client as cdp:
-                return await cdp.evm.sign_transaction(
-                    address=self.get_address(),
-                    transaction=TransactionRequestEIP1559(
-                        to=transaction["to"],
-                        value=transaction.get("value", 0),
-                        data=transaction.get("data", "0x"),
-                    ),
-                    network=self._network.network_id,
-                )
+            cdp = await self._runtime.get_client()
+            return await cdp.evm.sign_transaction(
+                address=self.get_address(),
+                transaction=TransactionRequestEIP1559(
+                    to=transaction["to"],
+                    value=transaction.get("value", 0),
+                    data=transaction.get("data", "0x"),
+                ),
+                network=self._network.network_id,
+            )
 
         return self._run_async(_sign_transaction())
 
-    async def _get_account(self, client: CdpClient, address: str):
+    async def _get_account(self, address: str):
         """Get an existing account by address.
 
         Args:
-            client (CdpClient): The CDP client instance
             address (str): The address of the account to get
 
         Returns:
             Any: The account object
 
         """
-        async with client as cdp:
-            return await cdp.evm.get_account(address=address)
+        cdp = await self._runtime.get_client()
+        return await cdp.evm.get_account(address=address)
 
-    async def _create_account(self, client: CdpClient):
+    async def _create_account(self):
         """Create a new account.
 
-        Args:
-            client (CdpClient): The CDP client instance
-
         Returns:
             Any: The newly created account object
 
         """
-        async with client as cdp:
-            return await cdp.evm.create_account(idempotency_key=self._idempotency_key)
+        cdp = await self._runtime.get_client()
+        return await cdp.evm.create_account(idempotency_key=self._idempotency_key)
 
     def _run_async(self, coroutine):
-        """Run an async coroutine synchronously.
+        """Run an async coroutine synchronously on the provider's CDP client runtime.
 
         Args:
             coroutine: The coroutine to run
@@ -344,9 +427,4 @@ class CdpEvmServerWalletProvider(EvmWalletProvider):
             Any: The result of the coroutine
 
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(coroutine)
+        return self._runtime.run(coroutine)
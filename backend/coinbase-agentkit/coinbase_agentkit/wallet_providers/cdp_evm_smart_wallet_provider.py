@@ -1,19 +1,28 @@
 """CDP EVM Smart Wallet provider."""
 
-import asyncio
 import os
+from collections.abc import Awaitable, Callable
 from decimal import Decimal
-from typing import Any
+from typing import Any, TypeVar
 
 from cdp import CdpClient
 from cdp.evm_call_types import EncodedCall
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from pydantic import BaseModel, Field
 from web3 import Web3
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
 from ..network import NETWORK_ID_TO_CHAIN, Network
+from .batching_provider import DEFAULT_BATCH_WINDOW, BatchingProvider, RequestBatch
+from .cdp_client_runtime import CdpClientRuntime
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .multicall import CallResult, ContractCall, batch_read_contract, get_multicall_address
+from .read_cache import ReadCache, function_signature
+from .receipt_watcher import get_receipt_watcher
+from .rpc_router import RpcRouterProvider
+
+T = TypeVar("T")
 
 
 class CdpEvmSmartWalletProviderConfig(BaseModel):
@@ -28,6 +37,18 @@ class CdpEvmSmartWalletProviderConfig(BaseModel):
         None, description="The owner's private key or CDP server wallet address"
     )
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
+    rpc_urls: list[str] | None = Field(
+        None,
+        description="Optional RPC URLs to route requests across, with failover and hedged reads",
+    )
+    batch_window: float | None = Field(
+        None,
+        description="Seconds to collect concurrent RPC requests into one JSON-RPC batch, 0 disables",
+    )
+    read_cache_size: int | None = Field(
+        None,
+        description="Number of read_contract results to cache by block, caching is off when unset",
+    )
     paymaster_url: str | None = Field(
         None, description="Optional paymaster URL for gasless transactions"
     )
@@ -65,42 +86,50 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             network_id = config.network_id or os.getenv("NETWORK_ID", "base-sepolia")
 
             chain = NETWORK_ID_TO_CHAIN[network_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
+            # Routing across several endpoints is opt-in through rpc_urls
+            rpc_urls = config.rpc_urls or chain.rpc_urls["default"].http[:1]
 
             self._network = Network(
                 protocol_family="evm",
                 network_id=network_id,
                 chain_id=chain.id,
             )
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
-
-            client = self.get_client()
-            try:
-
-                async def initialize_accounts():
-                    async with client as cdp:
-                        if (
-                            owner_address_or_private_key.startswith("0x")
-                            and len(owner_address_or_private_key) == 42
-                        ):
-                            owner = await cdp.evm.get_account(address=owner_address_or_private_key)
-                        else:
-                            owner = Account.from_key(owner_address_or_private_key)
-
-                        if config.address:
-                            smart_account = await cdp.evm.get_smart_account(
-                                owner=owner, address=config.address
-                            )
-                        else:
-                            smart_account = await cdp.evm.create_smart_account(owner=owner)
-                        return owner, smart_account
-
-                owner, smart_account = asyncio.run(initialize_accounts())
-                self._address = smart_account.address
-                self._owner = owner
-
-            finally:
-                asyncio.run(client.close())
+            self._router = RpcRouterProvider(rpc_urls) if len(rpc_urls) > 1 else None
+            self._rpc = BatchingProvider(
+                self._router or Web3.HTTPProvider(rpc_urls[0]),
+                window=(
+                    config.batch_window if config.batch_window is not None else DEFAULT_BATCH_WINDOW
+                ),
+            )
+            self._web3 = Web3(self._rpc)
+
+            self._receipt_watcher = get_receipt_watcher(chain.id, self._web3)
+            self._read_cache = ReadCache(self._web3, chain.id, max_size=config.read_cache_size or 0)
+            self._runtime = CdpClientRuntime(lambda: self.get_client())
+
+            async def initialize_accounts():
+                cdp = await self._runtime.get_client()
+                if (
+                    owner_address_or_private_key.startswith("0x")
+                    and len(owner_address_or_private_key) == 42
+                ):
+                    owner = await cdp.evm.get_account(address=owner_address_or_private_key)
+                else:
+                    owner = Account.from_key(owner_address_or_private_key)
+
+                if config.address:
+                    smart_account = await cdp.evm.get_smart_account(
+                        owner=owner, address=config.address
+                    )
+                else:
+                    smart_account = await cdp.evm.create_smart_account(owner=owner)
+                return cdp, owner, smart_account
+
+            client, owner, smart_account = self._run_async(initialize_accounts())
+            self._address = smart_account.address
+            self._owner = owner
+            self._smart_account = smart_account
+            self._smart_account_client = client
 
             self._gas_limit_multiplier = (
                 max(config.gas.gas_limit_multiplier, 1)
@@ -134,8 +163,28 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             wallet_secret=self._wallet_secret,
         )
 
+    def run_with_client(self, operation: Callable[[CdpClient], Awaitable[T]]) -> T:
+        """Run an operation against the provider's long-lived CDP client.
+
+        Args:
+            operation (Callable[[CdpClient], Awaitable[T]]): Callable that takes the client and
+                returns an awaitable
+
+        Returns:
+            T: The result of the operation
+
+        """
+        return self._runtime.run_with_client(operation)
+
+    def close(self) -> None:
+        """Close the CDP client and stop its background threads."""
+        self._runtime.close()
+        self._rpc.close()
+        if self._router is not None:
+            self._router.close()
+
     def _run_async(self, coroutine):
-        """Run an async coroutine synchronously.
+        """Run an async coroutine synchronously on the provider's CDP client runtime.
 
         Args:
             coroutine: The coroutine to run
@@ -144,15 +193,13 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             Any: The result of the coroutine
 
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(coroutine)
+        return self._runtime.run(coroutine)
 
     async def _get_smart_account(self, cdp):
-        """Get the smart account, handling server wallet owners differently.
+        """Get the smart account bound to the given client.
+
+        The smart account resolved at initialization is reused for as long as the provider's
+        long-lived client is, and is only looked up again after the client was reconnected.
 
         Args:
             cdp: CDP client instance
@@ -161,17 +208,28 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             The smart account object
 
         """
+        if self._smart_account is not None and self._smart_account_client is cdp:
+            return self._smart_account
+
         # Check if owner is a server wallet (not an eth_account)
-        if not isinstance(self._owner, Account):
-            # For server wallets, create a fresh owner reference to avoid nested client sessions
+        if not isinstance(self._owner, LocalAccount):
+            # Server wallet owners are bound to a client, so resolve them on the new one
             owner = await cdp.evm.get_account(address=self._owner.address)
-            smart_account = await cdp.evm.get_smart_account(owner=owner, address=self._address)
         else:
-            # Using eth_account is simpler - no nested client sessions
-            smart_account = await cdp.evm.get_smart_account(
-                owner=self._owner, address=self._address
-            )
-        return smart_account
+            owner = self._owner
+
+        self._smart_account = await cdp.evm.get_smart_account(owner=owner, address=self._address)
+        self._smart_account_client = cdp
+        return self._smart_account
+
+    def batch(self) -> RequestBatch:
+        """Start a batch of independent calls whose RPC requests are sent together.
+
+        Returns:
+            RequestBatch: A context manager whose ``call`` method schedules a call
+
+        """
+        return self._rpc.batch()
 
     def get_address(self) -> str:
         """Get the wallet address.
@@ -222,27 +280,22 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
 
         """
         value_wei = Web3.to_wei(value, "ether")
-        client = self.get_client()
 
         async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._network.network_id,
-                    calls=[EncodedCall(to=to, value=value_wei, data="0x")],
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
+            cdp = await self._runtime.get_client()
+            smart_account = await self._get_smart_account(cdp)
+            user_operation = await cdp.evm.send_user_operation(
+                smart_account=smart_account,
+                network=self._network.network_id,
+                calls=[EncodedCall(to=to, value=value_wei, data="0x")],
+                paymaster_url=self._paymaster_url,
+            )
+            return await cdp.evm.wait_for_user_operation(
+                smart_account_address=self._address,
+                user_op_hash=user_operation.user_op_hash,
+            )
 
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+        return self._run_async(_send_user_operation()).transaction_hash
 
     def read_contract(
         self,
@@ -254,6 +307,9 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
     ) -> Any:
         """Read data from a smart contract.
 
+        When ``read_cache_size`` is configured, results at "latest" or at a block number
+        are cached per block, so repeated reads within a block are answered from memory.
+
         Args:
             contract_address (ChecksumAddress): The address of the contract to read from
             abi (list[dict[str, Any]]): The ABI of the contract
@@ -269,7 +325,36 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
         func = contract.functions[function_name]
         if args is None:
             args = []
-        return func(*args).call(block_identifier=block_identifier)
+        return self._read_cache.read(
+            contract_address,
+            function_signature(abi, function_name),
+            args,
+            block_identifier,
+            lambda block: func(*args).call(block_identifier=block),
+        )
+
+    def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions through Multicall3.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        return batch_read_contract(
+            self._web3,
+            get_multicall_address(self._network),
+            calls,
+            block_identifier=block_identifier,
+        )
 
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a transaction using a user operation.
@@ -281,32 +366,28 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             HexStr: The transaction hash as a hex string
 
         """
-        client = self.get_client()
 
         async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._network.network_id,
-                    calls=[
-                        EncodedCall(
-                            to=transaction["to"],
-                            value=transaction.get("value", 0),
-                            data=transaction.get("data", "0x"),
-                        )
-                    ],
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
+            cdp = await self._runtime.get_client()
+            smart_account = await self._get_smart_account(cdp)
+            user_operation = await cdp.evm.send_user_operation(
+                smart_account=smart_account,
+                network=self._network.network_id,
+                calls=[
+                    EncodedCall(
+                        to=transaction["to"],
+                        value=transaction.get("value", 0),
+                        data=transaction.get("data", "0x"),
+                    )
+                ],
+                paymaster_url=self._paymaster_url,
+            )
+            return await cdp.evm.wait_for_user_operation(
+                smart_account_address=self._address,
+                user_op_hash=user_operation.user_op_hash,
+            )
 
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+        return self._run_async(_send_user_operation()).transaction_hash
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -316,7 +397,8 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float): Unused, kept for compatibility. The chain's shared receipt
+                watcher polls once per new block for every pending transaction
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
@@ -325,9 +407,10 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             TimeoutError: If transaction is not mined within timeout period
 
         """
-        return self._web3.eth.wait_for_transaction_receipt(
-            tx_hash, timeout=timeout, poll_latency=poll_latency
-        )
+        receipt = self._receipt_watcher.wait(tx_hash, timeout=timeout)
+        # Reads at "latest" must see the state the transaction produced
+        self._read_cache.invalidate_head()
+        return receipt
 
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key.
@@ -390,23 +473,19 @@ class CdpEvmSmartWalletProvider(EvmWalletProvider):
             str: The transaction hash of the executed user operation
 
         """
-        client = self.get_client()
 
         async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._network.network_id,
-                    calls=calls,
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
+            cdp = await self._runtime.get_client()
+            smart_account = await self._get_smart_account(cdp)
+            user_operation = await cdp.evm.send_user_operation(
+                smart_account=smart_account,
+                network=self._network.network_id,
+                calls=calls,
+                paymaster_url=self._paymaster_url,
+            )
+            return await cdp.evm.wait_for_user_operation(
+                smart_account_address=self._address,
+                user_op_hash=user_operation.user_op_hash,
+            )
 
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+        return self._run_async(_send_user_operation()).transaction_hash
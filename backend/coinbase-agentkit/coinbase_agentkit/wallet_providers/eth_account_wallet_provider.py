@@ -12,7 +12,19 @@ from web3.middleware import SignAndSendRawMiddlewareBuilder
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
 from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
-from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .batching_provider import DEFAULT_BATCH_WINDOW, BatchingProvider, RequestBatch
+from .evm_wallet_provider import (
+    EvmGasConfig,
+    EvmWalletProvider,
+    check_receipt,
+    resolve_gas_settings,
+)
+from .fee_oracle import FeeOracle, FeeProfile, scale_fees
+from .multicall import CallResult, ContractCall, batch_read_contract, get_multicall_address
+from .nonce_manager import NonceManager, is_already_known_error
+from .read_cache import ReadCache, function_signature
+from .receipt_watcher import get_receipt_watcher
+from .rpc_router import RpcRouterProvider
 
 
 class EthAccountWalletProviderConfig(BaseModel):
@@ -22,6 +34,18 @@ class EthAccountWalletProviderConfig(BaseModel):
     chain_id: str
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
     rpc_url: str | None = Field(None, description="Optional RPC URL to override default chain RPC")
+    rpc_urls: list[str] | None = Field(
+        None,
+        description="Optional RPC URLs to route requests across, with failover and hedged reads",
+    )
+    batch_window: float | None = Field(
+        None,
+        description="Seconds to collect concurrent RPC requests into one JSON-RPC batch, 0 disables",
+    )
+    read_cache_size: int | None = Field(
+        None,
+        description="Number of read_contract results to cache by block, caching is off when unset",
+    )
 
     class Config:
         """Configuration for EthAccountWalletProvider."""
@@ -29,6 +53,26 @@ class EthAccountWalletProviderConfig(BaseModel):
         arbitrary_types_allowed = True
 
 
+def resolve_rpc_urls(config: EthAccountWalletProviderConfig) -> tuple[str, list[str]]:
+    """Resolve the RPC URLs of an eth-account provider, defaulting to the chain's public RPC.
+
+    Args:
+        config: The provider configuration.
+
+    Returns:
+        tuple[str, list[str]]: The network ID, empty when RPC URLs are configured, and the
+            RPC URLs.
+
+    """
+    rpc_urls = config.rpc_urls or ([config.rpc_url] if config.rpc_url else None)
+    if rpc_urls:
+        return "", rpc_urls
+
+    network_id = CHAIN_ID_TO_NETWORK_ID[config.chain_id]
+    # Routing across several endpoints is opt-in through rpc_urls
+    return network_id, NETWORK_ID_TO_CHAIN[network_id].rpc_urls["default"].http[:1]
+
+
 class EthAccountWalletProvider(EvmWalletProvider):
     """A wallet provider that uses eth-account and web3.py for EVM chain interactions."""
 
@@ -42,18 +86,24 @@ class EthAccountWalletProvider(EvmWalletProvider):
         self.config = config
         self.account = config.account
 
-        network_id = ""
-        rpc_url = config.rpc_url
-
-        if rpc_url is None:
-            chain = NETWORK_ID_TO_CHAIN[CHAIN_ID_TO_NETWORK_ID[config.chain_id]]
-            network_id = CHAIN_ID_TO_NETWORK_ID[config.chain_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
-
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        network_id, rpc_urls = resolve_rpc_urls(config)
+        transport = (
+            RpcRouterProvider(rpc_urls) if len(rpc_urls) > 1 else Web3.HTTPProvider(rpc_urls[0])
+        )
+        self._rpc = BatchingProvider(
+            transport,
+            window=config.batch_window if config.batch_window is not None else DEFAULT_BATCH_WINDOW,
+        )
+        self.web3 = Web3(self._rpc)
         self.web3.middleware_onion.inject(
             SignAndSendRawMiddlewareBuilder.build(self.account), layer=0
         )
+        self._nonce_manager = NonceManager(self.web3, self.account.address)
+        self._fee_oracle = FeeOracle(self.web3)
+        self._receipt_watcher = get_receipt_watcher(config.chain_id, self.web3)
+        self._read_cache = ReadCache(
+            self.web3, config.chain_id, max_size=config.read_cache_size or 0
+        )
 
         self._network = Network(
             protocol_family="evm",
@@ -61,17 +111,19 @@ class EthAccountWalletProvider(EvmWalletProvider):
             network_id=network_id,
         )
 
-        self._gas_limit_multiplier = (
-            max(config.gas.gas_limit_multiplier, 1)
-            if config and config.gas and config.gas.gas_limit_multiplier is not None
-            else 1.2
+        self._gas_limit_multiplier, self._fee_per_gas_multiplier, self._fee_profile = (
+            resolve_gas_settings(config.gas)
         )
 
-        self._fee_per_gas_multiplier = (
-            max(config.gas.fee_per_gas_multiplier, 1)
-            if config and config.gas and config.gas.fee_per_gas_multiplier is not None
-            else 1
-        )
+    def batch(self) -> RequestBatch:
+        """Start a batch of independent calls whose RPC requests are sent together.
+
+        Returns:
+            RequestBatch: A context manager whose ``call`` method schedules a call, e.g.
+                ``batch.call(provider.web3.eth.get_balance, address)``
+
+        """
+        return self._rpc.batch()
 
     def get_address(self) -> str:
         """Get the wallet address.
@@ -156,40 +208,31 @@ class EthAccountWalletProvider(EvmWalletProvider):
 
         return self.account.sign_transaction(transaction)
 
-    def estimate_fees(self):
+    def estimate_fees(self, profile: FeeProfile | None = None) -> tuple[int, int]:
         """Estimate gas fees for a transaction, applying the configured fee multipliers.
 
+        Fees come from the fee oracle, which samples eth_feeHistory once per block, so
+        every transaction sent within the same block reuses the same values.
+
+        Args:
+            profile (FeeProfile | None): The fee profile to use, defaults to the configured profile
+
         Returns:
             tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
         """
-
-        def get_base_fee():
-            """Get the base fee from the latest block and apply the multiplier.
-
-            Returns:
-                int: The adjusted base fee in wei
-
-            """
-            latest_block = self.web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
-            # Multiply the configured fee multiplier to give some buffer
-            return int(base_fee * self._fee_per_gas_multiplier)
-
-        def get_max_priority_fee():
-            max_priority_fee_per_gas = Web3.to_wei(0.1, "gwei")
-            # Multiply the configured fee multiplier to give some buffer
-            return int(max_priority_fee_per_gas * self._fee_per_gas_multiplier)
-
-        base_fee_per_gas = get_base_fee()
-        max_priority_fee_per_gas = get_max_priority_fee()
-        max_fee_per_gas = base_fee_per_gas + max_priority_fee_per_gas
-
-        return (max_priority_fee_per_gas, max_fee_per_gas)
+        base_fee_per_gas, max_priority_fee_per_gas = self._fee_oracle.get_fees(
+            profile or self._fee_profile
+        )
+        return scale_fees(base_fee_per_gas, max_priority_fee_per_gas, self._fee_per_gas_multiplier)
 
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a signed transaction to the network.
 
+        The nonce is taken from the local nonce manager, so several transactions can be
+        sent back to back without waiting for receipts. A nonce, fee or gas limit already
+        present on the transaction is used as is.
+
         Args:
             transaction (TxParams): Transaction parameters including to, value, and data
 
@@ -203,18 +246,66 @@ class EthAccountWalletProvider(EvmWalletProvider):
         transaction["from"] = self.account.address
         transaction["chainId"] = int(self._network.chain_id)
 
-        nonce = self.web3.eth.get_transaction_count(self.account.address)
-        transaction["nonce"] = nonce
+        if "maxFeePerGas" not in transaction:
+            max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees()
+            transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+            transaction["maxFeePerGas"] = max_fee_per_gas
+
+        # The gas limit is estimated with the fees set, so the node checks the sender can
+        # pay for the gas at those fees like it will when the transaction is sent
+        if "gas" not in transaction:
+            gas = self.web3.eth.estimate_gas(transaction)
+            transaction["gas"] = int(gas * self._gas_limit_multiplier)
 
-        max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees()
-        transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
-        transaction["maxFeePerGas"] = max_fee_per_gas
+        return self._nonce_manager.send(transaction, self._broadcast)
 
-        gas = int(self.web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
-        transaction["gas"] = gas
+    def _broadcast(self, transaction: TxParams) -> HexStr:
+        """Sign and broadcast a transaction with its nonce set.
 
-        hash = self.web3.eth.send_transaction(transaction)
-        return Web3.to_hex(hash)
+        Args:
+            transaction (TxParams): The complete transaction
+
+        Returns:
+            HexStr: The transaction hash, also when the node already had the transaction
+
+        """
+        try:
+            return Web3.to_hex(self.web3.eth.send_transaction(transaction))
+        except Exception as e:
+            if not is_already_known_error(e):
+                raise
+            # Sending it again under a new nonce would execute it twice
+            return Web3.to_hex(self.sign_transaction(transaction).hash)
+
+    def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions back to back, in order, without waiting for receipts.
+
+        A transaction whose gas cannot be estimated until an earlier one is mined (e.g. a
+        deposit that depends on an approval) waits for the previous receipt first, unless
+        it already carries a gas limit.
+
+        Args:
+            transactions (list[TxParams]): The transactions to send, in nonce order
+
+        Returns:
+            list[HexStr]: The transaction hashes, in the order the transactions were given
+
+        Raises:
+            TransactionFailedError: If a transaction waited for fails, the transactions
+                after it are not sent
+
+        """
+        hashes: list[HexStr] = []
+        for transaction in transactions:
+            if hashes and "gas" not in transaction:
+                try:
+                    transaction["from"] = self.account.address
+                    gas = self.web3.eth.estimate_gas(transaction)
+                    transaction["gas"] = int(gas * self._gas_limit_multiplier)
+                except Exception:
+                    check_receipt(self.wait_for_transaction_receipt(hashes[-1]), hashes[-1])
+            hashes.append(self.send_transaction(transaction))
+        return hashes
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -224,7 +315,8 @@ class EthAccountWalletProvider(EvmWalletProvider):
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float): Unused, kept for compatibility. The chain's shared receipt
+                watcher polls once per new block for every pending transaction
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
@@ -233,9 +325,16 @@ class EthAccountWalletProvider(EvmWalletProvider):
             TimeoutError: If transaction is not mined within timeout period
 
         """
-        return self.web3.eth.wait_for_transaction_receipt(
-            tx_hash, timeout=timeout, poll_latency=poll_latency
-        )
+        try:
+            receipt = self._receipt_watcher.wait(tx_hash, timeout=timeout)
+        except Exception:
+            # A transaction that never lands may have left a nonce gap behind it
+            self._nonce_manager.reset()
+            raise
+
+        # Reads at "latest" must see the state the transaction produced
+        self._read_cache.invalidate_head()
+        return receipt
 
     def read_contract(
         self,
@@ -247,6 +346,9 @@ class EthAccountWalletProvider(EvmWalletProvider):
     ) -> Any:
         """Read data from a smart contract.
 
+        When ``read_cache_size`` is configured, results at "latest" or at a block number
+        are cached per block, so repeated reads within a block are answered from memory.
+
         Args:
             contract_address (ChecksumAddress): The address of the contract to read from
             abi (list[dict[str, Any]]): The ABI of the contract
@@ -262,7 +364,36 @@ class EthAccountWalletProvider(EvmWalletProvider):
         func = contract.functions[function_name]
         if args is None:
             args = []
-        return func(*args).call(block_identifier=block_identifier)
+        return self._read_cache.read(
+            contract_address,
+            function_signature(abi, function_name),
+            args,
+            block_identifier,
+            lambda block: func(*args).call(block_identifier=block),
+        )
+
+    def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions through Multicall3.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        return batch_read_contract(
+            self.web3,
+            get_multicall_address(self._network),
+            calls,
+            block_identifier=block_identifier,
+        )
 
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network.
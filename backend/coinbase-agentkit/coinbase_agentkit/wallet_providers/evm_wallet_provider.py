@@ -7,6 +7,8 @@ from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
+from .fee_oracle import FeeProfile
+from .multicall import CallResult, ContractCall, to_contract_call
 from .wallet_provider import WalletProvider
 
 
@@ -19,6 +21,59 @@ class EvmGasConfig(BaseModel):
     fee_per_gas_multiplier: float | None = Field(
         None, description="An internal multiplier on fee per gas estimation"
     )
+    fee_profile: FeeProfile | None = Field(
+        None, description="The priority fee profile to use, one of 'cheap', 'normal' or 'fast'"
+    )
+
+
+class TransactionFailedError(Exception):
+    """Exception raised when a transaction is mined but fails to execute."""
+
+    def __init__(self, tx_hash: HexStr):
+        """Initialize with the hash of the failed transaction.
+
+        Args:
+            tx_hash: The transaction hash
+
+        """
+        super().__init__(f"Transaction {tx_hash} failed to execute")
+        self.tx_hash = tx_hash
+
+
+def check_receipt(receipt: dict[str, Any], tx_hash: HexStr) -> None:
+    """Check that a mined transaction executed successfully.
+
+    Args:
+        receipt: The transaction receipt.
+        tx_hash: The transaction hash.
+
+    Raises:
+        TransactionFailedError: If the transaction failed to execute.
+
+    """
+    if receipt["status"] == 0:
+        raise TransactionFailedError(tx_hash)
+
+
+def resolve_gas_settings(gas: EvmGasConfig | None) -> tuple[float, float, FeeProfile]:
+    """Resolve the gas settings of a provider from its configuration.
+
+    Multipliers below 1 are raised to 1, so estimates are never cut.
+
+    Args:
+        gas: The gas configuration, if any.
+
+    Returns:
+        tuple[float, float, FeeProfile]: The gas limit multiplier, the fee per gas
+            multiplier and the fee profile.
+
+    """
+    gas = gas or EvmGasConfig()
+    return (
+        max(gas.gas_limit_multiplier, 1) if gas.gas_limit_multiplier is not None else 1.2,
+        max(gas.fee_per_gas_multiplier, 1) if gas.fee_per_gas_multiplier is not None else 1,
+        gas.fee_profile if gas.fee_profile is not None else "normal",
+    )
 
 
 class EvmWalletProvider(WalletProvider, ABC):
@@ -44,6 +99,31 @@ class EvmWalletProvider(WalletProvider, ABC):
         """Send a signed transaction to the network."""
         pass
 
+    def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several dependent transactions to the network, in order.
+
+        The default implementation waits for each transaction to be mined before sending
+        the next one. Providers that manage nonces locally override this to submit the
+        transactions back to back.
+
+        Args:
+            transactions (list[TxParams]): The transactions to send, in order
+
+        Returns:
+            list[HexStr]: The transaction hashes, in the order the transactions were given
+
+        Raises:
+            TransactionFailedError: If a transaction waited for fails, the transactions
+                after it are not sent
+
+        """
+        hashes: list[HexStr] = []
+        for transaction in transactions:
+            if hashes:
+                check_receipt(self.wait_for_transaction_receipt(hashes[-1]), hashes[-1])
+            hashes.append(self.send_transaction(transaction))
+        return hashes
+
     @abstractmethod
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -62,3 +142,39 @@ class EvmWalletProvider(WalletProvider, ABC):
     ) -> Any:
         """Read data from a smart contract."""
         pass
+
+    def batch_read_contract(
+        self,
+        calls: list[ContractCall | tuple],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[CallResult]:
+        """Read data from many smart contract functions at once.
+
+        The default implementation performs one read_contract call per entry. Providers
+        backed by an RPC node override this to aggregate the reads through Multicall3.
+
+        Args:
+            calls (list[ContractCall | tuple]): The reads to perform, as ContractCall objects
+                or (contract_address, abi, function_name, args) tuples
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[CallResult]: One result per call, in the order the calls were given
+
+        """
+        results = []
+        for call in map(to_contract_call, calls):
+            try:
+                value = self.read_contract(
+                    call.contract_address,
+                    call.abi,
+                    call.function_name,
+                    call.args,
+                    block_identifier=block_identifier,
+                )
+                results.append(CallResult(success=True, value=value))
+            except Exception as e:
+                if not call.allow_failure:
+                    raise
+                results.append(CallResult(success=False, error=str(e)))
+        return results
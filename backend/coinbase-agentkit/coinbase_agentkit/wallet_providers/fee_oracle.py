@@ -0,0 +1,266 @@
+"""Block-scoped EIP-1559 fee estimation based on eth_feeHistory."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from statistics import median
+from typing import Any, Literal
+
+from web3 import AsyncWeb3, Web3
+
+FeeProfile = Literal["cheap", "normal", "fast"]
+
+# Priority fee reward percentile sampled for each fee profile
+FEE_PROFILE_PERCENTILES: dict[str, int] = {
+    "cheap": 10,
+    "normal": 50,
+    "fast": 90,
+}
+
+# Number of recent blocks sampled by eth_feeHistory
+DEFAULT_FEE_HISTORY_BLOCKS = 5
+
+# Lowest priority fee offered, so quiet blocks with zero rewards still get included
+DEFAULT_MIN_PRIORITY_FEE_PER_GAS = Web3.to_wei(0.001, "gwei")
+
+
+@dataclass
+class FeeSnapshot:
+    """Fee data sampled from the most recent blocks."""
+
+    block_number: int
+    base_fee_per_gas: int
+    priority_fees_per_gas: dict[str, int]
+
+
+def _fee_history_percentiles() -> list[int]:
+    """Get the reward percentiles requested from eth_feeHistory.
+
+    Returns:
+        list[int]: The sorted, de-duplicated percentiles of every fee profile.
+
+    """
+    return sorted(set(FEE_PROFILE_PERCENTILES.values()))
+
+
+def _validate_profile(profile: str) -> None:
+    """Check that a fee profile is supported.
+
+    Args:
+        profile: The fee profile to check.
+
+    Raises:
+        ValueError: If the profile is not supported.
+
+    """
+    if profile not in FEE_PROFILE_PERCENTILES:
+        raise ValueError(
+            f"Unsupported fee profile '{profile}'. "
+            f"Supported profiles: {', '.join(FEE_PROFILE_PERCENTILES)}"
+        )
+
+
+def _is_stale(snapshot: FeeSnapshot | None, head: int) -> bool:
+    """Check whether a cached snapshot needs to be refreshed.
+
+    Args:
+        snapshot: The cached snapshot, if any.
+        head: The latest block number.
+
+    Returns:
+        bool: True if there is no snapshot or a block was produced since it was sampled.
+
+    """
+    return snapshot is None or head > snapshot.block_number
+
+
+def scale_fees(
+    base_fee_per_gas: int, max_priority_fee_per_gas: int, multiplier: float
+) -> tuple[int, int]:
+    """Apply a fee multiplier to sampled fees, to give some buffer.
+
+    Args:
+        base_fee_per_gas: The base fee of the next block, in wei.
+        max_priority_fee_per_gas: The priority fee, in wei.
+        multiplier: The multiplier applied to both fees.
+
+    Returns:
+        tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
+
+    """
+    base_fee_per_gas = int(base_fee_per_gas * multiplier)
+    max_priority_fee_per_gas = int(max_priority_fee_per_gas * multiplier)
+    return max_priority_fee_per_gas, base_fee_per_gas + max_priority_fee_per_gas
+
+
+def _snapshot_from_fee_history(
+    history: dict[str, Any], min_priority_fee_per_gas: int
+) -> FeeSnapshot:
+    """Build a fee snapshot from an eth_feeHistory response.
+
+    Args:
+        history: The eth_feeHistory response.
+        min_priority_fee_per_gas: The minimum priority fee to return, in wei.
+
+    Returns:
+        FeeSnapshot: The sampled fee data.
+
+    """
+    percentiles = _fee_history_percentiles()
+
+    # The last base fee entry is the base fee of the next, not yet produced, block
+    base_fee_per_gas = int(history["baseFeePerGas"][-1])
+    rewards = history.get("reward") or []
+
+    priority_fees_per_gas = {}
+    for profile, percentile in FEE_PROFILE_PERCENTILES.items():
+        column = percentiles.index(percentile)
+        samples = [int(block_rewards[column]) for block_rewards in rewards if block_rewards]
+        priority_fee = int(median(samples)) if samples else 0
+        priority_fees_per_gas[profile] = max(priority_fee, min_priority_fee_per_gas)
+
+    newest_block = int(history["oldestBlock"]) + len(history["baseFeePerGas"]) - 2
+
+    return FeeSnapshot(
+        block_number=newest_block,
+        base_fee_per_gas=base_fee_per_gas,
+        priority_fees_per_gas=priority_fees_per_gas,
+    )
+
+
+class FeeOracle:
+    """Caches base fee and priority fee percentiles from eth_feeHistory.
+
+    Each lookup checks the latest block number, and one eth_feeHistory call is made per
+    new block, so every transaction sent within a block reuses the cached values.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        block_count: int = DEFAULT_FEE_HISTORY_BLOCKS,
+        min_priority_fee_per_gas: int = DEFAULT_MIN_PRIORITY_FEE_PER_GAS,
+    ):
+        """Initialize the fee oracle.
+
+        Args:
+            web3: The Web3 instance used to query fee history.
+            block_count: The number of recent blocks to sample.
+            min_priority_fee_per_gas: The minimum priority fee to return, in wei.
+
+        """
+        self._web3 = web3
+        self._block_count = block_count
+        self._min_priority_fee_per_gas = min_priority_fee_per_gas
+        self._lock = threading.Lock()
+        self._snapshot: FeeSnapshot | None = None
+
+    def get_fees(self, profile: FeeProfile = "normal") -> tuple[int, int]:
+        """Get the next block's base fee and the priority fee for a profile.
+
+        Args:
+            profile: The fee profile, one of 'cheap', 'normal' or 'fast'.
+
+        Returns:
+            tuple[int, int]: Tuple of (base_fee_per_gas, max_priority_fee_per_gas) in wei
+
+        Raises:
+            ValueError: If the profile is not supported.
+
+        """
+        _validate_profile(profile)
+        snapshot = self.get_snapshot()
+        return snapshot.base_fee_per_gas, snapshot.priority_fees_per_gas[profile]
+
+    def get_snapshot(self) -> FeeSnapshot:
+        """Get the cached fee snapshot, refreshing it once a new block is produced.
+
+        Returns:
+            FeeSnapshot: The current fee snapshot.
+
+        """
+        head = self._web3.eth.get_block_number()
+        with self._lock:
+            if _is_stale(self._snapshot, head):
+                self._snapshot = self._fetch_snapshot()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Discard the cached snapshot so the next lookup refreshes it."""
+        with self._lock:
+            self._snapshot = None
+
+    def _fetch_snapshot(self) -> FeeSnapshot:
+        """Sample recent blocks with eth_feeHistory.
+
+        Returns:
+            FeeSnapshot: The sampled fee data.
+
+        """
+        history = self._web3.eth.fee_history(
+            self._block_count, "latest", _fee_history_percentiles()
+        )
+        return _snapshot_from_fee_history(history, self._min_priority_fee_per_gas)
+
+
+class AsyncFeeOracle:
+    """Awaitable counterpart of FeeOracle backed by an AsyncWeb3 instance."""
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        block_count: int = DEFAULT_FEE_HISTORY_BLOCKS,
+        min_priority_fee_per_gas: int = DEFAULT_MIN_PRIORITY_FEE_PER_GAS,
+    ):
+        """Initialize the fee oracle.
+
+        Args:
+            web3: The AsyncWeb3 instance used to query fee history.
+            block_count: The number of recent blocks to sample.
+            min_priority_fee_per_gas: The minimum priority fee to return, in wei.
+
+        """
+        self._web3 = web3
+        self._block_count = block_count
+        self._min_priority_fee_per_gas = min_priority_fee_per_gas
+        self._lock = asyncio.Lock()
+        self._snapshot: FeeSnapshot | None = None
+
+    async def get_fees(self, profile: FeeProfile = "normal") -> tuple[int, int]:
+        """Get the next block's base fee and the priority fee for a profile.
+
+        Args:
+            profile: The fee profile, one of 'cheap', 'normal' or 'fast'.
+
+        Returns:
+            tuple[int, int]: Tuple of (base_fee_per_gas, max_priority_fee_per_gas) in wei
+
+        Raises:
+            ValueError: If the profile is not supported.
+
+        """
+        _validate_profile(profile)
+        snapshot = await self.get_snapshot()
+        return snapshot.base_fee_per_gas, snapshot.priority_fees_per_gas[profile]
+
+    async def get_snapshot(self) -> FeeSnapshot:
+        """Get the cached fee snapshot, refreshing it once a new block is produced.
+
+        Concurrent callers wait for a single in-flight refresh.
+
+        Returns:
+            FeeSnapshot: The current fee snapshot.
+
+        """
+        head = await self._web3.eth.get_block_number()
+        async with self._lock:
+            if _is_stale(self._snapshot, head):
+                history = await self._web3.eth.fee_history(
+                    self._block_count, "latest", _fee_history_percentiles()
+                )
+                self._snapshot = _snapshot_from_fee_history(history, self._min_priority_fee_per_gas)
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Discard the cached snapshot so the next lookup refreshes it."""
+        self._snapshot = None
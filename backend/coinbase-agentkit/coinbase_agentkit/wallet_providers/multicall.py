@@ -0,0 +1,333 @@
+"""Multicall3 helpers for batching contract reads into a single eth_call."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+from eth_abi.exceptions import DecodingError
+from eth_utils.abi import get_abi_output_types
+from web3 import AsyncWeb3, Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.types import BlockIdentifier
+
+from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Upper bound on the encoded calldata sent in a single aggregate3 call
+DEFAULT_MAX_CALLDATA_BYTES = 50_000
+
+# Selector for the standard Error(string) revert payload
+ERROR_STRING_SELECTOR = bytes.fromhex("08c379a0")
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+
+@dataclass
+class ContractCall:
+    """A single contract read to include in a batch."""
+
+    contract_address: str
+    abi: list[dict[str, Any]]
+    function_name: str
+    args: list[Any] = field(default_factory=list)
+    allow_failure: bool = True
+
+
+@dataclass
+class CallResult:
+    """The decoded outcome of a single contract read in a batch."""
+
+    success: bool
+    value: Any = None
+    error: str | None = None
+
+
+def to_contract_call(call: ContractCall | tuple) -> ContractCall:
+    """Normalize a call given as a ContractCall or an (address, abi, function, args) tuple.
+
+    Args:
+        call: The call to normalize.
+
+    Returns:
+        ContractCall: The normalized call.
+
+    """
+    if isinstance(call, ContractCall):
+        return call
+    contract_address, abi, function_name, *rest = call
+    args = list(rest[0]) if rest and rest[0] is not None else []
+    return ContractCall(contract_address, abi, function_name, args)
+
+
+def get_multicall_address(network: Network) -> str:
+    """Get the Multicall3 address for a network.
+
+    Args:
+        network: The network to look up.
+
+    Returns:
+        str: The checksummed Multicall3 address, falling back to the canonical deployment.
+
+    """
+    network_id = network.network_id or CHAIN_ID_TO_NETWORK_ID.get(network.chain_id or "")
+    chain = NETWORK_ID_TO_CHAIN.get(network_id or "")
+    if chain is not None and "multicall3" in chain.contracts:
+        return Web3.to_checksum_address(chain.contracts["multicall3"].address)
+    return MULTICALL3_ADDRESS
+
+
+def _decode_revert_reason(web3: Web3 | AsyncWeb3, return_data: bytes) -> str:
+    """Decode a revert payload into a readable message.
+
+    Args:
+        web3: The Web3 instance whose codec is used for decoding.
+        return_data: The raw data returned by the failed call.
+
+    Returns:
+        str: The revert reason, or a generic message if it cannot be decoded.
+
+    """
+    if return_data[:4] == ERROR_STRING_SELECTOR:
+        try:
+            return f"execution reverted: {web3.codec.decode(['string'], return_data[4:])[0]}"
+        except DecodingError:
+            pass
+    return "execution reverted"
+
+
+def _decode_result(
+    web3: Web3 | AsyncWeb3, output_types: list[str], success: bool, return_data: bytes
+) -> CallResult:
+    """Decode the return data of a single aggregated call.
+
+    Args:
+        web3: The Web3 instance whose codec is used for decoding.
+        output_types: The ABI output types of the called function.
+        success: Whether the call succeeded.
+        return_data: The raw return data.
+
+    Returns:
+        CallResult: The decoded result.
+
+    """
+    if not success:
+        return CallResult(success=False, error=_decode_revert_reason(web3, return_data))
+
+    try:
+        decoded = web3.codec.decode(output_types, return_data)
+    except DecodingError as e:
+        return CallResult(success=False, error=f"Could not decode return data: {e!s}")
+
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+    value = normalized[0] if len(normalized) == 1 else normalized
+    return CallResult(success=True, value=value)
+
+
+def _encode_calls(
+    web3: Web3 | AsyncWeb3, contract_calls: list[ContractCall], max_calldata_bytes: int
+) -> tuple[list[list[tuple[str, bool, bytes]]], list[list[str]]]:
+    """Encode calls for aggregate3 and split them into chunks by calldata size.
+
+    Args:
+        web3: The Web3 instance used to encode the calls.
+        contract_calls: The calls to encode.
+        max_calldata_bytes: The maximum calldata size of a single aggregate3 call.
+
+    Returns:
+        tuple: The chunks of encoded (target, allowFailure, callData) calls, and the ABI
+            output types of every call, in order.
+
+    """
+    encoded_calls = []
+    output_types = []
+    for call in contract_calls:
+        address = Web3.to_checksum_address(call.contract_address)
+        contract = web3.eth.contract(address=address, abi=call.abi)
+        function = contract.functions[call.function_name](*call.args)
+        calldata = bytes.fromhex(contract.encode_abi(call.function_name, args=call.args)[2:])
+
+        encoded_calls.append((address, call.allow_failure, calldata))
+        output_types.append(get_abi_output_types(function.abi))
+
+    chunks: list[list[tuple[str, bool, bytes]]] = [[]]
+    chunk_size = 0
+    for encoded_call in encoded_calls:
+        call_size = len(encoded_call[2])
+        if chunks[-1] and chunk_size + call_size > max_calldata_bytes:
+            chunks.append([])
+            chunk_size = 0
+        chunks[-1].append(encoded_call)
+        chunk_size += call_size
+
+    return chunks, output_types
+
+
+def _is_block_tag(block_identifier: BlockIdentifier) -> bool:
+    """Check whether a block identifier is a tag such as 'latest' rather than a fixed block.
+
+    Args:
+        block_identifier: The block identifier to check.
+
+    Returns:
+        bool: True if the identifier is a block tag.
+
+    """
+    return isinstance(block_identifier, str) and not block_identifier.startswith("0x")
+
+
+def _check_required_calls(contract_calls: list[ContractCall], results: list[CallResult]) -> None:
+    """Raise if a call that does not allow failure failed.
+
+    Args:
+        contract_calls: The calls that were made.
+        results: The decoded results, in the same order.
+
+    Raises:
+        Exception: If a call with allow_failure=False failed.
+
+    """
+    for call, result in zip(contract_calls, results, strict=True):
+        if not call.allow_failure and not result.success:
+            raise Exception(
+                f"Call to {call.function_name} on {call.contract_address} failed: {result.error}"
+            )
+
+
+def batch_read_contract(
+    web3: Web3,
+    multicall_address: str,
+    calls: list[ContractCall | tuple],
+    block_identifier: BlockIdentifier = "latest",
+    max_calldata_bytes: int = DEFAULT_MAX_CALLDATA_BYTES,
+) -> list[CallResult]:
+    """Read many contract functions through Multicall3 aggregate3 calls.
+
+    Calls are chunked so that no single aggregate3 call carries more than
+    ``max_calldata_bytes`` of encoded calldata. When more than one chunk is needed
+    and the block identifier is a tag, it is resolved once so every chunk reads the
+    same block.
+
+    Args:
+        web3: The Web3 instance to use for the eth_call.
+        multicall_address: The address of the Multicall3 contract.
+        calls: The reads to perform, as ContractCall or (address, abi, function, args) tuples.
+        block_identifier: The block to read from, defaults to 'latest'.
+        max_calldata_bytes: The maximum calldata size of a single aggregate3 call.
+
+    Returns:
+        list[CallResult]: One result per call, in the order the calls were given.
+
+    Raises:
+        Exception: If a call with allow_failure=False reverts, or the aggregate call fails.
+
+    """
+    if not calls:
+        return []
+
+    contract_calls = [to_contract_call(call) for call in calls]
+    chunks, output_types = _encode_calls(web3, contract_calls, max_calldata_bytes)
+
+    if len(chunks) > 1 and _is_block_tag(block_identifier):
+        block_identifier = web3.eth.get_block_number()
+
+    multicall = web3.eth.contract(
+        address=Web3.to_checksum_address(multicall_address), abi=MULTICALL3_ABI
+    )
+
+    results: list[CallResult] = []
+    for chunk in chunks:
+        aggregated = multicall.functions.aggregate3(chunk).call(block_identifier=block_identifier)
+        for success, return_data in aggregated:
+            types = output_types[len(results)]
+            results.append(_decode_result(web3, types, success, return_data))
+
+    _check_required_calls(contract_calls, results)
+    return results
+
+
+async def async_batch_read_contract(
+    web3: AsyncWeb3,
+    multicall_address: str,
+    calls: list[ContractCall | tuple],
+    block_identifier: BlockIdentifier = "latest",
+    max_calldata_bytes: int = DEFAULT_MAX_CALLDATA_BYTES,
+) -> list[CallResult]:
+    """Read many contract functions through Multicall3 using an AsyncWeb3 instance.
+
+    This is the awaitable counterpart of ``batch_read_contract``, and the chunks are
+    requested concurrently.
+
+    Args:
+        web3: The AsyncWeb3 instance to use for the eth_call.
+        multicall_address: The address of the Multicall3 contract.
+        calls: The reads to perform, as ContractCall or (address, abi, function, args) tuples.
+        block_identifier: The block to read from, defaults to 'latest'.
+        max_calldata_bytes: The maximum calldata size of a single aggregate3 call.
+
+    Returns:
+        list[CallResult]: One result per call, in the order the calls were given.
+
+    Raises:
+        Exception: If a call with allow_failure=False reverts, or the aggregate call fails.
+
+    """
+    if not calls:
+        return []
+
+    contract_calls = [to_contract_call(call) for call in calls]
+    chunks, output_types = _encode_calls(web3, contract_calls, max_calldata_bytes)
+
+    if len(chunks) > 1 and _is_block_tag(block_identifier):
+        block_identifier = await web3.eth.get_block_number()
+
+    multicall = web3.eth.contract(
+        address=Web3.to_checksum_address(multicall_address), abi=MULTICALL3_ABI
+    )
+
+    aggregated_chunks = await asyncio.gather(
+        *(
+            multicall.functions.aggregate3(chunk).call(block_identifier=block_identifier)
+            for chunk in chunks
+        )
+    )
+
+    results: list[CallResult] = []
+    for aggregated in aggregated_chunks:
+        for success, return_data in aggregated:
+            types = output_types[len(results)]
+            results.append(_decode_result(web3, types, success, return_data))
+
+    _check_required_calls(contract_calls, results)
+    return results
@@ -0,0 +1,277 @@
+"""Local nonce tracking for accounts that sign their own transactions."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from web3 import AsyncWeb3, Web3
+
+T = TypeVar("T")
+
+# Fragments of node error messages that indicate the local nonce is out of sync
+NONCE_ERROR_MESSAGES = (
+    "nonce too low",
+    "nonce too high",
+    "invalid nonce",
+    "replacement transaction underpriced",
+)
+
+
+# Fragments of node error messages that indicate the node already has the transaction
+ALREADY_KNOWN_MESSAGES = ("already known", "already imported")
+
+
+def is_already_known_error(error: Exception) -> bool:
+    """Check whether a send failed because the node already has the same transaction.
+
+    Args:
+        error: The error raised while sending a transaction.
+
+    Returns:
+        bool: True if the transaction was already submitted and must not be sent again.
+
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in ALREADY_KNOWN_MESSAGES)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Check whether an error was caused by a stale or conflicting nonce.
+
+    Args:
+        error: The error raised while sending a transaction.
+
+    Returns:
+        bool: True if the error indicates the nonce needs to be resynced.
+
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in NONCE_ERROR_MESSAGES)
+
+
+class _NonceState:
+    """The next unreserved nonce of an account and the released nonces below it."""
+
+    def __init__(self):
+        self.next_nonce: int | None = None
+        self.released: set[int] = set()
+
+    def take(self, count: int) -> int:
+        """Reserve nonces once next_nonce is known, reusing a released nonce first.
+
+        Args:
+            count: The number of consecutive nonces to reserve.
+
+        Returns:
+            int: The first reserved nonce.
+
+        """
+        if count == 1 and self.released:
+            nonce = min(self.released)
+            self.released.remove(nonce)
+            return nonce
+        nonce = self.next_nonce
+        self.next_nonce += count
+        return nonce
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved nonce that was never broadcast.
+
+        Args:
+            nonce: The nonce to release.
+
+        """
+        if self.next_nonce is None or nonce >= self.next_nonce:
+            return
+        self.released.add(nonce)
+        # Released nonces at the top are handed out again in order
+        while self.next_nonce - 1 in self.released:
+            self.next_nonce -= 1
+            self.released.remove(self.next_nonce)
+
+    def reset(self) -> None:
+        """Forget the local state so the next reservation resyncs with the node."""
+        self.next_nonce = None
+        self.released.clear()
+
+
+class NonceManager:
+    """Thread-safe tracker of pending nonces for a single account.
+
+    The next nonce is read from the node once and then handed out locally, so that
+    several transactions can be submitted back to back without waiting for receipts
+    and concurrent senders never reuse a nonce.
+    """
+
+    def __init__(self, web3: Web3, address: str):
+        """Initialize the nonce manager.
+
+        Args:
+            web3: The Web3 instance used to read the pending transaction count.
+            address: The address of the account whose nonces are managed.
+
+        """
+        self._web3 = web3
+        self._address = address
+        self._lock = threading.Lock()
+        self._state = _NonceState()
+
+    def reserve(self, count: int = 1) -> int:
+        """Reserve one or more consecutive nonces.
+
+        A single nonce fills the lowest gap left by a released nonce first.
+
+        Args:
+            count: The number of consecutive nonces to reserve.
+
+        Returns:
+            int: The first reserved nonce.
+
+        """
+        with self._lock:
+            if self._state.next_nonce is None:
+                self._state.next_nonce = self._fetch_pending_nonce()
+            return self._state.take(count)
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved nonce that was never broadcast.
+
+        The nonce is handed out again by a later reservation. Nonces reserved after it
+        stay valid, so transactions already in flight are not affected.
+
+        Args:
+            nonce: The nonce to release.
+
+        """
+        with self._lock:
+            self._state.release(nonce)
+
+    def reset(self) -> None:
+        """Discard the local state so the next reservation resyncs with the node."""
+        with self._lock:
+            self._state.reset()
+
+    def send(self, transaction: dict[str, Any], broadcast: Callable[[dict[str, Any]], T]) -> T:
+        """Broadcast a transaction under a reserved nonce.
+
+        A nonce already present on the transaction is used as is. Otherwise the nonce is
+        released if the broadcast fails, and a nonce error resyncs with the node and
+        retries once, for when the account was used elsewhere.
+
+        Args:
+            transaction: The transaction, complete except for its nonce.
+            broadcast: The function sending the transaction.
+
+        Returns:
+            T: What broadcast returned.
+
+        """
+        if "nonce" in transaction:
+            return broadcast(transaction)
+
+        transaction["nonce"] = self.reserve()
+        try:
+            return broadcast(transaction)
+        except Exception as e:
+            if not is_nonce_error(e):
+                self.release(transaction["nonce"])
+                raise
+
+        # The local nonce is stale (e.g. the account was used elsewhere), resync and retry once
+        self.reset()
+        transaction["nonce"] = self.reserve()
+        try:
+            return broadcast(transaction)
+        except Exception:
+            self.release(transaction["nonce"])
+            raise
+
+    def _fetch_pending_nonce(self) -> int:
+        """Read the account's pending transaction count from the node.
+
+        Returns:
+            int: The pending transaction count.
+
+        """
+        return self._web3.eth.get_transaction_count(self._address, "pending")
+
+
+class AsyncNonceManager:
+    """Awaitable counterpart of NonceManager for use on a single event loop."""
+
+    def __init__(self, web3: AsyncWeb3, address: str):
+        """Initialize the nonce manager.
+
+        Args:
+            web3: The AsyncWeb3 instance used to read the pending transaction count.
+            address: The address of the account whose nonces are managed.
+
+        """
+        self._web3 = web3
+        self._address = address
+        self._lock = asyncio.Lock()
+        self._state = _NonceState()
+
+    async def reserve(self, count: int = 1) -> int:
+        """Reserve one or more consecutive nonces, like NonceManager.reserve.
+
+        Args:
+            count: The number of consecutive nonces to reserve.
+
+        Returns:
+            int: The first reserved nonce.
+
+        """
+        async with self._lock:
+            if self._state.next_nonce is None:
+                self._state.next_nonce = await self._web3.eth.get_transaction_count(
+                    self._address, "pending"
+                )
+            return self._state.take(count)
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved nonce that was never broadcast, like NonceManager.release.
+
+        Args:
+            nonce: The nonce to release.
+
+        """
+        self._state.release(nonce)
+
+    def reset(self) -> None:
+        """Discard the local state so the next reservation resyncs with the node."""
+        self._state.reset()
+
+    async def send(
+        self, transaction: dict[str, Any], broadcast: Callable[[dict[str, Any]], Awaitable[T]]
+    ) -> T:
+        """Broadcast a transaction under a reserved nonce, like NonceManager.send.
+
+        Args:
+            transaction: The transaction, complete except for its nonce.
+            broadcast: The coroutine function sending the transaction.
+
+        Returns:
+            T: What broadcast returned.
+
+        """
+        if "nonce" in transaction:
+            return await broadcast(transaction)
+
+        transaction["nonce"] = await self.reserve()
+        try:
+            return await broadcast(transaction)
+        except Exception as e:
+            if not is_nonce_error(e):
+                self.release(transaction["nonce"])
+                raise
+
+        # The local nonce is stale (e.g. the account was used elsewhere), resync and retry once
+        self.reset()
+        transaction["nonce"] = await self.reserve()
+        try:
+            return await broadcast(transaction)
+        except Exception:
+            self.release(transaction["nonce"])
+            raise
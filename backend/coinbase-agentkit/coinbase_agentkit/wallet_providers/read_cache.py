@@ -0,0 +1,271 @@
+"""Block-keyed LRU cache for contract reads."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from web3 import Web3
+from web3.types import BlockIdentifier
+
+# Seconds the block resolved for "latest" is reused before checking for a new head
+DEFAULT_HEAD_MAX_AGE = 1.0
+
+# Number of recent head hashes remembered to detect reorgs
+MAX_TRACKED_BLOCKS = 64
+
+
+@dataclass
+class _Head:
+    """The most recently seen chain head."""
+
+    number: int
+    fetched_at: float
+
+
+def _freeze(value: Any) -> Any:
+    """Convert call arguments to a hashable form usable in a cache key.
+
+    Args:
+        value: The arguments, or one argument.
+
+    Returns:
+        Any: The arguments with lists and dicts replaced by tuples.
+
+    Raises:
+        TypeError: If an argument cannot be hashed.
+
+    """
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, str) and Web3.is_address(value):
+        # Addresses are equal regardless of checksum casing, other strings are not
+        return value.lower()
+    hash(value)
+    return value
+
+
+def _abi_type(param: dict[str, Any]) -> str:
+    """Get the canonical type of an ABI parameter, expanding tuples into their components.
+
+    Args:
+        param: The ABI parameter.
+
+    Returns:
+        str: The type, e.g. "uint256" or "(address,uint256)[]".
+
+    """
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_abi_type(component) for component in param["components"])
+        return f"({components}){abi_type[len('tuple') :]}"
+    return abi_type
+
+
+def function_signature(abi: list[dict[str, Any]], function_name: str) -> str:
+    """Get the signature of a contract function, used to key its reads in a ReadCache.
+
+    The signature includes the output types, so the same function name read through ABIs
+    that decode its result differently is cached separately.
+
+    Args:
+        abi: The ABI of the contract.
+        function_name: The name of the function.
+
+    Returns:
+        str: The input and output types of every function of that name in the ABI, e.g.
+            "balanceOf(address)->(uint256)".
+
+    """
+    return (
+        ";".join(
+            f"{function_name}({','.join(_abi_type(param) for param in entry.get('inputs', []))})"
+            f"->({','.join(_abi_type(param) for param in entry.get('outputs', []))})"
+            for entry in abi
+            if entry.get("type") == "function" and entry.get("name") == function_name
+        )
+        or function_name
+    )
+
+
+class ReadCache:
+    """Caches contract reads by chain, block number, address, function signature and arguments.
+
+    Reads at "latest" are pinned to the current head block, which is looked up at most
+    once every ``head_max_age`` seconds, so repeated reads within a block are answered
+    from memory. Entries are evicted least recently used first. Each head lookup compares
+    the block hash with the ones seen before, and entries for blocks that were reorged
+    out are dropped. A cache with a ``max_size`` of zero passes every read through.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        chain_id: str,
+        max_size: int = 0,
+        head_max_age: float = DEFAULT_HEAD_MAX_AGE,
+    ):
+        """Initialize the cache.
+
+        Args:
+            web3: The Web3 instance used to look up the chain head.
+            chain_id: The chain ID, part of every cache key.
+            max_size: Largest number of cached results, zero disables caching.
+            head_max_age: Seconds the resolved head is reused before checking for a new one.
+
+        """
+        self._web3 = web3
+        self._chain_id = str(chain_id)
+        self._max_size = max_size
+        self._head_max_age = head_max_age
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._hashes: OrderedDict[int, bytes] = OrderedDict()
+        self._head: _Head | None = None
+        # Bumped on every reorg so reads that straddle one are not stored
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether reads are cached."""
+        return self._max_size > 0
+
+    def read(
+        self,
+        contract_address: str,
+        function: str,
+        args: list[Any],
+        block_identifier: BlockIdentifier,
+        load: Callable[[BlockIdentifier], Any],
+    ) -> Any:
+        """Get a contract read from the cache, or load and cache it.
+
+        Args:
+            contract_address: The address of the contract.
+            function: The function's signature, as returned by function_signature.
+            args: The function arguments.
+            block_identifier: The block to read at. Only "latest" and block numbers are
+                cached, other identifiers are passed through.
+            load: Performs the read at the given block.
+
+        Returns:
+            Any: The result of the read.
+
+        """
+        if not self.enabled:
+            return load(block_identifier)
+
+        block_number = self._resolve(block_identifier)
+        if block_number is None:
+            return load(block_identifier)
+
+        try:
+            key = (
+                self._chain_id,
+                block_number,
+                contract_address.lower(),
+                function,
+                _freeze(args),
+            )
+        except TypeError:
+            return load(block_number)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            generation = self._generation
+
+        value = load(block_number)
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate_head(self) -> None:
+        """Discard the resolved head so the next "latest" read checks for a new block."""
+        with self._lock:
+            self._head = None
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._hashes.clear()
+            self._head = None
+            self._generation += 1
+
+    def __len__(self) -> int:
+        """Get the number of cached results."""
+        with self._lock:
+            return len(self._entries)
+
+    def _resolve(self, block_identifier: BlockIdentifier) -> int | None:
+        """Resolve a block identifier to a block number, if it can be cached.
+
+        Args:
+            block_identifier: The block identifier.
+
+        Returns:
+            int | None: The block number, or None for identifiers that are not cached,
+                such as "pending" or a block hash.
+
+        """
+        if isinstance(block_identifier, int) and not isinstance(block_identifier, bool):
+            return block_identifier
+        if block_identifier != "latest":
+            return None
+
+        with self._lock:
+            head = self._head
+            if head is not None and time.monotonic() - head.fetched_at < self._head_max_age:
+                return head.number
+
+        block = self._web3.eth.get_block("latest")
+        return self._observe_head(block["number"], bytes(block["hash"]), bytes(block["parentHash"]))
+
+    def _observe_head(self, number: int, block_hash: bytes, parent_hash: bytes) -> int:
+        """Record a new head, dropping cached results for blocks that were reorged out.
+
+        Args:
+            number: The head block number.
+            block_hash: The head block hash.
+            parent_hash: The hash of the head's parent block.
+
+        Returns:
+            int: The head block number.
+
+        """
+        with self._lock:
+            seen = {number - 1: parent_hash, number: block_hash}
+            reorged = [n for n, h in seen.items() if self._hashes.get(n, h) != h]
+            if reorged:
+                self._purge_from(min(reorged))
+
+            self._hashes.update(seen)
+            while len(self._hashes) > MAX_TRACKED_BLOCKS:
+                self._hashes.popitem(last=False)
+
+            self._head = _Head(number=number, fetched_at=time.monotonic())
+            return number
+
+    def _purge_from(self, block_number: int) -> None:
+        """Drop cached results and hashes at or above a block. Must hold the lock.
+
+        Args:
+            block_number: The lowest block whose results are dropped.
+
+        """
+        for key in [key for key in self._entries if key[1] >= block_number]:
+            del self._entries[key]
+        for number in [number for number in self._hashes if number >= block_number]:
+            del self._hashes[number]
+        self._generation += 1
@@ -0,0 +1,324 @@
+"""A shared, block-driven watcher for transaction receipts."""
+
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any
+
+from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import HexStr, TxReceipt
+
+# Seconds between checks for a new block while transactions are pending
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Pending transactions above which new blocks are scanned with eth_getBlockReceipts
+DEFAULT_BLOCK_RECEIPTS_THRESHOLD = 8
+
+# Largest number of new blocks scanned with eth_getBlockReceipts in one poll
+MAX_BLOCK_RECEIPTS_SCAN = 4
+
+_watchers: dict[tuple[str, str], "ReceiptWatcher"] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_receipt_watcher(chain_id: str, web3: Web3) -> "ReceiptWatcher":
+    """Get the receipt watcher shared by every provider on a chain and RPC endpoint.
+
+    Args:
+        chain_id: The chain ID.
+        web3: The Web3 instance used if a new watcher has to be created.
+
+    Returns:
+        ReceiptWatcher: The shared watcher.
+
+    """
+    key = (str(chain_id), str(web3.provider))
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = ReceiptWatcher(web3)
+            _watchers[key] = watcher
+        return watcher
+
+
+def _normalize_hash(tx_hash: HexStr | bytes) -> HexStr:
+    """Normalize a transaction hash to a lowercase 0x-prefixed hex string.
+
+    Args:
+        tx_hash: The transaction hash.
+
+    Returns:
+        HexStr: The normalized hash.
+
+    """
+    if isinstance(tx_hash, bytes | bytearray):
+        return HexStr("0x" + bytes(tx_hash).hex())
+    tx_hash = tx_hash.lower()
+    return HexStr(tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash)
+
+
+class _Subscription:
+    """A pending transaction and the callers waiting for it."""
+
+    def __init__(self):
+        self.future: Future = Future()
+        self.waiters = 0
+        # Whether the hash has been looked up at least once, so that later polls only
+        # need to look at blocks mined after it was added
+        self.checked = False
+
+
+class ReceiptWatcher:
+    """Waits for many transaction receipts at once with one poll per new block.
+
+    Callers subscribe to a transaction hash and wait on a future. A single background
+    thread checks for a new block every ``poll_interval`` seconds while any transaction
+    is pending, and only then looks up receipts: with one JSON-RPC batch of
+    eth_getTransactionReceipt calls, or with eth_getBlockReceipts for the new blocks when
+    many transactions are pending. The thread exits when nothing is pending.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        block_receipts_threshold: int = DEFAULT_BLOCK_RECEIPTS_THRESHOLD,
+    ):
+        """Initialize the watcher without starting its thread.
+
+        Args:
+            web3: The Web3 instance used to look up blocks and receipts.
+            poll_interval: Seconds between checks for a new block.
+            block_receipts_threshold: Pending transactions above which new blocks are
+                scanned with eth_getBlockReceipts instead of looking up each hash.
+
+        """
+        self._web3 = web3
+        self._poll_interval = poll_interval
+        self._block_receipts_threshold = block_receipts_threshold
+        self._block_receipts_supported = True
+        self._subscriptions: dict[HexStr, _Subscription] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._last_block: int | None = None
+
+    def watch(self, tx_hash: HexStr | bytes) -> Future:
+        """Subscribe to a transaction's receipt.
+
+        Every call must be paired with a ``release`` once the caller stops waiting,
+        unless the future has completed.
+
+        Args:
+            tx_hash: The transaction hash.
+
+        Returns:
+            Future: A future that resolves to the receipt.
+
+        """
+        key = _normalize_hash(tx_hash)
+        with self._condition:
+            subscription = self._subscriptions.get(key)
+            if subscription is None:
+                subscription = _Subscription()
+                self._subscriptions[key] = subscription
+            subscription.waiters += 1
+            self._ensure_thread()
+            self._condition.notify()
+            return subscription.future
+
+    def release(self, tx_hash: HexStr | bytes) -> None:
+        """Stop waiting for a transaction, dropping it once no caller is waiting for it.
+
+        Args:
+            tx_hash: The transaction hash.
+
+        """
+        key = _normalize_hash(tx_hash)
+        with self._condition:
+            subscription = self._subscriptions.get(key)
+            if subscription is None:
+                return
+            subscription.waiters -= 1
+            if subscription.waiters <= 0:
+                del self._subscriptions[key]
+                subscription.future.cancel()
+
+    def wait(self, tx_hash: HexStr | bytes, timeout: float = 120) -> TxReceipt:
+        """Wait for a transaction's receipt.
+
+        Args:
+            tx_hash: The transaction hash.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            TxReceipt: The transaction receipt.
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within the timeout.
+
+        """
+        future = self.watch(tx_hash)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self.release(tx_hash)
+            raise TimeExhausted(
+                f"Transaction {_normalize_hash(tx_hash)!r} is not in the chain "
+                f"after {timeout} seconds"
+            ) from None
+
+    def pending_count(self) -> int:
+        """Get the number of transactions being watched.
+
+        Returns:
+            int: The number of pending transactions.
+
+        """
+        with self._condition:
+            return len(self._subscriptions)
+
+    def _ensure_thread(self) -> None:
+        """Start the polling thread if it is not running. Must hold the condition."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="receipt-watcher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Poll for receipts until no transaction is pending."""
+        while True:
+            with self._condition:
+                if not self._subscriptions:
+                    self._thread = None
+                    return
+            try:
+                self._poll()
+                failed = False
+            except Exception:
+                # A failed poll is retried on the next interval; waiters time out on their own
+                failed = True
+            with self._condition:
+                # Hashes added since the last poll are looked up straight away
+                if failed or all(s.checked for s in self._subscriptions.values()):
+                    self._condition.wait(self._poll_interval)
+
+    def _poll(self) -> None:
+        """Look up receipts for pending transactions if there is a new block or a new hash."""
+        block_number = self._web3.eth.block_number
+        with self._condition:
+            new_block = self._last_block is None or block_number > self._last_block
+            subscriptions = dict(self._subscriptions)
+
+        if new_block:
+            to_check = subscriptions
+        else:
+            # Transactions added since the last block may already be mined in an earlier one
+            to_check = {key: s for key, s in subscriptions.items() if not s.checked}
+        if not to_check:
+            return
+
+        new_blocks = (
+            range(self._last_block + 1, block_number + 1) if self._last_block is not None else ()
+        )
+        use_block_receipts = (
+            self._block_receipts_supported
+            and len(to_check) > self._block_receipts_threshold
+            and 0 < len(new_blocks) <= MAX_BLOCK_RECEIPTS_SCAN
+            and all(s.checked for s in to_check.values())
+        )
+
+        receipts = None
+        if use_block_receipts:
+            receipts = self._fetch_block_receipts(new_blocks, to_check)
+        if receipts is None:
+            receipts = self._fetch_receipts(list(to_check))
+
+        with self._condition:
+            self._last_block = max(block_number, self._last_block or 0)
+            for key, subscription in to_check.items():
+                subscription.checked = True
+                receipt = receipts.get(key)
+                if receipt is None:
+                    continue
+                if self._subscriptions.get(key) is subscription:
+                    del self._subscriptions[key]
+                if not subscription.future.done():
+                    subscription.future.set_result(receipt)
+
+    def _fetch_block_receipts(
+        self, block_numbers: range, subscriptions: dict[HexStr, _Subscription]
+    ) -> dict[HexStr, TxReceipt] | None:
+        """Find pending receipts among all receipts of the new blocks.
+
+        Args:
+            block_numbers: The new blocks.
+            subscriptions: The pending transactions.
+
+        Returns:
+            dict[HexStr, TxReceipt] | None: Receipts by hash, or None if the node does not
+                support eth_getBlockReceipts.
+
+        """
+        found: dict[HexStr, TxReceipt] = {}
+        try:
+            for block_number in block_numbers:
+                for receipt in self._web3.eth.get_block_receipts(block_number):
+                    key = _normalize_hash(receipt["transactionHash"])
+                    if key in subscriptions:
+                        found[key] = receipt
+        except Exception:
+            self._block_receipts_supported = False
+            return None
+        return found
+
+    def _fetch_receipts(self, tx_hashes: list[HexStr]) -> dict[HexStr, TxReceipt]:
+        """Look up receipts by hash, in one JSON-RPC batch when the provider supports it.
+
+        Args:
+            tx_hashes: The transaction hashes.
+
+        Returns:
+            dict[HexStr, TxReceipt]: Receipts of the mined transactions, by hash.
+
+        """
+        if len(tx_hashes) > 1:
+            try:
+                return self._fetch_receipts_batch(tx_hashes)
+            except NotImplementedError:
+                pass
+
+        found: dict[HexStr, TxReceipt] = {}
+        for tx_hash in tx_hashes:
+            try:
+                found[tx_hash] = self._web3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+        return found
+
+    def _fetch_receipts_batch(self, tx_hashes: list[HexStr]) -> dict[HexStr, TxReceipt]:
+        """Look up receipts with a single JSON-RPC batch request.
+
+        Args:
+            tx_hashes: The transaction hashes.
+
+        Returns:
+            dict[HexStr, TxReceipt]: Receipts of the mined transactions, by hash.
+
+        Raises:
+            NotImplementedError: If the provider cannot send batch requests.
+
+        """
+        responses = self._web3.provider.make_batch_request(
+            [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+        )
+        if not isinstance(responses, list):
+            # The whole batch was rejected, e.g. because the node does not accept batches
+            raise NotImplementedError(responses.get("error"))
+
+        found: dict[HexStr, TxReceipt] = {}
+        for tx_hash, response in zip(tx_hashes, responses, strict=True):
+            result: Any = response.get("result")
+            if result:
+                found[tx_hash] = AttributeDict.recursive(receipt_formatter(result))
+        return found
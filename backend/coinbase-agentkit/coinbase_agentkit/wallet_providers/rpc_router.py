@@ -0,0 +1,564 @@
+"""A web3 provider that routes JSON-RPC requests across several endpoints."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+# Methods that only read chain state and can safely be sent to several endpoints at once
+READ_METHODS = frozenset(
+    {
+        "eth_blockNumber",
+        "eth_call",
+        "eth_chainId",
+        "eth_feeHistory",
+        "eth_gasPrice",
+        "eth_getBalance",
+        "eth_getBlockByHash",
+        "eth_getBlockByNumber",
+        "eth_getCode",
+        "eth_getLogs",
+        "eth_getStorageAt",
+        "eth_getTransactionByHash",
+        "eth_getTransactionReceipt",
+        "eth_maxPriorityFeePerGas",
+        "net_version",
+        "web3_clientVersion",
+    }
+)
+
+# Methods that depend on the pending state of the endpoint that broadcast the last transaction
+PENDING_STATE_METHODS = frozenset({"eth_estimateGas", "eth_getTransactionCount"})
+
+# Methods that broadcast a transaction
+BROADCAST_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+# JSON-RPC error codes that mean the endpoint refused the request, not that the request failed
+ENDPOINT_ERROR_CODES = frozenset({-32005, 429})
+
+# Error messages of endpoints that have not yet seen the block a request is pinned to
+UNKNOWN_BLOCK_MESSAGES = ("header not found", "unknown block", "block not found")
+
+# Number of recent requests used for each endpoint's latency and error statistics
+DEFAULT_WINDOW = 100
+
+# Seconds an endpoint is skipped after repeated failures or falling behind the chain head
+DEFAULT_COOLDOWN = 30.0
+
+# Consecutive failures after which an endpoint is put in cooldown
+DEFAULT_MAX_FAILURES = 3
+
+# Blocks an endpoint may lag behind the highest head seen by check_health
+DEFAULT_MAX_BLOCK_LAG = 5
+
+# Seconds between the endpoint probes of check_health started by requests
+DEFAULT_HEALTH_CHECK_INTERVAL = 15.0
+
+# Bounds, in seconds, on how long a read waits before being hedged to the next endpoint
+MIN_HEDGE_DELAY = 0.05
+MAX_HEDGE_DELAY = 2.0
+
+# Hedge delay used before an endpoint has any latency samples
+DEFAULT_HEDGE_DELAY = 0.5
+
+
+@dataclass
+class EndpointHealth:
+    """Rolling statistics for one RPC endpoint."""
+
+    url: str
+    healthy: bool
+    p50_latency: float | None
+    p99_latency: float | None
+    error_rate: float
+    block_number: int | None = None
+
+
+def _percentile(samples: list[float], percentile: float) -> float | None:
+    """Get a percentile of a list of samples using the nearest-rank method.
+
+    Args:
+        samples: The samples.
+        percentile: The percentile to compute, between 0 and 100.
+
+    Returns:
+        float | None: The percentile, or None if there are no samples.
+
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _is_endpoint_error(response: RPCResponse) -> bool:
+    """Check whether a JSON-RPC response is a refusal or a gap in the endpoint's chain data.
+
+    Rate limits and errors for blocks a lagging endpoint has not seen yet say nothing about
+    the request itself, so another endpoint may answer it.
+
+    Args:
+        response: The JSON-RPC response.
+
+    Returns:
+        bool: True if the request should be sent to another endpoint.
+
+    """
+    error = response.get("error") if isinstance(response, dict) else None
+    if not isinstance(error, dict):
+        return False
+    if error.get("code") in ENDPOINT_ERROR_CODES:
+        return True
+    message = str(error.get("message", "")).lower()
+    return any(unknown in message for unknown in UNKNOWN_BLOCK_MESSAGES)
+
+
+def _is_pending_state_request(method: RPCEndpoint, params: Any) -> bool:
+    """Check whether a request reads the pending state, such as a pending nonce.
+
+    Args:
+        method: The JSON-RPC method.
+        params: The method parameters.
+
+    Returns:
+        bool: True if the request should go to the endpoint that broadcast last.
+
+    """
+    if method == "eth_getTransactionCount":
+        return isinstance(params, list | tuple) and len(params) > 1 and params[1] == "pending"
+    return method in PENDING_STATE_METHODS
+
+
+class _Endpoint:
+    """One upstream RPC endpoint and its rolling statistics."""
+
+    def __init__(self, url: str, window: int, request_kwargs: dict[str, Any] | None):
+        self.url = url
+        # The router does its own failover, so the endpoint's built-in retries are disabled
+        self.provider = Web3.HTTPProvider(
+            url, request_kwargs=request_kwargs, exception_retry_configuration=None
+        )
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.block_number: int | None = None
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def score(self) -> float:
+        """Get the expected latency of a successful request, or 0 before any samples."""
+        if not self.latencies:
+            return 0.0
+        samples = list(self.latencies)
+        expected = (_percentile(samples, 50) + _percentile(samples, 99)) / 2
+        return expected / max(1.0 - self.error_rate(), 0.05)
+
+    def health(self, now: float) -> EndpointHealth:
+        samples = list(self.latencies)
+        return EndpointHealth(
+            url=self.url,
+            healthy=self.is_healthy(now),
+            p50_latency=_percentile(samples, 50),
+            p99_latency=_percentile(samples, 99),
+            error_rate=self.error_rate(),
+            block_number=self.block_number,
+        )
+
+
+class RpcRouterProvider(JSONBaseProvider):
+    """A web3 provider that sends each request to the best of several RPC endpoints.
+
+    Every endpoint keeps rolling p50/p99 latency and error rate statistics, and requests
+    go to the endpoint with the lowest expected latency. An endpoint that fails several
+    times in a row, or that falls behind the chain head in ``check_health``, is skipped
+    for a cooldown period. Requests start ``check_health`` in the background once the
+    last check is older than ``health_check_interval``. Failed requests fail over to the
+    next endpoint, and read requests that have not answered within the current endpoint's
+    p99 latency are hedged to the next endpoint, with the first successful response
+    winning. Pending nonce reads and gas estimates are never hedged and go first to the
+    endpoint that broadcast the last transaction, which is the only one sure to have it
+    in its pending state.
+    """
+
+    def __init__(
+        self,
+        endpoint_urls: list[str],
+        hedge_reads: bool = True,
+        window: int = DEFAULT_WINDOW,
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        max_block_lag: int = DEFAULT_MAX_BLOCK_LAG,
+        health_check_interval: float | None = DEFAULT_HEALTH_CHECK_INTERVAL,
+        request_kwargs: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the router.
+
+        Args:
+            endpoint_urls: The HTTP RPC endpoints of a single chain, in order of preference.
+            hedge_reads: Whether slow read requests are also sent to the next endpoint.
+            window: Number of recent requests used for each endpoint's statistics.
+            cooldown: Seconds an unhealthy endpoint is skipped.
+            max_failures: Consecutive failures after which an endpoint is put in cooldown.
+            max_block_lag: Blocks an endpoint may lag behind the highest head in check_health.
+            health_check_interval: Seconds after which a request starts a new check_health in
+                the background. None or zero leaves health checks to the caller.
+            request_kwargs: Keyword arguments passed to every endpoint's HTTP requests.
+            **kwargs: Additional arguments passed to JSONBaseProvider.
+
+        Raises:
+            ValueError: If no endpoint URLs are given.
+
+        """
+        super().__init__(**kwargs)
+        urls = list(dict.fromkeys(endpoint_urls))
+        if not urls:
+            raise ValueError("At least one RPC endpoint URL is required")
+
+        self._endpoints = [_Endpoint(url, window, request_kwargs) for url in urls]
+        self._hedge_reads = hedge_reads
+        self._cooldown = cooldown
+        self._max_failures = max_failures
+        self._max_block_lag = max_block_lag
+        self._health_check_interval = health_check_interval
+        self._last_health_check = float("-inf")
+        self._health_check_running = False
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._broadcast_endpoint: _Endpoint | None = None
+
+    def __str__(self) -> str:
+        """Get a description of the router."""
+        return f"RPC router over {', '.join(endpoint.url for endpoint in self._endpoints)}"
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request to the best endpoint, failing over or hedging as needed.
+
+        Args:
+            method: The JSON-RPC method.
+            params: The method parameters.
+
+        Returns:
+            RPCResponse: The response of the first endpoint that answered.
+
+        """
+        self._schedule_health_check()
+        endpoints = self._ranked_endpoints()
+        if _is_pending_state_request(method, params):
+            with self._lock:
+                pinned = self._broadcast_endpoint
+            if pinned is not None:
+                endpoints.remove(pinned)
+                endpoints.insert(0, pinned)
+        elif self._hedge_reads and method in READ_METHODS and len(endpoints) > 1:
+            return self._hedged_request(endpoints, method, params)
+
+        response, endpoint = self._failover_request(endpoints, method, params)
+        if method in BROADCAST_METHODS and "error" not in response:
+            with self._lock:
+                self._broadcast_endpoint = endpoint
+        return response
+
+    def make_batch_request(self, requests: list[tuple[RPCEndpoint, Any]]) -> Any:
+        """Send a JSON-RPC batch to the best endpoint, failing over on errors.
+
+        Args:
+            requests: The (method, params) pairs in the batch.
+
+        Returns:
+            Any: The batch responses from the first endpoint that answered.
+
+        """
+        self._schedule_health_check()
+        last_error: Exception | None = None
+        for endpoint in self._ranked_endpoints():
+            try:
+                return self._send(endpoint, endpoint.provider.make_batch_request, requests)
+            except Exception as e:
+                last_error = e
+        raise last_error
+
+    def check_health(self) -> list[EndpointHealth]:
+        """Probe every endpoint with eth_blockNumber and update its health.
+
+        Endpoints that fail, or whose head lags more than ``max_block_lag`` blocks behind
+        the highest head seen, are put in cooldown.
+
+        Returns:
+            list[EndpointHealth]: The health of every endpoint after the probe.
+
+        """
+        futures = {
+            endpoint: self._get_executor().submit(
+                self._call, endpoint, RPCEndpoint("eth_blockNumber"), []
+            )
+            for endpoint in self._endpoints
+        }
+
+        heads: dict[_Endpoint, int | None] = {}
+        for endpoint, future in futures.items():
+            try:
+                heads[endpoint] = int(future.result()["result"], 16)
+            except Exception:
+                heads[endpoint] = None
+
+        highest = max((head for head in heads.values() if head is not None), default=None)
+        now = time.monotonic()
+        with self._lock:
+            self._last_health_check = now
+            for endpoint, head in heads.items():
+                endpoint.block_number = head
+                if head is None or highest - head > self._max_block_lag:
+                    endpoint.unhealthy_until = now + self._cooldown
+
+        return self.get_endpoint_health()
+
+    def get_endpoint_health(self) -> list[EndpointHealth]:
+        """Get the rolling statistics of every endpoint.
+
+        Returns:
+            list[EndpointHealth]: One entry per endpoint, in configured order.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [endpoint.health(now) for endpoint in self._endpoints]
+
+    def close(self) -> None:
+        """Stop the worker threads used for hedged requests and health checks."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _schedule_health_check(self) -> None:
+        """Start check_health on a worker thread if the last check is older than the interval."""
+        if not self._health_check_interval or len(self._endpoints) < 2:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._health_check_running
+                or now - self._last_health_check < self._health_check_interval
+            ):
+                return
+            self._health_check_running = True
+        self._get_executor().submit(self._run_health_check)
+
+    def _run_health_check(self) -> None:
+        """Run a background check_health, allowing the next one once it finishes."""
+        try:
+            self.check_health()
+        except Exception as e:
+            print(f"Warning: RPC endpoint health check failed: {e}")
+        finally:
+            with self._lock:
+                self._health_check_running = False
+
+    def _ranked_endpoints(self) -> list[_Endpoint]:
+        """Order the endpoints from best to worst.
+
+        Healthy endpoints come first, by expected latency. Endpoints in cooldown are kept
+        at the end so a request still has somewhere to go if every endpoint is down.
+
+        Returns:
+            list[_Endpoint]: The endpoints, best first.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            return sorted(
+                self._endpoints,
+                key=lambda endpoint: (not endpoint.is_healthy(now), endpoint.score()),
+            )
+
+    def _hedge_delay(self, endpoint: _Endpoint) -> float:
+        """Get how long to wait for an endpoint before hedging to the next one.
+
+        Args:
+            endpoint: The endpoint the request was sent to.
+
+        Returns:
+            float: The endpoint's p99 latency, clamped to the hedge delay bounds.
+
+        """
+        with self._lock:
+            p99 = _percentile(list(endpoint.latencies), 99)
+        if p99 is None:
+            return DEFAULT_HEDGE_DELAY
+        return min(max(p99, MIN_HEDGE_DELAY), MAX_HEDGE_DELAY)
+
+    def _failover_request(
+        self, endpoints: list[_Endpoint], method: RPCEndpoint, params: Any
+    ) -> tuple[RPCResponse, _Endpoint]:
+        """Try each endpoint in turn until one answers.
+
+        Args:
+            endpoints: The endpoints, best first.
+            method: The JSON-RPC method.
+            params: The method parameters.
+
+        Returns:
+            tuple[RPCResponse, _Endpoint]: The first usable response and the endpoint that
+                sent it.
+
+        """
+        last_response: tuple[RPCResponse, _Endpoint] | None = None
+        last_error: Exception | None = None
+        for endpoint in endpoints:
+            try:
+                response = self._call(endpoint, method, params)
+            except Exception as e:
+                last_error = e
+                continue
+            if not _is_endpoint_error(response):
+                return response, endpoint
+            last_response = response, endpoint
+
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def _hedged_request(
+        self, endpoints: list[_Endpoint], method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        """Send a read to the best endpoint, adding the next one whenever it is slow or fails.
+
+        Args:
+            endpoints: The endpoints, best first.
+            method: The JSON-RPC method.
+            params: The method parameters.
+
+        Returns:
+            RPCResponse: The first usable response.
+
+        """
+        executor = self._get_executor()
+        remaining = iter(endpoints)
+        pending: dict[Future, _Endpoint] = {}
+        last_response: RPCResponse | None = None
+        last_error: Exception | None = None
+
+        def _launch() -> bool:
+            endpoint = next(remaining, None)
+            if endpoint is None:
+                return False
+            pending[executor.submit(self._call, endpoint, method, params)] = endpoint
+            return True
+
+        _launch()
+        has_more = True
+        while pending:
+            delay = self._hedge_delay(next(reversed(pending.values()))) if has_more else None
+            done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+
+            if not done:
+                has_more = _launch()
+                continue
+
+            for future in done:
+                del pending[future]
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                else:
+                    if not _is_endpoint_error(response):
+                        # Slower requests still in flight finish in the background and
+                        # only update their endpoint's statistics
+                        return response
+                    last_response = response
+
+                # Fail over to the next endpoint straight away
+                if has_more:
+                    has_more = _launch()
+
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def _call(self, endpoint: _Endpoint, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a request to one endpoint.
+
+        Args:
+            endpoint: The endpoint to use.
+            method: The JSON-RPC method.
+            params: The method parameters.
+
+        Returns:
+            RPCResponse: The endpoint's response.
+
+        """
+        return self._send(endpoint, endpoint.provider.make_request, method, params)
+
+    def _send(self, endpoint: _Endpoint, request: Any, *args: Any) -> Any:
+        """Run a provider request against an endpoint and record its latency and outcome.
+
+        Args:
+            endpoint: The endpoint the request is sent to.
+            request: The provider method to call.
+            *args: Arguments for the provider method.
+
+        Returns:
+            Any: The provider method's result.
+
+        """
+        started = time.perf_counter()
+        try:
+            result = request(*args)
+        except Exception:
+            self._record(endpoint, None)
+            raise
+
+        self._record(
+            endpoint, None if _is_endpoint_error(result) else time.perf_counter() - started
+        )
+        return result
+
+    def _record(self, endpoint: _Endpoint, latency: float | None) -> None:
+        """Record the outcome of a request, putting the endpoint in cooldown after repeated failures.
+
+        Args:
+            endpoint: The endpoint the request was sent to.
+            latency: Seconds the request took, or None if it failed.
+
+        """
+        with self._lock:
+            endpoint.outcomes.append(latency is not None)
+            if latency is not None:
+                endpoint.latencies.append(latency)
+                endpoint.consecutive_failures = 0
+                return
+
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self._max_failures:
+                endpoint.unhealthy_until = time.monotonic() + self._cooldown
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The worker pool.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(4, 2 * len(self._endpoints)),
+                    thread_name_prefix="rpc-router",
+                )
+            return self._executor
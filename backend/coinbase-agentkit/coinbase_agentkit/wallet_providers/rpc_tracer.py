@@ -0,0 +1,391 @@
+"""Tracer recording the chain calls actions make through a wallet provider."""
+
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+import types
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..metrics import current_action_stats
+from .read_cache import _freeze
+
+# Wallet provider methods that reach the chain, traced by default
+TRACED_METHODS = (
+    "get_balance",
+    "read_contract",
+    "batch_read_contract",
+    "send_transaction",
+    "send_transactions",
+    "wait_for_transaction_receipt",
+    "native_transfer",
+)
+
+# Traced methods that only read chain state, reported when repeated with the same arguments
+READ_METHODS = frozenset({"get_balance", "read_contract", "batch_read_contract"})
+
+# Label of calls made outside of any action
+NO_ACTION = "(no action)"
+
+
+@dataclass
+class TracedCall:
+    """A wallet provider call recorded by the tracer."""
+
+    action: str
+    invocation_id: int
+    method: str
+    args: tuple
+    kwargs: dict[str, Any]
+    block_identifier: Any
+    duration: float
+    call_site: str
+    error: str | None = None
+
+    def describe(self) -> str:
+        """Describe the call in one line.
+
+        Returns:
+            str: The method, its arguments and block tag.
+
+        """
+        arguments = [repr(arg) for arg in self.args if not _is_abi(arg)]
+        arguments += [
+            f"{name}={value!r}"
+            for name, value in self.kwargs.items()
+            if name != "block_identifier" and not _is_abi(value)
+        ]
+        block = self.block_identifier if self.block_identifier is not None else "latest"
+        description = f"{self.method}({', '.join(arguments)}) @ {block}"
+        return description if len(description) <= 160 else description[:157] + "..."
+
+
+@dataclass
+class RedundantRead:
+    """A read repeated with identical arguments within one action invocation."""
+
+    action: str
+    invocation_id: int
+    call: TracedCall
+    count: int
+    call_sites: list[str] = field(default_factory=list)
+
+
+def _is_abi(value: Any) -> bool:
+    """Check whether a call argument is a contract ABI, left out of descriptions.
+
+    Args:
+        value: The argument.
+
+    Returns:
+        bool: True for a list of ABI entries.
+
+    """
+    return isinstance(value, list) and bool(value) and isinstance(value[0], dict)
+
+
+def _call_site(frame: types.FrameType | None) -> str:
+    """Format the location of the code making a call.
+
+    Args:
+        frame: The frame making the call.
+
+    Returns:
+        str: The file, relative to its package, line and function.
+
+    """
+    if frame is None:
+        return "<unknown>"
+    parts = frame.f_code.co_filename.split(os.sep)
+    return f"{'/'.join(parts[-2:])}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+def _read_key(call: TracedCall) -> Any:
+    """Get what identifies a read, so that identical reads compare equal.
+
+    Args:
+        call: The read.
+
+    Returns:
+        Any: The method, arguments and block tag in a hashable form.
+
+    """
+    try:
+        return (call.method, _freeze(call.args), _freeze(call.kwargs), call.block_identifier)
+    except TypeError:
+        return (call.method, repr(call.args), repr(call.kwargs), repr(call.block_identifier))
+
+
+class RpcTracer:
+    """Records every chain call made through a wallet provider, by action.
+
+    While attached, the tracer wraps the wallet provider's contract reads, balance lookups,
+    transactions and receipt waits, recording for each call the action running it, its
+    arguments, block tag, duration and call site. It works with real providers as well as
+    mocks, so tests can bound the number of calls an action makes and fail when a change
+    adds reads:
+
+        with RpcTracer(wallet_provider) as tracer:
+            provider.get_portfolio(wallet_provider, {})
+        tracer.assert_within_budget({"CompoundActionProvider_get_portfolio": 8})
+
+    Reads repeated with identical arguments within one action invocation are reported as
+    redundant, as they could have been made once.
+    """
+
+    def __init__(
+        self,
+        wallet_provider: Any,
+        methods: Iterable[str] = TRACED_METHODS,
+        print_report: bool = False,
+    ):
+        """Initialize the tracer without attaching it.
+
+        Args:
+            wallet_provider: The wallet provider, or a mock of one, to trace.
+            methods: The wallet provider methods to trace.
+            print_report: Print the report when the tracer is detached, for debugging.
+
+        """
+        self._wallet_provider = wallet_provider
+        self._methods = tuple(methods)
+        self._print_report = print_report
+        self._originals: dict[str, tuple[Any, bool]] = {}
+        self._calls: list[TracedCall] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RpcTracer":
+        """Attach the tracer."""
+        self.attach()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Detach the tracer."""
+        self.detach()
+
+    @property
+    def calls(self) -> list[TracedCall]:
+        """The recorded calls, in the order they were made."""
+        with self._lock:
+            return list(self._calls)
+
+    def attach(self) -> None:
+        """Start tracing the wallet provider's calls."""
+        for method in self._methods:
+            if method in self._originals:
+                continue
+            original = getattr(self._wallet_provider, method, None)
+            if original is None or not callable(original):
+                continue
+            own = method in getattr(self._wallet_provider, "__dict__", {})
+            self._originals[method] = (original, own)
+            setattr(self._wallet_provider, method, self._wrap(method, original))
+
+    def detach(self) -> None:
+        """Stop tracing, restoring the wallet provider's methods."""
+        for method, (original, own) in self._originals.items():
+            is_bound_method = (
+                isinstance(original, types.MethodType)
+                and original.__self__ is self._wallet_provider
+            )
+            if is_bound_method and not own:
+                delattr(self._wallet_provider, method)
+            else:
+                setattr(self._wallet_provider, method, original)
+        self._originals.clear()
+        if self._print_report:
+            print(self.report())
+
+    def reset(self) -> None:
+        """Forget the recorded calls."""
+        with self._lock:
+            self._calls.clear()
+
+    def _wrap(self, method: str, original: Callable) -> Callable:
+        """Wrap a wallet provider method so its calls are recorded.
+
+        Args:
+            method: The method name.
+            original: The method, bound to the wallet provider.
+
+        Returns:
+            Callable: The wrapped method.
+
+        """
+        try:
+            signature = inspect.signature(original)
+        except (TypeError, ValueError):
+            signature = None
+
+        def record(args: tuple, kwargs: dict, start: float, error: str | None, frame) -> None:
+            block_identifier = kwargs.get("block_identifier")
+            if signature is not None and block_identifier is None:
+                try:
+                    bound = signature.bind(*args, **kwargs)
+                    block_identifier = bound.arguments.get("block_identifier")
+                except TypeError:
+                    pass
+            stats = current_action_stats()
+            call = TracedCall(
+                action=stats.action if stats else NO_ACTION,
+                invocation_id=stats.invocation_id if stats else 0,
+                method=method,
+                args=args,
+                kwargs=kwargs,
+                block_identifier=block_identifier,
+                duration=time.perf_counter() - start,
+                call_site=_call_site(frame),
+                error=error,
+            )
+            with self._lock:
+                self._calls.append(call)
+
+        if inspect.iscoroutinefunction(original):
+
+            @functools.wraps(original)
+            async def async_traced(*args: Any, **kwargs: Any) -> Any:
+                frame = sys._getframe(1)
+                start = time.perf_counter()
+                error = None
+                try:
+                    return await original(*args, **kwargs)
+                except Exception as e:
+                    error = type(e).__name__
+                    raise
+                finally:
+                    record(args, kwargs, start, error, frame)
+
+            return async_traced
+
+        @functools.wraps(original)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            frame = sys._getframe(1)
+            start = time.perf_counter()
+            error = None
+            try:
+                return original(*args, **kwargs)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                record(args, kwargs, start, error, frame)
+
+        return traced
+
+    def calls_by_invocation(self) -> dict[tuple[str, int], list[TracedCall]]:
+        """Group the recorded calls by action invocation.
+
+        Returns:
+            dict[tuple[str, int], list[TracedCall]]: The calls, by action name and
+                invocation ID, in the order the invocations made their first call.
+
+        """
+        grouped: dict[tuple[str, int], list[TracedCall]] = defaultdict(list)
+        for call in self.calls:
+            grouped[(call.action, call.invocation_id)].append(call)
+        return dict(grouped)
+
+    def call_count(self, action: str, methods: Iterable[str] | None = None) -> int:
+        """Count the calls made by the invocation of an action making the most calls.
+
+        Args:
+            action: The action name, e.g. "CompoundActionProvider_get_portfolio".
+            methods: Only count calls to these methods. Defaults to every traced method.
+
+        Returns:
+            int: The largest number of calls made by one invocation of the action, 0 if
+                it was not invoked.
+
+        """
+        selected = set(methods) if methods is not None else None
+        counts = [
+            sum(1 for call in calls if selected is None or call.method in selected)
+            for (name, _), calls in self.calls_by_invocation().items()
+            if name == action
+        ]
+        return max(counts, default=0)
+
+    def redundant_reads(self) -> list[RedundantRead]:
+        """Find reads repeated with identical arguments within one action invocation.
+
+        Returns:
+            list[RedundantRead]: The repeated reads, most repeated first.
+
+        """
+        redundant = []
+        for (action, invocation_id), calls in self.calls_by_invocation().items():
+            if action == NO_ACTION:
+                continue
+            reads: dict[Any, list[TracedCall]] = defaultdict(list)
+            for call in calls:
+                if call.method in READ_METHODS:
+                    reads[_read_key(call)].append(call)
+            for repeated in reads.values():
+                if len(repeated) > 1:
+                    redundant.append(
+                        RedundantRead(
+                            action=action,
+                            invocation_id=invocation_id,
+                            call=repeated[0],
+                            count=len(repeated),
+                            call_sites=list(dict.fromkeys(call.call_site for call in repeated)),
+                        )
+                    )
+        return sorted(redundant, key=lambda read: -read.count)
+
+    def report(self) -> str:
+        """Describe the recorded calls of each action invocation and the redundant reads.
+
+        Returns:
+            str: The report, in plain text.
+
+        """
+        lines = []
+        for (action, invocation_id), calls in self.calls_by_invocation().items():
+            methods = Counter(call.method for call in calls)
+            duration = sum(call.duration for call in calls)
+            summary = ", ".join(f"{method} x{count}" for method, count in methods.most_common())
+            lines.append(
+                f"{action} #{invocation_id}: {len(calls)} calls in {duration * 1000:.1f} ms"
+                f" ({summary})"
+            )
+            for call in calls:
+                error = f" raised {call.error}" if call.error else ""
+                lines.append(
+                    f"  {call.duration * 1000:8.1f} ms  {call.describe()}{error}"
+                    f"  [{call.call_site}]"
+                )
+
+        redundant = self.redundant_reads()
+        if redundant:
+            lines.append("Redundant reads:")
+            for read in redundant:
+                lines.append(
+                    f"  {read.action} #{read.invocation_id}: {read.call.describe()} read"
+                    f" {read.count} times at {', '.join(read.call_sites)}"
+                )
+        return "\n".join(lines)
+
+    def assert_within_budget(self, budgets: dict[str, int]) -> None:
+        """Check that no invocation of an action made more calls than its budget.
+
+        Args:
+            budgets: The largest number of calls allowed per invocation, by action name.
+
+        Raises:
+            AssertionError: If an invocation made more calls than its action's budget,
+                with the report of the calls made.
+
+        """
+        exceeded = [
+            f"{action} made {self.call_count(action)} RPC calls, budget is {budget}"
+            for action, budget in budgets.items()
+            if self.call_count(action) > budget
+        ]
+        if exceeded:
+            raise AssertionError("; ".join(exceeded) + "\n" + self.report())
@@ -4,11 +4,24 @@ from abc import ABC, ABCMeta, abstractmethod
 from decimal import Decimal
 
 from ..analytics import RequiredEventData, send_analytics_event
+from ..metrics.recorder import INSTRUMENTED_WALLET_METHODS, instrument_wallet_method
 from ..network import Network
 
 
 class WalletProviderMeta(ABCMeta):
-    """Metaclass for WalletProvider to handle initialization tracking."""
+    """Metaclass for WalletProvider to handle initialization tracking and metrics.
+
+    Contract reads, transactions and receipt waits defined by a provider class are
+    wrapped so that their calls are counted and timed for the action running them.
+    """
+
+    def __new__(cls, name, bases, namespace, **kwargs):
+        """Create a WalletProvider class, instrumenting its contract and transaction calls."""
+        for method in INSTRUMENTED_WALLET_METHODS & namespace.keys():
+            func = namespace[method]
+            if callable(func) and not getattr(func, "__isabstractmethod__", False):
+                namespace[method] = instrument_wallet_method(method, func)
+        return super().__new__(cls, name, bases, namespace, **kwargs)
 
     def __call__(cls, *args, **kwargs):
         """Call when creating an instance of a WalletProvider class."""
@@ -69,3 +82,41 @@ class WalletProvider(ABC, metaclass=WalletProviderMeta):
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network."""
         pass
+
+
+class AsyncWalletProvider(ABC):
+    """Base class for wallet providers whose network calls are awaited.
+
+    Actions declared as coroutines are built for async wallet providers, the other
+    actions that use a wallet provider are built for synchronous ones.
+    """
+
+    @abstractmethod
+    def get_address(self) -> str:
+        """Get the wallet address."""
+        pass
+
+    @abstractmethod
+    def get_network(self) -> Network:
+        """Get the current network."""
+        pass
+
+    @abstractmethod
+    def get_name(self) -> str:
+        """Get the name of the wallet provider."""
+        pass
+
+    @abstractmethod
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency."""
+        pass
+
+    @abstractmethod
+    async def sign_message(self, message: str) -> str:
+        """Sign a message with the wallet."""
+        pass
+
+    @abstractmethod
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network."""
+        pass
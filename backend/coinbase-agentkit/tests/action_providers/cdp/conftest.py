@@ -1,5 +1,6 @@
 """Test fixtures for CDP API tests."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -121,8 +122,12 @@ def mock_wallet_testnet_provider():
         chain_id=MOCK_TESTNET_CHAIN_ID,
     )
     wallet.get_address.return_value = MOCK_WALLET_ADDRESS
-    # Add the get_client method to the wallet provider
-    wallet.get_client = Mock(return_value=Mock())
+
+    # Run operations against a mock client the way the provider's CDP client runtime would
+    mock_client = Mock()
+    mock_client.evm.request_faucet = AsyncMock(return_value=MOCK_TX_HASH)
+    wallet.cdp_client = mock_client
+    wallet.run_with_client = Mock(side_effect=lambda operation: asyncio.run(operation(mock_client)))
     return wallet
 
 
@@ -1,6 +1,8 @@
 """Tests for CDP API faucet funds action."""
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock
+
+import pytest
 
 from coinbase_agentkit.action_providers.cdp.cdp_api_action_provider import (
     RequestFaucetFundsSchema,
@@ -12,6 +14,7 @@ from .conftest import (
     MOCK_MAINNET_CHAIN_ID,
     MOCK_MAINNET_NETWORK_ID,
     MOCK_TX_HASH,
+    MOCK_WALLET_ADDRESS,
 )
 
 
@@ -29,75 +32,57 @@ def test_request_faucet_funds_input_without_asset_id():
 
 def test_request_eth_without_asset_id(mock_wallet_testnet_provider, mock_transaction, mock_env):
     """Test requesting ETH from faucet without specifying asset_id."""
-    # Create a mock CDP client
-    mock_client = Mock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-    mock_client.evm = Mock()
-    mock_client.evm.request_faucet = AsyncMock(return_value=MOCK_TX_HASH)
+    response = cdp_api_action_provider().request_faucet_funds(mock_wallet_testnet_provider, {})
 
-    # Ensure the wallet provider's get_client method returns our mock
-    mock_wallet_testnet_provider.get_client.return_value = mock_client
+    assert "Received ETH from the faucet" in response
+    assert MOCK_TX_HASH in response
+    mock_wallet_testnet_provider.cdp_client.evm.request_faucet.assert_awaited_once_with(
+        address=MOCK_WALLET_ADDRESS, token="eth", network="base-sepolia"
+    )
 
-    # Setup mock loop
-    mock_loop = Mock()
-    mock_loop.run_until_complete.return_value = MOCK_TX_HASH
 
-    with patch("asyncio.get_event_loop", return_value=mock_loop):
-        response = cdp_api_action_provider().request_faucet_funds(mock_wallet_testnet_provider, {})
+def test_request_eth_with_asset_id(mock_wallet_testnet_provider, mock_transaction, mock_env):
+    """Test requesting ETH from faucet with eth asset_id."""
+    response = cdp_api_action_provider().request_faucet_funds(
+        mock_wallet_testnet_provider, {"asset_id": "eth"}
+    )
 
-        assert "Received ETH from the faucet" in response
-        assert MOCK_TX_HASH in response
+    assert "Received eth from the faucet" in response
+    assert MOCK_TX_HASH in response
 
 
-def test_request_eth_with_asset_id(mock_wallet_testnet_provider, mock_transaction, mock_env):
-    """Test requesting ETH from faucet with eth asset_id."""
-    # Create a mock CDP client
-    mock_client = Mock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-    mock_client.evm = Mock()
-    mock_client.evm.request_faucet = AsyncMock(return_value=MOCK_TX_HASH)
+def test_request_usdc(mock_wallet_testnet_provider, mock_transaction, mock_env):
+    """Test requesting USDC from faucet."""
+    response = cdp_api_action_provider().request_faucet_funds(
+        mock_wallet_testnet_provider, {"asset_id": "usdc"}
+    )
 
-    # Ensure the wallet provider's get_client method returns our mock
-    mock_wallet_testnet_provider.get_client.return_value = mock_client
+    assert "Received usdc from the faucet" in response
+    assert MOCK_TX_HASH in response
+    mock_wallet_testnet_provider.cdp_client.evm.request_faucet.assert_awaited_once_with(
+        address=MOCK_WALLET_ADDRESS, token="usdc", network="base-sepolia"
+    )
 
-    # Setup mock loop
-    mock_loop = Mock()
-    mock_loop.run_until_complete.return_value = MOCK_TX_HASH
 
-    with patch("asyncio.get_event_loop", return_value=mock_loop):
-        response = cdp_api_action_provider().request_faucet_funds(
-            mock_wallet_testnet_provider, {"asset_id": "eth"}
-        )
+def test_request_faucet_uses_provider_client(mock_wallet_testnet_provider, mock_env):
+    """Test that repeated faucet requests reuse the wallet provider's long-lived client."""
+    provider = cdp_api_action_provider()
+    provider.request_faucet_funds(mock_wallet_testnet_provider, {})
+    provider.request_faucet_funds(mock_wallet_testnet_provider, {"asset_id": "usdc"})
 
-        assert "Received eth from the faucet" in response
-        assert MOCK_TX_HASH in response
+    assert mock_wallet_testnet_provider.run_with_client.call_count == 2
+    assert mock_wallet_testnet_provider.cdp_client.evm.request_faucet.await_count == 2
 
 
-def test_request_usdc(mock_wallet_testnet_provider, mock_transaction, mock_env):
-    """Test requesting USDC from faucet."""
-    # Create a mock CDP client
-    mock_client = Mock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-    mock_client.evm = Mock()
-    mock_client.evm.request_faucet = AsyncMock(return_value=MOCK_TX_HASH)
-
-    # Ensure the wallet provider's get_client method returns our mock
-    mock_wallet_testnet_provider.get_client.return_value = mock_client
-
-    # Setup mock loop
-    mock_loop = Mock()
-    mock_loop.run_until_complete.return_value = MOCK_TX_HASH
-
-    with patch("asyncio.get_event_loop", return_value=mock_loop):
-        response = cdp_api_action_provider().request_faucet_funds(
-            mock_wallet_testnet_provider, {"asset_id": "usdc"}
-        )
-
-        assert "Received usdc from the faucet" in response
-        assert MOCK_TX_HASH in response
+def test_request_faucet_without_cdp_client(mock_env):
+    """Test that a wallet provider without a CDP client is rejected."""
+    wallet = Mock(spec=["get_network", "get_address", "get_name"])
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+
+    with pytest.raises(AttributeError, match="run_with_client"):
+        cdp_api_action_provider().request_faucet_funds(wallet, {})
 
 
 def test_request_faucet_wrong_network(mock_env):
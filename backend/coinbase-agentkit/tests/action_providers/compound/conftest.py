@@ -5,6 +5,9 @@ import pytest
 from coinbase_agentkit.action_providers.compound.compound_action_provider import (
     CompoundActionProvider,
 )
+from coinbase_agentkit.action_providers.compound.rates import clear_rate_models
+from coinbase_agentkit.action_providers.compound.snapshot import clear_comet_markets
+from coinbase_agentkit.wallet_providers.multicall import CallResult
 
 
 @pytest.fixture
@@ -31,3 +34,68 @@ def compound_wallet():
     fake_receipt.transaction_link = "http://example.com/tx/0xTxHash"
     wallet.wait_for_transaction_receipt.return_value = fake_receipt
     return wallet
+
+
+@pytest.fixture(autouse=True)
+def clear_markets():
+    """Fixture that forgets the market configurations and rate models cached by other tests."""
+    clear_comet_markets()
+    clear_rate_models()
+    yield
+    clear_comet_markets()
+    clear_rate_models()
+
+
+WETH = "0x4200000000000000000000000000000000000006"
+CBETH = "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22"
+USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _asset_info(i, asset, feed, borrow_factor):
+    return (i, asset, feed, 10**18, borrow_factor, borrow_factor + 5 * 10**16, 0, 10**24)
+
+
+@pytest.fixture
+def market_reads():
+    """Fixture with the values read from a USDC market with WETH and cbETH collateral."""
+    return {
+        "getBlockNumber": 1234,
+        "baseToken": USDC,
+        "baseTokenPriceFeed": "0xUsdcFeed",
+        "numAssets": 2,
+        "getAssetInfo": {
+            0: _asset_info(0, WETH, "0xWethFeed", 8 * 10**17),
+            1: _asset_info(1, CBETH, "0xCbethFeed", 75 * 10**16),
+        },
+        "borrowBalanceOf": 1000 * 10**6,
+        "collateralBalanceOf": {WETH: 10**18, CBETH: 0},
+        "latestRoundData": {
+            "0xUsdcFeed": 10**8,
+            "0xWethFeed": 2000 * 10**8,
+            "0xCbethFeed": 2100 * 10**8,
+        },
+    }
+
+
+@pytest.fixture
+def snapshot_wallet(market_reads):
+    """Fixture with a wallet answering batched reads from market_reads."""
+
+    def read(call):
+        value = market_reads[call.function_name]
+        if call.function_name == "getAssetInfo":
+            return value[call.args[0]]
+        if call.function_name == "collateralBalanceOf":
+            return value[call.args[1]]
+        if call.function_name == "latestRoundData":
+            return (0, value[call.contract_address], 0, 0, 0)
+        return value
+
+    wallet = MagicMock()
+    wallet.get_address.return_value = "0xWallet"
+    wallet.get_network.return_value.chain_id = "8453"
+    wallet.get_network.return_value.network_id = "base-mainnet"
+    wallet.batch_read_contract.side_effect = lambda calls, **kw: [
+        CallResult(True, read(call)) for call in calls
+    ]
+    return wallet
@@ -9,15 +9,11 @@ def test_borrow_action_success(compound_wallet, compound_provider):
 
     with (
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_base_token_address",
-            return_value="0xBaseToken",
-        ),
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_borrow"
-        ) as mock_get_health_ratio_after_borrow,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
@@ -27,8 +23,12 @@ def test_borrow_action_success(compound_wallet, compound_provider):
     ):
         atomic_amount = 1000000000  # 1000 USDC with 6 decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_health_ratio.side_effect = [Decimal("Infinity"), Decimal("2.0")]
-        mock_get_health_ratio_after_borrow.return_value = Decimal("2.0")
+        snapshot = mock_load_position_snapshot.return_value
+        snapshot.market.base_token = "0xBaseToken"
+        snapshot.market.base_decimals = 6
+        snapshot.health_ratio.return_value = Decimal("Infinity")
+        snapshot.health_ratio_after_borrow.return_value = Decimal("2.0")
+        mock_get_health_ratio.return_value = Decimal("2.0")
 
         fake_contract = MagicMock()
         fake_contract.encode_abi.return_value = "encoded_borrow_data"
@@ -42,6 +42,9 @@ def test_borrow_action_success(compound_wallet, compound_provider):
         assert "Transaction hash: 0xTxHash" in result
         assert "Health ratio changed from Infinity to 2.00" in result
 
+        mock_load_position_snapshot.assert_called_once_with(compound_wallet, "0xComet")
+        snapshot.health_ratio_after_borrow.assert_called_once_with(atomic_amount)
+
         fake_contract.encode_abi.assert_called_once_with(
             "withdraw", args=["0xBaseToken", atomic_amount]
         )
@@ -56,20 +59,18 @@ def test_borrow_unhealthy_position(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_borrow"
-        ) as mock_get_health_ratio_after_borrow,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
-        ) as mock_get_health_ratio,
     ):
         atomic_amount = 1000000000
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_health_ratio.return_value = Decimal("2.0")
-        mock_get_health_ratio_after_borrow.return_value = Decimal("0.8")
+        snapshot = mock_load_position_snapshot.return_value
+        snapshot.health_ratio.return_value = Decimal("2.0")
+        snapshot.health_ratio_after_borrow.return_value = Decimal("0.8")
 
         result = provider.borrow(compound_wallet, input_args)
 
@@ -83,23 +84,21 @@ def test_borrow_transaction_failure(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_borrow"
-        ) as mock_get_health_ratio_after_borrow,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
-        ) as mock_get_health_ratio,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
     ):
         atomic_amount = 1000000000
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_health_ratio.return_value = Decimal("2.0")
-        mock_get_health_ratio_after_borrow.return_value = Decimal("1.5")
+        snapshot = mock_load_position_snapshot.return_value
+        snapshot.health_ratio.return_value = Decimal("2.0")
+        snapshot.health_ratio_after_borrow.return_value = Decimal("1.5")
 
         fake_contract = MagicMock()
         fake_contract.encode_abi.return_value = "encoded_borrow_data"
@@ -119,9 +118,15 @@ def test_borrow_general_error(compound_wallet, compound_provider):
     provider = compound_provider
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
-    with patch(
-        "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
-    ) as mock_format_amount_with_decimals:
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
+        ) as mock_format_amount_with_decimals,
+    ):
+        mock_load_position_snapshot.return_value.market.base_decimals = 6
         mock_format_amount_with_decimals.side_effect = Exception("Unexpected error occurred")
 
         result = provider.borrow(compound_wallet, input_args)
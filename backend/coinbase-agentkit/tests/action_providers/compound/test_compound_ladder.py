@@ -0,0 +1,114 @@
+"""Tests for the Compound health ratio ladder (ladder.py)."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.ladder import (
+    build_health_ladder,
+    evaluate_health_ratios,
+    max_safe_borrow,
+    max_safe_withdraw,
+)
+from coinbase_agentkit.action_providers.compound.snapshot import load_position_snapshot
+
+from .conftest import CBETH, WETH
+
+
+@pytest.fixture
+def snapshot(snapshot_wallet):
+    """Fixture with a position of 1 WETH at $2000 and a 0.8 collateral factor against 1000 USDC."""
+    return load_position_snapshot(snapshot_wallet, "0xComet")
+
+
+def test_max_safe_amounts(snapshot):
+    """Test the largest borrow and withdrawals keeping the health ratio at a target."""
+    assert max_safe_borrow(snapshot) == 600 * 10**6
+    assert max_safe_borrow(snapshot, "1.25") == 280 * 10**6
+    assert max_safe_borrow(snapshot, "2") == 0
+    assert max_safe_withdraw(snapshot, WETH) == 375 * 10**15
+    assert max_safe_withdraw(snapshot, WETH, "1.6") == 0
+    assert max_safe_withdraw(snapshot, CBETH) == 0
+
+    with pytest.raises(ValueError):
+        max_safe_borrow(snapshot, "0")
+
+
+def test_evaluate_health_ratios(snapshot):
+    """Test that every scenario is evaluated like the snapshot's own projections."""
+    ratios = evaluate_health_ratios(
+        snapshot,
+        borrow_changes=[0, 600 * 10**6, -1000 * 10**6, 0, 0],
+        collateral_changes={
+            WETH: [0, 0, 0, -5 * 10**17, 0],
+            CBETH: [0, 0, 0, 0, 10**18],
+        },
+        exact=True,
+    )
+
+    assert ratios == [
+        snapshot.health_ratio(),
+        snapshot.health_ratio_after_borrow(600 * 10**6),
+        Decimal("Infinity"),
+        snapshot.health_ratio_after_withdraw(WETH, 5 * 10**17),
+        Decimal("3.175"),
+    ]
+
+    with pytest.raises(ValueError):
+        evaluate_health_ratios(snapshot, [0, 0], {WETH: [0]})
+
+
+def test_evaluate_health_ratios_with_numpy(snapshot):
+    """Test that the NumPy evaluation matches the exact one."""
+    pytest.importorskip("numpy")
+    borrow_changes = [k * 10**8 for k in range(-10, 10)]
+    collateral_changes = {WETH: [-k * 10**16 for k in range(20)]}
+
+    approximate = evaluate_health_ratios(snapshot, borrow_changes, collateral_changes)
+    exact = evaluate_health_ratios(snapshot, borrow_changes, collateral_changes, exact=True)
+
+    assert [float(ratio) for ratio in approximate] == pytest.approx([float(r) for r in exact])
+
+
+def test_build_health_ladder(snapshot):
+    """Test the curves and maximum amounts of a ladder."""
+    ladder = build_health_ladder(snapshot, "1", steps=4, exact=True)
+
+    assert ladder.block_number == 1234
+    assert ladder.health_ratio == Decimal("1.6")
+    assert ladder.max_borrow == Decimal(600)
+    assert ladder.max_withdraw == {"WETH": Decimal("0.375")}
+    assert list(ladder.curves) == ["borrow USDC", "repay USDC", "withdraw WETH", "supply WETH"]
+    assert [point.amount for point in ladder.curves["borrow USDC"]] == [0, 150, 300, 450, 600]
+    assert ladder.curves["borrow USDC"][-1].health_ratio == Decimal(1)
+    assert ladder.curves["repay USDC"][-1].health_ratio == Decimal("Infinity")
+    assert ladder.curves["withdraw WETH"][2].health_ratio == Decimal("0.8")
+    assert ladder.curves["supply WETH"][-1].health_ratio == Decimal("3.2")
+
+    markdown = ladder.to_markdown()
+    assert "- **Max Safe Borrow:** 600 USDC\n" in markdown
+    assert "- **Max Safe Withdraw:** 0.375 WETH\n" in markdown
+    assert "## Withdraw WETH\n" in markdown
+
+
+def test_get_health_ladder_action(compound_provider, snapshot_wallet):
+    """Test that the get_health_ladder action reads the position once and uses exact ratios."""
+    compound_provider.get_health_ladder(snapshot_wallet, {})
+    snapshot_wallet.batch_read_contract.reset_mock()
+
+    with patch(
+        "coinbase_agentkit.action_providers.compound.compound_action_provider.build_health_ladder",
+        wraps=build_health_ladder,
+    ) as build:
+        result = compound_provider.get_health_ladder(
+            snapshot_wallet, {"target_health_ratio": "1.25", "steps": 5}
+        )
+
+    assert build.call_args.kwargs == {"exact": True}
+    assert "- **Max Safe Borrow:** 280 USDC\n" in result
+    snapshot_wallet.batch_read_contract.assert_called_once()
+    snapshot_wallet.read_contract.assert_not_called()
+
+    result = compound_provider.get_health_ladder(snapshot_wallet, {"target_health_ratio": "-1"})
+    assert "Error getting health ratio ladder:" in result
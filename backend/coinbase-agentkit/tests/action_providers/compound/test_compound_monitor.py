@@ -0,0 +1,178 @@
+"""Tests for the Compound position monitor (monitor.py)."""
+
+import threading
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.monitor import (
+    COMET_ACCOUNT_EVENT_TOPICS,
+    CompoundPositionMonitor,
+)
+from coinbase_agentkit.wallet_providers.multicall import CallResult
+
+from .conftest import WETH
+
+COMET = "0xb125E6687d4313864e53df431d5425969c15Eb2F"
+SAFE = "0x1111111111111111111111111111111111111111"
+RISKY = "0x2222222222222222222222222222222222222222"
+
+
+def _topic(address):
+    return "0x" + "00" * 12 + address[2:].lower()
+
+
+@pytest.fixture
+def positions():
+    """Fixture with the borrow and collateral balances of each account."""
+    return {
+        SAFE: (1000 * 10**6, {WETH: 10**18}),
+        RISKY: (1600 * 10**6, {WETH: 10**18}),
+    }
+
+
+@pytest.fixture
+def monitor_wallet(market_reads, positions):
+    """Fixture with a wallet answering batched reads of several accounts."""
+
+    def read(call):
+        if call.function_name == "borrowBalanceOf":
+            return positions.get(call.args[0], (0, {}))[0]
+        if call.function_name == "collateralBalanceOf":
+            account, asset = call.args
+            return positions.get(account, (0, {}))[1].get(asset, 0)
+        if call.function_name == "getAssetInfo":
+            return market_reads["getAssetInfo"][call.args[0]]
+        if call.function_name == "latestRoundData":
+            return (0, market_reads["latestRoundData"][call.contract_address], 0, 0, 0)
+        return market_reads[call.function_name]
+
+    wallet = MagicMock()
+    wallet.get_network.return_value.chain_id = "8453"
+    wallet.batch_read_contract.side_effect = lambda calls, **kw: [
+        CallResult(True, read(call)) for call in calls
+    ]
+    return wallet
+
+
+@pytest.fixture
+def web3():
+    """Fixture with a Web3 instance without logs."""
+    web3 = MagicMock()
+    web3.eth.get_logs.return_value = []
+    return web3
+
+
+def _read_accounts(wallet):
+    """Get the accounts whose borrow balance was read by the last batch."""
+    calls = wallet.batch_read_contract.call_args.args[0]
+    return [call.args[0] for call in calls if call.function_name == "borrowBalanceOf"]
+
+
+def test_refresh_reads_touched_accounts(monitor_wallet, web3):
+    """Test that only accounts named in Comet logs are read again on a new block."""
+    alerts = []
+    monitor = CompoundPositionMonitor(
+        monitor_wallet, web3, COMET, [SAFE, RISKY], on_alert=alerts.append
+    )
+
+    monitor.refresh(100)
+
+    assert sorted(_read_accounts(monitor_wallet)) == [SAFE, RISKY]
+    assert monitor_wallet.batch_read_contract.call_args.kwargs == {"block_identifier": 100}
+    assert monitor.get_health(SAFE).liquidation_ratio == Decimal("1.7")
+    assert monitor.get_health(RISKY).liquidation_ratio == Decimal("1.0625")
+    assert [(a.account, a.threshold, a.below) for a in alerts] == [(RISKY, Decimal("1.1"), True)]
+    assert [h.account for h in monitor.at_risk()] == [RISKY]
+
+    web3.eth.get_logs.return_value = [
+        {"topics": [COMET_ACCOUNT_EVENT_TOPICS[0], _topic(SAFE), _topic(COMET)]}
+    ]
+    assert monitor.refresh(102) == []
+
+    assert _read_accounts(monitor_wallet) == [SAFE]
+    assert web3.eth.get_logs.call_args.args[0]["fromBlock"] == 101
+    assert web3.eth.get_logs.call_args.args[0]["toBlock"] == 102
+
+    monitor_wallet.batch_read_contract.reset_mock()
+    assert monitor.refresh(102) == []
+    monitor_wallet.batch_read_contract.assert_not_called()
+
+
+def test_price_change_alerts_every_account(monitor_wallet, web3, market_reads):
+    """Test that prices read once per block are applied to every account."""
+    alerts = []
+    monitor = CompoundPositionMonitor(
+        monitor_wallet, web3, COMET, [SAFE, RISKY], on_alert=alerts.append
+    )
+    monitor.refresh(100)
+    alerts.clear()
+
+    market_reads["latestRoundData"]["0xWethFeed"] = 1800 * 10**8
+    monitor.refresh(101)
+
+    assert _read_accounts(monitor_wallet) == []
+    assert monitor.get_health(SAFE).liquidation_ratio == Decimal("1.53")
+    assert [(a.account, a.threshold, a.below) for a in alerts] == [(RISKY, Decimal(1), True)]
+    assert alerts[0].previous_liquidation_ratio == Decimal("1.0625")
+
+    market_reads["latestRoundData"]["0xWethFeed"] = 3000 * 10**8
+    monitor.refresh(102)
+
+    assert [(a.threshold, a.below) for a in alerts[1:]] == [
+        (Decimal("1.1"), False),
+        (Decimal(1), False),
+    ]
+
+
+def test_full_refresh_and_new_accounts(monitor_wallet, web3, positions):
+    """Test that new accounts are read on the next block and all accounts periodically."""
+    monitor = CompoundPositionMonitor(monitor_wallet, web3, COMET, [SAFE], full_refresh_blocks=10)
+    monitor.refresh(100)
+
+    monitor.watch([RISKY])
+    monitor.refresh(101)
+    assert _read_accounts(monitor_wallet) == [RISKY]
+
+    monitor.refresh(110)
+    assert sorted(_read_accounts(monitor_wallet)) == [SAFE, RISKY]
+
+    monitor.unwatch([RISKY])
+    monitor.refresh(111)
+    assert monitor.accounts() == [SAFE]
+    assert monitor.get_health(RISKY) is None
+
+
+def test_hundreds_of_accounts_in_one_batch(monitor_wallet, web3, positions):
+    """Test that every account is read in a single batch per block."""
+    accounts = [f"0x{i:040x}" for i in range(1, 301)]
+    for account in accounts:
+        positions[account] = (500 * 10**6, {WETH: 10**18})
+
+    monitor = CompoundPositionMonitor(monitor_wallet, web3, COMET, accounts)
+    monitor_wallet.batch_read_contract.reset_mock()
+    monitor.refresh(100)
+
+    # The market configuration is read on first use, then one batch for the block
+    assert monitor_wallet.batch_read_contract.call_count == 3
+    assert len(_read_accounts(monitor_wallet)) == 300
+    assert all(monitor.get_health(account) for account in accounts)
+
+
+def test_background_refresh(monitor_wallet, web3):
+    """Test that the background thread refreshes on new blocks."""
+    alerted = threading.Event()
+    web3.eth.block_number = 100
+
+    with CompoundPositionMonitor(
+        monitor_wallet,
+        web3,
+        COMET,
+        [RISKY],
+        on_alert=lambda alert: alerted.set(),
+        poll_interval=0.01,
+    ):
+        assert alerted.wait(5)
+
+    assert monitor_wallet.batch_read_contract.call_count == 3
@@ -1,5 +1,8 @@
 from unittest.mock import patch
 
+from coinbase_agentkit.wallet_providers import RpcTracer
+from coinbase_agentkit.wallet_providers.multicall import CallResult
+
 
 def test_get_portfolio_success(compound_wallet, compound_provider):
     """Test that the get_portfolio action returns the expected markdown details."""
@@ -34,3 +37,42 @@ def test_get_portfolio_failure(compound_wallet, compound_provider):
 
         assert "Error getting portfolio details:" in result
         assert "Test error" in result
+
+
+def test_get_portfolio_rpc_budget(compound_wallet, compound_provider, monkeypatch):
+    """Test that get_portfolio stays within its budget of contract reads."""
+    monkeypatch.setenv("DISABLE_AGENTKIT_ANALYTICS", "true")
+    reads = {
+        "getBlockNumber": 123,
+        "numAssets": 1,
+        "getAssetInfo": (
+            0,
+            "0x4200000000000000000000000000000000000006",
+            "0xFeed",
+            10**18,
+            8 * 10**17,
+            85 * 10**16,
+            93 * 10**16,
+            10**24,
+        ),
+        "collateralBalanceOf": 10**18,
+        "latestRoundData": (0, 2000 * 10**8, 0, 0, 0),
+        "borrowBalanceOf": 0,
+        "baseToken": "0x4200000000000000000000000000000000000006",
+        "baseTokenPriceFeed": "0xFeed",
+    }
+    compound_wallet.batch_read_contract.side_effect = lambda calls, **kw: [
+        CallResult(True, reads[call.function_name]) for call in calls
+    ]
+    compound_wallet.get_network.return_value.chain_id = "8453"
+
+    with RpcTracer(compound_wallet) as tracer:
+        first = compound_provider.get_portfolio(compound_wallet, {})
+        second = compound_provider.get_portfolio(compound_wallet, {})
+
+    assert "WETH" in first
+    assert first == second
+    # The market configuration is read on first use, then each position in one batch
+    tracer.assert_within_budget({"CompoundActionProvider_get_portfolio": 3})
+    assert len(tracer.calls) == 4
+    compound_wallet.read_contract.assert_not_called()
@@ -0,0 +1,88 @@
+"""Tests for the Compound interest rate model (rates.py)."""
+
+from decimal import Decimal
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.rates import (
+    SECONDS_PER_YEAR,
+    CometRateModel,
+    load_market_rates,
+)
+
+MODEL = CometRateModel(
+    supply_kink=8 * 10**17,
+    supply_base=0,
+    supply_slope_low=10**9,
+    supply_slope_high=10**10,
+    borrow_kink=8 * 10**17,
+    borrow_base=10**8,
+    borrow_slope_low=2 * 10**9,
+    borrow_slope_high=2 * 10**10,
+)
+
+
+@pytest.fixture
+def rate_reads(market_reads):
+    """Fixture adding the totals and rate model of the market to market_reads."""
+    market_reads.update(
+        totalSupply=1000 * 10**6,
+        totalBorrow=500 * 10**6,
+        supplyKink=MODEL.supply_kink,
+        supplyPerSecondInterestRateBase=MODEL.supply_base,
+        supplyPerSecondInterestRateSlopeLow=MODEL.supply_slope_low,
+        supplyPerSecondInterestRateSlopeHigh=MODEL.supply_slope_high,
+        borrowKink=MODEL.borrow_kink,
+        borrowPerSecondInterestRateBase=MODEL.borrow_base,
+        borrowPerSecondInterestRateSlopeLow=MODEL.borrow_slope_low,
+        borrowPerSecondInterestRateSlopeHigh=MODEL.borrow_slope_high,
+    )
+    return market_reads
+
+
+def test_rate_model():
+    """Test that rates follow Comet's kinked rate curves."""
+    assert MODEL.utilization(0, 0) == 0
+    assert MODEL.utilization(1000, 500) == 5 * 10**17
+    assert MODEL.supply_rate(5 * 10**17) == 5 * 10**8
+    assert MODEL.borrow_rate(5 * 10**17) == 11 * 10**8
+    assert MODEL.supply_rate(9 * 10**17) == 8 * 10**8 + 10**9
+    assert MODEL.borrow_rate(10**18) == 10**8 + 16 * 10**8 + 4 * 10**9
+
+
+def test_load_market_rates(snapshot_wallet, rate_reads):
+    """Test that the totals are read in a single batch once the rate model is cached."""
+    load_market_rates(snapshot_wallet, "0xComet")
+    snapshot_wallet.batch_read_contract.reset_mock()
+
+    rates = load_market_rates(snapshot_wallet, "0xComet", block_identifier=1200)
+
+    snapshot_wallet.batch_read_contract.assert_called_once()
+    assert snapshot_wallet.batch_read_contract.call_args.kwargs == {"block_identifier": 1200}
+    assert rates.model == MODEL
+    assert rates.block_number == 1234
+    assert rates.base_symbol == "USDC"
+
+    quote = rates.quote()
+    assert quote.utilization == Decimal("0.5")
+    assert quote.supply_apr == Decimal(5 * 10**8 * SECONDS_PER_YEAR) / Decimal(10**18)
+    assert rates.supply_apr(1000 * 10**6) == rates.quote(supply_change=1000 * 10**6).supply_apr
+    assert rates.quote(supply_change=1000 * 10**6).utilization == Decimal("0.25")
+    assert rates.quote(borrow_change=400 * 10**6).utilization == Decimal("0.9")
+    assert rates.borrow_apr(400 * 10**6) > rates.borrow_apr()
+
+    with pytest.raises(ValueError):
+        rates.quote(borrow_change=-600 * 10**6)
+
+
+def test_get_rates_action(compound_provider, snapshot_wallet, rate_reads):
+    """Test the rates formatted by the get_rates action."""
+    result = compound_provider.get_rates(snapshot_wallet, {"supply_amount": "1000"})
+
+    assert "- **Total Supply:** 1000.00 USDC\n" in result
+    assert "| Current | 50.00% | 1.58% | 3.47% |\n" in result
+    assert "| After Supplying 1000 | 25.00% |" in result
+    assert "After Borrowing" not in result
+
+    result = compound_provider.get_rates(snapshot_wallet, {"supply_amount": "-5000"})
+    assert "Error getting market rates:" in result
@@ -0,0 +1,81 @@
+"""Tests for the Compound position snapshots (snapshot.py)."""
+
+from decimal import Decimal
+
+from coinbase_agentkit.action_providers.compound.snapshot import (
+    get_comet_market,
+    load_position_snapshot,
+)
+
+from .conftest import CBETH, USDC, WETH
+
+
+def test_load_position_snapshot(snapshot_wallet):
+    """Test that a snapshot reads the market once and the position in a single batch."""
+    snapshot = load_position_snapshot(snapshot_wallet, "0xComet")
+
+    assert snapshot.block_number == 1234
+    assert snapshot.market.base_symbol == "USDC"
+    assert [asset.symbol for asset in snapshot.market.assets] == ["WETH", "cbETH"]
+    assert snapshot.get_collateral_balance(WETH.lower()) == 10**18
+    assert snapshot.get_collateral_balance(USDC) == 0
+
+    snapshot_wallet.batch_read_contract.reset_mock()
+    load_position_snapshot(snapshot_wallet, "0xComet", block_identifier=1200)
+
+    snapshot_wallet.batch_read_contract.assert_called_once()
+    assert snapshot_wallet.batch_read_contract.call_args.kwargs == {"block_identifier": 1200}
+    snapshot_wallet.read_contract.assert_not_called()
+
+
+def test_snapshot_health_ratios(snapshot_wallet):
+    """Test the current and projected health ratios computed from a snapshot."""
+    snapshot = load_position_snapshot(snapshot_wallet, "0xComet")
+
+    # 1 WETH at $2000 with a 0.8 collateral factor against 1000 USDC
+    assert snapshot.health_ratio() == Decimal("1.6")
+    assert snapshot.health_ratio_after_borrow(600 * 10**6) == Decimal("1")
+    assert snapshot.health_ratio_after_withdraw(WETH, 5 * 10**17) == Decimal("0.8")
+    assert snapshot.health_ratio_after_withdraw(CBETH, 10**18) == Decimal("1.6")
+    assert snapshot.liquidation_ratio() == Decimal("1.7")
+    assert snapshot.supply_details() == [
+        {
+            "Token Symbol": "WETH",
+            "Supply Amount": Decimal(1),
+            "Price": Decimal(2000),
+            "Collateral Factor": Decimal("0.8"),
+            "Decimals": 18,
+        }
+    ]
+
+
+def test_snapshot_without_borrow(snapshot_wallet, market_reads):
+    """Test that a position without borrows has an infinite health ratio."""
+    market_reads["borrowBalanceOf"] = 0
+
+    snapshot = load_position_snapshot(snapshot_wallet, "0xComet")
+
+    assert snapshot.health_ratio() == Decimal("Infinity")
+    assert "No borrowed assets found in your Compound position." in snapshot.to_markdown()
+    assert snapshot.health_ratio_after_borrow(10**6) == Decimal(1600)
+
+
+def test_snapshot_markdown(snapshot_wallet):
+    """Test the portfolio summary formatted from a snapshot."""
+    markdown = load_position_snapshot(snapshot_wallet, "0xComet").to_markdown()
+
+    assert "### WETH\n- **Supply Amount:** 1.000000000000000000\n" in markdown
+    assert "### Total Supply Value: $2000.00" in markdown
+    assert "### USDC\n- **Borrow Amount:** 1000.000000\n" in markdown
+    assert "- **Health Ratio:** 1.60\n" in markdown
+
+
+def test_snapshot_reloads_market_after_listing(snapshot_wallet, market_reads):
+    """Test that the market configuration is read again when an asset is listed."""
+    assert len(get_comet_market(snapshot_wallet, "0xComet").assets) == 2
+
+    market_reads["numAssets"] = 1
+    snapshot = load_position_snapshot(snapshot_wallet, "0xComet")
+
+    assert [asset.symbol for asset in snapshot.market.assets] == ["WETH"]
+    assert get_comet_market(snapshot_wallet, "0xComet") is snapshot.market
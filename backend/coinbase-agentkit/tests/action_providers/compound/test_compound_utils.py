@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 from coinbase_agentkit.action_providers.compound.constants import (
     COMET_ABI,
     PRICE_FEED_ABI,
+    USDC_ADDRESS,
 )
 from coinbase_agentkit.action_providers.compound.utils import (
     format_amount_from_decimals,
@@ -17,6 +18,9 @@ from coinbase_agentkit.action_providers.compound.utils import (
     get_token_symbol,
 )
 from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.wallet_providers.multicall import CallResult
+
+TOKEN_ADDRESS = "0x1234567890123456789012345678901234567890"
 
 
 def test_format_amount_with_decimals():
@@ -77,36 +81,52 @@ def test_get_collateral_balance():
     assert balance == 5000
 
 
-def test_get_token_decimals():
-    """Test that get_token_decimals returns a predetermined value."""
-    # Create a mock wallet
+def _metadata_wallet(decimals, symbol, name):
+    """Create a mock wallet whose batched reads return a token's metadata."""
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value.chain_id = "8453"
+    mock_wallet.batch_read_contract.return_value = [
+        CallResult(success=True, value=decimals),
+        CallResult(success=True, value=symbol),
+        CallResult(success=True, value=name),
+    ]
+    return mock_wallet
 
-    # Set up the mock to return decimals
-    mock_wallet.read_contract.return_value = 18
 
-    decimals = get_token_decimals(mock_wallet, "0xToken")
+def test_get_token_decimals():
+    """Test that get_token_decimals reads a token's metadata once and then reuses it."""
+    mock_wallet = _metadata_wallet(18, "TKN", "Token")
 
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "decimals")
+    first = get_token_decimals(mock_wallet, TOKEN_ADDRESS)
+    second = get_token_decimals(mock_wallet, TOKEN_ADDRESS)
 
-    assert decimals == 18
+    assert first == second == 18
+    mock_wallet.batch_read_contract.assert_called_once()
+    calls = mock_wallet.batch_read_contract.call_args.args[0]
+    assert [call.function_name for call in calls] == ["decimals", "symbol", "name"]
+    assert all(call.abi == ERC20_ABI for call in calls)
+    mock_wallet.read_contract.assert_not_called()
 
 
 def test_get_token_symbol():
-    """Test that get_token_symbol returns a predetermined symbol."""
-    # Create a mock wallet
-    mock_wallet = MagicMock()
+    """Test that get_token_symbol returns the symbol from the token metadata registry."""
+    mock_wallet = _metadata_wallet(18, "WETH", "Wrapped Ether")
 
-    # Set up the mock to return a symbol
-    mock_wallet.read_contract.return_value = "WETH"
+    symbol = get_token_symbol(mock_wallet, TOKEN_ADDRESS)
 
-    symbol = get_token_symbol(mock_wallet, "0xToken")
+    assert symbol == "WETH"
+    assert get_token_decimals(mock_wallet, TOKEN_ADDRESS) == 18
+    mock_wallet.batch_read_contract.assert_called_once()
 
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "symbol")
 
-    assert symbol == "WETH"
+def test_get_token_symbol_known_token():
+    """Test that known tokens are answered without reading from the chain."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value.chain_id = "8453"
+
+    assert get_token_symbol(mock_wallet, USDC_ADDRESS) == "USDC"
+    assert get_token_decimals(mock_wallet, USDC_ADDRESS) == 6
+    mock_wallet.batch_read_contract.assert_not_called()
 
 
 def test_get_token_balance():
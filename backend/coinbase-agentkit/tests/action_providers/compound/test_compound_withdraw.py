@@ -14,14 +14,11 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_amount_from_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
-        ) as mock_get_health_ratio_after_withdraw,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
@@ -36,10 +33,12 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
         atomic_amount = 1000000000
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_collateral_balance.return_value = atomic_amount
+        snapshot = mock_load_position_snapshot.return_value
+        snapshot.get_collateral_balance.return_value = atomic_amount
         mock_format_amount_from_decimals.return_value = "1000"
-        mock_get_health_ratio_after_withdraw.return_value = 1.5
-        mock_get_health_ratio.side_effect = [2.0, 3.0]
+        snapshot.health_ratio_after_withdraw.return_value = 1.5
+        snapshot.health_ratio.return_value = 2.0
+        mock_get_health_ratio.return_value = 3.0
         mock_get_token_symbol.return_value = "USDC"
 
         fake_contract = MagicMock()
@@ -54,6 +53,9 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
         assert "Transaction hash: 0xTxHash" in result
         assert "Health ratio changed from 2.00 to 3.00" in result
 
+        mock_load_position_snapshot.assert_called_once_with(compound_wallet, "0xComet")
+        snapshot.health_ratio_after_withdraw.assert_called_once_with("0xToken", atomic_amount)
+
         fake_contract.encode_abi.assert_called_once_with(
             "withdraw", args=["0xToken", atomic_amount]
         )
@@ -77,8 +79,8 @@ def test_withdraw_insufficient_collateral(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_amount_from_decimals,
@@ -89,7 +91,8 @@ def test_withdraw_insufficient_collateral(compound_wallet, compound_provider):
 
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = withdraw_amount
-        mock_get_collateral_balance.return_value = collateral_balance
+        snapshot = mock_load_position_snapshot.return_value
+        snapshot.get_collateral_balance.return_value = collateral_balance
         mock_format_amount_from_decimals.return_value = "500"
 
         result = provider.withdraw(compound_wallet, input_args)
@@ -111,18 +114,16 @@ def test_withdraw_unhealthy_position(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
-        ) as mock_get_health_ratio_after_withdraw,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
     ):
         token_decimals = 6
         atomic_amount = 1000000000  # 1000 USDC
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_collateral_balance.return_value = atomic_amount * 2
-        mock_get_health_ratio_after_withdraw.return_value = 0.8
+        snapshot = mock_load_position_snapshot.return_value
+        snapshot.get_collateral_balance.return_value = atomic_amount * 2
+        snapshot.health_ratio_after_withdraw.return_value = 0.8
 
         result = provider.withdraw(compound_wallet, input_args)
 
@@ -143,11 +144,8 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
-        ) as mock_get_health_ratio_after_withdraw,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.load_position_snapshot"
+        ) as mock_load_position_snapshot,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
@@ -159,8 +157,9 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
         atomic_amount = 1000000000
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_collateral_balance.return_value = atomic_amount * 2
-        mock_get_health_ratio_after_withdraw.return_value = 1.5
+        snapshot = mock_load_position_snapshot.return_value
+        snapshot.get_collateral_balance.return_value = atomic_amount * 2
+        snapshot.health_ratio_after_withdraw.return_value = 1.5
         mock_get_health_ratio.return_value = 2.0
 
         fake_contract = MagicMock()
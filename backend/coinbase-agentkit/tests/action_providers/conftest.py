@@ -0,0 +1,17 @@
+"""Shared fixtures for action provider tests."""
+
+import pytest
+
+from coinbase_agentkit.action_providers.erc20.token_metadata import (
+    TokenMetadataRegistry,
+    set_token_metadata_registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def token_metadata_registry():
+    """Give every test its own in-memory token metadata registry."""
+    registry = TokenMetadataRegistry()
+    set_token_metadata_registry(registry)
+    yield registry
+    set_token_metadata_registry(None)
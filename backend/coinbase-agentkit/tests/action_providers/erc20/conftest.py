@@ -4,7 +4,9 @@ from unittest.mock import Mock
 
 import pytest
 
+from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.multicall import CallResult
 
 MOCK_AMOUNT = "1000000000000000000"
 MOCK_DECIMALS = 6
@@ -18,5 +20,13 @@ def mock_wallet():
     """Create a mock wallet provider."""
     mock = Mock(spec=EvmWalletProvider)
     mock.get_address.return_value = MOCK_ADDRESS
-    mock.read_contract.side_effect = [int(MOCK_AMOUNT), MOCK_DECIMALS]
+    mock.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock.read_contract.return_value = int(MOCK_AMOUNT)
+    mock.batch_read_contract.return_value = [
+        CallResult(success=True, value=MOCK_DECIMALS),
+        CallResult(success=True, value="TKN"),
+        CallResult(success=True, value="Token"),
+    ]
     return mock
@@ -1,7 +1,5 @@
 """Tests for the ERC20 action provider."""
 
-from unittest.mock import call
-
 import pytest
 from web3 import Web3
 
@@ -40,22 +38,13 @@ def test_get_balance_success(mock_wallet):
 
     response = provider.get_balance(mock_wallet, args)
 
-    mock_wallet.read_contract.assert_has_calls(
-        [
-            call(
-                contract_address=MOCK_CONTRACT_ADDRESS,
-                abi=ERC20_ABI,
-                function_name="balanceOf",
-                args=[mock_wallet.get_address()],
-            ),
-            call(
-                contract_address=MOCK_CONTRACT_ADDRESS,
-                abi=ERC20_ABI,
-                function_name="decimals",
-                args=[],
-            ),
-        ]
+    mock_wallet.read_contract.assert_called_once_with(
+        contract_address=MOCK_CONTRACT_ADDRESS,
+        abi=ERC20_ABI,
+        function_name="balanceOf",
+        args=[mock_wallet.get_address()],
     )
+    mock_wallet.batch_read_contract.assert_called_once()
     assert (
         f"Balance of {MOCK_CONTRACT_ADDRESS} is {int(MOCK_AMOUNT) / 10 ** MOCK_DECIMALS}"
         in response
@@ -0,0 +1,131 @@
+"""Tests for the token metadata registry."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.action_providers.erc20.token_metadata import (
+    TokenMetadata,
+    TokenMetadataRegistry,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.multicall import CallResult
+
+TOKEN_A = "0x1111111111111111111111111111111111111111"
+TOKEN_B = "0x2222222222222222222222222222222222222222"
+USDC_BASE = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _ok(value):
+    """Create a successful call result."""
+    return CallResult(success=True, value=value)
+
+
+def _failed():
+    """Create a failed call result."""
+    return CallResult(success=False, error="execution reverted")
+
+
+@pytest.fixture
+def mock_wallet():
+    """Create a mock wallet provider on Base mainnet."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    return wallet
+
+
+def test_known_tokens_are_seeded(mock_wallet):
+    """Test that well-known tokens are answered without any reads."""
+    registry = TokenMetadataRegistry()
+
+    metadata = registry.get(mock_wallet, USDC_BASE.lower())
+
+    assert metadata.decimals == 6
+    assert metadata.symbol == "USDC"
+    mock_wallet.batch_read_contract.assert_not_called()
+
+
+def test_missing_tokens_are_read_in_one_batch(mock_wallet):
+    """Test that every missing token is read with a single batched call."""
+    registry = TokenMetadataRegistry()
+    mock_wallet.batch_read_contract.return_value = [
+        _ok(18),
+        _ok("AAA"),
+        _ok("Token A"),
+        _ok(8),
+        _ok("BBB"),
+        _ok("Token B"),
+    ]
+
+    metadata = registry.get_many(mock_wallet, [TOKEN_A, USDC_BASE, TOKEN_B, TOKEN_A])
+
+    assert [m.decimals for m in metadata] == [18, 6, 8, 18]
+    assert metadata[2].name == "Token B"
+    calls = mock_wallet.batch_read_contract.call_args.args[0]
+    assert [(call.contract_address, call.function_name) for call in calls] == [
+        (TOKEN_A, "decimals"),
+        (TOKEN_A, "symbol"),
+        (TOKEN_A, "name"),
+        (TOKEN_B, "decimals"),
+        (TOKEN_B, "symbol"),
+        (TOKEN_B, "name"),
+    ]
+
+    registry.get_many(mock_wallet, [TOKEN_A, TOKEN_B])
+    mock_wallet.batch_read_contract.assert_called_once()
+
+
+def test_missing_symbol_is_optional(mock_wallet):
+    """Test that a token without a readable symbol still has its decimals cached."""
+    registry = TokenMetadataRegistry()
+    mock_wallet.batch_read_contract.return_value = [_ok(18), _failed(), _failed()]
+
+    assert registry.get_decimals(mock_wallet, TOKEN_A) == 18
+    with pytest.raises(ValueError, match="does not have a readable symbol"):
+        registry.get_symbol(mock_wallet, TOKEN_A)
+    mock_wallet.batch_read_contract.assert_called_once()
+
+
+def test_unreadable_decimals_raise_and_keep_other_tokens(mock_wallet):
+    """Test that a token whose decimals fail raises while the others are cached."""
+    registry = TokenMetadataRegistry()
+    mock_wallet.batch_read_contract.return_value = [
+        _failed(),
+        _failed(),
+        _failed(),
+        _ok(6),
+        _ok("BBB"),
+        _ok("Token B"),
+    ]
+
+    with pytest.raises(ValueError, match=f"Failed to read decimals of token {TOKEN_A}"):
+        registry.get_many(mock_wallet, [TOKEN_A, TOKEN_B])
+
+    assert registry.lookup("8453", TOKEN_B).decimals == 6
+    assert registry.lookup("8453", TOKEN_A) is None
+
+
+def test_disk_tier_is_shared_between_registries(mock_wallet, tmp_path):
+    """Test that metadata written to the sqlite file is found by a new registry."""
+    path = str(tmp_path / "cache" / "tokens.sqlite")
+    mock_wallet.batch_read_contract.return_value = [_ok(18), _ok("AAA"), _ok("Token A")]
+    TokenMetadataRegistry(path).get(mock_wallet, TOKEN_A)
+
+    other_wallet = Mock(spec=EvmWalletProvider)
+    other_wallet.get_network.return_value = mock_wallet.get_network.return_value
+    metadata = TokenMetadataRegistry(path).get(other_wallet, TOKEN_A)
+
+    assert metadata == TokenMetadata("8453", TOKEN_A, 18, "AAA", "Token A")
+    other_wallet.batch_read_contract.assert_not_called()
+
+
+def test_metadata_is_keyed_by_chain(mock_wallet):
+    """Test that the same address on another chain is looked up separately."""
+    registry = TokenMetadataRegistry()
+    registry.add([TokenMetadata("1", TOKEN_A, 18, "AAA")])
+
+    assert registry.lookup("1", TOKEN_A).symbol == "AAA"
+    assert registry.lookup("8453", TOKEN_A) is None
@@ -4,12 +4,16 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from coinbase_agentkit.action_providers.morpho.morpho_action_provider import morpho_action_provider
+from coinbase_agentkit.action_providers.morpho.utils import build_approve_transaction
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import TransactionFailedError
+from coinbase_agentkit.wallet_providers.multicall import CallResult
 
 MOCK_VAULT_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_TOKEN_ADDRESS = "0x0987654321098765432109876543210987654321"
 MOCK_RECEIVER = "0x5555555555555555555555555555555555555555"
 MOCK_TX_HASH = "0xabcdef1234567890"
+MOCK_APPROVE_TX_HASH = "0x1234567890abcdef"
 MOCK_DECIMALS = 18
 
 
@@ -17,32 +21,43 @@ MOCK_DECIMALS = 18
 def test_morpho_deposit_success():
     """Test successful morpho deposit with valid parameters."""
     mock_wallet = MagicMock()
-    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
-    mock_wallet.read_contract.return_value = MOCK_DECIMALS
-
-    with patch(
-        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
-    ) as mock_approve:
-        mock_approve.return_value = True
+    mock_wallet.send_transactions.return_value = [MOCK_APPROVE_TX_HASH, MOCK_TX_HASH]
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+    mock_wallet.get_network.return_value.chain_id = "8453"
+    mock_wallet.batch_read_contract.return_value = [
+        CallResult(success=True, value=MOCK_DECIMALS),
+        CallResult(success=True, value="TKN"),
+        CallResult(success=True, value="Token"),
+    ]
 
-        result = morpho_action_provider().deposit(
-            mock_wallet,
-            {
-                "vault_address": MOCK_VAULT_ADDRESS,
-                "token_address": MOCK_TOKEN_ADDRESS,
-                "assets": "1.0",
-                "receiver": MOCK_RECEIVER,
-            },
-        )
+    result = morpho_action_provider().deposit(
+        mock_wallet,
+        {
+            "vault_address": MOCK_VAULT_ADDRESS,
+            "token_address": MOCK_TOKEN_ADDRESS,
+            "assets": "1.0",
+            "receiver": MOCK_RECEIVER,
+        },
+    )
 
-        mock_approve.assert_called_once_with(
-            mock_wallet, MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS, 1000000000000000000
-        )
+    approve_params, deposit_params = mock_wallet.send_transactions.call_args.args[0]
+    assert approve_params["to"] == MOCK_TOKEN_ADDRESS
+    assert (
+        approve_params["data"]
+        == build_approve_transaction(MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS, 1000000000000000000)[
+            "data"
+        ]
+    )
+    assert deposit_params["to"] == MOCK_VAULT_ADDRESS
+    assert "gas" not in deposit_params
 
-        assert MOCK_TX_HASH in result
-        assert "Deposited 1.0" in result
-        mock_wallet.send_transaction.assert_called_once()
-        mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
+    assert MOCK_TX_HASH in result
+    assert "Deposited 1.0" in result
+    mock_wallet.send_transactions.assert_called_once()
+    assert [call.args[0] for call in mock_wallet.wait_for_transaction_receipt.call_args_list] == [
+        MOCK_APPROVE_TX_HASH,
+        MOCK_TX_HASH,
+    ]
 
 
 def test_morpho_deposit_zero_amount():
@@ -99,24 +114,83 @@ def test_morpho_deposit_invalid_amount():
 def test_morpho_deposit_approval_error():
     """Test morpho deposit with approval error."""
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value.chain_id = "8453"
+    mock_wallet.batch_read_contract.return_value = [
+        CallResult(success=True, value=MOCK_DECIMALS),
+        CallResult(success=True, value="TKN"),
+        CallResult(success=True, value="Token"),
+    ]
+    mock_wallet.send_transactions.side_effect = Exception("Approval failed")
 
-    with patch(
-        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
-    ) as mock_approve:
-        mock_approve.side_effect = Exception("Approval failed")
+    result = morpho_action_provider().deposit(
+        mock_wallet,
+        {
+            "vault_address": MOCK_VAULT_ADDRESS,
+            "token_address": MOCK_TOKEN_ADDRESS,
+            "assets": "1.0",
+            "receiver": MOCK_RECEIVER,
+        },
+    )
 
-        result = morpho_action_provider().deposit(
-            mock_wallet,
-            {
-                "vault_address": MOCK_VAULT_ADDRESS,
-                "token_address": MOCK_TOKEN_ADDRESS,
-                "assets": "1.0",
-                "receiver": MOCK_RECEIVER,
-            },
-        )
+    assert "Error depositing to Morpho Vault: Approval failed" in result
+    mock_wallet.wait_for_transaction_receipt.assert_not_called()
 
-        assert "Error approving Morpho Vault as spender" in result
-        mock_wallet.send_transaction.assert_not_called()
+
+def _deposit_wallet():
+    """Create a wallet mock that can read the token and send the deposit."""
+    mock_wallet = MagicMock()
+    mock_wallet.send_transactions.return_value = [MOCK_APPROVE_TX_HASH, MOCK_TX_HASH]
+    mock_wallet.get_network.return_value.chain_id = "8453"
+    mock_wallet.batch_read_contract.return_value = [
+        CallResult(success=True, value=MOCK_DECIMALS),
+        CallResult(success=True, value="TKN"),
+        CallResult(success=True, value="Token"),
+    ]
+    return mock_wallet
+
+
+DEPOSIT_ARGS = {
+    "vault_address": MOCK_VAULT_ADDRESS,
+    "token_address": MOCK_TOKEN_ADDRESS,
+    "assets": "1.0",
+    "receiver": MOCK_RECEIVER,
+}
+
+
+def test_morpho_deposit_approval_reverted_before_deposit():
+    """Test morpho deposit when the approval reverts before the deposit is sent."""
+    mock_wallet = _deposit_wallet()
+    mock_wallet.send_transactions.side_effect = TransactionFailedError(MOCK_APPROVE_TX_HASH)
+
+    result = morpho_action_provider().deposit(mock_wallet, DEPOSIT_ARGS)
+
+    assert result == (
+        f"Error approving Morpho Vault as spender: Transaction {MOCK_APPROVE_TX_HASH} "
+        "failed to execute"
+    )
+
+
+def test_morpho_deposit_approval_reverted():
+    """Test morpho deposit when the approval sent with the deposit reverts."""
+    mock_wallet = _deposit_wallet()
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 0}
+
+    result = morpho_action_provider().deposit(mock_wallet, DEPOSIT_ARGS)
+
+    assert "Error approving Morpho Vault as spender" in result
+    mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_APPROVE_TX_HASH)
+
+
+def test_morpho_deposit_reverted():
+    """Test morpho deposit when the deposit reverts."""
+    mock_wallet = _deposit_wallet()
+    mock_wallet.wait_for_transaction_receipt.side_effect = [{"status": 1}, {"status": 0}]
+
+    result = morpho_action_provider().deposit(mock_wallet, DEPOSIT_ARGS)
+
+    assert (
+        result == f"Error depositing to Morpho Vault: Transaction {MOCK_TX_HASH} failed to execute"
+    )
 
 
 # Withdraw Tests
@@ -0,0 +1,242 @@
+"""Tests for the Morpho vault indexer (indexer.py)."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.morpho.indexer import (
+    SECONDS_PER_YEAR,
+    MorphoVaultIndexer,
+)
+from coinbase_agentkit.action_providers.morpho.morpho_action_provider import morpho_action_provider
+from coinbase_agentkit.wallet_providers.multicall import CallResult
+
+USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+WETH = "0x4200000000000000000000000000000000000006"
+MORPHO = "0xBBBBBbbBBb9cC5e90e3b3Af64bdAF62C37EEFFCb"
+LARGE_VAULT = "0x1111111111111111111111111111111111111111"
+SMALL_VAULT = "0x2222222222222222222222222222222222222222"
+WETH_VAULT = "0x3333333333333333333333333333333333333333"
+MARKET_1 = b"\x01" * 32
+MARKET_2 = b"\x02" * 32
+HEAD = 1_000_000
+
+
+@pytest.fixture
+def vault_reads():
+    """Fixture with the values read from three vaults, by vault address."""
+    return {
+        LARGE_VAULT: {
+            "asset": USDC,
+            "withdrawQueue": [MARKET_1],
+            "totalAssets": 1_000_000 * 10**6,
+            "totalSupply": 950_000 * 10**18,
+            "price": 1_050_000,
+            "past_price": 1_049_000,
+            "fee": 10**17,
+            "maxDeposit": 500_000 * 10**6,
+        },
+        SMALL_VAULT: {
+            "asset": USDC,
+            "withdrawQueue": [MARKET_2],
+            "totalAssets": 10_000 * 10**6,
+            "totalSupply": 10_000 * 10**18,
+            "price": 1_002_000,
+            "past_price": 1_000_000,
+            "fee": 0,
+            "maxDeposit": 1_000 * 10**6,
+        },
+        WETH_VAULT: {
+            "asset": WETH,
+            "withdrawQueue": [],
+            "totalAssets": 100 * 10**18,
+            "totalSupply": 100 * 10**18,
+            "price": 10**18,
+            "past_price": None,
+            "fee": 0,
+            "maxDeposit": 10**18,
+        },
+    }
+
+
+@pytest.fixture
+def morpho_reads():
+    """Fixture with the Morpho Blue market totals and vault supply shares."""
+    return {
+        "market": {
+            MARKET_1: (2_000_000 * 10**6, 2_000_000 * 10**12, 1_500_000 * 10**6, 0, 0, 0),
+            MARKET_2: (50_000 * 10**6, 50_000 * 10**12, 10_000 * 10**6, 0, 0, 0),
+        },
+        "position": {
+            (MARKET_1, LARGE_VAULT): 800_000 * 10**12,
+            (MARKET_2, SMALL_VAULT): 10_000 * 10**12,
+        },
+    }
+
+
+@pytest.fixture
+def vault_wallet(vault_reads, morpho_reads):
+    """Fixture with a wallet answering batched reads from vault_reads and morpho_reads."""
+
+    def read(call, block):
+        name, args = call.function_name, call.args
+        if name == "getBlockNumber":
+            return HEAD
+        if name == "getCurrentBlockTimestamp":
+            return 2 * (HEAD if block == "latest" else block)
+        if call.contract_address == MORPHO:
+            if name == "market":
+                return morpho_reads["market"][args[0]]
+            return (morpho_reads["position"].get(tuple(args), 0), 0, 0)
+        if name in ("decimals", "symbol", "name"):
+            return {"decimals": 18, "symbol": "mv", "name": "Vault"}[name]
+
+        vault = vault_reads[call.contract_address]
+        if vault is None:
+            raise ValueError("execution reverted")
+        if name == "MORPHO":
+            return MORPHO
+        if name == "withdrawQueueLength":
+            return len(vault["withdrawQueue"])
+        if name == "withdrawQueue":
+            return vault["withdrawQueue"][args[0]]
+        if name == "convertToAssets":
+            price = vault["price"] if block == "latest" else vault["past_price"]
+            if price is None:
+                raise ValueError("execution reverted")
+            return price
+        return vault[name]
+
+    def batch_read_contract(calls, block_identifier="latest"):
+        results = []
+        for call in calls:
+            try:
+                results.append(CallResult(True, read(call, block_identifier)))
+            except ValueError as e:
+                results.append(CallResult(False, error=str(e)))
+        return results
+
+    wallet = MagicMock()
+    wallet.get_network.return_value.chain_id = "8453"
+    wallet.get_network.return_value.network_id = "base-mainnet"
+    wallet.batch_read_contract.side_effect = batch_read_contract
+    return wallet
+
+
+@pytest.fixture
+def indexer():
+    """Fixture with an indexer of the three vaults."""
+    return MorphoVaultIndexer({"8453": [LARGE_VAULT, SMALL_VAULT, WETH_VAULT]})
+
+
+def _apy(price, past_price, blocks):
+    return (price / past_price) ** (SECONDS_PER_YEAR / (2 * blocks)) - 1
+
+
+def test_vault_table(indexer, vault_wallet):
+    """Test that vaults are read, ranked and then looked up from memory."""
+    table = indexer.get_table(vault_wallet)
+
+    # Configurations, withdraw queues, vault metadata, vault states and past share prices
+    assert vault_wallet.batch_read_contract.call_count == 5
+    sample_block = vault_wallet.batch_read_contract.call_args.kwargs["block_identifier"]
+    assert sample_block % indexer.refresh_blocks == 0
+    assert HEAD - sample_block >= indexer.apy_window_blocks
+
+    assert table.block_number == HEAD
+    assert [vault.address for vault in table.vaults] == [SMALL_VAULT, LARGE_VAULT, WETH_VAULT]
+    large = table.vaults[1]
+    assert large.share_price == Decimal("1.05")
+    assert large.fee == Decimal("0.1")
+    assert large.liquidity == 500_000 * 10**6
+    assert large.deposit_capacity == 500_000 * 10**6
+    assert float(large.apy) == pytest.approx(_apy(1_050_000, 1_049_000, HEAD - sample_block))
+    assert table.vaults[2].apy is None
+
+    vault_wallet.batch_read_contract.reset_mock()
+    assert indexer.get_best_vault(vault_wallet, USDC).address == SMALL_VAULT
+    assert indexer.get_best_vault(vault_wallet, USDC.lower(), 5_000 * 10**6).address == LARGE_VAULT
+    assert indexer.get_best_vault(vault_wallet, USDC, 10**12) is None
+    assert indexer.get_best_vault(vault_wallet, WETH).address == WETH_VAULT
+    vault_wallet.batch_read_contract.assert_not_called()
+
+
+def test_refresh_reloads_changed_queues(indexer, vault_wallet, vault_reads):
+    """Test that a refresh reuses the past share prices and reloads changed withdraw queues."""
+    indexer.get_table(vault_wallet)
+    vault_wallet.batch_read_contract.reset_mock()
+
+    indexer.get_table(vault_wallet, refresh=True)
+    vault_wallet.batch_read_contract.assert_called_once()
+
+    vault_reads[LARGE_VAULT]["withdrawQueue"].append(MARKET_2)
+    vault_wallet.batch_read_contract.reset_mock()
+    table = indexer.get_table(vault_wallet, refresh=True)
+
+    # The vault's configuration and queue are read again before its state
+    assert vault_wallet.batch_read_contract.call_count == 4
+    assert table.vaults[1].address == LARGE_VAULT
+    assert table.vaults[1].liquidity == 500_000 * 10**6
+
+
+def test_vaults_are_ranked_without_an_archive_node(indexer, vault_wallet, capsys):
+    """Test that vaults are ranked by total assets when past share prices cannot be read."""
+    read_contracts = vault_wallet.batch_read_contract.side_effect
+
+    def batch_read_contract(calls, block_identifier="latest"):
+        if block_identifier != "latest":
+            raise ValueError("missing trie node")
+        return read_contracts(calls, block_identifier)
+
+    vault_wallet.batch_read_contract.side_effect = batch_read_contract
+
+    table = indexer.get_table(vault_wallet)
+
+    assert "trailing APYs need an archive node" in capsys.readouterr().out
+    assert [vault.address for vault in table.for_asset(USDC)] == [LARGE_VAULT, SMALL_VAULT]
+    assert all(vault.apy is None for vault in table.vaults)
+    assert indexer.get_best_vault(vault_wallet, USDC).address == LARGE_VAULT
+    assert indexer.get_best_vault(vault_wallet, USDC, 600_000 * 10**6) is None
+    assert "ranked by total assets" in table.to_markdown(USDC)
+
+    # The failed sample is not read again on the next refresh
+    vault_wallet.batch_read_contract.reset_mock()
+    indexer.get_table(vault_wallet, refresh=True)
+    vault_wallet.batch_read_contract.assert_called_once()
+
+
+def test_unreadable_vaults_are_skipped(vault_wallet, vault_reads, capsys):
+    """Test that vaults whose configuration cannot be read are left out of the table."""
+    broken = "0x4444444444444444444444444444444444444444"
+    vault_reads[broken] = None
+    indexer = MorphoVaultIndexer({"8453": [LARGE_VAULT, broken]})
+
+    table = indexer.get_table(vault_wallet)
+
+    assert [vault.address for vault in table.vaults] == [LARGE_VAULT]
+    assert f"Skipping Morpho vault {broken}" in capsys.readouterr().out
+
+    indexer.add_vaults("8453", [SMALL_VAULT])
+    assert indexer.vaults("8453") == [LARGE_VAULT, broken, SMALL_VAULT]
+    assert len(indexer.get_table(vault_wallet).vaults) == 2
+
+
+def test_get_best_vault_action(indexer, vault_wallet):
+    """Test the best vault and ranking returned by the get_best_vault action."""
+    provider = morpho_action_provider(indexer)
+
+    result = provider.get_best_vault(vault_wallet, {"asset_address": USDC, "amount": "5000"})
+
+    assert f"- **Vault:** mv ({LARGE_VAULT})\n" in result
+    assert "- **APY After Deposit of 5000 USDC:**" in result
+    assert f"| mv | {SMALL_VAULT} |" in result
+    assert WETH_VAULT not in result
+
+    result = provider.get_best_vault(
+        vault_wallet, {"asset_address": "0x036CbD53842c5426634e7929541eC2318f3dCF7e"}
+    )
+    assert "No indexed Morpho Vault accepts" in result
+
+    result = provider.get_best_vault(vault_wallet, {"asset_address": USDC, "amount": "-1"})
+    assert "Error: Assets amount must not be negative" in result
@@ -0,0 +1,176 @@
+"""Tests for the base ActionProvider class."""
+
+import asyncio
+import gc
+import weakref
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.action_providers.action_provider import ActionProvider
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import AsyncWalletProvider
+
+
+class EchoSchema(BaseModel):
+    """Schema for the echo action."""
+
+    message: str
+
+
+class BaseProvider(ActionProvider):
+    """Provider with one action that uses the wallet provider and one that does not."""
+
+    def __init__(self, action_providers=None):
+        super().__init__("base", action_providers or [])
+
+    @create_action(
+        name="echo", description="Echo a message", schema=EchoSchema, validates_args=True
+    )
+    def echo(self, args):
+        """Echo a message."""
+        return EchoSchema(**args).message
+
+    @create_action(name="shout", description="Shout a message", schema=EchoSchema)
+    def shout(self, args):
+        """Shout a message without validating it."""
+        return args["message"].upper()
+
+    @create_action(name="address", description="Get the wallet address")
+    def address(self, wallet_provider, args):
+        """Get the wallet address."""
+        return wallet_provider.get_address()
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+class ChildProvider(BaseProvider):
+    """Provider that overrides an inherited action with a plain method."""
+
+    def echo(self, args):
+        """Return a constant instead of echoing."""
+        return "overridden"
+
+
+class MixedProvider(BaseProvider):
+    """Provider with an async action next to the synchronous ones."""
+
+    @create_action(name="balance", description="Get the wallet balance", read_only=True)
+    async def balance(self, wallet_provider, args):
+        """Await the wallet balance."""
+        return await wallet_provider.get_balance()
+
+
+@pytest.fixture(autouse=True)
+def no_analytics():
+    """Keep action invocations from queueing analytics events."""
+    with patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"):
+        yield
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet provider."""
+    wallet = Mock()
+    wallet.get_address.return_value = "0x123"
+    wallet.get_network.return_value = Network(protocol_family="evm", chain_id="1")
+    return wallet
+
+
+def test_actions_are_collected_once_per_class():
+    """Test that actions are collected when the class is defined, sorted by method name."""
+    assert [action.name for action in BaseProvider._class_actions] == [
+        "BaseProvider_address",
+        "BaseProvider_echo",
+        "BaseProvider_shout",
+    ]
+    assert [action.name for action in ChildProvider._class_actions] == [
+        "BaseProvider_address",
+        "BaseProvider_shout",
+    ]
+
+
+def test_actions_declare_whether_they_validate_their_args(wallet):
+    """Test that actions validate their arguments only when declared or without a schema."""
+    actions = {action.name: action for action in BaseProvider().get_actions(wallet)}
+
+    assert actions["BaseProvider_echo"].validates_args
+    assert not actions["BaseProvider_shout"].validates_args
+    assert actions["BaseProvider_address"].validates_args
+
+
+def test_get_actions_invokes_with_wallet_provider(wallet):
+    """Test that built actions pass the wallet provider only to actions that use it."""
+    actions = {action.name: action for action in BaseProvider().get_actions(wallet)}
+
+    assert actions["BaseProvider_echo"].invoke({"message": "hi"}) == "hi"
+    assert actions["BaseProvider_address"].invoke({}) == "0x123"
+
+
+def test_get_actions_is_memoized_per_wallet_provider(wallet):
+    """Test that the same actions are returned for a wallet provider and rebuilt for another."""
+    provider = BaseProvider()
+
+    first = provider.get_actions(wallet)
+    second = provider.get_actions(wallet)
+    other = provider.get_actions(Mock())
+
+    assert first == second
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert first[0] is not other[0]
+
+
+def test_cached_actions_do_not_keep_wallet_provider_alive():
+    """Test that a wallet provider is freed while its actions are cached."""
+    provider = BaseProvider()
+    wallet = Mock()
+    actions = {action.name: action for action in provider.get_actions(wallet)}
+    wallet_ref = weakref.ref(wallet)
+
+    del wallet
+    gc.collect()
+
+    assert wallet_ref() is None
+    assert len(provider._actions_by_wallet) == 0
+    with pytest.raises(ReferenceError):
+        actions["BaseProvider_address"].invoke({})
+
+
+def test_get_actions_includes_sub_providers(wallet):
+    """Test that actions of sub-providers follow the provider's own actions."""
+    provider = BaseProvider(action_providers=[ChildProvider()])
+
+    names = [action.name for action in provider.get_actions(wallet)]
+
+    assert names == [
+        "BaseProvider_address",
+        "BaseProvider_echo",
+        "BaseProvider_shout",
+        "BaseProvider_address",
+        "BaseProvider_shout",
+    ]
+
+
+def test_async_actions_are_built_for_async_wallet_providers(wallet):
+    """Test that wallet actions are only built for wallet providers of the same kind."""
+    async_wallet = Mock(spec=AsyncWalletProvider)
+    async_wallet.get_balance.return_value = 5
+    provider = MixedProvider()
+
+    sync_actions = {action.name: action for action in provider.get_actions(wallet)}
+    async_actions = {action.name: action for action in provider.get_actions(async_wallet)}
+
+    assert "MixedProvider_balance" not in sync_actions
+    assert sorted(async_actions) == [
+        "BaseProvider_echo",
+        "BaseProvider_shout",
+        "MixedProvider_balance",
+    ]
+    assert async_actions["MixedProvider_balance"].is_async
+    assert asyncio.run(async_actions["MixedProvider_balance"].ainvoke({})) == 5
+    assert asyncio.run(async_actions["BaseProvider_shout"].ainvoke({"message": "hi"})) == "HI"
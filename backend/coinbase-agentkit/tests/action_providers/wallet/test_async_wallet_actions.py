@@ -0,0 +1,61 @@
+"""Tests for the async wallet action provider."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.action_providers.wallet.async_wallet_action_provider import (
+    AsyncWalletActionProvider,
+)
+from coinbase_agentkit.wallet_providers import AsyncWalletProvider
+
+from .conftest import MOCK_ADDRESS, MOCK_BALANCE, MOCK_NETWORK, MOCK_PROVIDER_NAME
+
+
+@pytest.fixture
+def mock_async_wallet_provider():
+    """Create a mock async wallet provider for testing."""
+    mock = Mock(spec=AsyncWalletProvider)
+    mock.get_address.return_value = MOCK_ADDRESS
+    mock.get_balance.return_value = MOCK_BALANCE
+    mock.get_network.return_value = MOCK_NETWORK
+    mock.get_name.return_value = MOCK_PROVIDER_NAME
+    return mock
+
+
+def test_get_wallet_details(mock_async_wallet_provider):
+    """Test that the wallet details await the balance."""
+    result = asyncio.run(
+        AsyncWalletActionProvider().get_wallet_details(mock_async_wallet_provider, {})
+    )
+
+    assert f"- Address: {MOCK_ADDRESS}" in result
+    assert f"- Native Balance: {MOCK_BALANCE}" in result
+    mock_async_wallet_provider.get_balance.assert_awaited_once()
+
+
+def test_native_transfer(mock_async_wallet_provider):
+    """Test that a transfer awaits the wallet provider."""
+    mock_async_wallet_provider.native_transfer.return_value = "0xabc"
+
+    result = asyncio.run(
+        AsyncWalletActionProvider().native_transfer(
+            mock_async_wallet_provider, {"to": "0x456", "value": "1.5"}
+        )
+    )
+
+    assert result == "Successfully transferred 1.5 native tokens to 0x456.\nTransaction hash: 0xabc"
+
+
+def test_native_transfer_error(mock_async_wallet_provider):
+    """Test that a failed transfer is reported."""
+    mock_async_wallet_provider.native_transfer.side_effect = Exception("insufficient funds")
+
+    result = asyncio.run(
+        AsyncWalletActionProvider().native_transfer(
+            mock_async_wallet_provider, {"to": "0x456", "value": "1.5"}
+        )
+    )
+
+    assert result == "Error transferring native tokens: insufficient funds"
@@ -0,0 +1,150 @@
+"""Tests for the background analytics queue."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.analytics.send_analytics_event import (
+    AnalyticsQueue,
+    RequiredEventData,
+    send_analytics_event,
+)
+from coinbase_agentkit.network import Network
+
+
+def _event(index=0):
+    """Create an analytics event."""
+    return RequiredEventData(
+        name="agent_action_invocation",
+        action="invoke_action",
+        component="agent_action",
+        action_name=f"action_{index}",
+    )
+
+
+@pytest.fixture
+def mock_post():
+    """Patch the HTTP request used to upload events."""
+    with patch("coinbase_agentkit.analytics.send_analytics_event.requests.post") as mock:
+        yield mock
+
+
+@pytest.fixture
+def analytics_queue():
+    """Create a queue whose thread never uploads on its own."""
+    analytics_queue = AnalyticsQueue(max_queue_size=3, max_batch_size=2, flush_interval=3600)
+    yield analytics_queue
+    analytics_queue._stopped.set()
+
+
+def test_enqueue_does_not_upload(analytics_queue, mock_post):
+    """Test that queueing an event returns without making a request."""
+    assert analytics_queue.enqueue(_event())
+
+    assert analytics_queue.pending_count() == 1
+    mock_post.assert_not_called()
+
+
+def test_flush_uploads_events_in_batches(analytics_queue, mock_post):
+    """Test that queued events are uploaded in requests of at most the batch size."""
+    for index in range(3):
+        analytics_queue.enqueue(_event(index))
+
+    analytics_queue.flush()
+
+    assert mock_post.call_count == 2
+    first = mock_post.call_args_list[0].kwargs["json"]
+    events = json.loads(first["e"])
+    assert [event["event_properties"]["action_name"] for event in events] == [
+        "action_0",
+        "action_1",
+    ]
+    assert events[0]["event_type"] == "agent_action_invocation"
+    assert len(first["checksum"]) == 32
+    assert analytics_queue.pending_count() == 0
+
+
+def test_full_queue_drops_events(analytics_queue, mock_post):
+    """Test that events beyond the queue size are dropped instead of blocking."""
+    results = [analytics_queue.enqueue(_event(index)) for index in range(5)]
+
+    assert results == [True, True, True, False, False]
+    assert analytics_queue.dropped == 2
+    assert analytics_queue.pending_count() == 3
+
+
+def test_failed_upload_is_discarded(analytics_queue, mock_post):
+    """Test that a failed upload does not raise or keep the events."""
+    mock_post.side_effect = requests.exceptions.ConnectionError("offline")
+    analytics_queue.enqueue(_event())
+
+    analytics_queue.flush()
+
+    assert analytics_queue.pending_count() == 0
+
+
+def test_close_flushes_and_rejects_new_events(analytics_queue, mock_post):
+    """Test that closing the queue uploads what is left and drops later events."""
+    analytics_queue.enqueue(_event())
+
+    analytics_queue.close()
+
+    mock_post.assert_called_once()
+    assert not analytics_queue.enqueue(_event())
+
+
+def test_background_thread_uploads_events(mock_post):
+    """Test that the background thread uploads queued events once per interval."""
+    analytics_queue = AnalyticsQueue(flush_interval=0.01)
+    try:
+        analytics_queue.enqueue(_event())
+        for _ in range(500):
+            if mock_post.called:
+                break
+            analytics_queue._stopped.wait(0.01)
+    finally:
+        analytics_queue._stopped.set()
+
+    mock_post.assert_called_once()
+
+
+def test_send_analytics_event_respects_opt_out(monkeypatch):
+    """Test that no event is queued when analytics are disabled."""
+    monkeypatch.setenv("DISABLE_AGENTKIT_ANALYTICS", "true")
+
+    with patch(
+        "coinbase_agentkit.analytics.send_analytics_event.get_analytics_queue"
+    ) as mock_get_queue:
+        send_analytics_event(_event())
+
+    mock_get_queue.assert_not_called()
+
+
+def test_wallet_metadata_is_computed_once_per_wallet():
+    """Test that action events describe a wallet provider without calling it again."""
+
+    class Provider:
+        @create_action(name="test", description="Test action")
+        def test(self, wallet_provider, args):
+            return "done"
+
+    wallet = Mock()
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    wallet.get_name.return_value = "test_wallet"
+    wallet.get_address.return_value = "0x123"
+
+    with patch(
+        "coinbase_agentkit.action_providers.action_decorator.send_analytics_event"
+    ) as mock_send:
+        provider = Provider()
+        assert provider.test(wallet, {}) == "done"
+        assert provider.test(wallet, {}) == "done"
+
+    assert mock_send.call_count == 2
+    assert mock_send.call_args.args[0]["wallet_address"] == "0x123"
+    wallet.get_network.assert_called_once()
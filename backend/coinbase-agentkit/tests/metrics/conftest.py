@@ -0,0 +1,14 @@
+"""Fixtures for the metrics tests."""
+
+import pytest
+
+from coinbase_agentkit.metrics import MetricsRegistry, set_metrics_sink
+
+
+@pytest.fixture
+def registry():
+    """Record metrics to a fresh in-process registry for the duration of a test."""
+    registry = MetricsRegistry()
+    set_metrics_sink(registry)
+    yield registry
+    set_metrics_sink(None)
@@ -0,0 +1,203 @@
+"""Tests for the metrics recorded by actions and wallet providers."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.action_providers.wallet.wallet_action_provider import wallet_action_provider
+from coinbase_agentkit.metrics import current_action_stats, track_http_request
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.wallet_provider import WalletProvider
+
+
+class _Wallet(WalletProvider):
+    """Wallet provider whose contract and transaction calls do nothing."""
+
+    get_address = get_network = get_balance = sign_message = get_name = native_transfer = (
+        lambda self, *args: None
+    )
+
+    def track_initialization(self):
+        """Skip the initialization event."""
+
+    def read_contract(self, *args):
+        """Read a contract."""
+        return 1
+
+    def send_transaction(self, transaction):
+        """Send a transaction."""
+        return "0x1"
+
+    def send_transactions(self, transactions):
+        """Send transactions one by one."""
+        return [self.send_transaction(transaction) for transaction in transactions]
+
+    def wait_for_transaction_receipt(self, tx_hash):
+        """Wait for a receipt."""
+        return {"status": 1}
+
+    async def batch_read_contract(self, calls):
+        """Read several contracts."""
+        return [1] * len(calls)
+
+
+class _Provider:
+    """Action provider calling the wallet provider."""
+
+    @create_action(name="transfer", description="Transfer")
+    def transfer(self, wallet_provider, args):
+        """Read twice, send a transaction and wait for it."""
+        wallet_provider.read_contract()
+        wallet_provider.read_contract()
+        wallet_provider.wait_for_transaction_receipt(wallet_provider.send_transaction({}))
+        with track_http_request("pyth"):
+            pass
+        return "done"
+
+    @create_action(name="send_many", description="Send many")
+    def send_many(self, wallet_provider, args):
+        """Send two transactions at once."""
+        wallet_provider.send_transactions([{}, {}])
+        return "done"
+
+    @create_action(name="fail", description="Fail")
+    def fail(self, wallet_provider, args):
+        """Raise an error."""
+        raise ValueError("boom")
+
+    @create_action(name="validate", description="Validate")
+    def validate(self, wallet_provider, args):
+        """Reject the arguments without raising."""
+        return "Error: Assets amount must not be negative"
+
+
+@pytest.fixture(autouse=True)
+def no_analytics(monkeypatch):
+    """Turn analytics off."""
+    monkeypatch.setenv("DISABLE_AGENTKIT_ANALYTICS", "true")
+
+
+def test_action_records_wallet_calls(registry):
+    """Test that an action records its duration, wallet calls, receipt wait and HTTP calls."""
+    assert _Provider().transfer(_Wallet(), {}) == "done"
+
+    action = {"action": "_Provider_transfer"}
+    assert (
+        registry.get_histogram("agentkit_action_duration_seconds", {**action, "status": "ok"})[0]
+        == 1
+    )
+    assert registry.get_histogram(
+        "agentkit_action_wallet_calls", {**action, "method": "read_contract"}
+    ) == (1, 2)
+    assert registry.get_histogram(
+        "agentkit_action_wallet_calls", {**action, "method": "send_transaction"}
+    ) == (1, 1)
+    assert registry.get_histogram("agentkit_action_receipt_wait_seconds", action)[0] == 1
+    assert registry.get_histogram("agentkit_action_http_requests", action) == (1, 1)
+    assert (
+        registry.get_histogram(
+            "agentkit_wallet_call_duration_seconds",
+            {"provider": "_Wallet", "method": "read_contract"},
+        )[0]
+        == 2
+    )
+    assert (
+        registry.get_counter("agentkit_http_requests_total", {"service": "pyth", "status": "ok"})
+        == 1
+    )
+
+
+def test_nested_wallet_calls_are_not_counted_twice(registry):
+    """Test that the calls an instrumented wallet call makes itself are not recorded."""
+    assert _Provider().send_many(_Wallet(), {}) == "done"
+
+    action = {"action": "_Provider_send_many"}
+    assert registry.get_histogram(
+        "agentkit_action_wallet_calls", {**action, "method": "send_transactions"}
+    ) == (1, 1)
+    assert registry.get_histogram(
+        "agentkit_action_wallet_calls", {**action, "method": "send_transaction"}
+    ) == (1, 0)
+    assert registry.get_histogram(
+        "agentkit_wallet_call_duration_seconds",
+        {"provider": "_Wallet", "method": "send_transaction"},
+    ) == (0, 0.0)
+
+
+def test_action_errors_are_counted_by_type(registry):
+    """Test that exceptions raised by actions are counted by exception type."""
+    with pytest.raises(ValueError):
+        _Provider().fail(_Wallet(), {})
+
+    labels = {"action": "_Provider_fail", "error": "ValueError"}
+    assert registry.get_counter("agentkit_action_errors_total", labels) == 1
+    assert (
+        registry.get_histogram(
+            "agentkit_action_duration_seconds", {"action": "_Provider_fail", "status": "error"}
+        )[0]
+        == 1
+    )
+
+
+def test_async_wallet_calls_are_counted(registry):
+    """Test that coroutine wallet methods are counted for the action awaiting them."""
+
+    class Provider:
+        @create_action(name="batch", description="Batch")
+        def batch(self, wallet_provider, args):
+            asyncio.run(wallet_provider.batch_read_contract([1, 2]))
+            return current_action_stats().wallet_calls["batch_read_contract"]
+
+    assert Provider().batch(_Wallet(), {}) == 1
+
+
+def test_wallet_calls_outside_actions_are_timed(registry):
+    """Test that wallet calls made outside of an action are still timed."""
+    _Wallet().send_transaction({})
+
+    assert current_action_stats() is None
+    assert (
+        registry.get_histogram(
+            "agentkit_wallet_call_duration_seconds",
+            {"provider": "_Wallet", "method": "send_transaction"},
+        )[0]
+        == 1
+    )
+
+
+def test_failing_sink_does_not_break_actions():
+    """Test that an action still returns when the metrics sink raises."""
+    with patch(
+        "coinbase_agentkit.metrics.recorder.get_metrics_sink", side_effect=RuntimeError("down")
+    ):
+        assert _Provider().transfer(_Wallet(), {}) == "done"
+
+
+def test_returned_action_errors_are_counted(registry):
+    """Test that a provider action which catches its error and returns a message counts it."""
+    wallet = Mock(spec=WalletProvider)
+    wallet.get_balance.side_effect = ConnectionError("node down")
+    wallet.get_network.return_value = Network(protocol_family="evm", network_id="base-sepolia")
+
+    result = wallet_action_provider().get_balance(wallet, {})
+
+    assert result.startswith("Error getting balance")
+    action = {"action": "WalletActionProvider_get_balance"}
+    assert (
+        registry.get_counter("agentkit_action_errors_total", {**action, "error": "ConnectionError"})
+        == 1
+    )
+    assert (
+        registry.get_histogram("agentkit_action_duration_seconds", {**action, "status": "error"})[0]
+        == 1
+    )
+
+
+def test_error_messages_are_counted_without_a_recorded_exception(registry):
+    """Test that an "Error ..." result is counted when the action records no exception."""
+    assert _Provider().validate(_Wallet(), {}).startswith("Error")
+
+    labels = {"action": "_Provider_validate", "error": "ErrorResult"}
+    assert registry.get_counter("agentkit_action_errors_total", labels) == 1
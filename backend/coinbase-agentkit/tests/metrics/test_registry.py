@@ -0,0 +1,79 @@
+"""Tests for the in-process metrics registry."""
+
+from coinbase_agentkit.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsRegistry,
+    MetricsSink,
+    get_metrics_sink,
+    metrics_view,
+    set_metrics_sink,
+)
+
+
+def test_render_prometheus_histogram_and_counter():
+    """Test that histograms and counters are rendered in the Prometheus text format."""
+    registry = MetricsRegistry(duration_buckets=(0.1, 1))
+    registry.observe("agentkit_action_duration_seconds", 0.05, {"action": "a"})
+    registry.observe("agentkit_action_duration_seconds", 0.5, {"action": "a"})
+    registry.increment("agentkit_action_errors_total", {"action": "a", "error": "ValueError"})
+
+    assert registry.render_prometheus().splitlines() == [
+        "# TYPE agentkit_action_duration_seconds histogram",
+        'agentkit_action_duration_seconds_bucket{action="a",le="0.1"} 1',
+        'agentkit_action_duration_seconds_bucket{action="a",le="1"} 2',
+        'agentkit_action_duration_seconds_bucket{action="a",le="+Inf"} 2',
+        'agentkit_action_duration_seconds_sum{action="a"} 0.55',
+        'agentkit_action_duration_seconds_count{action="a"} 2',
+        "# TYPE agentkit_action_errors_total counter",
+        'agentkit_action_errors_total{action="a",error="ValueError"} 1',
+    ]
+
+
+def test_count_histograms_use_count_buckets():
+    """Test that histograms not measured in seconds use the count buckets."""
+    registry = MetricsRegistry(count_buckets=(0, 5))
+    registry.observe("agentkit_action_wallet_calls", 3, {})
+
+    rendered = registry.render_prometheus()
+
+    assert 'agentkit_action_wallet_calls_bucket{le="0"} 0' in rendered
+    assert 'agentkit_action_wallet_calls_bucket{le="5"} 1' in rendered
+
+
+def test_label_values_are_escaped():
+    """Test that quotes and backslashes in label values are escaped."""
+    registry = MetricsRegistry()
+    registry.increment("errors_total", {"error": 'a"b\\c'})
+
+    assert 'errors_total{error="a\\"b\\\\c"} 1' in registry.render_prometheus()
+
+
+def test_metrics_view_serves_registry(registry):
+    """Test that the view returns the current registry's metrics with their content type."""
+    registry.increment("calls_total", {})
+
+    body, status, headers = metrics_view()()
+
+    assert status == 200
+    assert headers["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+    assert "calls_total 1" in body
+
+
+def test_metrics_view_without_registry():
+    """Test that the view answers 404 when metrics go to an external sink."""
+
+    class Sink(MetricsSink):
+        def observe(self, name, value, labels):
+            pass
+
+        def increment(self, name, labels, value=1):
+            pass
+
+    set_metrics_sink(Sink())
+    try:
+        _, status, _ = metrics_view()()
+    finally:
+        set_metrics_sink(None)
+
+    assert status == 404
+    assert isinstance(get_metrics_sink(), MetricsRegistry)
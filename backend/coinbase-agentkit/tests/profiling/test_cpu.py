@@ -0,0 +1,53 @@
+"""Tests for the sampling CPU profiler."""
+
+import threading
+from collections import Counter
+
+import pytest
+
+from coinbase_agentkit.profiling import CpuProfile, profile_cpu
+
+
+def _busy_loop(stop):
+    """Spin until stopped."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_profile_samples_busy_threads():
+    """Test that the stacks of a busy thread are sampled, named after the thread."""
+    stop = threading.Event()
+    thread = threading.Thread(target=_busy_loop, args=(stop,), name="busy")
+    thread.start()
+    try:
+        profile = profile_cpu(0.2, interval=0.001)
+    finally:
+        stop.set()
+        thread.join()
+
+    busy = [stack for stack in profile.samples if stack[0] == "busy"]
+    assert busy
+    assert any(frame.startswith("_busy_loop (test_cpu.py:") for frame in busy[0])
+    assert profile.sample_count >= len(busy)
+
+
+def test_collapsed_and_flamegraph_output():
+    """Test that a profile is exported as collapsed stacks and as an SVG flamegraph."""
+    profile = CpuProfile(
+        duration=1.0,
+        interval=0.01,
+        samples=Counter(
+            {("main", "run (a.py:1)", "work (b.py:2)"): 3, ("main", "run (a.py:1)"): 1}
+        ),
+    )
+
+    assert profile.collapsed() == "main;run (a.py:1) 1\nmain;run (a.py:1);work (b.py:2) 3\n"
+    svg = profile.flamegraph()
+    assert svg.startswith("<svg")
+    assert "work (b.py:2) (3 samples, 75.0%)" in svg
+
+
+def test_profile_duration_is_bounded():
+    """Test that profiles longer than the maximum are rejected."""
+    with pytest.raises(ValueError):
+        profile_cpu(3600)
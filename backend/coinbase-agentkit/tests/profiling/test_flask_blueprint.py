@@ -0,0 +1,12 @@
+"""Tests for the profiling blueprint."""
+
+import pytest
+
+from coinbase_agentkit.profiling import create_profiling_blueprint
+
+
+@pytest.mark.parametrize("token", [None, ""])
+def test_blueprint_requires_token(token):
+    """Test that the profiling endpoints cannot be served without a token."""
+    with pytest.raises(ValueError, match="A token is required"):
+        create_profiling_blueprint(token=token)
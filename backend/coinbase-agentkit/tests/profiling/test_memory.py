@@ -0,0 +1,78 @@
+"""Tests for memory snapshots and object counts."""
+
+import pytest
+
+from coinbase_agentkit.profiling import MemoryTracker, agent_memory_stats, count_objects
+
+
+class MemorySaver:
+    """Stand-in for LangGraph's in-memory checkpointer."""
+
+    def __init__(self):
+        self.storage = {"thread-1": {"": {"c1": 1, "c2": 2}}, "thread-2": {"": {"c3": 3}}}
+        self.writes = {("thread-1", "", "c1"): {}}
+        self.blobs = {}
+
+
+def test_snapshot_diff_reports_growth():
+    """Test that allocations made between two snapshots are reported as growth."""
+    tracker = MemoryTracker()
+    tracker.start()
+    try:
+        tracker.snapshot("before")
+        retained = [bytearray(1024) for _ in range(200)]
+        tracker.snapshot("after")
+        growth = tracker.diff("before", "after", limit=5)
+    finally:
+        tracker.stop()
+
+    assert retained
+    assert growth[0].size_diff >= 200 * 1024
+    assert "test_memory.py" in growth[0].location
+
+
+def test_snapshot_requires_tracing():
+    """Test that snapshots cannot be taken before tracing starts."""
+    with pytest.raises(RuntimeError):
+        MemoryTracker().snapshot()
+
+
+def test_old_snapshots_are_dropped():
+    """Test that only the most recent snapshots are kept."""
+    tracker = MemoryTracker(max_snapshots=2)
+    tracker.start()
+    try:
+        for label in ("a", "b", "c"):
+            tracker.snapshot(label)
+        assert tracker.labels() == ["b", "c"]
+    finally:
+        tracker.stop()
+
+
+def test_count_objects_by_base_class():
+    """Test that objects are counted in the groups of their class or base classes."""
+
+    class Web3:
+        pass
+
+    class CustomWeb3(Web3):
+        pass
+
+    instances = [Web3(), CustomWeb3()]
+
+    counts = count_objects({"web3": ("Web3",)})
+
+    assert instances
+    assert counts["web3"] >= 2
+
+
+def test_agent_memory_stats():
+    """Test that checkpoints held by in-memory savers are counted."""
+    saver = MemorySaver()
+
+    stats = agent_memory_stats()
+
+    assert saver
+    assert stats["savers"] >= 1
+    assert stats["threads"] >= 2
+    assert stats["checkpoints"] >= 3
@@ -0,0 +1,245 @@
+"""Tests for AgentKit.invoke_many and the async invoke path."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coinbase_agentkit import (
+    ActionCall,
+    AgentKit,
+    AgentKitConfig,
+    AsyncWalletProvider,
+    WalletProvider,
+    create_action,
+)
+from coinbase_agentkit.action_providers.action_provider import ActionProvider
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.tracing import get_request_id, request_context
+
+
+class RecordingProvider(ActionProvider):
+    """Provider whose actions record when they run."""
+
+    def __init__(self):
+        super().__init__("recording", [])
+        self.events = []
+        self.lock = threading.Lock()
+        self.read_barrier = threading.Barrier(3, timeout=5)
+
+    def _record(self, event):
+        with self.lock:
+            self.events.append(event)
+
+    @create_action(name="read", description="Read a value", read_only=True)
+    def read(self, wallet_provider, args):
+        """Wait for the other reads, which only return if reads overlap."""
+        self.read_barrier.wait()
+        return f"read {args['value']}"
+
+    @create_action(name="write", description="Write a value")
+    def write(self, wallet_provider, args):
+        """Record the start and end of a write."""
+        self._record(f"start {args['value']}")
+        time.sleep(0.01)
+        self._record(f"end {args['value']}")
+        return f"wrote {args['value']}"
+
+    @create_action(name="request_id", description="Get the request ID", read_only=True)
+    def request_id(self, wallet_provider, args):
+        """Return the ID of the request the action runs in."""
+        return get_request_id()
+
+    @create_action(name="nested", description="Invoke other actions", read_only=True)
+    def nested(self, wallet_provider, args):
+        """Invoke writes through the AgentKit instance running this action."""
+        calls = [
+            ActionCall("RecordingProvider_write", {"value": value}) for value in args["values"]
+        ]
+        return self.agent_kit.invoke_many(calls)
+
+    @create_action(name="fail", description="Always fail", read_only=True)
+    def fail(self, wallet_provider, args):
+        """Raise an error."""
+        raise RuntimeError("failed")
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+@pytest.fixture(autouse=True)
+def no_analytics():
+    """Keep action invocations from queueing analytics events."""
+    with patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"):
+        yield
+
+
+@pytest.fixture
+def provider():
+    """Create a recording action provider."""
+    return RecordingProvider()
+
+
+@pytest.fixture
+def agent_kit(provider):
+    """Create an AgentKit instance with a mock wallet provider."""
+    wallet_provider = Mock(spec=WalletProvider)
+    wallet_provider.get_network.return_value = Network(protocol_family="evm", chain_id="1")
+    return AgentKit(AgentKitConfig(wallet_provider=wallet_provider, action_providers=[provider]))
+
+
+def test_read_only_actions_run_concurrently(agent_kit):
+    """Test that read-only actions overlap and results keep the order of the calls."""
+    calls = [ActionCall("RecordingProvider_read", {"value": value}) for value in (1, 2, 3)]
+
+    assert agent_kit.invoke_many(calls) == ["read 1", "read 2", "read 3"]
+
+
+def test_write_actions_run_in_order_without_overlap(agent_kit, provider):
+    """Test that actions that change state run one after another in the given order."""
+    calls = [ActionCall("RecordingProvider_write", {"value": value}) for value in (1, 2, 3)]
+
+    results = agent_kit.invoke_many(calls)
+
+    assert results == ["wrote 1", "wrote 2", "wrote 3"]
+    assert provider.events == ["start 1", "end 1", "start 2", "end 2", "start 3", "end 3"]
+
+
+def test_writes_from_separate_callers_do_not_overlap(agent_kit, provider):
+    """Test that writes on the same wallet are serialized across invocations."""
+    actions = {action.name: action for action in agent_kit.get_actions()}
+    threads = [
+        threading.Thread(target=actions["RecordingProvider_write"].invoke, args=({"value": i},))
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts = provider.events[::2]
+    ends = provider.events[1::2]
+    assert [event.split()[1] for event in starts] == [event.split()[1] for event in ends]
+
+
+def test_errors_are_raised_or_returned(agent_kit):
+    """Test that a failing action raises unless exceptions are returned in place."""
+    calls = [
+        ActionCall("RecordingProvider_fail"),
+        ActionCall("RecordingProvider_write", {"value": 1}),
+    ]
+
+    with pytest.raises(RuntimeError, match="failed"):
+        agent_kit.invoke_many(calls)
+
+    results = agent_kit.invoke_many(calls, return_exceptions=True)
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "wrote 1"
+
+
+def test_actions_run_in_the_callers_context(agent_kit):
+    """Test that actions on worker threads see the request of the caller."""
+    calls = [
+        ActionCall("RecordingProvider_request_id"),
+        ActionCall("RecordingProvider_write", {"value": 1}),
+    ]
+
+    with request_context("request-1"):
+        results = agent_kit.invoke_many(calls)
+
+    assert results == ["request-1", "wrote 1"]
+
+
+def test_nested_invoke_many_runs_inline(provider):
+    """Test that invoke_many called from an action does not wait on the busy worker pool."""
+    wallet_provider = Mock(spec=WalletProvider)
+    wallet_provider.get_network.return_value = Network(protocol_family="evm", chain_id="1")
+    agent_kit = AgentKit(
+        AgentKitConfig(
+            wallet_provider=wallet_provider, action_providers=[provider], max_parallel_actions=1
+        )
+    )
+    provider.agent_kit = agent_kit
+    results = []
+    calls = [ActionCall("RecordingProvider_nested", {"values": [1, 2]})]
+    thread = threading.Thread(
+        target=lambda: results.extend(agent_kit.invoke_many(calls)), daemon=True
+    )
+
+    thread.start()
+    thread.join(timeout=5)
+
+    assert results == [["wrote 1", "wrote 2"]]
+    assert provider.events == ["start 1", "end 1", "start 2", "end 2"]
+
+
+def test_unknown_action_invokes_nothing(agent_kit, provider):
+    """Test that an unknown action name is rejected before any action runs."""
+    calls = [ActionCall("RecordingProvider_write", {"value": 1}), ActionCall("missing")]
+
+    with pytest.raises(ValueError, match="Unknown actions: missing"):
+        agent_kit.invoke_many(calls)
+
+    assert provider.events == []
+
+
+@pytest.fixture
+def async_agent_kit():
+    """Create an AgentKit instance with a mock async wallet provider and default actions."""
+    wallet_provider = Mock(spec=AsyncWalletProvider)
+    wallet_provider.get_network.return_value = Network(protocol_family="evm", chain_id="1")
+    wallet_provider.get_address.return_value = "0x123"
+    wallet_provider.get_balance.return_value = 7
+    wallet_provider.native_transfer.return_value = "0xabc"
+    return AgentKit(AgentKitConfig(wallet_provider=wallet_provider))
+
+
+def test_ainvoke_awaits_async_wallet_actions(async_agent_kit):
+    """Test that an async wallet provider gets the async wallet actions, awaited on the loop."""
+    names = [action.name for action in async_agent_kit.get_actions()]
+    assert names == [
+        "AsyncWalletActionProvider_get_balance",
+        "AsyncWalletActionProvider_get_wallet_details",
+        "AsyncWalletActionProvider_native_transfer",
+    ]
+
+    result = asyncio.run(async_agent_kit.ainvoke("AsyncWalletActionProvider_get_balance"))
+
+    assert result == "Native balance at address 0x123: 7"
+    async_agent_kit.wallet_provider.get_balance.assert_awaited_once()
+
+
+def test_ainvoke_many_keeps_call_order(async_agent_kit):
+    """Test that ainvoke_many returns results in call order and raises the first error."""
+    calls = [
+        ActionCall("AsyncWalletActionProvider_native_transfer", {"to": "0x456", "value": "1"}),
+        ActionCall("AsyncWalletActionProvider_get_balance"),
+    ]
+
+    results = asyncio.run(async_agent_kit.ainvoke_many(calls))
+
+    assert results[0].endswith("Transaction hash: 0xabc")
+    assert results[1] == "Native balance at address 0x123: 7"
+
+    with pytest.raises(ValueError, match="Async actions must be awaited"):
+        async_agent_kit.invoke_many(calls)
+
+
+def test_ainvoke_many_runs_sync_actions_off_the_loop(agent_kit):
+    """Test that synchronous actions awaited with ainvoke_many still overlap when read-only."""
+    calls = [ActionCall("RecordingProvider_read", {"value": value}) for value in (1, 2, 3)]
+
+    assert asyncio.run(agent_kit.ainvoke_many(calls)) == ["read 1", "read 2", "read 3"]
+
+    calls = [
+        ActionCall("RecordingProvider_fail"),
+        ActionCall("RecordingProvider_write", {"value": 1}),
+    ]
+    with pytest.raises(RuntimeError, match="failed"):
+        asyncio.run(agent_kit.ainvoke_many(calls))
+    results = asyncio.run(agent_kit.ainvoke_many(calls, return_exceptions=True))
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "wrote 1"
@@ -0,0 +1,66 @@
+"""Tests that importing AgentKit stays fast and does not load unused providers."""
+
+import json
+import subprocess
+import sys
+
+import coinbase_agentkit
+
+# Seconds a bare `import coinbase_agentkit` may take in a fresh interpreter
+IMPORT_TIME_BUDGET = 1.5
+
+# Modules only needed by providers that are loaded on first use
+HEAVY_MODULES = [
+    "allora_sdk",
+    "cdp",
+    "ecdsa",
+    "jsonschema",
+    "jwt",
+    "nilql",
+    "paramiko",
+    "coinbase_agentkit.action_providers.wow.constants",
+    "coinbase_agentkit.wallet_providers.cdp_evm_server_wallet_provider",
+]
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import coinbase_agentkit
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_in_subprocess():
+    """Import coinbase_agentkit in a fresh interpreter and report what it loaded."""
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+    """Test that a bare import does not load the dependencies of unused providers."""
+    loaded = set(_import_in_subprocess()["modules"])
+
+    assert [module for module in HEAVY_MODULES if module in loaded] == []
+
+
+def test_import_time_within_budget():
+    """Test that a bare import stays within the import time budget."""
+    # The fastest of a few runs, to leave out noise from a busy machine
+    elapsed = min(_import_in_subprocess()["elapsed"] for _ in range(3))
+
+    assert (
+        elapsed < IMPORT_TIME_BUDGET
+    ), f"import coinbase_agentkit took {elapsed:.2f}s, over the {IMPORT_TIME_BUDGET}s budget"
+
+
+def test_lazy_names_resolve():
+    """Test that every exported name can be accessed."""
+    for name in coinbase_agentkit.__all__:
+        assert getattr(coinbase_agentkit, name) is not None
+    assert "erc20_action_provider" in dir(coinbase_agentkit)
@@ -0,0 +1,88 @@
+"""Tests for the span exporters."""
+
+import io
+import json
+from unittest.mock import patch
+
+from coinbase_agentkit.tracing import (
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    SlowTraceExporter,
+    Span,
+    format_waterfall,
+)
+
+
+def _trace():
+    """Create a trace of a slow quote within a request."""
+    root = Span("POST /chat", "a" * 32, "1" * 16, None, 100.0, 103.0, kind="server")
+    root.local_root_id = root.span_id
+    quote = Span("wow.get_buy_quote", "a" * 32, "2" * 16, root.span_id, 100.5, 102.5)
+    rpc = Span("rpc read_contract", "a" * 32, "3" * 16, quote.span_id, 101.0, 102.0)
+    rpc.error = "TimeoutError"
+    for span in (quote, rpc):
+        span.local_root_id = root.span_id
+    return [rpc, quote, root]
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    """Test that the file exporter appends one JSON object per span."""
+    path = tmp_path / "spans.jsonl"
+
+    FileSpanExporter(str(path)).export(_trace())
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == [
+        "rpc read_contract",
+        "wow.get_buy_quote",
+        "POST /chat",
+    ]
+    assert lines[0]["duration"] == 1.0
+
+
+def test_otlp_payload():
+    """Test that spans are converted to OTLP/JSON."""
+    exporter = OtlpHttpSpanExporter("http://collector:4318/")
+
+    payload = exporter.to_payload(_trace())
+
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert spans[0]["parentSpanId"] == "2" * 16
+    assert spans[0]["status"] == {"code": 2, "message": "TimeoutError"}
+    assert spans[2]["kind"] == 2
+    assert spans[2]["startTimeUnixNano"] == str(100 * 10**9)
+    assert "parentSpanId" not in spans[2]
+
+
+def test_otlp_exporter_posts_to_traces_endpoint():
+    """Test that spans are posted to the collector's traces endpoint."""
+    exporter = OtlpHttpSpanExporter("http://collector:4318")
+
+    with patch("coinbase_agentkit.tracing.exporters.requests.post") as mock_post:
+        exporter.export(_trace())
+        exporter._executor.shutdown(wait=True)
+
+    assert mock_post.call_args.args[0] == "http://collector:4318/v1/traces"
+
+
+def test_waterfall_indents_children():
+    """Test that the waterfall places spans in time under their parent."""
+    lines = format_waterfall(_trace()).splitlines()
+
+    assert lines[1].endswith("| POST /chat")
+    assert lines[2].endswith("|   wow.get_buy_quote")
+    assert lines[3].endswith("|     rpc read_contract (TimeoutError)")
+    assert "  1000.0" in lines[3]
+
+
+def test_slow_trace_exporter_prints_slow_quotes():
+    """Test that only traces with a slow matching span are printed."""
+    stream = io.StringIO()
+    exporter = SlowTraceExporter(1.5, span_names=("wow.get_buy_quote",), stream=stream)
+
+    exporter.export(_trace())
+    SlowTraceExporter(5, stream=stream).export(_trace())
+
+    output = stream.getvalue()
+    assert output.startswith(f"Slow trace {'a' * 32}: wow.get_buy_quote (2000 ms)")
+    assert output.count("Slow trace") == 1
@@ -0,0 +1,108 @@
+"""Tests for spans and the tracer."""
+
+import pytest
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.metrics import track_http_request
+from coinbase_agentkit.tracing import (
+    SpanExporter,
+    Tracer,
+    record_span,
+    request_context,
+    set_tracer,
+    start_span,
+)
+
+
+class _Collector(SpanExporter):
+    """Exporter keeping the exported traces in memory."""
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(spans)
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    """Trace with an in-memory exporter for the duration of a test."""
+    monkeypatch.setenv("DISABLE_AGENTKIT_ANALYTICS", "true")
+    collector = _Collector()
+    set_tracer(Tracer([collector]))
+    yield collector
+    set_tracer(None)
+
+
+def test_nested_spans_are_exported_with_their_root(collector):
+    """Test that child spans are exported together when the outermost span ends."""
+    with start_span("request", kind="server") as root:
+        with start_span("child") as child:
+            pass
+        assert collector.traces == []
+
+    (trace,) = collector.traces
+    assert [span.name for span in trace] == ["child", "request"]
+    assert child.parent_id == root.span_id
+    assert child.trace_id == root.trace_id
+    assert root.end_time >= child.end_time
+
+
+def test_request_id_sets_the_trace_id(collector):
+    """Test that traces of the same request share a trace ID derived from the request ID."""
+    with request_context("abc") as request_id, start_span("first"):
+        pass
+    with request_context(request_id), start_span("second"):
+        pass
+
+    first, second = (trace[0] for trace in collector.traces)
+    assert first.trace_id == second.trace_id
+    assert len(first.trace_id) == 32
+    assert first.attributes["request.id"] == "abc"
+
+
+def test_errors_are_recorded(collector):
+    """Test that a span records the exception raised within it."""
+    with pytest.raises(ValueError), start_span("failing"):
+        raise ValueError("boom")
+
+    assert collector.traces[0][0].error == "ValueError"
+
+
+def test_record_span_adds_a_timed_child(collector):
+    """Test that an operation timed by the caller is recorded under the current span."""
+    with start_span("request") as root:
+        record_span("llm step", 1.0, 2.5)
+
+    step = collector.traces[0][0]
+    assert step.parent_id == root.span_id
+    assert step.duration == 1.5
+
+
+def test_actions_wallet_calls_and_http_calls_are_traced(collector):
+    """Test that an action's span is the parent of its HTTP call's span."""
+
+    class Provider:
+        @create_action(name="price", description="Price")
+        def price(self, args):
+            with track_http_request("pyth"):
+                return "1"
+
+    with start_span("request"):
+        Provider().price({})
+
+    http, action, request = collector.traces[0]
+    assert action.name.startswith("action ") and action.name.endswith("Provider_price")
+    assert http.name == "http pyth"
+    assert http.parent_id == action.span_id
+    assert action.parent_id == request.span_id
+
+
+def test_disabled_tracer_records_nothing():
+    """Test that no span is created without exporters."""
+    set_tracer(Tracer())
+    try:
+        with start_span("request") as span:
+            assert span is None
+    finally:
+        set_tracer(None)
@@ -0,0 +1 @@
+"""Tests for the async CDP EVM Server Wallet Provider."""
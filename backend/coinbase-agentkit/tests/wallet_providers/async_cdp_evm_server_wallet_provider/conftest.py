@@ -0,0 +1,75 @@
+"""Common test fixtures for async CDP EVM Server Wallet Provider tests."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.cdp_evm_server_wallet_provider import (
+    CdpEvmServerWalletProviderConfig,
+)
+
+# =========================================================
+# test constants
+# =========================================================
+
+MOCK_API_KEY_ID = "test_api_key_id"
+MOCK_API_KEY_SECRET = "test_api_key_secret"
+MOCK_WALLET_SECRET = "test_wallet_secret"
+
+MOCK_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+MOCK_ADDRESS_TO = "0x1234567890123456789012345678901234567890"
+MOCK_NETWORK_ID = "base-sepolia"
+
+MOCK_TRANSACTION_HASH = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+MOCK_SIGNATURE = "0x123456"
+MOCK_ONE_ETH_WEI = 1000000000000000000
+
+# =========================================================
+# test fixtures
+# =========================================================
+
+
+@pytest.fixture
+def mock_cdp_client():
+    """Create a mock CDP client whose EVM methods are awaitable."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.async_cdp_evm_server_wallet_provider.CdpClient"
+    ) as mock_client_class:
+        mock_instance = Mock()
+        mock_instance.close = AsyncMock()
+        mock_instance.evm = AsyncMock()
+        mock_instance.evm.send_transaction.return_value = MOCK_TRANSACTION_HASH
+        mock_instance.evm.sign_message.return_value = MOCK_SIGNATURE
+        mock_instance.evm.sign_typed_data.return_value = MOCK_SIGNATURE
+        mock_instance.evm.create_account.return_value = Mock(address=MOCK_ADDRESS)
+        mock_instance.evm.get_account.return_value = Mock(address=MOCK_ADDRESS)
+
+        mock_client_class.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def mock_async_web3():
+    """Create a mock AsyncWeb3 instance whose RPC methods are awaitable."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.async_cdp_evm_server_wallet_provider.AsyncWeb3"
+    ) as mock_web3_class:
+        mock_web3_instance = Mock()
+        mock_web3_class.return_value = mock_web3_instance
+        mock_web3_instance.eth.get_balance = AsyncMock(return_value=MOCK_ONE_ETH_WEI)
+        mock_web3_instance.eth.wait_for_transaction_receipt = AsyncMock(
+            return_value={"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+        )
+        mock_web3_instance.provider.disconnect = AsyncMock()
+        yield mock_web3_instance
+
+
+@pytest.fixture
+def provider_config():
+    """Create a provider configuration."""
+    return CdpEvmServerWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+    )
@@ -0,0 +1,90 @@
+"""Tests for the async CDP EVM Server Wallet Provider."""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.async_cdp_evm_server_wallet_provider import (
+    AsyncCdpEvmServerWalletProvider,
+)
+from coinbase_agentkit.wallet_providers.cdp_evm_server_wallet_provider import (
+    CdpEvmServerWalletProviderConfig,
+)
+
+from .conftest import (
+    MOCK_ADDRESS,
+    MOCK_ADDRESS_TO,
+    MOCK_NETWORK_ID,
+    MOCK_ONE_ETH_WEI,
+    MOCK_SIGNATURE,
+    MOCK_TRANSACTION_HASH,
+)
+
+
+def test_create_with_new_account(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that create resolves a new account on the shared client."""
+    provider = asyncio.run(AsyncCdpEvmServerWalletProvider.create(provider_config))
+
+    assert provider.get_address() == MOCK_ADDRESS
+    assert provider.get_network().network_id == MOCK_NETWORK_ID
+    mock_cdp_client.evm.create_account.assert_awaited_once()
+
+
+def test_create_with_address(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that create looks up an existing account."""
+    provider_config.address = MOCK_ADDRESS
+    asyncio.run(AsyncCdpEvmServerWalletProvider.create(provider_config))
+
+    mock_cdp_client.evm.get_account.assert_awaited_once_with(address=MOCK_ADDRESS)
+
+
+def test_create_failure(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that an account lookup failure is wrapped in a ValueError."""
+    mock_cdp_client.evm.create_account.side_effect = Exception("API error")
+
+    with pytest.raises(ValueError, match="Failed to initialize CDP wallet: API error"):
+        asyncio.run(AsyncCdpEvmServerWalletProvider.create(provider_config))
+
+
+def test_missing_credentials(monkeypatch, mock_cdp_client, mock_async_web3):
+    """Test that missing credentials are rejected."""
+    for name in ("CDP_API_KEY_ID", "CDP_API_KEY_SECRET", "CDP_WALLET_SECRET"):
+        monkeypatch.delenv(name, raising=False)
+
+    with pytest.raises(ValueError, match="Missing required environment variables"):
+        AsyncCdpEvmServerWalletProvider(CdpEvmServerWalletProviderConfig())
+
+
+def test_calls_reuse_one_client(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that sends and signatures are awaited on the same client without reopening it."""
+
+    async def run():
+        provider = await AsyncCdpEvmServerWalletProvider.create(provider_config)
+        return await asyncio.gather(
+            provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1}),
+            provider.sign_message("hello"),
+            provider.sign_typed_data({"domain": {}, "types": {}, "message": {}}),
+            provider.get_balance(),
+        )
+
+    tx_hash, message_signature, typed_data_signature, balance = asyncio.run(run())
+
+    assert tx_hash == MOCK_TRANSACTION_HASH
+    assert message_signature == MOCK_SIGNATURE
+    assert typed_data_signature == MOCK_SIGNATURE
+    assert balance == Decimal(MOCK_ONE_ETH_WEI)
+    mock_cdp_client.close.assert_not_awaited()
+
+
+def test_close(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that closing the provider closes the client and the HTTP session."""
+
+    async def run():
+        async with await AsyncCdpEvmServerWalletProvider.create(provider_config) as provider:
+            await provider.wait_for_transaction_receipt(MOCK_TRANSACTION_HASH)
+
+    asyncio.run(run())
+
+    mock_cdp_client.close.assert_awaited_once()
+    mock_async_web3.provider.disconnect.assert_awaited_once()
@@ -0,0 +1 @@
+"""Tests for the async CDP EVM Smart Wallet Provider."""
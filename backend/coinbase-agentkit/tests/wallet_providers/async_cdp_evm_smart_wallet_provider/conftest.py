@@ -0,0 +1,77 @@
+"""Common test fixtures for async CDP EVM Smart Wallet Provider tests."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.cdp_evm_smart_wallet_provider import (
+    CdpEvmSmartWalletProviderConfig,
+)
+
+# =========================================================
+# test constants
+# =========================================================
+
+MOCK_OWNER_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+MOCK_SMART_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_ADDRESS_TO = "0x2345678901234567890123456789012345678901"
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TRANSACTION_HASH = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+MOCK_USER_OP_HASH = "0x9876543210"
+MOCK_PAYMASTER_URL = "https://paymaster.example.com"
+
+# =========================================================
+# test fixtures
+# =========================================================
+
+
+@pytest.fixture
+def mock_smart_account():
+    """Create a mock smart account."""
+    return Mock(address=MOCK_SMART_WALLET_ADDRESS)
+
+
+@pytest.fixture
+def mock_cdp_client(mock_smart_account):
+    """Create a mock CDP client whose EVM methods are awaitable."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.async_cdp_evm_smart_wallet_provider.CdpClient"
+    ) as mock_client_class:
+        mock_instance = Mock()
+        mock_instance.close = AsyncMock()
+        mock_instance.evm = AsyncMock()
+        mock_instance.evm.get_account.return_value = Mock(address=MOCK_OWNER_ADDRESS)
+        mock_instance.evm.create_smart_account.return_value = mock_smart_account
+        mock_instance.evm.get_smart_account.return_value = mock_smart_account
+        mock_instance.evm.send_user_operation.return_value = Mock(user_op_hash=MOCK_USER_OP_HASH)
+        mock_instance.evm.wait_for_user_operation.return_value = Mock(
+            transaction_hash=MOCK_TRANSACTION_HASH
+        )
+
+        mock_client_class.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def mock_async_web3():
+    """Create a mock AsyncWeb3 instance whose RPC methods are awaitable."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.async_cdp_evm_smart_wallet_provider.AsyncWeb3"
+    ) as mock_web3_class:
+        mock_web3_instance = Mock()
+        mock_web3_class.return_value = mock_web3_instance
+        mock_web3_instance.provider.disconnect = AsyncMock()
+        yield mock_web3_instance
+
+
+@pytest.fixture
+def provider_config():
+    """Create a provider configuration with a CDP server wallet owner."""
+    return CdpEvmSmartWalletProviderConfig(
+        api_key_id="test_api_key_id",
+        api_key_secret="test_api_key_secret",
+        wallet_secret="test_wallet_secret",
+        network_id=MOCK_NETWORK_ID,
+        owner=MOCK_OWNER_ADDRESS,
+        paymaster_url=MOCK_PAYMASTER_URL,
+    )
@@ -0,0 +1,61 @@
+"""Tests for the async CDP EVM Smart Wallet Provider."""
+
+import asyncio
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.async_cdp_evm_smart_wallet_provider import (
+    AsyncCdpEvmSmartWalletProvider,
+)
+
+from .conftest import (
+    MOCK_ADDRESS_TO,
+    MOCK_OWNER_ADDRESS,
+    MOCK_PAYMASTER_URL,
+    MOCK_SMART_WALLET_ADDRESS,
+    MOCK_TRANSACTION_HASH,
+    MOCK_USER_OP_HASH,
+)
+
+
+def test_create(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that create resolves the owner and creates the smart account."""
+    provider = asyncio.run(AsyncCdpEvmSmartWalletProvider.create(provider_config))
+
+    assert provider.get_address() == MOCK_SMART_WALLET_ADDRESS
+    mock_cdp_client.evm.get_account.assert_awaited_once_with(address=MOCK_OWNER_ADDRESS)
+    mock_cdp_client.evm.create_smart_account.assert_awaited_once()
+
+
+def test_create_failure(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that an initialization failure is wrapped in a ValueError."""
+    mock_cdp_client.evm.create_smart_account.side_effect = Exception("API error")
+
+    with pytest.raises(ValueError, match="Failed to initialize CDP smart wallet: API error"):
+        asyncio.run(AsyncCdpEvmSmartWalletProvider.create(provider_config))
+
+
+def test_send_transaction(mock_cdp_client, mock_async_web3, mock_smart_account, provider_config):
+    """Test that send_transaction sends a user operation and waits for it."""
+
+    async def run():
+        provider = await AsyncCdpEvmSmartWalletProvider.create(provider_config)
+        return await provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1})
+
+    assert asyncio.run(run()) == MOCK_TRANSACTION_HASH
+
+    send_kwargs = mock_cdp_client.evm.send_user_operation.await_args.kwargs
+    assert send_kwargs["smart_account"] is mock_smart_account
+    assert send_kwargs["paymaster_url"] == MOCK_PAYMASTER_URL
+    assert send_kwargs["calls"][0].to == MOCK_ADDRESS_TO
+    mock_cdp_client.evm.wait_for_user_operation.assert_awaited_once_with(
+        smart_account_address=MOCK_SMART_WALLET_ADDRESS, user_op_hash=MOCK_USER_OP_HASH
+    )
+
+
+def test_sign_message_not_supported(mock_cdp_client, mock_async_web3, provider_config):
+    """Test that smart wallets cannot sign messages directly."""
+    provider = asyncio.run(AsyncCdpEvmSmartWalletProvider.create(provider_config))
+
+    with pytest.raises(NotImplementedError):
+        asyncio.run(provider.sign_message("hello"))
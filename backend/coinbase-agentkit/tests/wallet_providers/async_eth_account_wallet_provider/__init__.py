@@ -0,0 +1 @@
+"""Tests for the async ETH Account Wallet Provider."""
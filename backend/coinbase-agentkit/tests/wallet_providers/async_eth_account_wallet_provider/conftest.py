@@ -0,0 +1,115 @@
+"""Common test fixtures for async ETH Account Wallet Provider tests."""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from eth_account.account import LocalAccount
+
+from coinbase_agentkit.wallet_providers.async_eth_account_wallet_provider import (
+    AsyncEthAccountWalletProvider,
+)
+from coinbase_agentkit.wallet_providers.eth_account_wallet_provider import (
+    EthAccountWalletProviderConfig,
+)
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmGasConfig
+
+# =========================================================
+# test constants
+# =========================================================
+
+MOCK_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+MOCK_ADDRESS_TO = "0x1234567890123456789012345678901234567890"
+MOCK_CHAIN_ID = "84532"
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_RPC_URL = "https://sepolia.base.org"
+
+MOCK_TX_HASH = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+
+MOCK_GAS_LIMIT = 21000
+MOCK_BASE_FEE_PER_GAS = 10000000000
+MOCK_PRIORITY_FEE_PER_GAS = 2000000000
+MOCK_FEE_HISTORY = {
+    "oldestBlock": 100,
+    "baseFeePerGas": [MOCK_BASE_FEE_PER_GAS] * 6,
+    "gasUsedRatio": [0.5] * 5,
+    "reward": [[1, MOCK_PRIORITY_FEE_PER_GAS, 3]] * 5,
+}
+
+MOCK_ONE_ETH_WEI = 1000000000000000000
+MOCK_BALANCE = Decimal(MOCK_ONE_ETH_WEI)
+
+MOCK_SIGNATURE_BYTES = "123456"
+
+# =========================================================
+# test fixtures
+# =========================================================
+
+
+@pytest.fixture
+def mock_account():
+    """Create a mock LocalAccount."""
+    account = Mock(spec=LocalAccount)
+    account.address = MOCK_ADDRESS
+
+    signed = Mock()
+    signed.signature = bytes.fromhex(MOCK_SIGNATURE_BYTES)
+    account.sign_message.return_value = signed
+    account.sign_typed_data.return_value = signed
+
+    signed_tx = Mock()
+    signed_tx.hash = bytes.fromhex(MOCK_TX_HASH[2:])
+    account.sign_transaction.return_value = signed_tx
+
+    return account
+
+
+@pytest.fixture
+def mock_async_web3():
+    """Create a mock AsyncWeb3 instance whose RPC methods are awaitable."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.async_eth_account_wallet_provider.AsyncWeb3"
+    ) as mock_web3_class:
+        mock_web3_instance = Mock()
+        mock_web3_class.return_value = mock_web3_instance
+
+        mock_web3_instance.eth.get_balance = AsyncMock(return_value=MOCK_ONE_ETH_WEI)
+        mock_web3_instance.eth.get_transaction_count = AsyncMock(return_value=1)
+        mock_web3_instance.eth.fee_history = AsyncMock(return_value=MOCK_FEE_HISTORY)
+        mock_web3_instance.eth.get_block_number = AsyncMock(return_value=100)
+        mock_web3_instance.eth.estimate_gas = AsyncMock(return_value=MOCK_GAS_LIMIT)
+        mock_web3_instance.eth.send_transaction = AsyncMock(
+            return_value=bytes.fromhex(MOCK_TX_HASH[2:])
+        )
+        mock_web3_instance.eth.wait_for_transaction_receipt = AsyncMock(
+            return_value={"transactionHash": bytes.fromhex(MOCK_TX_HASH[2:]), "status": 1}
+        )
+        mock_web3_instance.provider.disconnect = AsyncMock()
+
+        mock_contract = Mock()
+        mock_function = Mock()
+        mock_function.call = AsyncMock(return_value="mock_result")
+        mock_contract.functions = {"testFunction": lambda *args: mock_function}
+        mock_web3_instance.eth.contract.return_value = mock_contract
+
+        yield mock_web3_instance
+
+
+@pytest.fixture
+def wallet_provider(mock_account, mock_async_web3):
+    """Create an AsyncEthAccountWalletProvider instance."""
+    mock_chain = Mock()
+    mock_chain.rpc_urls = {"default": Mock(http=[MOCK_RPC_URL])}
+    mock_chain.id = MOCK_CHAIN_ID
+
+    with patch.multiple(
+        "coinbase_agentkit.wallet_providers.eth_account_wallet_provider",
+        CHAIN_ID_TO_NETWORK_ID={MOCK_CHAIN_ID: MOCK_NETWORK_ID},
+        NETWORK_ID_TO_CHAIN={MOCK_NETWORK_ID: mock_chain},
+    ):
+        config = EthAccountWalletProviderConfig(
+            account=mock_account,
+            chain_id=MOCK_CHAIN_ID,
+            gas=EvmGasConfig(gas_limit_multiplier=1.5),
+        )
+        yield AsyncEthAccountWalletProvider(config)
@@ -0,0 +1,72 @@
+"""Tests for async ETH Account Wallet Provider basic methods."""
+
+import asyncio
+
+from coinbase_agentkit.network import Network
+
+from .conftest import MOCK_ADDRESS, MOCK_BALANCE, MOCK_CHAIN_ID, MOCK_SIGNATURE_BYTES
+
+# =========================================================
+# basic methods tests
+# =========================================================
+
+
+def test_get_address(wallet_provider):
+    """Test get_address method."""
+    assert wallet_provider.get_address() == MOCK_ADDRESS
+
+
+def test_get_network(wallet_provider):
+    """Test get_network method."""
+    network = wallet_provider.get_network()
+    assert isinstance(network, Network)
+    assert network.chain_id == MOCK_CHAIN_ID
+
+
+def test_get_name(wallet_provider):
+    """Test get_name method."""
+    assert wallet_provider.get_name() == "async_eth_account_wallet_provider"
+
+
+def test_get_balance(wallet_provider, mock_async_web3):
+    """Test that get_balance awaits the AsyncWeb3 balance lookup."""
+    assert asyncio.run(wallet_provider.get_balance()) == MOCK_BALANCE
+    mock_async_web3.eth.get_balance.assert_awaited_once_with(MOCK_ADDRESS)
+
+
+def test_sign_message(wallet_provider, mock_account):
+    """Test sign_message method."""
+    signature = asyncio.run(wallet_provider.sign_message("hello"))
+
+    assert signature == MOCK_SIGNATURE_BYTES
+    mock_account.sign_message.assert_called_once()
+
+
+def test_read_contract(wallet_provider, mock_async_web3):
+    """Test that read_contract awaits the contract call."""
+    result = asyncio.run(wallet_provider.read_contract(MOCK_ADDRESS, [], "testFunction", [1]))
+
+    assert result == "mock_result"
+    mock_async_web3.eth.contract.assert_called_once_with(address=MOCK_ADDRESS, abi=[])
+
+
+def test_concurrent_reads(wallet_provider, mock_async_web3):
+    """Test that several reads can be in flight on one event loop."""
+
+    async def read_many():
+        return await asyncio.gather(
+            *(wallet_provider.read_contract(MOCK_ADDRESS, [], "testFunction") for _ in range(10))
+        )
+
+    assert asyncio.run(read_many()) == ["mock_result"] * 10
+
+
+def test_async_context_closes_provider(wallet_provider, mock_async_web3):
+    """Test that leaving the async context disconnects the HTTP session."""
+
+    async def use_provider():
+        async with wallet_provider as provider:
+            await provider.get_balance()
+
+    asyncio.run(use_provider())
+    mock_async_web3.provider.disconnect.assert_awaited_once()
@@ -0,0 +1,102 @@
+"""Tests for async ETH Account Wallet Provider transaction methods."""
+
+import asyncio
+
+import pytest
+
+from .conftest import (
+    MOCK_ADDRESS_TO,
+    MOCK_BASE_FEE_PER_GAS,
+    MOCK_GAS_LIMIT,
+    MOCK_PRIORITY_FEE_PER_GAS,
+    MOCK_TX_HASH,
+)
+
+# =========================================================
+# transaction tests
+# =========================================================
+
+
+def test_send_transaction(wallet_provider, mock_async_web3):
+    """Test that send_transaction fills fees, gas and nonce before sending."""
+    tx_hash = asyncio.run(wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO, "value": 1}))
+
+    assert tx_hash == MOCK_TX_HASH
+    sent = mock_async_web3.eth.send_transaction.await_args.args[0]
+    assert sent["nonce"] == 1
+    assert sent["gas"] == int(MOCK_GAS_LIMIT * 1.5)
+    assert sent["maxPriorityFeePerGas"] == MOCK_PRIORITY_FEE_PER_GAS
+    assert sent["maxFeePerGas"] == MOCK_BASE_FEE_PER_GAS + MOCK_PRIORITY_FEE_PER_GAS
+
+
+def test_concurrent_sends_use_distinct_nonces(wallet_provider, mock_async_web3):
+    """Test that concurrent sends share one nonce lookup and one fee lookup."""
+
+    async def send_many():
+        return await asyncio.gather(
+            *(wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO}) for _ in range(5))
+        )
+
+    asyncio.run(send_many())
+
+    nonces = sorted(
+        call.args[0]["nonce"] for call in mock_async_web3.eth.send_transaction.await_args_list
+    )
+    assert nonces == [1, 2, 3, 4, 5]
+    mock_async_web3.eth.get_transaction_count.assert_awaited_once()
+    mock_async_web3.eth.fee_history.assert_awaited_once()
+
+
+def test_send_transaction_resyncs_stale_nonce(wallet_provider, mock_async_web3):
+    """Test that a nonce error resyncs the nonce and retries once."""
+    mock_async_web3.eth.send_transaction.side_effect = [
+        Exception("nonce too low"),
+        bytes.fromhex(MOCK_TX_HASH[2:]),
+    ]
+    mock_async_web3.eth.get_transaction_count.side_effect = [1, 7]
+
+    asyncio.run(wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO}))
+
+    assert mock_async_web3.eth.send_transaction.await_args.args[0]["nonce"] == 7
+
+
+def test_send_transaction_already_known_is_not_resent(wallet_provider, mock_async_web3):
+    """Test that a transaction the node already has is not sent again under a new nonce."""
+    mock_async_web3.eth.send_transaction.side_effect = Exception("already known")
+
+    tx_hash = asyncio.run(wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO}))
+
+    assert tx_hash == MOCK_TX_HASH
+    mock_async_web3.eth.send_transaction.assert_awaited_once()
+
+
+def test_send_transaction_failure_releases_nonce(wallet_provider, mock_async_web3):
+    """Test that a failed send hands the nonce out again."""
+    mock_async_web3.eth.send_transaction.side_effect = [
+        Exception("insufficient funds"),
+        bytes.fromhex(MOCK_TX_HASH[2:]),
+    ]
+
+    with pytest.raises(Exception, match="insufficient funds"):
+        asyncio.run(wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO}))
+    asyncio.run(wallet_provider.send_transaction({"to": MOCK_ADDRESS_TO}))
+
+    assert mock_async_web3.eth.send_transaction.await_args.args[0]["nonce"] == 1
+
+
+def test_wait_for_transaction_receipt(wallet_provider, mock_async_web3):
+    """Test that wait_for_transaction_receipt awaits the AsyncWeb3 receipt lookup."""
+    receipt = asyncio.run(wallet_provider.wait_for_transaction_receipt(MOCK_TX_HASH))
+
+    assert receipt["transactionHash"] == bytes.fromhex(MOCK_TX_HASH[2:])
+    mock_async_web3.eth.wait_for_transaction_receipt.assert_awaited_once_with(
+        MOCK_TX_HASH, timeout=120, poll_latency=0.1
+    )
+
+
+def test_native_transfer(wallet_provider, mock_async_web3):
+    """Test native_transfer sends the value in wei and waits for the receipt."""
+    tx_hash = asyncio.run(wallet_provider.native_transfer(MOCK_ADDRESS_TO, "0.5"))
+
+    assert tx_hash == MOCK_TX_HASH[2:]
+    assert mock_async_web3.eth.send_transaction.await_args.args[0]["value"] == 5 * 10**17
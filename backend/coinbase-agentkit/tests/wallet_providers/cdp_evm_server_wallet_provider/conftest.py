@@ -88,6 +88,14 @@ def mock_account():
     return mock
 
 
+@pytest.fixture
+def mock_receipt_watcher():
+    """Create a mock receipt watcher that returns a receipt immediately."""
+    watcher = Mock()
+    watcher.wait.return_value = {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+    return watcher
+
+
 @pytest.fixture
 def mock_web3():
     """Create a mock Web3 instance."""
@@ -103,9 +111,6 @@ def mock_web3():
 
         mock_web3_instance.eth.estimate_gas.return_value = MOCK_GAS_LIMIT
 
-        mock_receipt = {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
-        mock_web3_instance.eth.wait_for_transaction_receipt.return_value = mock_receipt
-
         mock_contract = Mock()
         mock_function = Mock()
         mock_function.call.return_value = "mock_result"
@@ -127,7 +132,9 @@ def mock_wallet():
 
 
 @pytest.fixture
-def mocked_wallet_provider(mock_cdp_client, mock_account, mock_web3, mock_wallet):
+def mocked_wallet_provider(
+    mock_cdp_client, mock_account, mock_web3, mock_wallet, mock_receipt_watcher
+):
     """Create a mocked wallet provider instance."""
     # Create the configuration
     config = CdpEvmServerWalletProviderConfig(
@@ -144,5 +151,6 @@ def mocked_wallet_provider(mock_cdp_client, mock_account, mock_web3, mock_wallet
         # Manually set account and wallet attributes
         provider._account = mock_account
         provider._wallet = mock_wallet
+        provider._receipt_watcher = mock_receipt_watcher
 
         yield provider
@@ -49,8 +49,8 @@ def test_network_error_handling(mocked_wallet_provider, mock_cdp_client, mock_we
     timeout_error = "Timeout waiting for receipt"
     with (
         patch.object(
-            mocked_wallet_provider._web3.eth,
-            "wait_for_transaction_receipt",
+            mocked_wallet_provider._receipt_watcher,
+            "wait",
             side_effect=Exception(timeout_error),
         ),
         pytest.raises(Exception, match=timeout_error),
@@ -113,13 +113,34 @@ def test_init_with_invalid_network(mock_cdp_client):
 
 def test_init_with_account_creation_error(mock_cdp_client):
     """Test initialization when account creation fails."""
-    with patch("asyncio.run", side_effect=Exception("Failed to create account")):
-        config = CdpEvmServerWalletProviderConfig(
-            api_key_id=MOCK_API_KEY_ID,
-            api_key_secret=MOCK_API_KEY_SECRET,
-            wallet_secret=MOCK_WALLET_SECRET,
-            network_id=MOCK_NETWORK_ID,
+    mock_cdp_client.evm.create_account.side_effect = Exception("Failed to create account")
+    config = CdpEvmServerWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+    )
+
+    with pytest.raises(ValueError, match="Failed to create account"):
+        CdpEvmServerWalletProvider(config)
+
+
+def test_close_closes_rpc_router(mock_cdp_client, mock_account):
+    """Test that close stops the RPC router created for several RPC URLs."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.cdp_evm_server_wallet_provider.RpcRouterProvider"
+    ) as mock_router:
+        provider = CdpEvmServerWalletProvider(
+            CdpEvmServerWalletProviderConfig(
+                api_key_id=MOCK_API_KEY_ID,
+                api_key_secret=MOCK_API_KEY_SECRET,
+                wallet_secret=MOCK_WALLET_SECRET,
+                network_id=MOCK_NETWORK_ID,
+                address=MOCK_ADDRESS,
+                rpc_urls=["https://rpc-a.example.com", "https://rpc-b.example.com"],
+            )
         )
 
-        with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
-            CdpEvmServerWalletProvider(config)
+        provider.close()
+
+    mock_router.return_value.close.assert_called_once()
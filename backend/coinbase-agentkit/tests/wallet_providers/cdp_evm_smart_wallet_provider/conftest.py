@@ -10,6 +10,7 @@ from coinbase_agentkit.wallet_providers.cdp_evm_smart_wallet_provider import (
     CdpEvmSmartWalletProvider,
     CdpEvmSmartWalletProviderConfig,
 )
+from coinbase_agentkit.wallet_providers.read_cache import ReadCache
 
 # =========================================================
 # test constants
@@ -81,6 +82,14 @@ def mock_smart_account():
     return mock
 
 
+@pytest.fixture
+def mock_receipt_watcher():
+    """Create a mock receipt watcher that returns a receipt immediately."""
+    watcher = Mock()
+    watcher.wait.return_value = {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+    return watcher
+
+
 @pytest.fixture
 def mock_web3():
     """Create a mock Web3 instance."""
@@ -92,9 +101,6 @@ def mock_web3():
 
         mock_web3_instance.eth.get_balance.return_value = MOCK_ONE_ETH_WEI
 
-        mock_receipt = {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
-        mock_web3_instance.eth.wait_for_transaction_receipt.return_value = mock_receipt
-
         mock_contract = Mock()
         mock_function = Mock()
         mock_function.call.return_value = "mock_result"
@@ -107,31 +113,6 @@ def mock_web3():
         yield mock_web3
 
 
-@pytest.fixture
-def mock_asyncio():
-    """Create a mock for asyncio."""
-    with patch(
-        "coinbase_agentkit.wallet_providers.cdp_evm_smart_wallet_provider.asyncio"
-    ) as mock_asyncio:
-        # Create a side effect for asyncio.run that handles the initialization coroutine
-        def run_side_effect(coro):
-            # Special handling for the initialization_accounts coroutine
-            if coro.__name__ == "initialize_accounts":
-                # Return a tuple of mock owner and smart account
-                mock_owner = Mock(spec=Account)
-                mock_owner.address = "0x123456789012345678901234567890123456789012"
-
-                mock_smart_account = Mock()
-                mock_smart_account.address = MOCK_ADDRESS
-
-                return (mock_owner, mock_smart_account)
-            # For client.close, just return None
-            return None
-
-        mock_asyncio.run = Mock(side_effect=run_side_effect)
-        yield mock_asyncio
-
-
 @pytest.fixture
 def mock_network_id_to_chain():
     """Create a mock for NETWORK_ID_TO_CHAIN."""
@@ -154,8 +135,8 @@ def mocked_wallet_provider(
     mock_owner,
     mock_smart_account,
     mock_web3,
-    mock_asyncio,
     mock_network_id_to_chain,
+    mock_receipt_watcher,
 ):
     """Create a CdpEvmSmartWalletProvider instance with mocked dependencies."""
 
@@ -197,7 +178,11 @@ def mocked_wallet_provider(
         )
 
         provider._web3 = mock_web3.return_value
+        provider._receipt_watcher = mock_receipt_watcher
+        provider._read_cache = ReadCache(provider._web3, MOCK_CHAIN_ID)
         provider._owner = mock_owner
+        provider._smart_account = mock_smart_account
+        provider._smart_account_client = mock_cdp_client
         provider._gas_limit_multiplier = 1.2
         provider._fee_per_gas_multiplier = 1
         provider.get_client = Mock(return_value=mock_cdp_client)
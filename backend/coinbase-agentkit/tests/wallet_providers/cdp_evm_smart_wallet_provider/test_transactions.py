@@ -279,19 +279,19 @@ def test_send_user_operation_multiple_calls(
     assert tx_hash == MOCK_TRANSACTION_HASH
 
 
-def test_wait_for_transaction_receipt(mocked_wallet_provider, mock_web3):
+def test_wait_for_transaction_receipt(mocked_wallet_provider, mock_web3, mock_receipt_watcher):
     """Test wait_for_transaction_receipt method."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
 
     receipt = mocked_wallet_provider.wait_for_transaction_receipt(tx_hash)
 
     assert receipt == {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
-    mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
-        tx_hash, timeout=120, poll_latency=0.1
-    )
+    mock_receipt_watcher.wait.assert_called_once_with(tx_hash, timeout=120)
 
 
-def test_wait_for_transaction_receipt_custom_timeout(mocked_wallet_provider, mock_web3):
+def test_wait_for_transaction_receipt_custom_timeout(
+    mocked_wallet_provider, mock_web3, mock_receipt_watcher
+):
     """Test wait_for_transaction_receipt method with custom timeout."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
     custom_timeout = 300
@@ -302,29 +302,29 @@ def test_wait_for_transaction_receipt_custom_timeout(mocked_wallet_provider, moc
     )
 
     assert receipt is not None
-    mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
-        tx_hash, timeout=custom_timeout, poll_latency=custom_poll_latency
-    )
+    mock_receipt_watcher.wait.assert_called_once_with(tx_hash, timeout=custom_timeout)
 
 
-def test_wait_for_transaction_receipt_failure(mocked_wallet_provider, mock_web3):
+def test_wait_for_transaction_receipt_failure(
+    mocked_wallet_provider, mock_web3, mock_receipt_watcher
+):
     """Test wait_for_transaction_receipt method when receipt retrieval fails."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
     error_message = "Transaction receipt retrieval failed"
 
-    mock_web3.return_value.eth.wait_for_transaction_receipt.side_effect = Exception(error_message)
+    mock_receipt_watcher.wait.side_effect = Exception(error_message)
 
     with pytest.raises(Exception, match=error_message):
         mocked_wallet_provider.wait_for_transaction_receipt(tx_hash)
 
 
-def test_wait_for_transaction_receipt_timeout(mocked_wallet_provider, mock_web3):
+def test_wait_for_transaction_receipt_timeout(
+    mocked_wallet_provider, mock_web3, mock_receipt_watcher
+):
     """Test wait_for_transaction_receipt method when transaction times out."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
 
-    mock_web3.return_value.eth.wait_for_transaction_receipt.side_effect = TimeoutError(
-        "Transaction timeout"
-    )
+    mock_receipt_watcher.wait.side_effect = TimeoutError("Transaction timeout")
 
     with pytest.raises(TimeoutError, match="Transaction timeout"):
         mocked_wallet_provider.wait_for_transaction_receipt(tx_hash)
@@ -37,9 +37,18 @@ MOCK_BALANCE = Decimal(MOCK_ONE_ETH_WEI)
 MOCK_SIGNATURE_BYTES = "123456"
 MOCK_SIGNATURE_HEX = f"0x{MOCK_SIGNATURE_BYTES}"
 
-MOCK_BASE_PRIORITY_FEE_GWEI = 0.1
 MOCK_FEE_MULTIPLIER = 1.5
-MOCK_PRIORITY_FEE_WEI = int(MOCK_ONE_ETH_WEI * MOCK_FEE_MULTIPLIER)
+
+MOCK_NEXT_BASE_FEE_PER_GAS = 12000000000
+MOCK_CHEAP_PRIORITY_FEE = 1000000000
+MOCK_NORMAL_PRIORITY_FEE = 2000000000
+MOCK_FAST_PRIORITY_FEE = 3000000000
+MOCK_FEE_HISTORY = {
+    "oldestBlock": 100,
+    "baseFeePerGas": [MOCK_BASE_FEE_PER_GAS] * 5 + [MOCK_NEXT_BASE_FEE_PER_GAS],
+    "gasUsedRatio": [0.5] * 5,
+    "reward": [[MOCK_CHEAP_PRIORITY_FEE, MOCK_NORMAL_PRIORITY_FEE, MOCK_FAST_PRIORITY_FEE]] * 5,
+}
 
 # =========================================================
 # test fixtures
@@ -62,11 +71,20 @@ def mock_account():
     account.sign_typed_data.return_value = signed_typed_data
 
     signed_tx = Mock(spec=SignedTransaction)
+    signed_tx.hash = bytes.fromhex(MOCK_TX_HASH[2:])
     account.sign_transaction.return_value = signed_tx
 
     return account
 
 
+@pytest.fixture
+def mock_receipt_watcher():
+    """Create a mock receipt watcher that returns a receipt immediately."""
+    watcher = Mock()
+    watcher.wait.return_value = {"transactionHash": bytes.fromhex(MOCK_TX_HASH[2:]), "status": 1}
+    return watcher
+
+
 @pytest.fixture
 def mock_web3():
     """Create a mock Web3 instance."""
@@ -82,14 +100,13 @@ def mock_web3():
 
         mock_block = {"baseFeePerGas": MOCK_BASE_FEE_PER_GAS}
         mock_web3_instance.eth.get_block.return_value = mock_block
+        mock_web3_instance.eth.fee_history.return_value = MOCK_FEE_HISTORY
+        mock_web3_instance.eth.get_block_number.return_value = 100
 
         mock_web3_instance.eth.estimate_gas.return_value = MOCK_GAS_LIMIT
 
         mock_web3_instance.eth.send_transaction.return_value = bytes.fromhex(MOCK_TX_HASH[2:])
 
-        mock_receipt = {"transactionHash": bytes.fromhex(MOCK_TX_HASH[2:])}
-        mock_web3_instance.eth.wait_for_transaction_receipt.return_value = mock_receipt
-
         mock_contract = Mock()
         mock_function = Mock()
         mock_function.call.return_value = "mock_result"
@@ -104,7 +121,7 @@ def mock_web3():
 
 
 @pytest.fixture
-def wallet_provider(mock_account, mock_web3):
+def wallet_provider(mock_account, mock_web3, mock_receipt_watcher):
     """Create a EthAccountWalletProvider instance."""
     mock_chain = Mock()
     mock_chain.rpc_urls = {"default": Mock(http=[MOCK_RPC_URL])}
@@ -129,5 +146,6 @@ def wallet_provider(mock_account, mock_web3):
         )
 
         provider = EthAccountWalletProvider(config)
+        provider._receipt_watcher = mock_receipt_watcher
 
         yield provider
@@ -1,10 +1,13 @@
 """Tests for ETH Account Wallet Provider contract operations."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
-from .conftest import MOCK_ADDRESS_TO
+from coinbase_agentkit.wallet_providers.multicall import MULTICALL3_ADDRESS, CallResult
+from coinbase_agentkit.wallet_providers.read_cache import ReadCache
+
+from .conftest import MOCK_ADDRESS_TO, MOCK_CHAIN_ID
 
 # =========================================================
 # contract tests
@@ -29,6 +32,25 @@ def test_read_contract(wallet_provider, mock_web3):
     mock_web3.return_value.eth.contract.assert_called_once_with(address=contract_address, abi=abi)
 
 
+def test_read_contract_cached_within_block(wallet_provider, mock_web3):
+    """Test that repeated reads at the same head are answered from the read cache."""
+    web3_instance = mock_web3.return_value
+    web3_instance.eth.get_block.return_value = {
+        "number": 100,
+        "hash": b"head",
+        "parentHash": b"parent",
+    }
+    mock_function = Mock()
+    mock_function.call.return_value = 42
+    web3_instance.eth.contract.return_value.functions = {"totalSupply": lambda *a: mock_function}
+    wallet_provider._read_cache = ReadCache(web3_instance, MOCK_CHAIN_ID, max_size=16)
+
+    results = [wallet_provider.read_contract(MOCK_ADDRESS_TO, [], "totalSupply") for _ in range(3)]
+
+    assert results == [42, 42, 42]
+    mock_function.call.assert_called_once_with(block_identifier=100)
+
+
 def test_read_contract_error(wallet_provider, mock_web3):
     """Test read_contract method when contract call fails."""
     contract_address = MOCK_ADDRESS_TO
@@ -85,3 +107,19 @@ def test_read_contract_with_contract_logic_error(wallet_provider, mock_web3):
 
     with pytest.raises(ContractLogicError, match=error_message):
         wallet_provider.read_contract(contract_address, abi, "testFunction")
+
+
+def test_batch_read_contract(wallet_provider, mock_web3):
+    """Test batch_read_contract delegates to Multicall3 on the provider's network."""
+    calls = [(MOCK_ADDRESS_TO, [], "testFunction", [])]
+
+    with patch(
+        "coinbase_agentkit.wallet_providers.eth_account_wallet_provider.batch_read_contract",
+        return_value=[CallResult(success=True, value="mock_result")],
+    ) as mock_batch:
+        results = wallet_provider.batch_read_contract(calls)
+
+    assert results[0].value == "mock_result"
+    mock_batch.assert_called_once_with(
+        mock_web3.return_value, MULTICALL3_ADDRESS, calls, block_identifier="latest"
+    )
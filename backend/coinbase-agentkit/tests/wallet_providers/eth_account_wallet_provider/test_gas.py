@@ -3,9 +3,11 @@
 from unittest.mock import patch
 
 from .conftest import (
-    MOCK_BASE_FEE_PER_GAS,
+    MOCK_ADDRESS,
+    MOCK_FAST_PRIORITY_FEE,
     MOCK_FEE_MULTIPLIER,
-    MOCK_PRIORITY_FEE_WEI,
+    MOCK_NEXT_BASE_FEE_PER_GAS,
+    MOCK_NORMAL_PRIORITY_FEE,
 )
 
 # =========================================================
@@ -19,23 +21,37 @@ def test_estimate_fees(wallet_provider, mock_web3):
         max_priority_fee, max_fee = wallet_provider.estimate_fees()
 
         assert max_fee > max_priority_fee
-        assert max_priority_fee == MOCK_PRIORITY_FEE_WEI
+        assert max_priority_fee == int(MOCK_NORMAL_PRIORITY_FEE * MOCK_FEE_MULTIPLIER)
 
 
 def test_estimate_fees_with_multiplier(wallet_provider, mock_web3):
     """Test estimate_fees method with custom fee multiplier."""
-    mock_web3.return_value.eth.get_block.return_value = {"baseFeePerGas": MOCK_BASE_FEE_PER_GAS}
     custom_fee_multiplier = 2.0
-
-    mock_web3.to_wei.return_value = 100000000
-    expected_priority_fee = int(100000000 * custom_fee_multiplier)
+    expected_priority_fee = int(MOCK_NORMAL_PRIORITY_FEE * custom_fee_multiplier)
 
     with patch.object(wallet_provider, "_fee_per_gas_multiplier", custom_fee_multiplier):
         max_priority_fee, max_fee = wallet_provider.estimate_fees()
 
         assert max_priority_fee == expected_priority_fee
-        assert max_fee > max_priority_fee
-        assert max_fee >= (MOCK_BASE_FEE_PER_GAS * 2) + max_priority_fee
+        assert max_fee == (MOCK_NEXT_BASE_FEE_PER_GAS * 2) + max_priority_fee
+
+        mock_web3.return_value.eth.fee_history.assert_called_once_with(5, "latest", [10, 50, 90])
+        mock_web3.return_value.eth.get_block.assert_not_called()
+
+
+def test_estimate_fees_with_profile(wallet_provider, mock_web3):
+    """Test estimate_fees method with an explicit fee profile."""
+    with patch.object(wallet_provider, "_fee_per_gas_multiplier", 1):
+        max_priority_fee, max_fee = wallet_provider.estimate_fees("fast")
+
+        assert max_priority_fee == MOCK_FAST_PRIORITY_FEE
+        assert max_fee == MOCK_NEXT_BASE_FEE_PER_GAS + MOCK_FAST_PRIORITY_FEE
+
+
+def test_estimate_fees_reused_within_block(wallet_provider, mock_web3):
+    """Test that transactions sent within one block share a single fee history lookup."""
+    for _ in range(3):
+        wallet_provider.send_transaction({"to": MOCK_ADDRESS, "value": 1})
 
-        mock_web3.return_value.eth.get_block.assert_called_once_with("latest")
-        mock_web3.to_wei.assert_called_once_with(0.1, "gwei")
+    mock_web3.return_value.eth.fee_history.assert_called_once()
+    mock_web3.return_value.eth.get_block.assert_not_called()
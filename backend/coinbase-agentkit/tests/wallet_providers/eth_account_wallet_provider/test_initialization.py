@@ -66,6 +66,52 @@ def test_init_with_custom_rpc(mock_account, mock_web3):
     mock_web3.HTTPProvider.assert_called_with(custom_rpc)
 
 
+def test_init_with_multiple_rpc_urls(mock_account, mock_web3):
+    """Test that several RPC URLs are routed through an RpcRouterProvider."""
+    rpc_urls = ["https://rpc-a.example.com", "https://rpc-b.example.com"]
+
+    config = EthAccountWalletProviderConfig(
+        account=mock_account, chain_id=MOCK_CHAIN_ID, rpc_urls=rpc_urls
+    )
+
+    with patch(
+        "coinbase_agentkit.wallet_providers.eth_account_wallet_provider.RpcRouterProvider"
+    ) as mock_router:
+        EthAccountWalletProvider(config)
+
+    mock_router.assert_called_once_with(rpc_urls)
+    assert mock_web3.call_args.args[0].provider is mock_router.return_value
+    mock_web3.HTTPProvider.assert_not_called()
+
+
+def test_default_rpc_uses_a_single_endpoint(mock_account, mock_web3):
+    """Test that routing is not enabled unless RPC URLs are configured."""
+    with (
+        patch(
+            "coinbase_agentkit.wallet_providers.eth_account_wallet_provider.CHAIN_ID_TO_NETWORK_ID",
+            {MOCK_CHAIN_ID: MOCK_NETWORK_ID},
+        ),
+        patch(
+            "coinbase_agentkit.wallet_providers.eth_account_wallet_provider.NETWORK_ID_TO_CHAIN",
+            {
+                MOCK_NETWORK_ID: Mock(
+                    rpc_urls={"default": Mock(http=[MOCK_RPC_URL, "https://other.example.com"])},
+                    id=MOCK_CHAIN_ID,
+                )
+            },
+        ),
+        patch(
+            "coinbase_agentkit.wallet_providers.eth_account_wallet_provider.RpcRouterProvider"
+        ) as mock_router,
+    ):
+        EthAccountWalletProvider(
+            EthAccountWalletProviderConfig(account=mock_account, chain_id=MOCK_CHAIN_ID)
+        )
+
+    mock_router.assert_not_called()
+    mock_web3.HTTPProvider.assert_called_with(MOCK_RPC_URL)
+
+
 def test_init_with_gas_config(mock_account, mock_web3):
     """Test initialization with gas configuration."""
     with (
@@ -5,7 +5,15 @@ from unittest.mock import patch
 
 import pytest
 
-from .conftest import MOCK_ADDRESS, MOCK_ADDRESS_TO, MOCK_ONE_ETH_WEI, MOCK_TX_HASH
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import TransactionFailedError
+
+from .conftest import (
+    MOCK_ADDRESS,
+    MOCK_ADDRESS_TO,
+    MOCK_GAS_LIMIT,
+    MOCK_ONE_ETH_WEI,
+    MOCK_TX_HASH,
+)
 
 # =========================================================
 # transaction tests
@@ -66,19 +74,19 @@ def test_send_transaction_timeout(wallet_provider, mock_web3):
         wallet_provider.send_transaction(transaction)
 
 
-def test_wait_for_transaction_receipt(wallet_provider, mock_web3):
+def test_wait_for_transaction_receipt(wallet_provider, mock_web3, mock_receipt_watcher):
     """Test wait_for_transaction_receipt method."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
 
     receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
 
-    assert receipt == {"transactionHash": bytes.fromhex(MOCK_TX_HASH[2:])}
-    mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
-        tx_hash, timeout=120, poll_latency=0.1
-    )
+    assert receipt == mock_receipt_watcher.wait.return_value
+    mock_receipt_watcher.wait.assert_called_once_with(tx_hash, timeout=120)
 
 
-def test_wait_for_transaction_receipt_custom_timeout(wallet_provider, mock_web3):
+def test_wait_for_transaction_receipt_custom_timeout(
+    wallet_provider, mock_web3, mock_receipt_watcher
+):
     """Test wait_for_transaction_receipt method with custom timeout."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
     custom_timeout = 300
@@ -88,19 +96,15 @@ def test_wait_for_transaction_receipt_custom_timeout(wallet_provider, mock_web3)
         tx_hash, timeout=custom_timeout, poll_latency=custom_poll_latency
     )
 
-    assert receipt == {"transactionHash": bytes.fromhex(MOCK_TX_HASH[2:])}
-    mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
-        tx_hash, timeout=custom_timeout, poll_latency=custom_poll_latency
-    )
+    assert receipt == mock_receipt_watcher.wait.return_value
+    mock_receipt_watcher.wait.assert_called_once_with(tx_hash, timeout=custom_timeout)
 
 
-def test_wait_for_transaction_receipt_timeout(wallet_provider, mock_web3):
+def test_wait_for_transaction_receipt_timeout(wallet_provider, mock_web3, mock_receipt_watcher):
     """Test wait_for_transaction_receipt method when timeout occurs."""
     tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
 
-    mock_web3.return_value.eth.wait_for_transaction_receipt.side_effect = Exception(
-        "Transaction timeout"
-    )
+    mock_receipt_watcher.wait.side_effect = Exception("Transaction timeout")
 
     with pytest.raises(Exception, match="Transaction timeout"):
         wallet_provider.wait_for_transaction_receipt(tx_hash)
@@ -169,3 +173,125 @@ def test_native_transfer_with_invalid_address(wallet_provider, mock_web3):
 
     with pytest.raises(Exception, match="Failed to transfer native tokens: Invalid address format"):
         wallet_provider.native_transfer(invalid_address, Decimal("1.0"))
+
+
+def test_send_transaction_tracks_nonce_locally(wallet_provider, mock_web3):
+    """Test that consecutive sends use local nonces without re-reading the node."""
+    for _ in range(3):
+        wallet_provider.send_transaction({"to": MOCK_ADDRESS, "value": MOCK_ONE_ETH_WEI})
+
+    sent_nonces = [
+        call.args[0]["nonce"] for call in mock_web3.return_value.eth.send_transaction.call_args_list
+    ]
+    assert sent_nonces == [1, 2, 3]
+    mock_web3.return_value.eth.get_transaction_count.assert_called_once_with(
+        MOCK_ADDRESS, "pending"
+    )
+
+
+def test_send_transaction_resyncs_on_nonce_too_low(wallet_provider, mock_web3):
+    """Test that a stale nonce is resynced from the node and the send retried."""
+    mock_web3.return_value.eth.send_transaction.side_effect = [
+        ValueError("nonce too low"),
+        bytes.fromhex(MOCK_TX_HASH[2:]),
+    ]
+    mock_web3.return_value.eth.get_transaction_count.side_effect = [1, 4]
+
+    tx_hash = wallet_provider.send_transaction({"to": MOCK_ADDRESS, "value": MOCK_ONE_ETH_WEI})
+
+    assert tx_hash == MOCK_TX_HASH
+    retried = mock_web3.return_value.eth.send_transaction.call_args_list[1].args[0]
+    assert retried["nonce"] == 4
+
+
+def test_send_transaction_already_known_is_not_resent(wallet_provider, mock_web3, mock_account):
+    """Test that a transaction the node already has is not sent again under a new nonce."""
+    mock_web3.return_value.eth.send_transaction.side_effect = ValueError("already known")
+
+    tx_hash = wallet_provider.send_transaction({"to": MOCK_ADDRESS, "value": MOCK_ONE_ETH_WEI})
+
+    assert tx_hash == MOCK_TX_HASH
+    mock_web3.return_value.eth.send_transaction.assert_called_once()
+    assert mock_account.sign_transaction.call_args.args[0]["nonce"] == 1
+    mock_web3.return_value.eth.get_transaction_count.assert_called_once()
+
+
+def test_send_transaction_failure_releases_nonce(wallet_provider, mock_web3):
+    """Test that a nonce is reused after a send that was never broadcast."""
+    mock_web3.return_value.eth.send_transaction.side_effect = [
+        Exception("Transaction failed"),
+        bytes.fromhex(MOCK_TX_HASH[2:]),
+    ]
+
+    with pytest.raises(Exception, match="Transaction failed"):
+        wallet_provider.send_transaction({"to": MOCK_ADDRESS, "value": MOCK_ONE_ETH_WEI})
+    wallet_provider.send_transaction({"to": MOCK_ADDRESS, "value": MOCK_ONE_ETH_WEI})
+
+    sent_nonces = [
+        call.args[0]["nonce"] for call in mock_web3.return_value.eth.send_transaction.call_args_list
+    ]
+    assert sent_nonces == [1, 1]
+
+
+def test_send_transaction_keeps_provided_nonce_and_gas(wallet_provider, mock_web3):
+    """Test that a caller supplied nonce and gas limit are used as is."""
+    wallet_provider.send_transaction(
+        {"to": MOCK_ADDRESS, "value": MOCK_ONE_ETH_WEI, "nonce": 42, "gas": 50000}
+    )
+
+    sent = mock_web3.return_value.eth.send_transaction.call_args.args[0]
+    assert sent["nonce"] == 42
+    assert sent["gas"] == 50000
+    mock_web3.return_value.eth.estimate_gas.assert_not_called()
+    mock_web3.return_value.eth.get_transaction_count.assert_not_called()
+
+
+def test_send_transactions_pipelines(wallet_provider, mock_web3, mock_receipt_watcher):
+    """Test that dependent transactions are sent back to back without waiting."""
+    hashes = wallet_provider.send_transactions(
+        [{"to": MOCK_ADDRESS, "data": "0x01"}, {"to": MOCK_ADDRESS, "data": "0x02"}]
+    )
+
+    assert hashes == [MOCK_TX_HASH, MOCK_TX_HASH]
+    sent_nonces = [
+        call.args[0]["nonce"] for call in mock_web3.return_value.eth.send_transaction.call_args_list
+    ]
+    assert sent_nonces == [1, 2]
+    mock_receipt_watcher.wait.assert_not_called()
+
+
+def test_send_transactions_waits_when_gas_cannot_be_estimated(
+    wallet_provider, mock_web3, mock_receipt_watcher
+):
+    """Test that a transaction depending on an unmined one waits for its receipt."""
+    mock_web3.return_value.eth.estimate_gas.side_effect = [
+        MOCK_GAS_LIMIT,
+        Exception("execution reverted: insufficient allowance"),
+        MOCK_GAS_LIMIT,
+    ]
+
+    wallet_provider.send_transactions(
+        [{"to": MOCK_ADDRESS, "data": "0x01"}, {"to": MOCK_ADDRESS, "data": "0x02"}]
+    )
+
+    mock_receipt_watcher.wait.assert_called_once_with(MOCK_TX_HASH, timeout=120)
+    assert mock_web3.return_value.eth.send_transaction.call_count == 2
+
+
+def test_send_transactions_stops_after_failed_transaction(
+    wallet_provider, mock_web3, mock_receipt_watcher
+):
+    """Test that transactions depending on a failed one are not sent."""
+    mock_web3.return_value.eth.estimate_gas.side_effect = [
+        MOCK_GAS_LIMIT,
+        Exception("execution reverted: insufficient allowance"),
+    ]
+    mock_receipt_watcher.wait.return_value = {"status": 0}
+
+    with pytest.raises(TransactionFailedError) as error:
+        wallet_provider.send_transactions(
+            [{"to": MOCK_ADDRESS, "data": "0x01"}, {"to": MOCK_ADDRESS, "data": "0x02"}]
+        )
+
+    assert error.value.tx_hash == MOCK_TX_HASH
+    mock_web3.return_value.eth.send_transaction.assert_called_once()
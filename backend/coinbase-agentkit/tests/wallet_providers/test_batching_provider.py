@@ -0,0 +1,208 @@
+"""Tests for the JSON-RPC batching provider."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.wallet_providers.batching_provider import BatchingProvider
+
+ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def _response(result, request_id=1):
+    """Create a successful JSON-RPC response."""
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _answer(method, params):
+    """Answer a request with a result derived from its method and parameters."""
+    return _response(f"{method}:{','.join(map(str, params))}")
+
+
+@pytest.fixture
+def inner():
+    """Create a mock provider that answers single and batch requests."""
+    inner = Mock()
+    inner.make_request.side_effect = _answer
+    inner.make_batch_request.side_effect = lambda requests: [
+        {**_answer(method, params), "id": i} for i, (method, params) in enumerate(requests)
+    ]
+    return inner
+
+
+@pytest.fixture
+def provider(inner):
+    """Create a batching provider over the mock provider."""
+    provider = BatchingProvider(inner, window=0.05)
+    yield provider
+    provider.close()
+
+
+def _request_in_thread(provider, method, params, results):
+    """Make a request on a separate thread, storing the response by method."""
+    thread = threading.Thread(
+        target=lambda: results.__setitem__(method, provider.make_request(method, params))
+    )
+    thread.start()
+    return thread
+
+
+def test_concurrent_requests_share_one_batch(provider, inner):
+    """Test that requests made while another is in flight are sent as one batch."""
+    sent, release = threading.Event(), threading.Event()
+
+    def _slow_answer(method, params):
+        sent.set()
+        release.wait(timeout=5)
+        return _answer(method, params)
+
+    inner.make_request.side_effect = _slow_answer
+    results = {}
+    first = _request_in_thread(provider, "eth_blockNumber", [], results)
+    assert sent.wait(timeout=5)
+
+    threads = [
+        _request_in_thread(provider, method, [ADDRESS], results)
+        for method in ("eth_getBalance", "eth_getTransactionCount", "eth_getCode")
+    ]
+    for thread in threads:
+        thread.join(timeout=5)
+    release.set()
+    first.join(timeout=5)
+
+    inner.make_request.assert_called_once_with("eth_blockNumber", [])
+    inner.make_batch_request.assert_called_once()
+    assert len(inner.make_batch_request.call_args.args[0]) == 3
+    assert results["eth_getBalance"]["result"] == f"eth_getBalance:{ADDRESS}"
+    assert results["eth_getCode"]["result"] == f"eth_getCode:{ADDRESS}"
+    assert results["eth_blockNumber"]["result"] == "eth_blockNumber:"
+
+
+def test_request_with_nothing_in_flight_does_not_wait(inner):
+    """Test that a request made while the provider is idle skips the batch window."""
+    provider = BatchingProvider(inner, window=5)
+
+    start = time.monotonic()
+    provider.make_request("eth_chainId", [])
+
+    assert time.monotonic() - start < 1
+    inner.make_request.assert_called_once_with("eth_chainId", [])
+
+
+def test_single_request_is_not_wrapped_in_batch(provider, inner):
+    """Test that a request with no company is sent on its own."""
+    response = provider.make_request("eth_chainId", [])
+
+    assert response["result"] == "eth_chainId:"
+    inner.make_batch_request.assert_not_called()
+
+
+def test_zero_window_sends_straight_through(inner):
+    """Test that a zero window disables batching outside explicit batches."""
+    provider = BatchingProvider(inner, window=0)
+
+    provider.make_request("eth_blockNumber", [])
+
+    inner.make_request.assert_called_once_with("eth_blockNumber", [])
+
+
+def test_explicit_batch_sends_one_request(provider, inner):
+    """Test that calls in a batch block have their requests sent together."""
+    with provider.batch() as batch:
+        balance = batch.call(provider.make_request, "eth_getBalance", [ADDRESS, "latest"])
+        nonce = batch.call(provider.make_request, "eth_getTransactionCount", [ADDRESS, "pending"])
+        block = batch.call(provider.make_request, "eth_blockNumber", [])
+
+    assert balance.result()["result"] == f"eth_getBalance:{ADDRESS},latest"
+    assert nonce.result()["result"] == f"eth_getTransactionCount:{ADDRESS},pending"
+    assert block.result()["result"] == "eth_blockNumber:"
+    inner.make_batch_request.assert_called_once()
+    inner.make_request.assert_not_called()
+
+
+def test_explicit_batch_sends_dependent_requests_in_rounds(provider, inner):
+    """Test that requests made after a response is received form the next round."""
+
+    def _two_requests(method):
+        provider.make_request(method, ["first"])
+        return provider.make_request(method, ["second"])
+
+    with provider.batch() as batch:
+        futures = [batch.call(_two_requests, method) for method in ("eth_a", "eth_b")]
+
+    assert [f.result()["result"] for f in futures] == ["eth_a:second", "eth_b:second"]
+    assert inner.make_batch_request.call_count == 2
+
+
+def test_explicit_batch_propagates_call_errors(provider, inner):
+    """Test that an exception raised by a call is delivered through its future."""
+
+    def _fail():
+        raise ValueError("bad call")
+
+    with provider.batch() as batch:
+        failing = batch.call(_fail)
+        working = batch.call(provider.make_request, "eth_chainId", [])
+
+    with pytest.raises(ValueError, match="bad call"):
+        failing.result()
+    assert working.result()["result"] == "eth_chainId:"
+
+
+def test_call_after_batch_is_sent_raises(provider):
+    """Test that a batch cannot be reused once it has been sent."""
+    with provider.batch() as batch:
+        pass
+
+    with pytest.raises(RuntimeError, match="already been sent"):
+        batch.call(provider.make_request, "eth_chainId", [])
+
+
+def test_rejected_batch_falls_back_to_single_requests(provider, inner):
+    """Test that requests are sent one by one when the node rejects the batch."""
+    inner.make_batch_request.side_effect = None
+    inner.make_batch_request.return_value = {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "batch requests are not supported"},
+    }
+
+    with provider.batch() as batch:
+        futures = [batch.call(provider.make_request, m, []) for m in ("eth_a", "eth_b")]
+
+    assert [f.result()["result"] for f in futures] == ["eth_a:", "eth_b:"]
+    assert inner.make_request.call_count == 2
+
+
+def test_transport_error_reaches_every_caller(provider, inner):
+    """Test that a failed batch POST raises in every call that was part of it."""
+    inner.make_batch_request.side_effect = ConnectionError("reset")
+
+    with provider.batch() as batch:
+        futures = [batch.call(provider.make_request, m, []) for m in ("eth_a", "eth_b")]
+
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result()
+
+
+def test_works_as_web3_provider(inner):
+    """Test that Web3 methods called in a batch are answered and formatted."""
+    results = {"eth_getBalance": hex(10**18), "eth_getTransactionCount": hex(7)}
+    inner.make_batch_request.side_effect = lambda requests: [
+        _response(results[method], i) for i, (method, _) in enumerate(requests)
+    ]
+    provider = BatchingProvider(inner)
+    web3 = Web3(provider)
+
+    with provider.batch() as batch:
+        balance = batch.call(web3.eth.get_balance, ADDRESS)
+        nonce = batch.call(web3.eth.get_transaction_count, ADDRESS, "pending")
+
+    assert balance.result() == 10**18
+    assert nonce.result() == 7
+    inner.make_batch_request.assert_called_once()
+    provider.close()
@@ -0,0 +1,190 @@
+"""Tests for the background CDP client runtime."""
+
+import asyncio
+import gc
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+import pytest
+
+from coinbase_agentkit.wallet_providers.cdp_client_runtime import (
+    CdpClientRuntime,
+    is_connection_error,
+)
+
+
+def _make_client():
+    """Create a mock CdpClient with an awaitable close."""
+    client = Mock()
+    client.close = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def client_factory():
+    """Create a factory that builds a new mock client on every call."""
+    return Mock(side_effect=lambda: _make_client())
+
+
+@pytest.fixture
+def runtime(client_factory):
+    """Create a runtime and close it after the test."""
+    runtime = CdpClientRuntime(client_factory, timeout=5)
+    yield runtime
+    runtime.close()
+
+
+def test_client_is_reused_across_calls(runtime, client_factory):
+    """Test that every call shares one client and one loop thread."""
+    seen = []
+
+    async def _operation(cdp):
+        seen.append((cdp, threading.current_thread().name))
+        return len(seen)
+
+    assert runtime.run_with_client(_operation) == 1
+    assert runtime.run_with_client(_operation) == 2
+
+    assert client_factory.call_count == 1
+    assert seen[0] == seen[1]
+    assert seen[0][1] == "cdp-client-runtime"
+
+
+def test_run_from_running_event_loop(runtime):
+    """Test that run can be called from a thread that already runs an event loop."""
+
+    async def _value():
+        return 42
+
+    async def _caller():
+        return runtime.run(_value())
+
+    assert asyncio.run(_caller()) == 42
+
+
+def test_connection_error_discards_client(runtime, client_factory):
+    """Test that a broken connection closes the client and the next call reconnects."""
+    clients = []
+
+    async def _broken(cdp):
+        clients.append(cdp)
+        raise aiohttp.ClientConnectionError("connection reset")
+
+    async def _healthy(cdp):
+        clients.append(cdp)
+        return "ok"
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        runtime.run_with_client(_broken)
+
+    assert runtime.run_with_client(_healthy) == "ok"
+    assert client_factory.call_count == 2
+    assert clients[0] is not clients[1]
+    clients[0].close.assert_awaited_once()
+
+
+def test_other_errors_keep_client(runtime, client_factory):
+    """Test that API errors propagate without dropping the client."""
+
+    async def _failing(cdp):
+        raise ValueError("bad request")
+
+    async def _healthy(cdp):
+        return "ok"
+
+    with pytest.raises(ValueError, match="bad request"):
+        runtime.run_with_client(_failing)
+
+    assert runtime.run_with_client(_healthy) == "ok"
+    assert client_factory.call_count == 1
+
+
+def test_timeout_error_from_call_is_not_rewritten(runtime):
+    """Test that a TimeoutError raised by the call itself propagates unchanged."""
+
+    async def _timed_out(cdp):
+        raise TimeoutError("Transaction timed out")
+
+    with pytest.raises(TimeoutError, match="Transaction timed out"):
+        runtime.run_with_client(_timed_out)
+
+
+def test_call_exceeding_timeout(client_factory):
+    """Test that a call that does not finish in time raises TimeoutError."""
+    runtime = CdpClientRuntime(client_factory, timeout=0.05)
+
+    async def _slow(cdp):
+        await asyncio.sleep(1)
+
+    try:
+        with pytest.raises(TimeoutError, match="did not complete within"):
+            runtime.run_with_client(_slow)
+    finally:
+        runtime.close()
+
+
+def test_close_stops_thread_and_closes_client(client_factory):
+    """Test that close closes the client, stops the loop thread and rejects later calls."""
+    runtime = CdpClientRuntime(client_factory)
+
+    async def _operation(cdp):
+        return cdp
+
+    client = runtime.run_with_client(_operation)
+    thread = runtime._thread
+
+    runtime.close()
+
+    client.close.assert_awaited_once()
+    assert not thread.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        runtime.run_with_client(_operation)
+
+
+def test_close_without_use_is_noop(client_factory):
+    """Test that closing an unused runtime does not start a thread or a client."""
+    runtime = CdpClientRuntime(client_factory)
+
+    runtime.close()
+    runtime.close()
+
+    assert runtime._thread is None
+    client_factory.assert_not_called()
+
+
+class _Owner:
+    """Stand-in for a wallet provider whose runtime's client factory refers back to it."""
+
+    def __init__(self):
+        self.runtime = CdpClientRuntime(lambda: self.make_client())
+
+    def make_client(self):
+        """Create a mock client."""
+        return _make_client()
+
+
+def test_unreferenced_runtime_is_shut_down():
+    """Test that a runtime and its owner are collected, stopping the thread and the client."""
+    owner = _Owner()
+
+    async def _operation(cdp):
+        return cdp
+
+    client = owner.runtime.run_with_client(_operation)
+    thread = owner.runtime._thread
+
+    del owner
+    gc.collect()
+    thread.join(timeout=5)
+
+    client.close.assert_awaited_once()
+    assert not thread.is_alive()
+
+
+def test_is_connection_error():
+    """Test classification of errors that require a new client."""
+    assert is_connection_error(aiohttp.ClientConnectionError())
+    assert is_connection_error(RuntimeError("Session is closed"))
+    assert not is_connection_error(RuntimeError("something else"))
+    assert not is_connection_error(ValueError("closed"))
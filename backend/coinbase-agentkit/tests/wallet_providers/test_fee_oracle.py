@@ -0,0 +1,98 @@
+"""Tests for the eth_feeHistory based fee oracle."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.fee_oracle import AsyncFeeOracle, FeeOracle
+
+MOCK_FEE_HISTORY = {
+    "oldestBlock": 100,
+    "baseFeePerGas": [100, 110, 120, 130],
+    "gasUsedRatio": [0.5, 0.6, 0.7],
+    "reward": [[1, 10, 100], [2, 20, 200], [3, 30, 300]],
+}
+
+
+@pytest.fixture
+def mock_web3():
+    """Create a mock Web3 instance returning a fixed fee history."""
+    web3 = Mock()
+    web3.eth.fee_history.return_value = MOCK_FEE_HISTORY
+    web3.eth.get_block_number.return_value = 102
+    return web3
+
+
+def test_get_fees_profiles(mock_web3):
+    """Test that each profile uses the median of its reward percentile."""
+    oracle = FeeOracle(mock_web3, min_priority_fee_per_gas=0)
+
+    assert oracle.get_fees("cheap") == (130, 2)
+    assert oracle.get_fees("normal") == (130, 20)
+    assert oracle.get_fees("fast") == (130, 200)
+    mock_web3.eth.fee_history.assert_called_once_with(5, "latest", [10, 50, 90])
+
+
+def test_get_snapshot_block_number(mock_web3):
+    """Test that the snapshot records the newest sampled block."""
+    assert FeeOracle(mock_web3).get_snapshot().block_number == 102
+
+
+def test_min_priority_fee(mock_web3):
+    """Test that priority fees are floored at the configured minimum."""
+    oracle = FeeOracle(mock_web3, min_priority_fee_per_gas=50)
+
+    assert oracle.get_fees("cheap") == (130, 50)
+    assert oracle.get_fees("fast") == (130, 200)
+
+
+def test_empty_rewards_use_minimum(mock_web3):
+    """Test that blocks without rewards fall back to the minimum priority fee."""
+    mock_web3.eth.fee_history.return_value = {**MOCK_FEE_HISTORY, "reward": []}
+
+    assert FeeOracle(mock_web3, min_priority_fee_per_gas=7).get_fees() == (130, 7)
+
+
+def test_refreshes_on_new_block(mock_web3):
+    """Test that fee history is fetched again once a new block is produced."""
+    oracle = FeeOracle(mock_web3)
+
+    oracle.get_fees()
+    oracle.get_fees("fast")
+    assert mock_web3.eth.fee_history.call_count == 1
+    assert mock_web3.eth.get_block_number.call_count == 2
+
+    mock_web3.eth.get_block_number.return_value = 103
+    oracle.get_fees()
+    assert mock_web3.eth.fee_history.call_count == 2
+
+
+def test_invalidate(mock_web3):
+    """Test that invalidate forces a refresh."""
+    oracle = FeeOracle(mock_web3)
+    oracle.get_fees()
+    oracle.invalidate()
+    oracle.get_fees()
+
+    assert mock_web3.eth.fee_history.call_count == 2
+
+
+def test_unsupported_profile(mock_web3):
+    """Test that an unknown profile raises."""
+    with pytest.raises(ValueError, match="Unsupported fee profile"):
+        FeeOracle(mock_web3).get_fees("instant")
+
+
+def test_async_fee_oracle_single_refresh():
+    """Test that concurrent async lookups share a single eth_feeHistory call."""
+    web3 = Mock()
+    web3.eth.fee_history = AsyncMock(return_value=MOCK_FEE_HISTORY)
+    web3.eth.get_block_number = AsyncMock(return_value=102)
+    oracle = AsyncFeeOracle(web3, min_priority_fee_per_gas=0)
+
+    async def get_many():
+        return await asyncio.gather(*(oracle.get_fees("fast") for _ in range(5)))
+
+    assert asyncio.run(get_many()) == [(130, 200)] * 5
+    web3.eth.fee_history.assert_awaited_once_with(5, "latest", [10, 50, 90])
@@ -0,0 +1,194 @@
+"""Tests for the Multicall3 batch read helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from web3 import AsyncWeb3, Web3
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.multicall import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    ContractCall,
+    async_batch_read_contract,
+    batch_read_contract,
+    get_multicall_address,
+)
+
+MOCK_TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_ACCOUNT = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+
+def _encode_aggregate3_result(web3: Web3, results: list[tuple[bool, bytes]]) -> bytes:
+    """Encode an aggregate3 return value."""
+    return web3.codec.encode(["(bool,bytes)[]"], [results])
+
+
+def _decode_aggregate3_calls(web3: Web3, calldata: str) -> list[dict]:
+    """Decode the calls passed to aggregate3."""
+    multicall = web3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+    _, params = multicall.decode_function_input(calldata)
+    return params["calls"]
+
+
+@pytest.fixture
+def web3():
+    """Create an offline Web3 instance."""
+    return Web3()
+
+
+def test_batch_read_contract_decodes_results(web3):
+    """Test that results are decoded in order in a single eth_call."""
+    response = _encode_aggregate3_result(
+        web3,
+        [
+            (True, web3.codec.encode(["uint8"], [6])),
+            (True, web3.codec.encode(["string"], ["USDC"])),
+            (True, web3.codec.encode(["uint256"], [1234])),
+        ],
+    )
+
+    with patch.object(web3.eth, "call", return_value=response) as mock_call:
+        results = batch_read_contract(
+            web3,
+            MULTICALL3_ADDRESS,
+            [
+                ContractCall(MOCK_TOKEN, ERC20_ABI, "decimals"),
+                (MOCK_TOKEN, ERC20_ABI, "symbol"),
+                (MOCK_TOKEN, ERC20_ABI, "balanceOf", [MOCK_ACCOUNT]),
+            ],
+        )
+
+    assert [result.value for result in results] == [6, "USDC", 1234]
+    assert all(result.success for result in results)
+    mock_call.assert_called_once()
+
+    calls = _decode_aggregate3_calls(web3, mock_call.call_args.args[0]["data"])
+    assert len(calls) == 3
+    assert calls[0]["target"] == MOCK_TOKEN
+    assert calls[0]["allowFailure"] is True
+
+
+def test_batch_read_contract_tolerates_failures(web3):
+    """Test that a reverted call is reported without failing the batch."""
+    revert_data = bytes.fromhex("08c379a0") + web3.codec.encode(["string"], ["not allowed"])
+    response = _encode_aggregate3_result(
+        web3,
+        [
+            (False, revert_data),
+            (True, web3.codec.encode(["uint8"], [18])),
+        ],
+    )
+
+    with patch.object(web3.eth, "call", return_value=response):
+        results = batch_read_contract(
+            web3,
+            MULTICALL3_ADDRESS,
+            [
+                ContractCall(MOCK_TOKEN, ERC20_ABI, "symbol"),
+                ContractCall(MOCK_TOKEN, ERC20_ABI, "decimals"),
+            ],
+        )
+
+    assert results[0].success is False
+    assert results[0].error == "execution reverted: not allowed"
+    assert results[1].success is True
+    assert results[1].value == 18
+
+
+def test_batch_read_contract_reports_undecodable_data(web3):
+    """Test that return data that cannot be decoded is reported as a failure."""
+    response = _encode_aggregate3_result(web3, [(True, b"")])
+
+    with patch.object(web3.eth, "call", return_value=response):
+        results = batch_read_contract(
+            web3, MULTICALL3_ADDRESS, [ContractCall(MOCK_TOKEN, ERC20_ABI, "decimals")]
+        )
+
+    assert results[0].success is False
+    assert "Could not decode" in results[0].error
+
+
+def test_batch_read_contract_chunks_by_calldata_size(web3):
+    """Test that calls are split across aggregate3 calls pinned to one block."""
+    balance = web3.codec.encode(["uint256"], [1])
+
+    def fake_call(transaction, block_identifier=None, **kwargs):
+        calls = _decode_aggregate3_calls(web3, transaction["data"])
+        return _encode_aggregate3_result(web3, [(True, balance)] * len(calls))
+
+    calls = [ContractCall(MOCK_TOKEN, ERC20_ABI, "balanceOf", [MOCK_ACCOUNT]) for _ in range(5)]
+
+    with (
+        patch.object(web3.eth, "call", side_effect=fake_call) as mock_call,
+        patch.object(web3.eth, "get_block_number", return_value=100),
+    ):
+        results = batch_read_contract(web3, MULTICALL3_ADDRESS, calls, max_calldata_bytes=72)
+
+    assert len(results) == 5
+    assert all(result.value == 1 for result in results)
+    assert mock_call.call_count == 3
+    for call in mock_call.call_args_list:
+        assert call.kwargs["block_identifier"] == 100
+
+
+def test_batch_read_contract_raises_for_required_call(web3):
+    """Test that a failed call with allow_failure=False raises."""
+    response = _encode_aggregate3_result(web3, [(True, b"")])
+
+    with (
+        patch.object(web3.eth, "call", return_value=response),
+        pytest.raises(Exception, match="Call to decimals"),
+    ):
+        batch_read_contract(
+            web3,
+            MULTICALL3_ADDRESS,
+            [ContractCall(MOCK_TOKEN, ERC20_ABI, "decimals", allow_failure=False)],
+        )
+
+
+def test_batch_read_contract_empty(web3):
+    """Test that an empty batch makes no calls."""
+    with patch.object(web3.eth, "call") as mock_call:
+        assert batch_read_contract(web3, MULTICALL3_ADDRESS, []) == []
+    mock_call.assert_not_called()
+
+
+def test_async_batch_read_contract(web3):
+    """Test that the async variant decodes results and pins chunks to one block."""
+    async_web3 = AsyncWeb3()
+    balance = web3.codec.encode(["uint256"], [7])
+
+    async def fake_call(transaction, block_identifier=None, **kwargs):
+        calls = _decode_aggregate3_calls(web3, transaction["data"])
+        return _encode_aggregate3_result(web3, [(True, balance)] * len(calls))
+
+    calls = [ContractCall(MOCK_TOKEN, ERC20_ABI, "balanceOf", [MOCK_ACCOUNT]) for _ in range(3)]
+
+    with (
+        patch.object(async_web3.eth, "call", side_effect=fake_call) as mock_call,
+        patch.object(async_web3.eth, "get_block_number", AsyncMock(return_value=100)),
+    ):
+        results = asyncio.run(
+            async_batch_read_contract(async_web3, MULTICALL3_ADDRESS, calls, max_calldata_bytes=72)
+        )
+
+    assert [result.value for result in results] == [7, 7, 7]
+    assert mock_call.call_count == 2
+    for call in mock_call.call_args_list:
+        assert call.kwargs["block_identifier"] == 100
+
+
+def test_get_multicall_address():
+    """Test that the Multicall3 address is resolved from the chain definitions."""
+    assert get_multicall_address(Network(protocol_family="evm", network_id="base-mainnet")) == (
+        MULTICALL3_ADDRESS
+    )
+    assert get_multicall_address(Network(protocol_family="evm", chain_id="84532")) == (
+        MULTICALL3_ADDRESS
+    )
+    assert get_multicall_address(Network(protocol_family="evm", chain_id="999999")) == (
+        MULTICALL3_ADDRESS
+    )
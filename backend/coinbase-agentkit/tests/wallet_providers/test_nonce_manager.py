@@ -0,0 +1,162 @@
+"""Tests for the local nonce manager."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.nonce_manager import (
+    AsyncNonceManager,
+    NonceManager,
+    is_already_known_error,
+    is_nonce_error,
+)
+
+MOCK_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+
+@pytest.fixture
+def mock_web3():
+    """Create a mock Web3 instance with a pending nonce of 5."""
+    web3 = Mock()
+    web3.eth.get_transaction_count.return_value = 5
+    return web3
+
+
+def test_reserve_fetches_pending_nonce_once(mock_web3):
+    """Test that nonces are handed out locally after the first fetch."""
+    manager = NonceManager(mock_web3, MOCK_ADDRESS)
+
+    assert [manager.reserve() for _ in range(3)] == [5, 6, 7]
+    mock_web3.eth.get_transaction_count.assert_called_once_with(MOCK_ADDRESS, "pending")
+
+
+def test_reserve_multiple(mock_web3):
+    """Test reserving a range of consecutive nonces."""
+    manager = NonceManager(mock_web3, MOCK_ADDRESS)
+
+    assert manager.reserve(3) == 5
+    assert manager.reserve() == 8
+
+
+def test_release_last_nonce_reuses_it(mock_web3):
+    """Test that releasing the most recent nonce hands it out again."""
+    manager = NonceManager(mock_web3, MOCK_ADDRESS)
+
+    nonce = manager.reserve()
+    manager.release(nonce)
+
+    assert manager.reserve() == nonce
+    mock_web3.eth.get_transaction_count.assert_called_once()
+
+
+def test_release_with_gap_fills_it(mock_web3):
+    """Test that a nonce released behind later reservations is reused without a resync."""
+    manager = NonceManager(mock_web3, MOCK_ADDRESS)
+
+    first = manager.reserve()
+    manager.reserve()
+    manager.release(first)
+
+    assert manager.reserve() == 5
+    assert manager.reserve() == 7
+    mock_web3.eth.get_transaction_count.assert_called_once()
+
+
+def test_release_collapses_released_top(mock_web3):
+    """Test that releasing every outstanding nonce hands them out again in order."""
+    manager = NonceManager(mock_web3, MOCK_ADDRESS)
+
+    nonces = [manager.reserve() for _ in range(3)]
+    manager.release(nonces[1])
+    manager.release(nonces[2])
+    manager.release(nonces[0])
+
+    assert manager.reserve(3) == 5
+    assert manager.reserve() == 8
+
+
+def test_async_release_with_gap_fills_it():
+    """Test that the async manager also reuses a released nonce behind later ones."""
+    web3 = Mock()
+    web3.eth.get_transaction_count = AsyncMock(return_value=5)
+    manager = AsyncNonceManager(web3, MOCK_ADDRESS)
+
+    async def reserve_release_reserve():
+        first = await manager.reserve()
+        await manager.reserve()
+        manager.release(first)
+        return [await manager.reserve(), await manager.reserve()]
+
+    assert asyncio.run(reserve_release_reserve()) == [5, 7]
+    web3.eth.get_transaction_count.assert_awaited_once()
+
+
+def test_reset_resyncs(mock_web3):
+    """Test that reset makes the next reservation read the node."""
+    manager = NonceManager(mock_web3, MOCK_ADDRESS)
+    manager.reserve()
+
+    mock_web3.eth.get_transaction_count.return_value = 9
+    manager.reset()
+
+    assert manager.reserve() == 9
+
+
+def test_concurrent_reservations_are_unique(mock_web3):
+    """Test that concurrent senders never receive the same nonce."""
+    manager = NonceManager(mock_web3, MOCK_ADDRESS)
+    nonces = []
+
+    def reserve_many():
+        for _ in range(100):
+            nonces.append(manager.reserve())
+
+    threads = [threading.Thread(target=reserve_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(nonces) == list(range(5, 805))
+
+
+def test_async_concurrent_reservations_are_unique():
+    """Test that concurrent async reservations share one fetch and never collide."""
+    web3 = Mock()
+    web3.eth.get_transaction_count = AsyncMock(return_value=5)
+    manager = AsyncNonceManager(web3, MOCK_ADDRESS)
+
+    async def reserve_many():
+        return await asyncio.gather(*(manager.reserve() for _ in range(10)))
+
+    assert sorted(asyncio.run(reserve_many())) == list(range(5, 15))
+    web3.eth.get_transaction_count.assert_awaited_once_with(MOCK_ADDRESS, "pending")
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("nonce too low: next nonce 6, tx nonce 5", True),
+        ("Nonce too high", True),
+        ("already known", False),
+        ("insufficient funds for gas * price + value", False),
+    ],
+)
+def test_is_nonce_error(message, expected):
+    """Test detection of nonce related node errors."""
+    assert is_nonce_error(Exception(message)) is expected
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("already known", True),
+        ("Transaction already imported", True),
+        ("nonce too low", False),
+    ],
+)
+def test_is_already_known_error(message, expected):
+    """Test detection of transactions the node already has."""
+    assert is_already_known_error(Exception(message)) is expected
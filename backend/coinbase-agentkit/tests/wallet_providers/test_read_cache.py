@@ -0,0 +1,194 @@
+"""Tests for the block-keyed contract read cache."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.read_cache import ReadCache, function_signature
+
+CONTRACT = "0x1234567890123456789012345678901234567890"
+HOLDER = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _block(number, fork="a"):
+    """Create a block with hashes derived from its number and fork."""
+    return {
+        "number": number,
+        "hash": f"{fork}{number}".encode(),
+        "parentHash": f"{fork}{number - 1}".encode(),
+    }
+
+
+@pytest.fixture
+def mock_web3():
+    """Create a mock Web3 instance whose head is block 100."""
+    web3 = Mock()
+    web3.eth.get_block.return_value = _block(100)
+    return web3
+
+
+@pytest.fixture
+def cache(mock_web3):
+    """Create a cache whose head is looked up on every read."""
+    return ReadCache(mock_web3, "8453", max_size=3, head_max_age=0)
+
+
+def _loader(value="value"):
+    """Create a mock read that returns a value."""
+    return Mock(return_value=value)
+
+
+def test_repeated_reads_in_a_block_are_cached(cache):
+    """Test that the same read at the same head is loaded once."""
+    load = _loader()
+
+    first = cache.read(CONTRACT, "balanceOf", [HOLDER], "latest", load)
+    second = cache.read(
+        CONTRACT.upper().replace("0X", "0x"), "balanceOf", [HOLDER.lower()], "latest", load
+    )
+
+    assert first == second == "value"
+    load.assert_called_once_with(100)
+
+
+def test_strings_other_than_addresses_are_case_sensitive(cache):
+    """Test that only address arguments are compared regardless of case."""
+    load = _loader()
+
+    cache.read(CONTRACT, "resolve", ["Alice.base.eth"], 10, load)
+    cache.read(CONTRACT, "resolve", ["alice.base.eth"], 10, load)
+
+    assert load.call_count == 2
+
+
+def test_function_signature_tells_abis_apart():
+    """Test that the signature keys a function by its input and output types."""
+
+    def _abi(outputs):
+        return [
+            {"type": "event", "name": "getReserves", "inputs": []},
+            {
+                "type": "function",
+                "name": "getReserves",
+                "inputs": [{"type": "address"}],
+                "outputs": outputs,
+            },
+        ]
+
+    narrow = function_signature(_abi([{"type": "uint112"}]), "getReserves")
+    wide = function_signature(
+        _abi([{"type": "tuple[]", "components": [{"type": "address"}, {"type": "uint256"}]}]),
+        "getReserves",
+    )
+
+    assert narrow == "getReserves(address)->(uint112)"
+    assert wide == "getReserves(address)->((address,uint256)[])"
+    assert function_signature([], "getReserves") == "getReserves"
+
+
+def test_latest_is_pinned_to_the_head_block(cache, mock_web3):
+    """Test that a new head makes the next read load again, at the new block."""
+    load = _loader()
+    cache.read(CONTRACT, "totalSupply", [], "latest", load)
+
+    mock_web3.eth.get_block.return_value = _block(101)
+    cache.read(CONTRACT, "totalSupply", [], "latest", load)
+
+    assert [call.args[0] for call in load.call_args_list] == [100, 101]
+
+
+def test_head_is_reused_within_max_age(mock_web3):
+    """Test that the head block is looked up once per max age."""
+    cache = ReadCache(mock_web3, "8453", max_size=10, head_max_age=60)
+
+    for function in ("a", "b", "c"):
+        cache.read(CONTRACT, function, [], "latest", _loader())
+
+    mock_web3.eth.get_block.assert_called_once_with("latest")
+
+
+def test_invalidate_head_forces_new_lookup(mock_web3):
+    """Test that invalidating the head makes the next read check for a new block."""
+    cache = ReadCache(mock_web3, "8453", max_size=10, head_max_age=60)
+    load = _loader()
+    cache.read(CONTRACT, "a", [], "latest", load)
+
+    mock_web3.eth.get_block.return_value = _block(101)
+    cache.invalidate_head()
+    cache.read(CONTRACT, "a", [], "latest", load)
+
+    assert load.call_count == 2
+
+
+def test_block_numbers_are_cached_without_head_lookup(cache, mock_web3):
+    """Test that reads at an explicit block number do not look up the head."""
+    load = _loader()
+
+    cache.read(CONTRACT, "a", [], 50, load)
+    cache.read(CONTRACT, "a", [], 50, load)
+
+    load.assert_called_once_with(50)
+    mock_web3.eth.get_block.assert_not_called()
+
+
+def test_other_block_identifiers_are_not_cached(cache):
+    """Test that reads at pending or a block hash pass through."""
+    load = _loader()
+
+    cache.read(CONTRACT, "a", [], "pending", load)
+    cache.read(CONTRACT, "a", [], "pending", load)
+
+    assert load.call_count == 2
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    """Test that the oldest unused entry is dropped when the cache is full."""
+    loads = {name: _loader(name) for name in ("a", "b", "c", "d")}
+    for name in ("a", "b", "c"):
+        cache.read(CONTRACT, name, [], 10, loads[name])
+    cache.read(CONTRACT, "a", [], 10, loads["a"])
+    cache.read(CONTRACT, "d", [], 10, loads["d"])
+
+    cache.read(CONTRACT, "a", [], 10, loads["a"])
+    cache.read(CONTRACT, "b", [], 10, loads["b"])
+
+    assert loads["a"].call_count == 1
+    assert loads["b"].call_count == 2
+    assert len(cache) == 3
+
+
+def test_reorg_purges_entries_from_the_changed_block(cache, mock_web3):
+    """Test that a new hash for a known block drops the results read at it."""
+    load = _loader()
+    cache.read(CONTRACT, "a", [], 99, load)
+    cache.read(CONTRACT, "a", [], "latest", load)
+
+    mock_web3.eth.get_block.return_value = _block(100, fork="b")
+    cache.read(CONTRACT, "a", [], "latest", load)
+    cache.read(CONTRACT, "a", [], 99, load)
+
+    assert [call.args[0] for call in load.call_args_list] == [99, 100, 100, 99]
+
+
+def test_unhashable_arguments_are_not_cached(cache):
+    """Test that reads with arguments that cannot be keyed are passed through."""
+    load = _loader()
+
+    cache.read(CONTRACT, "a", [{1, 2}], 10, load)
+    cache.read(CONTRACT, "a", [{1, 2}], 10, load)
+
+    assert load.call_count == 2
+
+
+def test_disabled_cache_passes_reads_through(mock_web3):
+    """Test that a cache with no size forwards the original block identifier."""
+    cache = ReadCache(mock_web3, "8453")
+    load = _loader()
+
+    cache.read(CONTRACT, "a", [], "latest", load)
+    cache.read(CONTRACT, "a", [], "latest", load)
+
+    assert load.call_count == 2
+    load.assert_called_with("latest")
+    mock_web3.eth.get_block.assert_not_called()
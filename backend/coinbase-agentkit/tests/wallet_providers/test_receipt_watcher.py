@@ -0,0 +1,221 @@
+"""Tests for the shared receipt watcher."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from coinbase_agentkit.wallet_providers.receipt_watcher import (
+    ReceiptWatcher,
+    get_receipt_watcher,
+)
+
+HASH_A = "0x" + "aa" * 32
+HASH_B = "0x" + "bb" * 32
+HASH_C = "0x" + "cc" * 32
+
+
+class FakeChain:
+    """A minimal chain whose transactions are mined when the test says so."""
+
+    def __init__(self):
+        self.block_number = 100
+        self.mined: dict[str, int] = {}
+        self.batches: list[list[str]] = []
+
+    def mine(self, *tx_hashes):
+        """Mine a new block containing the given transactions."""
+        self.block_number += 1
+        for tx_hash in tx_hashes:
+            self.mined[tx_hash] = self.block_number
+
+    def raw_receipt(self, tx_hash):
+        """Get the raw JSON-RPC receipt of a mined transaction."""
+        if tx_hash not in self.mined:
+            return None
+        return {
+            "transactionHash": tx_hash,
+            "blockNumber": hex(self.mined[tx_hash]),
+            "status": "0x1",
+        }
+
+    def get_transaction_receipt(self, tx_hash):
+        """Get the formatted receipt of a mined transaction, as Web3 returns it."""
+        if tx_hash not in self.mined:
+            raise TransactionNotFound(tx_hash)
+        return {
+            "transactionHash": bytes.fromhex(tx_hash[2:]),
+            "blockNumber": self.mined[tx_hash],
+            "status": 1,
+        }
+
+    def make_batch_request(self, requests):
+        """Answer a batch of eth_getTransactionReceipt requests."""
+        self.batches.append([params[0] for _, params in requests])
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": self.raw_receipt(params[0])}
+            for i, (_, params) in enumerate(requests)
+        ]
+
+    def get_block_receipts(self, block_number):
+        """Get the receipts of every transaction mined in a block."""
+        return [
+            {"transactionHash": bytes.fromhex(tx_hash[2:]), "blockNumber": block}
+            for tx_hash, block in self.mined.items()
+            if block == block_number
+        ]
+
+
+@pytest.fixture
+def chain():
+    """Create a fake chain."""
+    return FakeChain()
+
+
+@pytest.fixture
+def mock_web3(chain):
+    """Create a mock Web3 instance backed by the fake chain."""
+    web3 = Mock()
+    type(web3.eth).block_number = property(lambda _: chain.block_number)
+    web3.provider.make_batch_request.side_effect = chain.make_batch_request
+    web3.eth.get_block_receipts.side_effect = chain.get_block_receipts
+    web3.eth.get_transaction_receipt.side_effect = chain.get_transaction_receipt
+    return web3
+
+
+def _wait_in_thread(watcher, tx_hash, results, timeout=5):
+    """Wait for a receipt on a separate thread, storing the result by hash."""
+
+    def _wait():
+        try:
+            results[tx_hash] = watcher.wait(tx_hash, timeout=timeout)
+        except Exception as e:
+            results[tx_hash] = e
+
+    thread = threading.Thread(target=_wait)
+    thread.start()
+    return thread
+
+
+def _until(condition, timeout=2.0):
+    """Wait until a condition holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def test_pending_transactions_share_one_batch_per_block(chain, mock_web3):
+    """Test that all pending hashes are looked up together, once per new block."""
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01)
+    results = {}
+    threads = [_wait_in_thread(watcher, h, results) for h in (HASH_A, HASH_B, HASH_C)]
+    _until(lambda: watcher.pending_count() == 3)
+    _until(lambda: all(s.checked for s in list(watcher._subscriptions.values())))
+    batches_before_block = len(chain.batches)
+
+    chain.mine(HASH_A, HASH_B)
+    _until(lambda: watcher.pending_count() == 1)
+    chain.mine(HASH_C)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results[HASH_A]["blockNumber"] == 101
+    assert results[HASH_B]["status"] == 1
+    assert results[HASH_C]["blockNumber"] == 102
+    # One lookup per new block, covering every hash still pending
+    assert sorted(chain.batches[batches_before_block]) == [HASH_A, HASH_B, HASH_C]
+    assert len(chain.batches) == batches_before_block + 1
+
+
+def test_already_mined_transaction_resolves_without_new_block(chain, mock_web3):
+    """Test that a hash mined before it was watched is found on the first lookup."""
+    chain.mine(HASH_A)
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01)
+
+    receipt = watcher.wait(HASH_A, timeout=2)
+
+    assert receipt["transactionHash"] == bytes.fromhex(HASH_A[2:])
+
+
+def test_same_hash_shares_subscription(chain, mock_web3):
+    """Test that callers waiting on the same hash share one subscription."""
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01)
+
+    first = watcher.watch(HASH_A)
+    second = watcher.watch(HASH_A.upper().replace("0X", "0x"))
+
+    assert first is second
+    assert watcher.pending_count() == 1
+    chain.mine(HASH_A)
+    assert first.result(timeout=2)["blockNumber"] == 101
+
+
+def test_timeout_raises_and_drops_subscription(chain, mock_web3):
+    """Test that a wait that times out raises TimeExhausted and stops watching the hash."""
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01)
+
+    with pytest.raises(TimeExhausted, match="is not in the chain after 0.05 seconds"):
+        watcher.wait(HASH_A, timeout=0.05)
+
+    assert watcher.pending_count() == 0
+
+
+def test_release_keeps_other_waiters(chain, mock_web3):
+    """Test that one caller giving up does not cancel another caller's wait."""
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01)
+    future = watcher.watch(HASH_A)
+
+    with pytest.raises(TimeExhausted):
+        watcher.wait(HASH_A, timeout=0.05)
+
+    assert not future.cancelled()
+    chain.mine(HASH_A)
+    assert future.result(timeout=2)["status"] == 1
+
+
+def test_block_receipts_used_for_many_pending(chain, mock_web3):
+    """Test that new blocks are scanned with eth_getBlockReceipts above the threshold."""
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01, block_receipts_threshold=1)
+    futures = [watcher.watch(h) for h in (HASH_A, HASH_B)]
+    _until(lambda: all(s.checked for s in list(watcher._subscriptions.values())))
+    batches = len(chain.batches)
+
+    chain.mine(HASH_A, HASH_B)
+
+    assert [f.result(timeout=2)["blockNumber"] for f in futures] == [101, 101]
+    mock_web3.eth.get_block_receipts.assert_called_with(101)
+    assert len(chain.batches) == batches
+
+
+def test_falls_back_when_batching_is_unsupported(chain, mock_web3):
+    """Test that receipts are looked up one by one when the provider cannot batch."""
+    mock_web3.provider.make_batch_request.side_effect = NotImplementedError
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01)
+    futures = [watcher.watch(h) for h in (HASH_A, HASH_B)]
+
+    chain.mine(HASH_A, HASH_B)
+
+    assert [f.result(timeout=2)["blockNumber"] for f in futures] == [101, 101]
+
+
+def test_thread_stops_when_nothing_is_pending(chain, mock_web3):
+    """Test that the polling thread exits once every receipt has been delivered."""
+    chain.mine(HASH_A)
+    watcher = ReceiptWatcher(mock_web3, poll_interval=0.01)
+
+    watcher.wait(HASH_A, timeout=2)
+
+    _until(lambda: watcher._thread is None)
+
+
+def test_get_receipt_watcher_is_shared_per_chain_and_endpoint():
+    """Test that providers on the same chain and endpoint share a watcher."""
+    web3 = Mock()
+    other_web3 = Mock()
+
+    assert get_receipt_watcher("8453", web3) is get_receipt_watcher("8453", web3)
+    assert get_receipt_watcher("8453", web3) is not get_receipt_watcher("1", web3)
+    assert get_receipt_watcher("8453", web3) is not get_receipt_watcher("8453", other_web3)
@@ -0,0 +1,266 @@
+"""Tests for the multi-endpoint RPC router."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.wallet_providers.rpc_router import RpcRouterProvider
+
+URL_A = "https://rpc-a.example.com"
+URL_B = "https://rpc-b.example.com"
+URL_C = "https://rpc-c.example.com"
+
+
+def _response(result):
+    """Create a successful JSON-RPC response."""
+    return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+def _error(code, message):
+    """Create a JSON-RPC error response."""
+    return {"jsonrpc": "2.0", "id": 1, "error": {"code": code, "message": message}}
+
+
+def _slow(result, delay):
+    """Create a request side effect that answers after a delay."""
+
+    def _answer(*args):
+        time.sleep(delay)
+        return _response(result)
+
+    return _answer
+
+
+@pytest.fixture
+def router():
+    """Create a router over three endpoints whose HTTP providers are mocks."""
+    router = RpcRouterProvider([URL_A, URL_B, URL_C], health_check_interval=None)
+    for endpoint in router._endpoints:
+        endpoint.provider = Mock()
+        endpoint.provider.make_request.return_value = _response(endpoint.url)
+    yield router
+    router.close()
+
+
+def _endpoint(router, url):
+    """Get a router endpoint by URL."""
+    return next(endpoint for endpoint in router._endpoints if endpoint.url == url)
+
+
+def _seed_latency(router, url, latency, count=10):
+    """Record successful requests with a fixed latency for an endpoint."""
+    for _ in range(count):
+        router._record(_endpoint(router, url), latency)
+
+
+def test_requires_endpoint():
+    """Test that a router needs at least one endpoint."""
+    with pytest.raises(ValueError, match="At least one RPC endpoint URL is required"):
+        RpcRouterProvider([])
+
+
+def test_duplicate_urls_are_merged():
+    """Test that repeated URLs produce a single endpoint."""
+    router = RpcRouterProvider([URL_A, URL_A, URL_B])
+
+    assert [endpoint.url for endpoint in router._endpoints] == [URL_A, URL_B]
+
+
+def test_routes_to_fastest_endpoint(router):
+    """Test that requests go to the endpoint with the lowest latency."""
+    _seed_latency(router, URL_A, 0.5)
+    _seed_latency(router, URL_B, 0.02)
+    _seed_latency(router, URL_C, 0.1)
+
+    response = router.make_request("eth_sendRawTransaction", ["0x01"])
+
+    assert response["result"] == URL_B
+    _endpoint(router, URL_A).provider.make_request.assert_not_called()
+
+
+def test_failover_on_transport_error(router):
+    """Test that a failed request is retried on the next endpoint."""
+    _seed_latency(router, URL_A, 0.01)
+    _seed_latency(router, URL_B, 0.02)
+    _seed_latency(router, URL_C, 0.03)
+    _endpoint(router, URL_A).provider.make_request.side_effect = ConnectionError("reset")
+
+    response = router.make_request("eth_sendRawTransaction", ["0x01"])
+
+    assert response["result"] == URL_B
+    assert _endpoint(router, URL_A).error_rate() > 0
+
+
+def test_failover_on_rate_limit(router):
+    """Test that a rate limited endpoint is skipped for the next one."""
+    _seed_latency(router, URL_A, 0.01)
+    _seed_latency(router, URL_B, 0.02)
+    _seed_latency(router, URL_C, 0.03)
+    _endpoint(router, URL_A).provider.make_request.return_value = _error(-32005, "limit")
+
+    response = router.make_request("eth_blockNumber", [])
+
+    assert response["result"] == URL_B
+
+
+def test_execution_errors_are_not_retried(router):
+    """Test that an error from the call itself is returned without trying other endpoints."""
+    _seed_latency(router, URL_A, 0.01)
+    _seed_latency(router, URL_B, 0.02)
+    _seed_latency(router, URL_C, 0.03)
+    _endpoint(router, URL_A).provider.make_request.return_value = _error(3, "execution reverted")
+
+    response = router.make_request("eth_call", [{}, "latest"])
+
+    assert response["error"]["message"] == "execution reverted"
+    _endpoint(router, URL_B).provider.make_request.assert_not_called()
+
+
+def test_all_endpoints_failing_raises(router):
+    """Test that the last error is raised when every endpoint fails."""
+    for endpoint in router._endpoints:
+        endpoint.provider.make_request.side_effect = ConnectionError(endpoint.url)
+
+    with pytest.raises(ConnectionError):
+        router.make_request("eth_blockNumber", [])
+
+
+def test_hedged_read_returns_fastest_response(router):
+    """Test that a slow read is hedged to the next endpoint."""
+    _seed_latency(router, URL_A, 0.01)
+    _seed_latency(router, URL_B, 0.02)
+    _seed_latency(router, URL_C, 0.03)
+    _endpoint(router, URL_A).provider.make_request.side_effect = _slow(URL_A, 1.0)
+
+    started = time.perf_counter()
+    response = router.make_request("eth_getBalance", ["0x0", "latest"])
+
+    assert response["result"] == URL_B
+    assert time.perf_counter() - started < 0.5
+
+
+def test_writes_are_not_hedged(router):
+    """Test that a slow write is not sent to a second endpoint."""
+    _seed_latency(router, URL_A, 0.01)
+    _seed_latency(router, URL_B, 0.02)
+    _seed_latency(router, URL_C, 0.03)
+    _endpoint(router, URL_A).provider.make_request.side_effect = _slow(URL_A, 0.2)
+
+    response = router.make_request("eth_sendRawTransaction", ["0x01"])
+
+    assert response["result"] == URL_A
+    _endpoint(router, URL_B).provider.make_request.assert_not_called()
+
+
+def test_unknown_block_errors_fail_over(router):
+    """Test that a lagging endpoint's unknown block error is retried on the next endpoint."""
+    _seed_latency(router, URL_A, 0.01)
+    _seed_latency(router, URL_B, 0.02)
+    _seed_latency(router, URL_C, 0.03)
+    _endpoint(router, URL_A).provider.make_request.return_value = _error(-32000, "header not found")
+
+    response = router.make_request("eth_call", [{}, hex(100)])
+
+    assert response["result"] == URL_B
+
+
+@pytest.mark.parametrize(
+    ("method", "params"),
+    [
+        ("eth_getTransactionCount", ["0x0", "pending"]),
+        ("eth_estimateGas", [{}]),
+    ],
+)
+def test_pending_state_reads_use_broadcast_endpoint(router, method, params):
+    """Test that pending nonce reads and gas estimates go to the endpoint that broadcast."""
+    _seed_latency(router, URL_A, 0.5)
+    _seed_latency(router, URL_B, 0.01)
+    _seed_latency(router, URL_C, 0.6)
+    _endpoint(router, URL_B).provider.make_request.side_effect = ConnectionError("reset")
+    router.make_request("eth_sendRawTransaction", ["0x01"])
+    _endpoint(router, URL_B).provider.make_request.side_effect = None
+
+    response = router.make_request(method, params)
+
+    assert response["result"] == URL_A
+    _endpoint(router, URL_C).provider.make_request.assert_not_called()
+
+
+def test_latest_nonce_reads_are_not_pinned(router):
+    """Test that only pending nonce reads are pinned to the broadcasting endpoint."""
+    _seed_latency(router, URL_A, 0.5)
+    _seed_latency(router, URL_B, 0.01)
+    _seed_latency(router, URL_C, 0.6)
+    router._broadcast_endpoint = _endpoint(router, URL_A)
+
+    response = router.make_request("eth_getTransactionCount", ["0x0", "latest"])
+
+    assert response["result"] == URL_B
+
+
+def test_repeated_failures_put_endpoint_in_cooldown(router):
+    """Test that an endpoint is ranked last after repeated failures."""
+    _seed_latency(router, URL_A, 0.01)
+    _seed_latency(router, URL_B, 0.5)
+    _seed_latency(router, URL_C, 0.6)
+    for _ in range(3):
+        router._record(_endpoint(router, URL_A), None)
+
+    assert router._ranked_endpoints()[-1].url == URL_A
+    health = {entry.url: entry for entry in router.get_endpoint_health()}
+    assert not health[URL_A].healthy
+    assert health[URL_B].healthy
+
+
+def test_check_health_marks_lagging_endpoint(router):
+    """Test that an endpoint behind the chain head is put in cooldown."""
+    _endpoint(router, URL_A).provider.make_request.return_value = _response(hex(100))
+    _endpoint(router, URL_B).provider.make_request.return_value = _response(hex(90))
+    _endpoint(router, URL_C).provider.make_request.side_effect = ConnectionError("down")
+
+    health = {entry.url: entry for entry in router.check_health()}
+
+    assert health[URL_A].healthy
+    assert health[URL_A].block_number == 100
+    assert health[URL_A].p50_latency is not None
+    assert not health[URL_B].healthy
+    assert not health[URL_C].healthy
+    assert health[URL_C].block_number is None
+
+
+def test_requests_start_periodic_health_checks():
+    """Test that requests probe the endpoints in the background once the last check is stale."""
+    router = RpcRouterProvider([URL_A, URL_B], hedge_reads=False, health_check_interval=60)
+    heads = {URL_A: hex(100), URL_B: hex(90)}
+    for endpoint in router._endpoints:
+        endpoint.provider = Mock()
+        endpoint.provider.make_request.side_effect = (
+            lambda method, params, url=endpoint.url: _response(
+                heads[url] if method == "eth_blockNumber" else url
+            )
+        )
+
+    router.make_request("eth_sendRawTransaction", ["0x01"])
+    deadline = time.monotonic() + 5
+    while router._health_check_running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    health = {entry.url: entry for entry in router.get_endpoint_health()}
+    assert health[URL_A].block_number == 100
+    assert not health[URL_B].healthy
+
+    # The check is not repeated until the interval has passed
+    router.make_request("eth_sendRawTransaction", ["0x01"])
+    probes = _endpoint(router, URL_A).provider.make_request.call_args_list
+    assert [call.args[0] for call in probes].count("eth_blockNumber") == 1
+    router.close()
+
+
+def test_works_as_web3_provider(router):
+    """Test that the router can back a Web3 instance."""
+    for endpoint in router._endpoints:
+        endpoint.provider.make_request.return_value = _response(hex(1234))
+
+    assert Web3(router).eth.block_number == 1234
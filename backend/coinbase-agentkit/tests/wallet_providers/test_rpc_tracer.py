@@ -0,0 +1,83 @@
+"""Tests for the RPC call tracer."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.wallet_providers import EvmWalletProvider, RpcTracer
+
+TOKEN = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+WALLET = "0x1234567890AbcdEF1234567890aBcdef12345678"
+
+
+class _Provider:
+    """Action provider reading the same balance twice."""
+
+    @create_action(name="check", description="Check")
+    def check(self, wallet_provider, args):
+        """Read a balance twice, then the total supply once."""
+        wallet_provider.read_contract(TOKEN, [], "balanceOf", args=[WALLET])
+        wallet_provider.read_contract(TOKEN.lower(), [], "balanceOf", args=[WALLET.lower()])
+        wallet_provider.read_contract(TOKEN, [], "totalSupply", block_identifier=12)
+        return "done"
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock EVM wallet provider."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.read_contract.return_value = 1
+    return wallet
+
+
+@pytest.fixture(autouse=True)
+def no_analytics(monkeypatch):
+    """Turn analytics off."""
+    monkeypatch.setenv("DISABLE_AGENTKIT_ANALYTICS", "true")
+
+
+def test_tracer_records_calls_by_action(wallet):
+    """Test that each call is recorded with its action, arguments, block tag and call site."""
+    with RpcTracer(wallet) as tracer:
+        _Provider().check(wallet, {})
+
+    calls = tracer.calls
+    assert [call.method for call in calls] == ["read_contract"] * 3
+    assert {call.action for call in calls} == {"_Provider_check"}
+    assert calls[0].args == (TOKEN, [], "balanceOf")
+    assert calls[0].kwargs == {"args": [WALLET]}
+    assert calls[2].block_identifier == 12
+    assert calls[0].call_site.endswith("in check")
+    assert tracer.call_count("_Provider_check") == 3
+
+
+def test_tracer_flags_redundant_reads(wallet):
+    """Test that identical reads within one invocation are reported, ignoring address case."""
+    with RpcTracer(wallet) as tracer:
+        _Provider().check(wallet, {})
+        _Provider().check(wallet, {})
+
+    redundant = tracer.redundant_reads()
+
+    assert len(redundant) == 2
+    assert all(read.count == 2 and read.call.args[2] == "balanceOf" for read in redundant)
+    assert "Redundant reads:" in tracer.report()
+
+
+def test_tracer_restores_the_wallet_provider(wallet):
+    """Test that detaching the tracer restores the mock's configured methods."""
+    with RpcTracer(wallet):
+        pass
+
+    assert wallet.read_contract("0xToken", [], "decimals") == 1
+
+
+def test_budget_failure_includes_report(wallet):
+    """Test that exceeding a budget raises an assertion error describing the calls."""
+    with RpcTracer(wallet) as tracer:
+        _Provider().check(wallet, {})
+
+    tracer.assert_within_budget({"_Provider_check": 3})
+    with pytest.raises(AssertionError, match="_Provider_check made 3 RPC calls, budget is 2"):
+        tracer.assert_within_budget({"_Provider_check": 2})
@@ -19,43 +19,58 @@ from coinbase_agentkit import (
     EthAccountWalletProvider,
     EthAccountWalletProviderConfig,
     erc20_action_provider,
+    morpho_action_provider,
     pyth_action_provider,
     wallet_action_provider,
     weth_action_provider,
 )
+from coinbase_agentkit.metrics import metrics_view
+from coinbase_agentkit.profiling import create_profiling_blueprint
+from coinbase_agentkit.tracing import REQUEST_ID_HEADER, record_span, request_context, start_span
 from coinbase_agentkit_langchain import get_langchain_tools
 from eth_account import Account
 
 # Configure a file to persist the agent's wallet data
 wallet_data_file = "wallet1.json"
 app = Flask(__name__)
+# Serve action and wallet metrics to Prometheus when ENABLE_METRICS is set
+if os.getenv("ENABLE_METRICS"):
+    app.add_url_rule("/metrics", "metrics", metrics_view())
 load_dotenv()
+# Serve CPU and memory profiles under /debug when ENABLE_PROFILING and PROFILING_TOKEN are set
+if os.getenv("ENABLE_PROFILING"):
+    if os.getenv("PROFILING_TOKEN"):
+        app.register_blueprint(create_profiling_blueprint(token=os.getenv("PROFILING_TOKEN")))
+    else:
+        print("Warning: ENABLE_PROFILING is set without PROFILING_TOKEN, profiling is disabled")
 MASTER_URL = "http://127.0.0.1:6000"  # The master server's endpoint
 AGENT_ID = "agent_8000"
 agent_executor = None
 agent_config = None
 
-# Define supported chains with their IDs and RPC URLs
+# Define supported chains with their IDs and RPC URLs.
+# Each *_RPC_URL variable accepts a comma-separated list to opt in to routing requests to
+# the fastest healthy endpoint with automatic failover; a single URL is used as is.
 CHAINS = {
     "1": {
         "name": "Ethereum Mainnet",
-        "rpc_url": os.getenv("ETH_MAINNET_RPC_URL", "https://ethereum.publicnode.com")
+        "rpc_urls": os.getenv("ETH_MAINNET_RPC_URL", "https://ethereum.publicnode.com").split(",")
     },
     "8453": {
         "name": "Base Mainnet",
-        "rpc_url": os.getenv("BASE_MAINNET_RPC_URL", "https://mainnet.base.org")
+        "rpc_urls": os.getenv("BASE_MAINNET_RPC_URL", "https://mainnet.base.org").split(",")
     },
     "42161": {
         "name": "Arbitrum Mainnet",
-        "rpc_url": os.getenv("ARBITRUM_MAINNET_RPC_URL", "https://arb1.arbitrum.io/rpc")
+        "rpc_urls": os.getenv("ARBITRUM_MAINNET_RPC_URL", "https://arb1.arbitrum.io/rpc").split(",")
     },
     "10": {
         "name": "Optimism Mainnet",
-        "rpc_url": os.getenv("OPTIMISM_MAINNET_RPC_URL", "https://mainnet.optimism.io")
+        "rpc_urls": os.getenv("OPTIMISM_MAINNET_RPC_URL", "https://mainnet.optimism.io").split(",")
     },
     "84532": {
         "name": "Base Sepolia",
-        "rpc_url": os.getenv("BASE_SEPOLIA_RPC_URL", "https://sepolia.base.org")
+        "rpc_urls": os.getenv("BASE_SEPOLIA_RPC_URL", "https://sepolia.base.org").split(",")
     }
 }
 
@@ -106,11 +121,11 @@ def initialize_agent(chain_id=None):
     chain_info = CHAINS[CURRENT_CHAIN_ID]
     print(f"Initializing agent for {chain_info['name']} (Chain ID: {CURRENT_CHAIN_ID})")
 
-    # Create the wallet provider config with RPC URL
+    # Create the wallet provider config with the chain's RPC URLs
     wallet_provider_config = EthAccountWalletProviderConfig(
         account=account,
         chain_id=CURRENT_CHAIN_ID,
-        rpc_url=chain_info['rpc_url']
+        rpc_urls=chain_info['rpc_urls']
     )
 
     # Initialize Ethereum Account Wallet Provider
@@ -122,6 +137,7 @@ def initialize_agent(chain_id=None):
             wallet_provider=wallet_provider,
             action_providers=[
                 erc20_action_provider(),
+                morpho_action_provider(),
                 pyth_action_provider(),
                 wallet_action_provider(),
                 weth_action_provider(),
@@ -167,10 +183,11 @@ def initialize_agent(chain_id=None):
                 "you must say so, and encourage them to implement it themselves using the CDP SDK + Agentkit, "
                 "recommend they go to docs.cdp.coinbase.com for more information. Be concise and helpful with your "
                 "responses. Refrain from restating your tools' descriptions unless it is explicitly requested. "
-                "If someone asks you to deposit or withdraw funds from a morpho vault or the best vault or the "
-                "best morpho vault you will use this address to do the action. The address is going to be "
-                "0xc1256Ae5FF1cf2719D4937adb3bbCCab2E00A2Ca for the vault on base mainnet. The address for USDC on "
-                "base mainnet is 0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913."
+                "If someone asks you to deposit funds into a morpho vault or the best vault or the best morpho "
+                "vault, use the get_best_vault action with the asset and amount to choose the vault, then deposit "
+                "into the vault it returns. To withdraw, use the vault the funds were deposited into. The "
+                "address for USDC on base mainnet is "
+                "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913."
             ),
         ),
         config,
@@ -260,23 +277,36 @@ def chat():
     prompt = data['prompt']
     responses = []
     
-    # Process the prompt through the agent
-    for chunk in agent_executor.stream({"messages": [HumanMessage(content=prompt)]}, agent_config):
-        if "agent" in chunk:
-            responses.append(chunk["agent"]["messages"][0].content)
-        elif "tools" in chunk:
-            responses.append(chunk["tools"]["messages"][0].content)
-            
-    # Try to forward to master server
-    try:
-        master_payload = {
-            "agent_id": AGENT_ID,
-            "prompt": prompt,
-            "response": "\n".join(responses)
-        }
-        requests.post(f"{MASTER_URL}/agent_response", json=master_payload)
-    except Exception as e:
-        print(f"Could not reach master server: {e}")
+    # Trace the request under the ID the master server sent, so its spans join the master's
+    with request_context(request.headers.get(REQUEST_ID_HEADER)) as request_id, start_span(
+        "POST /chat", kind="server", attributes={"agent.id": AGENT_ID}
+    ):
+        # Process the prompt through the agent, recording each LLM and tools step as a span
+        step_start = time.time()
+        for chunk in agent_executor.stream({"messages": [HumanMessage(content=prompt)]}, agent_config):
+            step = "llm step" if "agent" in chunk else "tools step"
+            record_span(step, step_start, time.time())
+            step_start = time.time()
+            if "agent" in chunk:
+                responses.append(chunk["agent"]["messages"][0].content)
+            elif "tools" in chunk:
+                responses.append(chunk["tools"]["messages"][0].content)
+                
+        # Try to forward to master server
+        try:
+            master_payload = {
+                "agent_id": AGENT_ID,
+                "prompt": prompt,
+                "response": "\n".join(responses)
+            }
+            with start_span("POST /agent_response", kind="client"):
+                requests.post(
+                    f"{MASTER_URL}/agent_response",
+                    json=master_payload,
+                    headers={REQUEST_ID_HEADER: request_id},
+                )
+        except Exception as e:
+            print(f"Could not reach master server: {e}")
     
     return jsonify({"response": "\n".join(responses)})
 
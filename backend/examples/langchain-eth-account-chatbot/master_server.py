@@ -4,6 +4,7 @@ from flask import Flask, request, jsonify, render_template_string
 from dotenv import load_dotenv
 import requests
 import datetime
+import uuid
 
 app = Flask(__name__)
 load_dotenv()
@@ -146,6 +147,9 @@ def broadcast():
     
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
+    # Agents trace their work on this command under the same request ID
+    request_id = uuid.uuid4().hex
+    
     # Add a system message to all agents
     for agent_id in agents:
         agents[agent_id]['responses'].append({
@@ -162,7 +166,9 @@ def broadcast():
                 "prompt": prompt,
                 "chain_id": chain_id
             }
-            requests.post(agent_url, json=payload, timeout=0.5)  # Non-blocking request
+            requests.post(
+                agent_url, json=payload, headers={"X-Request-ID": request_id}, timeout=0.5
+            )  # Non-blocking request
         except Exception as e:
             print(f"Could not reach agent {agent_id}: {e}")
     
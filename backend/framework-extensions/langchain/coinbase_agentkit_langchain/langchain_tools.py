@@ -1,41 +1,127 @@
 """LangChain integration tools for AgentKit."""
 
-import nest_asyncio
+import asyncio
+import contextvars
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
 from langchain.tools import StructuredTool
 
 from coinbase_agentkit import Action, AgentKit
 
-# Apply nest-asyncio to allow nested event loops
-nest_asyncio.apply()
+# Number of actions the tools' coroutines run at the same time by default
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Tools already built for each AgentKit instance, by action name, with the executor they use
+_tools: "weakref.WeakKeyDictionary[AgentKit, dict[str, tuple[Action, Executor, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_default_executor: ThreadPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    """Get the executor the tools' coroutines run actions on, creating it on first use.
+
+    Returns:
+        The executor, capped at DEFAULT_MAX_CONCURRENCY threads
+
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_CONCURRENCY, thread_name_prefix="agentkit-langchain"
+            )
+        return _default_executor
+
+
+class AgentKitTool(StructuredTool):
+    """Structured tool wrapping an AgentKit action.
+
+    Actions that validate their own arguments receive the arguments as the model sent
+    them, so they are not validated a second time by the tool.
+    """
+
+    validate_input: bool = True
+
+    def _parse_input(self, tool_input: str | dict, *args: Any, **kwargs: Any) -> str | dict:
+        """Validate the tool input, unless the action validates it itself."""
+        if not self.validate_input and isinstance(tool_input, dict):
+            return tool_input
+        return super()._parse_input(tool_input, *args, **kwargs)
+
 
+def _build_tool(action: Action, executor: Executor) -> AgentKitTool:
+    """Build the Langchain tool wrapping an action.
 
-def get_langchain_tools(agent_kit: AgentKit) -> list[StructuredTool]:
+    Args:
+        action: The AgentKit action
+        executor: The executor the tool's coroutine runs the action on
+
+    Returns:
+        The Langchain tool
+
+    """
+
+    def tool_fn(**kwargs) -> str:
+        return action.invoke(kwargs)
+
+    async def tool_coroutine(**kwargs) -> str:
+        if action.is_async:
+            return await action.invoke(kwargs)
+        # Synchronous actions run on the executor to keep the event loop free, in a copy
+        # of the caller's context so their spans join its trace
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, contextvars.copy_context().run, partial(action.invoke, kwargs)
+        )
+
+    return AgentKitTool(
+        name=action.name,
+        description=action.description,
+        # Async actions can only be awaited
+        func=None if action.is_async else tool_fn,
+        coroutine=tool_coroutine,
+        args_schema=action.args_schema,
+        validate_input=not action.validates_args,
+    )
+
+
+def get_langchain_tools(
+    agent_kit: AgentKit, executor: Executor | None = None
+) -> list[StructuredTool]:
     """Get Langchain tools from an AgentKit instance.
 
+    Each tool can be called synchronously or awaited. Awaited tools run their action on
+    a thread pool, so an agent such as LangGraph's create_react_agent can await several
+    tools, or serve several conversations, without one slow RPC call blocking the others.
+
     Args:
         agent_kit: The AgentKit instance
+        executor: The executor awaited tools run actions on. Defaults to a shared thread
+            pool running at most DEFAULT_MAX_CONCURRENCY actions at the same time.
 
     Returns:
-        A list of Langchain tools
+        A list of Langchain tools, reused for as long as AgentKit returns the same actions.
+        Several tools can be called at the same time, e.g. by a LangGraph ToolNode running
+        parallel tool calls; AgentKit keeps actions that change the wallet's state from
+        overlapping.
 
     """
     actions: list[Action] = agent_kit.get_actions()
+    executor = executor or _get_default_executor()
 
+    built = _tools.setdefault(agent_kit, {})
     tools = []
     for action in actions:
-
-        def create_tool_fn(action=action):
-            def tool_fn(**kwargs) -> str:
-                return action.invoke(kwargs)
-
-            return tool_fn
-
-        tool = StructuredTool(
-            name=action.name,
-            description=action.description,
-            func=create_tool_fn(action),
-            args_schema=action.args_schema,
-        )
-        tools.append(tool)
+        cached = built.get(action.name)
+        if cached is None or cached[0] is not action or cached[1] is not executor:
+            cached = (action, executor, _build_tool(action, executor))
+            built[action.name] = cached
+        tools.append(cached[2])
 
     return tools
@@ -0,0 +1,156 @@
+"""Test fixtures for LangChain tools tests."""
+
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+
+from coinbase_agentkit import AgentKit, AgentKitConfig
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.action_providers.action_provider import ActionProvider
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.wallet_provider import (
+    AsyncWalletProvider,
+    WalletProvider,
+)
+
+
+class AddNumbersSchema(BaseModel):
+    """Schema for adding two numbers."""
+
+    a: int
+    b: int
+
+
+class BalanceSchema(BaseModel):
+    """Schema for getting the wallet balance."""
+
+
+class MockWalletProvider(WalletProvider):
+    """Mock wallet provider for testing."""
+
+    def get_address(self) -> str:
+        """Get the wallet address."""
+        return "mock_address_123"
+
+    def get_network(self) -> Network:
+        """Get the network information."""
+        return Network(chain_id="1", protocol_family="mock")
+
+    def get_balance(self) -> Decimal:
+        """Get the wallet balance."""
+        return Decimal("100.0")
+
+    def sign_message(self, message: str) -> str:
+        """Sign a message with the wallet."""
+        return f"mock_signed_{message}"
+
+    def get_name(self) -> str:
+        """Get the wallet name."""
+        return "mock_wallet"
+
+    def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer native tokens to the specified address."""
+        return "mock_tx_hash"
+
+
+class MockAsyncWalletProvider(AsyncWalletProvider):
+    """Mock async wallet provider for testing."""
+
+    def get_address(self) -> str:
+        """Get the wallet address."""
+        return "mock_address_456"
+
+    def get_network(self) -> Network:
+        """Get the network information."""
+        return Network(chain_id="1", protocol_family="mock")
+
+    def get_name(self) -> str:
+        """Get the wallet name."""
+        return "mock_async_wallet"
+
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance."""
+        return Decimal("42.0")
+
+    async def sign_message(self, message: str) -> str:
+        """Sign a message with the wallet."""
+        return f"mock_signed_{message}"
+
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer native tokens to the specified address."""
+        return "mock_tx_hash"
+
+
+class MockActionProvider(ActionProvider[MockWalletProvider]):
+    """Mock action provider with one action validated by the tool and one by itself."""
+
+    def __init__(self) -> None:
+        super().__init__("mock_provider", [])
+
+    @create_action(
+        name="add",
+        description="Add two numbers together",
+        schema=AddNumbersSchema,
+    )
+    def add_numbers(self, wallet_provider: MockWalletProvider, args: dict) -> str:
+        """Add two numbers, reporting the type of the arguments received."""
+        return f"{args['a'] + args['b']} from {type(args['a']).__name__}"
+
+    @create_action(
+        name="add_raw",
+        description="Add two numbers, validating them in the action",
+        schema=AddNumbersSchema,
+        validates_args=True,
+    )
+    def add_raw_numbers(self, wallet_provider: MockWalletProvider, args: dict) -> str:
+        """Validate and add two numbers, reporting the type of the arguments received."""
+        validated_args = AddNumbersSchema(**args)
+        return f"{validated_args.a + validated_args.b} from {type(args['a']).__name__}"
+
+    def supports_network(self, network: Network) -> bool:
+        """Check if the network is supported by this action provider."""
+        return True
+
+
+class MockAsyncActionProvider(ActionProvider[MockAsyncWalletProvider]):
+    """Mock action provider with an action awaiting the async wallet provider."""
+
+    def __init__(self) -> None:
+        super().__init__("mock_async_provider", [])
+
+    @create_action(
+        name="balance",
+        description="Get the wallet balance",
+        schema=BalanceSchema,
+        read_only=True,
+    )
+    async def balance(self, wallet_provider: MockAsyncWalletProvider, args: dict) -> str:
+        """Await the wallet balance."""
+        return f"Balance: {await wallet_provider.get_balance()}"
+
+    def supports_network(self, network: Network) -> bool:
+        """Check if the network is supported by this action provider."""
+        return True
+
+
+@pytest.fixture
+def agent_kit():
+    """Create an AgentKit instance with a synchronous wallet provider."""
+    return AgentKit(
+        AgentKitConfig(
+            wallet_provider=MockWalletProvider(),
+            action_providers=[MockActionProvider()],
+        )
+    )
+
+
+@pytest.fixture
+def async_agent_kit():
+    """Create an AgentKit instance with an async wallet provider."""
+    return AgentKit(
+        AgentKitConfig(
+            wallet_provider=MockAsyncWalletProvider(),
+            action_providers=[MockAsyncActionProvider()],
+        )
+    )
@@ -0,0 +1,85 @@
+"""Tests for LangChain tools conversion."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from langchain.tools import StructuredTool
+from pydantic import ValidationError
+
+from coinbase_agentkit.tracing import get_request_id, request_context
+from coinbase_agentkit_langchain import get_langchain_tools
+
+
+def _tool(tools, name):
+    """Get a tool by name."""
+    return next(tool for tool in tools if tool.name == name)
+
+
+def test_basic_tool_conversion(agent_kit):
+    """Test that actions are converted to structured tools, reused across calls."""
+    tools = get_langchain_tools(agent_kit)
+
+    assert {tool.name for tool in tools} == {
+        "MockActionProvider_add_numbers",
+        "MockActionProvider_add_raw_numbers",
+    }
+    assert all(isinstance(tool, StructuredTool) for tool in tools)
+    assert get_langchain_tools(agent_kit) == tools
+
+
+def test_tool_validates_input_unless_action_does(agent_kit):
+    """Test that the tool only validates arguments for actions that do not validate them."""
+    tools = get_langchain_tools(agent_kit)
+    add = _tool(tools, "MockActionProvider_add_numbers")
+    add_raw = _tool(tools, "MockActionProvider_add_raw_numbers")
+
+    assert add.validate_input
+    assert not add_raw.validate_input
+    assert add.invoke({"a": "2", "b": 3}) == "5 from int"
+    assert add_raw.invoke({"a": "2", "b": 3}) == "5 from str"
+    with pytest.raises(ValidationError):
+        add_raw.invoke({"a": "two", "b": 3})
+
+
+def test_coroutine_runs_sync_action_on_executor(agent_kit):
+    """Test that awaiting a tool runs its synchronous action on the given executor."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.submit = Mock(wraps=executor.submit)
+    add = _tool(get_langchain_tools(agent_kit, executor), "MockActionProvider_add_numbers")
+
+    assert asyncio.run(add.ainvoke({"a": 1, "b": 2})) == "3 from int"
+    executor.submit.assert_called_once()
+    executor.shutdown()
+
+
+def test_coroutine_runs_in_the_callers_context(agent_kit):
+    """Test that a synchronous action run on the executor sees the caller's request."""
+    add = _tool(get_langchain_tools(agent_kit), "MockActionProvider_add_numbers")
+    action = next(a for a in agent_kit.get_actions() if a.name == add.name)
+    request_ids = []
+    original_invoke = action.invoke
+    object.__setattr__(
+        action,
+        "invoke",
+        lambda args: request_ids.append(get_request_id()) or original_invoke(args),
+    )
+
+    async def invoke():
+        with request_context("request-1"):
+            return await add.ainvoke({"a": 1, "b": 2})
+
+    assert asyncio.run(invoke()) == "3 from int"
+    object.__setattr__(action, "invoke", original_invoke)
+    assert request_ids == ["request-1"]
+
+
+def test_async_action_is_awaited(async_agent_kit):
+    """Test that a tool wrapping an async action awaits it and cannot be called synchronously."""
+    balance = _tool(get_langchain_tools(async_agent_kit), "MockAsyncActionProvider_balance")
+
+    assert balance.func is None
+    assert asyncio.run(balance.ainvoke({})) == "Balance: 42.0"
+    with pytest.raises(NotImplementedError):
+        balance.invoke({})
@@ -1,40 +1,62 @@
 """OpenAI Agents SDK integration tools for AgentKit."""
 
+import asyncio
+import contextvars
+import copy
+import functools
 import json
+import re
+import threading
 import warnings
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from importlib import metadata
 from typing import Any
 
-import nest_asyncio
-import pkg_resources
 from agents import FunctionTool, RunContextWrapper
+from pydantic import BaseModel
 
 from coinbase_agentkit import Action, AgentKit
 
-# Apply nest-asyncio to allow nested event loops
-nest_asyncio.apply()
+# Number of actions the tools run at the same time by default
+DEFAULT_MAX_CONCURRENCY = 8
 
+# Oldest web3 version supporting the voice features
+MIN_VOICE_WEB3_VERSION = (7, 10, 0)
 
+_default_executor: ThreadPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    """Get the executor tools run actions on, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor: The executor, capped at DEFAULT_MAX_CONCURRENCY threads
+
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_CONCURRENCY, thread_name_prefix="agentkit-openai"
+            )
+        return _default_executor
+
+
+@functools.cache
 def _check_web3_version() -> bool:
     """Check if web3 version is compatible with voice features.
 
+    The check runs once per process.
+
     Returns:
         bool: True if web3 version is >= 7.10.0, False otherwise
 
     """
     try:
-        web3_version = pkg_resources.get_distribution("web3").version
-        is_compatible = pkg_resources.parse_version(web3_version) >= pkg_resources.parse_version(
-            "7.10.0"
-        )
-        if not is_compatible:
-            warnings.warn(
-                f"Voice features require web3 >= 7.10.0, but found version {web3_version}. "
-                "Voice features will be disabled. Please upgrade web3 to enable voice functionality.",
-                UserWarning,
-                stacklevel=2,
-            )
-        return is_compatible
-    except pkg_resources.DistributionNotFound:
+        web3_version = metadata.version("web3")
+    except metadata.PackageNotFoundError:
         warnings.warn(
             "web3 package not found. Voice features will be disabled. "
             "Please install web3 >= 7.10.0 to enable voice functionality.",
@@ -43,6 +65,17 @@ def _check_web3_version() -> bool:
         )
         return False
 
+    release = tuple(int(part) for part in re.findall(r"\d+", web3_version)[:3])
+    is_compatible = release >= MIN_VOICE_WEB3_VERSION
+    if not is_compatible:
+        warnings.warn(
+            f"Voice features require web3 >= 7.10.0, but found version {web3_version}. "
+            "Voice features will be disabled. Please upgrade web3 to enable voice functionality.",
+            UserWarning,
+            stacklevel=2,
+        )
+    return is_compatible
+
 
 def _fix_schema_for_openai(schema: dict) -> None:
     """Recursively fix schema to meet OpenAI's requirements."""
@@ -70,14 +103,145 @@ def _fix_schema_for_openai(schema: dict) -> None:
                 _fix_schema_for_openai(subschema)
 
 
-def get_openai_agents_sdk_tools(agent_kit: AgentKit) -> list[FunctionTool]:
+@functools.cache
+def _get_openai_schema(args_schema: type[BaseModel] | None) -> dict:
+    """Get the JSON schema of an args schema class, fixed for OpenAI, computing it once.
+
+    Args:
+        args_schema: The args schema class of an action, or None for actions without one
+
+    Returns:
+        dict: The JSON schema, shared by every tool with the same args schema
+
+    """
+    if args_schema is None:
+        schema = {"type": "object", "properties": {}}
+    else:
+        schema = args_schema.model_json_schema()
+    _fix_schema_for_openai(schema)
+    return schema
+
+
+class _ConcurrencyLimit:
+    """Limits how many calls of a tool run at the same time, on any event loop."""
+
+    def __init__(self, limit: int):
+        """Initialize the limit.
+
+        Args:
+            limit: Largest number of calls running at the same time
+
+        """
+        self._limit = limit
+        # A semaphore is bound to the event loop it is first used on
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def get(self) -> asyncio.Semaphore:
+        """Get the semaphore of the running event loop.
+
+        Returns:
+            asyncio.Semaphore: The semaphore
+
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._limit)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+
+# Tools already built for each AgentKit instance, by action name, with the executor and
+# concurrency limit they use
+_tools: "weakref.WeakKeyDictionary[AgentKit, dict[str, tuple[Action, tuple, FunctionTool]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _parse_args(action: Action, input_str: str) -> dict[str, Any]:
+    """Parse the JSON arguments of a tool call, validating them unless the action does.
+
+    Args:
+        action: The AgentKit action
+        input_str: The arguments, as a JSON object
+
+    Returns:
+        dict[str, Any]: The arguments to invoke the action with
+
+    Raises:
+        json.JSONDecodeError: If the arguments are not valid JSON
+        pydantic.ValidationError: If the arguments do not match the action's schema
+
+    """
+    args = json.loads(input_str) if input_str else {}
+    if action.validates_args or action.args_schema is None:
+        return args
+    validated = action.args_schema.model_validate(args)
+    return {name: getattr(validated, name) for name in validated.model_fields_set}
+
+
+def _build_tool(
+    action: Action, executor: Executor, max_concurrency_per_tool: int | None
+) -> FunctionTool:
+    """Build the OpenAI Agents SDK tool wrapping an action.
+
+    Args:
+        action: The AgentKit action
+        executor: The executor the action runs on
+        max_concurrency_per_tool: Largest number of calls of the tool running at the same
+            time, or None for no limit
+
+    Returns:
+        The OpenAI Agents SDK tool
+
+    """
+    limit = _ConcurrencyLimit(max_concurrency_per_tool) if max_concurrency_per_tool else None
+
+    async def run_action(args: dict[str, Any]) -> str:
+        if action.is_async:
+            return str(await action.invoke(args))
+        # Synchronous actions run on the executor to keep the event loop free, in a copy
+        # of the caller's context so their spans join its trace
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return str(await loop.run_in_executor(executor, context.run, action.invoke, args))
+
+    async def invoke_tool(ctx: RunContextWrapper[Any], input_str: str) -> str:
+        args = _parse_args(action, input_str)
+        if limit is None:
+            return await run_action(args)
+        async with limit.get():
+            return await run_action(args)
+
+    return FunctionTool(
+        name=action.name,
+        description=action.description,
+        # Copied so the SDK cannot change the schema shared with other tools
+        params_json_schema=copy.deepcopy(_get_openai_schema(action.args_schema)),
+        on_invoke_tool=invoke_tool,
+    )
+
+
+def get_openai_agents_sdk_tools(
+    agent_kit: AgentKit,
+    executor: Executor | None = None,
+    max_concurrency_per_tool: int | None = None,
+) -> list[FunctionTool]:
     """Get OpenAI Agents SDK tools from an AgentKit instance.
 
+    Tools run their action on a thread pool, so a slow RPC call or transaction wait does
+    not block the Runner's event loop.
+
     Args:
         agent_kit: The AgentKit instance
+        executor: The executor actions run on. Defaults to a shared thread pool running at
+            most DEFAULT_MAX_CONCURRENCY actions at the same time.
+        max_concurrency_per_tool: Largest number of calls of each tool running at the same
+            time, or None for no limit beyond the executor's
 
     Returns:
-        A list of OpenAI Agents SDK tools
+        A list of OpenAI Agents SDK tools, reused for as long as AgentKit returns the same
+        actions
 
     """
     actions: list[Action] = agent_kit.get_actions()
@@ -85,23 +249,16 @@ def get_openai_agents_sdk_tools(agent_kit: AgentKit) -> list[FunctionTool]:
     # Check web3 version for voice compatibility
     _check_web3_version()  # This will print a warning if version is incompatible
 
+    executor = executor or _get_default_executor()
+    options = (executor, max_concurrency_per_tool)
+
+    built = _tools.setdefault(agent_kit, {})
     tools = []
     for action in actions:
-
-        async def invoke_tool(ctx: RunContextWrapper[Any], input_str: str, action=action) -> str:
-            args = json.loads(input_str) if input_str else {}
-            return str(action.invoke(args))
-
-        # Get the schema and modify it for OpenAI compatibility
-        schema = action.args_schema.model_json_schema()
-        _fix_schema_for_openai(schema)
-
-        tool = FunctionTool(
-            name=action.name,
-            description=action.description,
-            params_json_schema=schema,
-            on_invoke_tool=invoke_tool,
-        )
-        tools.append(tool)
+        cached = built.get(action.name)
+        if cached is None or cached[0] is not action or cached[1] != options:
+            cached = (action, options, _build_tool(action, executor, max_concurrency_per_tool))
+            built[action.name] = cached
+        tools.append(cached[2])
 
     return tools
@@ -1,7 +1,10 @@
 """Tests for OpenAI Agents SDK tools conversion."""
 
+import asyncio
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from agents import Agent, FunctionTool
@@ -9,6 +12,8 @@ from agents.run import Runner
 from agents.run_context import RunContextWrapper
 from dotenv import load_dotenv
 
+from coinbase_agentkit.tracing import get_request_id, request_context
+from coinbase_agentkit_openai_agents_sdk import openai_agents_sdk_tools
 from coinbase_agentkit_openai_agents_sdk.openai_agents_sdk_tools import get_openai_agents_sdk_tools
 
 # Load environment variables from .env file
@@ -105,11 +110,83 @@ async def test_tool_error_handling(agent_kit):
     with pytest.raises(ValueError):
         await add_tool.on_invoke_tool(ctx, json.dumps({"invalid": "args"}))
 
-    # Test type validation
-    with pytest.raises(TypeError):
+    # Test type validation, rejected by the schema before the action runs
+    with pytest.raises(ValueError):
         await add_tool.on_invoke_tool(ctx, json.dumps({"a": "not a number", "b": 3}))
 
 
+@pytest.mark.asyncio
+async def test_tool_passes_validated_args(agent_kit):
+    """Test that arguments are converted by the action's schema before the action runs."""
+    tools = get_openai_agents_sdk_tools(agent_kit)
+    add_tool = next(t for t in tools if t.name == "MockActionProvider_add_numbers")
+
+    result = await add_tool.on_invoke_tool(RunContextWrapper(None), json.dumps({"a": "2", "b": 3}))
+
+    assert result == "The sum of 2 and 3 is 5"
+
+
+@pytest.mark.asyncio
+async def test_tools_and_schemas_are_reused(agent_kit):
+    """Test that tools are built once and schemas are computed once per args schema."""
+    openai_agents_sdk_tools._get_openai_schema.cache_clear()
+
+    first = get_openai_agents_sdk_tools(agent_kit)
+    second = get_openai_agents_sdk_tools(agent_kit)
+
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert openai_agents_sdk_tools._get_openai_schema.cache_info().currsize == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_runs_on_executor(agent_kit):
+    """Test that tools run their action on the given executor, off the event loop."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-executor")
+    thread_names = []
+
+    tools = get_openai_agents_sdk_tools(agent_kit, executor=executor, max_concurrency_per_tool=1)
+    add_tool = next(t for t in tools if t.name == "MockActionProvider_add_numbers")
+    action = next(a for a in agent_kit.get_actions() if a.name == add_tool.name)
+    original_invoke = action.invoke
+    object.__setattr__(
+        action,
+        "invoke",
+        lambda args: thread_names.append(threading.current_thread().name) or original_invoke(args),
+    )
+
+    results = await asyncio.gather(
+        *(
+            add_tool.on_invoke_tool(RunContextWrapper(None), json.dumps({"a": i, "b": 1}))
+            for i in range(3)
+        )
+    )
+
+    assert [result.split()[-1] for result in results] == ["1", "2", "3"]
+    assert all(name.startswith("test-executor") for name in thread_names)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tool_runs_in_the_callers_context(agent_kit):
+    """Test that actions run on the executor see the request of the awaiting task."""
+    tools = get_openai_agents_sdk_tools(agent_kit)
+    add_tool = next(t for t in tools if t.name == "MockActionProvider_add_numbers")
+    action = next(a for a in agent_kit.get_actions() if a.name == add_tool.name)
+    request_ids = []
+    original_invoke = action.invoke
+    object.__setattr__(
+        action,
+        "invoke",
+        lambda args: request_ids.append(get_request_id()) or original_invoke(args),
+    )
+
+    with request_context("request-1"):
+        await add_tool.on_invoke_tool(RunContextWrapper(None), json.dumps({"a": 1, "b": 2}))
+
+    object.__setattr__(action, "invoke", original_invoke)
+    assert request_ids == ["request-1"]
+
+
 @pytest.mark.asyncio
 async def test_agent_using_tools(agent_kit):
     """Test that an agent can successfully use the converted tools."""